@@ -1,6 +1,7 @@
 # Application Messages
 class AppMessages:
     TASK_CREATED = "Task created successfully"
+    TASKS_BULK_PROCESSED = "Bulk task request processed"
     TEAM_CREATED = "Team created successfully"
     GOOGLE_LOGIN_SUCCESS = "Successfully logged in with Google"
     GOOGLE_LOGOUT_SUCCESS = "Successfully logged out"
@@ -35,6 +36,7 @@ class ApiErrors:
     TASK_NOT_FOUND = "Task with ID {0} not found."
     TASK_NOT_FOUND_GENERIC = "Task not found."
     TASK_NOT_FOUND_TITLE = "Task Not Found"
+    TASK_CREATED_WITH_ERRORS = "Task {0} was created, but writing its assignment or reading it back failed: {1}"
     INVALID_TASK_ID = "Invalid task ID format"
     RESOURCE_NOT_FOUND_TITLE = "Resource Not Found"
     GOOGLE_AUTH_FAILED = "Google authentication failed"
@@ -52,6 +54,7 @@ class ApiErrors:
     UNAUTHORIZED_TITLE = "You are not authorized to perform this action"
     USER_NOT_FOUND = "User with ID {0} not found."
     USER_NOT_FOUND_GENERIC = "User not found."
+    TEAM_NOT_FOUND = "Team with ID {0} not found."
     SEARCH_QUERY_EMPTY = "Search query cannot be empty"
     TASK_ALREADY_IN_WATCHLIST = "Task is already in the watchlist"
     CANNOT_REMOVE_OWNER = "Owner cannot be removed from the team"
@@ -86,6 +89,15 @@ class ValidationErrors:
     INVALID_IS_ACTIVE_VALUE = "Invalid value for is_active"
     USER_NOT_TEAM_MEMBER = "User is not a member of the team"
     POC_NOT_PROVIDED = "POC is required for team update"
+    INVALID_CURSOR = "Invalid cursor."
+    CURSOR_SORT_MISMATCH = "Cursor does not match the requested sort_by and order."
+    BULK_TASKS_REQUIRED = "tasks must be a non-empty list."
+    BULK_TASKS_LIMIT_EXCEEDED = "A bulk request accepts at most {0} tasks."
+    BULK_TASK_ID_REQUIRED = "id is required."
+    DUPLICATE_BULK_TASK_ID = "Task {0} appears more than once in the request."
+    BULK_ASSIGNEE_UPDATE_NOT_SUPPORTED = "Assignees cannot be changed by a bulk update."
+    INVALID_TIMELINE_POSITION = "Must be a timestamp, optionally followed by a comma and the ID of a timeline entry."
+    TIMELINE_BEFORE_AND_SINCE = "before and since cannot be used together."
 
 
 # Auth messages
@@ -47,3 +47,6 @@ SORT_FIELD_DEFAULT_ORDERS = {
 }
 
 MINIMUM_DEFERRAL_NOTICE_DAYS = 20
+
+# Tasks accepted by one request to the bulk create and update endpoints
+BULK_TASKS_MAX_ITEMS = 1000
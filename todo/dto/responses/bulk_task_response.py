@@ -0,0 +1,39 @@
+from typing import List
+from pydantic import BaseModel
+
+from todo.constants.messages import AppMessages
+from todo.dto.responses.error_response import ApiErrorDetail
+from todo.dto.task_dto import TaskDTO
+
+
+class BulkTaskResult(BaseModel):
+    """Outcome of one task of a bulk request, at the position it had in the request."""
+
+    index: int
+    statusCode: int
+    # ID of the created task, also set when writing what follows the creation of the task failed
+    id: str | None = None
+    data: TaskDTO | None = None
+    errors: List[ApiErrorDetail] | None = None
+
+
+class BulkTaskResponse(BaseModel):
+    statusCode: int
+    successMessage: str = AppMessages.TASKS_BULK_PROCESSED
+    succeeded: int
+    failed: int
+    results: List[BulkTaskResult]
+
+    @classmethod
+    def from_results(cls, results: List[BulkTaskResult], success_status_code: int) -> "BulkTaskResponse":
+        """
+        Build the response of a bulk request, 207 when some of its tasks failed or were created with errors.
+        """
+        results = sorted(results, key=lambda result: result.index)
+        failed = sum(1 for result in results if result.statusCode >= 400)
+        return cls(
+            statusCode=207 if any(result.errors for result in results) else success_status_code,
+            succeeded=len(results) - failed,
+            failed=failed,
+            results=results,
+        )
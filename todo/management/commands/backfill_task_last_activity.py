@@ -0,0 +1,22 @@
+from django.core.management.base import BaseCommand
+from todo.repositories.task_repository import TaskRepository
+
+
+class Command(BaseCommand):
+    help = "Store lastActivity on tasks written before it was stored, so that sorting by updatedAt uses its index"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Number of tasks to update per batch",
+        )
+
+    def handle(self, *args, **options):
+        self.stdout.write("Backfilling task lastActivity...")
+        try:
+            updated_count = TaskRepository.backfill_last_activity(batch_size=options["batch_size"])
+            self.stdout.write(self.style.SUCCESS(f"lastActivity stored on {updated_count} tasks"))
+        except Exception as e:
+            self.stdout.write(self.style.ERROR(f"lastActivity backfill failed: {str(e)}"))
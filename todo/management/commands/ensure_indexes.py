@@ -0,0 +1,51 @@
+from django.core.management.base import BaseCommand
+from todo_project.db.config import DatabaseManager
+from todo_project.db.indexes import (
+    INDEX_STATUS_CHANGED,
+    INDEX_STATUS_CREATED,
+    INDEX_STATUS_FAILED,
+    INDEX_STATUS_MISSING,
+    INDEX_STATUS_REBUILT,
+    check_indexes,
+    ensure_indexes,
+)
+
+
+class Command(BaseCommand):
+    help = "Create the MongoDB indexes declared by repositories and report any drift"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--check",
+            action="store_true",
+            help="Only report missing and drifted indexes without building them",
+        )
+        parser.add_argument(
+            "--rebuild-changed",
+            action="store_true",
+            help="Drop and recreate indexes whose definition differs from the declared one",
+        )
+
+    def handle(self, *args, **options):
+        database = DatabaseManager().get_database()
+
+        if options["check"]:
+            reports = check_indexes(database)
+        else:
+            reports = ensure_indexes(database, rebuild_changed=options["rebuild_changed"])
+
+        if not reports:
+            self.stdout.write(self.style.SUCCESS("All declared indexes are present and up to date."))
+            return
+
+        for report in reports:
+            message = f"[{report.status}] {report.collection}.{report.name}"
+            if report.detail:
+                message = f"{message}: {report.detail}"
+
+            if report.status in (INDEX_STATUS_CREATED, INDEX_STATUS_REBUILT):
+                self.stdout.write(self.style.SUCCESS(message))
+            elif report.status in (INDEX_STATUS_MISSING, INDEX_STATUS_CHANGED, INDEX_STATUS_FAILED):
+                self.stdout.write(self.style.ERROR(message))
+            else:
+                self.stdout.write(self.style.WARNING(message))
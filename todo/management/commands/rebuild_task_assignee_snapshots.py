@@ -0,0 +1,37 @@
+from django.core.management.base import BaseCommand
+from todo.repositories.task_assignment_repository import TaskAssignmentRepository
+
+
+class Command(BaseCommand):
+    help = "Rebuild the assignee snapshot stored on tasks from task assignments, users and teams"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="Number of tasks to recompute per batch",
+        )
+        parser.add_argument(
+            "--task-id",
+            action="append",
+            dest="task_ids",
+            help="Only recompute the snapshot of this task (can be repeated)",
+        )
+
+    def handle(self, *args, **options):
+        task_ids = options["task_ids"] or []
+
+        if task_ids:
+            if TaskAssignmentRepository.refresh_assignee_snapshots(task_ids):
+                self.stdout.write(self.style.SUCCESS("Assignee snapshots refreshed successfully!"))
+            else:
+                self.stdout.write(self.style.ERROR("Assignee snapshot refresh failed!"))
+            return
+
+        self.stdout.write("Rebuilding task assignee snapshots...")
+        try:
+            processed_count = TaskAssignmentRepository.rebuild_assignee_snapshots(batch_size=options["batch_size"])
+            self.stdout.write(self.style.SUCCESS(f"Assignee snapshots rebuilt for {processed_count} tasks"))
+        except Exception as e:
+            self.stdout.write(self.style.ERROR(f"Assignee snapshot rebuild failed: {str(e)}"))
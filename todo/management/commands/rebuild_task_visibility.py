@@ -0,0 +1,48 @@
+from django.core.management.base import BaseCommand
+from todo.repositories.task_visibility_repository import TaskVisibilityRepository
+
+
+class Command(BaseCommand):
+    help = "Rebuild the task_visibility collection from task assignments, team POCs and team memberships"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="Number of tasks to recompute per batch",
+        )
+        parser.add_argument(
+            "--task-id",
+            action="append",
+            dest="task_ids",
+            help="Only recompute visibility for this task (can be repeated)",
+        )
+        parser.add_argument(
+            "--team-id",
+            action="append",
+            dest="team_ids",
+            help="Only recompute visibility for tasks assigned to this team (can be repeated)",
+        )
+
+    def handle(self, *args, **options):
+        task_ids = options["task_ids"] or []
+        team_ids = options["team_ids"] or []
+
+        if task_ids or team_ids:
+            success = TaskVisibilityRepository.refresh_for_tasks(task_ids) if task_ids else True
+            for team_id in team_ids:
+                success = TaskVisibilityRepository.refresh_for_team(team_id) and success
+
+            if success:
+                self.stdout.write(self.style.SUCCESS("Task visibility refreshed successfully!"))
+            else:
+                self.stdout.write(self.style.ERROR("Some task visibility refreshes failed!"))
+            return
+
+        self.stdout.write("Rebuilding task visibility...")
+        try:
+            processed_count = TaskVisibilityRepository.rebuild(batch_size=options["batch_size"])
+            self.stdout.write(self.style.SUCCESS(f"Task visibility rebuilt for {processed_count} tasks"))
+        except Exception as e:
+            self.stdout.write(self.style.ERROR(f"Task visibility rebuild failed: {str(e)}"))
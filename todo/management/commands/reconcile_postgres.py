@@ -0,0 +1,71 @@
+import time
+
+from django.core.management.base import BaseCommand
+from todo.services.dual_write_service import DualWriteService
+from todo.services.reconciliation_service import ReconciliationService
+
+
+class Command(BaseCommand):
+    help = "Compare MongoDB collections with their PostgreSQL tables chunk by chunk and optionally repair drift"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--collection",
+            action="append",
+            dest="collections",
+            choices=list(DualWriteService.COLLECTION_MODEL_MAP),
+            help="Only reconcile this collection (can be repeated)",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=1000,
+            help="Number of documents compared per chunk",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=4,
+            help="Maximum number of collections reconciled concurrently",
+        )
+        parser.add_argument(
+            "--repair",
+            action="store_true",
+            help="Write differing documents to PostgreSQL and delete rows that have no MongoDB document",
+        )
+        parser.add_argument(
+            "--restart",
+            action="store_true",
+            help="Start from the first document instead of resuming an interrupted run",
+        )
+
+    def handle(self, *args, **options):
+        reconciliation_service = ReconciliationService(
+            chunk_size=options["chunk_size"], workers=options["workers"], repair=options["repair"]
+        )
+
+        self.stdout.write("Starting MongoDB to PostgreSQL reconciliation...")
+        started = time.monotonic()
+        results = reconciliation_service.reconcile(options["collections"], restart=options["restart"])
+        seconds = time.monotonic() - started
+
+        for result in results:
+            message = (
+                f"{result.collection}: rows={result.rows} chunks={result.chunks} "
+                f"mismatched_chunks={result.mismatched_chunks} missing={result.missing} extra={result.extra} "
+                f"different={result.different} repaired={result.repaired} repair_failed={result.repair_failed} "
+                f"rows/s={result.rows_per_second:.0f}"
+            )
+            if result.resumed_from:
+                message = f"{message} (resumed after {result.resumed_from})"
+
+            if result.error:
+                self.stdout.write(self.style.ERROR(f"{message} error: {result.error}"))
+            elif result.in_sync:
+                self.stdout.write(self.style.SUCCESS(message))
+            else:
+                self.stdout.write(self.style.WARNING(f"{message} sample ids: {', '.join(result.sample_ids)}"))
+
+        scanned = sum(result.scanned for result in results)
+        rate = scanned / seconds if seconds else 0.0
+        self.stdout.write(f"Compared {scanned} rows in {seconds:.1f}s ({rate:.0f} rows/s)")
@@ -0,0 +1,58 @@
+import signal
+
+from django.core.management.base import BaseCommand
+from todo.repositories.task_repository import TaskRepository
+from todo.services.deferral_expiry_service import DeferralExpiryService
+
+
+class Command(BaseCommand):
+    help = "Move deferred tasks back to their status when their deferral ends"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--poll-interval",
+            type=float,
+            default=60.0,
+            help="Maximum number of seconds to wait before checking for ended deferrals again",
+        )
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="Expire the deferrals that have ended and exit instead of polling",
+        )
+        parser.add_argument(
+            "--backfill",
+            action="store_true",
+            help="Store effectiveStatus on tasks written before it was stored and exit",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Number of tasks to update per batch when backfilling",
+        )
+
+    def handle(self, *args, **options):
+        if options["backfill"]:
+            self.stdout.write("Backfilling task effectiveStatus...")
+            try:
+                updated_count = TaskRepository.backfill_effective_status(batch_size=options["batch_size"])
+                self.stdout.write(self.style.SUCCESS(f"effectiveStatus stored on {updated_count} tasks"))
+            except Exception as e:
+                self.stdout.write(self.style.ERROR(f"effectiveStatus backfill failed: {str(e)}"))
+            return
+
+        expiry_service = DeferralExpiryService()
+        if options["once"]:
+            expired_count = expiry_service.run_once()
+            self.stdout.write(self.style.SUCCESS(f"{expired_count} deferred tasks moved back to their status"))
+            return
+
+        signal.signal(signal.SIGTERM, lambda signum, frame: expiry_service.stop())
+
+        self.stdout.write("Starting deferral expiry worker...")
+        try:
+            expiry_service.run(poll_interval=options["poll_interval"])
+        except KeyboardInterrupt:
+            expiry_service.stop()
+        self.stdout.write(self.style.SUCCESS("Deferral expiry worker stopped"))
@@ -0,0 +1,62 @@
+import signal
+
+from django.core.management.base import BaseCommand
+from todo.repositories.outbox_repository import OutboxRepository
+from todo.services.sync_relay_service import SyncRelayService
+
+
+class Command(BaseCommand):
+    help = "Apply queued outbox events to Postgres (run a single instance to keep per-document ordering)"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=100,
+            help="Number of outbox events to sync per batch",
+        )
+        parser.add_argument(
+            "--poll-interval",
+            type=float,
+            default=1.0,
+            help="Seconds to wait before polling again when the outbox has no more due events",
+        )
+        parser.add_argument(
+            "--metrics-interval",
+            type=float,
+            default=60.0,
+            help="Seconds between two outbox lag metric log lines",
+        )
+        parser.add_argument(
+            "--drain",
+            action="store_true",
+            help="Exit once there are no more due events instead of polling",
+        )
+        parser.add_argument(
+            "--stats",
+            action="store_true",
+            help="Print the outbox lag metrics and exit",
+        )
+
+    def handle(self, *args, **options):
+        if options["stats"]:
+            metrics = OutboxRepository.get_lag_metrics()
+            self.stdout.write(
+                f"Pending: {metrics['pending']}, dead: {metrics['dead']}, "
+                f"oldest pending age: {metrics['oldest_pending_age_seconds']:.1f}s"
+            )
+            return
+
+        relay = SyncRelayService(batch_size=options["batch_size"])
+        signal.signal(signal.SIGTERM, lambda signum, frame: relay.stop())
+
+        self.stdout.write("Starting sync relay...")
+        try:
+            relay.run(
+                poll_interval=options["poll_interval"],
+                metrics_interval=options["metrics_interval"],
+                drain=options["drain"],
+            )
+        except KeyboardInterrupt:
+            relay.stop()
+        self.stdout.write(self.style.SUCCESS("Sync relay stopped"))
@@ -0,0 +1,58 @@
+import signal
+
+from django.core.management.base import BaseCommand
+from todo.repositories.sync_failure_repository import SyncFailureRepository
+from todo.services.sync_retry_service import SyncRetryService
+
+
+class Command(BaseCommand):
+    help = "Retry failed Postgres syncs stored in sync_failures with exponential backoff"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=50,
+            help="Number of failures to retry per batch",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=4,
+            help="Maximum number of failures retried concurrently",
+        )
+        parser.add_argument(
+            "--poll-interval",
+            type=float,
+            default=5.0,
+            help="Seconds to wait before polling again when no more failures are due",
+        )
+        parser.add_argument(
+            "--drain",
+            action="store_true",
+            help="Exit once there are no more due failures instead of polling",
+        )
+        parser.add_argument(
+            "--stats",
+            action="store_true",
+            help="Print the sync failure metrics and exit",
+        )
+
+    def handle(self, *args, **options):
+        if options["stats"]:
+            metrics = SyncFailureRepository.get_metrics()
+            self.stdout.write(
+                f"Pending: {metrics['pending']}, dead: {metrics['dead']}, "
+                f"by collection: {metrics['failures_by_collection']}"
+            )
+            return
+
+        retry_service = SyncRetryService(batch_size=options["batch_size"], workers=options["workers"])
+        signal.signal(signal.SIGTERM, lambda signum, frame: retry_service.stop())
+
+        self.stdout.write("Starting sync retry scheduler...")
+        try:
+            retry_service.run(poll_interval=options["poll_interval"], drain=options["drain"])
+        except KeyboardInterrupt:
+            retry_service.stop()
+        self.stdout.write(self.style.SUCCESS("Sync retry scheduler stopped"))
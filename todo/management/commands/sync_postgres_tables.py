@@ -1,31 +1,77 @@
 from django.core.management.base import BaseCommand
+from todo.services.dual_write_service import DualWriteService
 from todo.services.postgres_sync_service import PostgresSyncService
 
 
 class Command(BaseCommand):
-    help = "Synchronize labels and roles PostgreSQL tables with MongoDB data"
+    help = "Backfill PostgreSQL tables with the MongoDB documents they are missing"
 
     def add_arguments(self, parser):
         parser.add_argument(
             "--force",
             action="store_true",
-            help="Force sync even if tables already have data",
+            help="Backfill tables even if they already have as many rows as their collection",
+        )
+        parser.add_argument(
+            "--collections",
+            nargs="+",
+            choices=list(DualWriteService.COLLECTION_MODEL_MAP),
+            help="Only backfill these collections (default: all mapped collections)",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Number of documents read and inserted per batch",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=1,
+            help="Maximum number of collections backfilled concurrently",
+        )
+        parser.add_argument(
+            "--resume",
+            action="store_true",
+            help="Continue interrupted backfills after their last finished batch",
         )
 
     def handle(self, *args, **options):
-        self.stdout.write(self.style.SUCCESS("Starting PostgreSQL table synchronization for labels and roles..."))
+        self.stdout.write(self.style.SUCCESS("Starting PostgreSQL table synchronization..."))
 
         try:
-            postgres_sync_service = PostgresSyncService()
+            postgres_sync_service = PostgresSyncService(batch_size=options["batch_size"], workers=options["workers"])
 
             if options["force"]:
                 self.stdout.write("Force sync enabled - will sync all tables regardless of existing data")
 
-            success = postgres_sync_service.sync_all_tables()
-
-            if success:
-                self.stdout.write(self.style.SUCCESS("PostgreSQL table synchronization completed successfully!"))
-            else:
-                self.stdout.write(self.style.ERROR("Some PostgreSQL table synchronizations failed!"))
+            results = postgres_sync_service.backfill(
+                options["collections"], force=options["force"], resume=options["resume"]
+            )
         except Exception as e:
             self.stdout.write(self.style.ERROR(f"PostgreSQL table synchronization failed: {str(e)}"))
+            return
+
+        for result in results:
+            if result.up_to_date:
+                self.stdout.write(f"{result.collection}: already up to date, skipped")
+                continue
+
+            message = (
+                f"{result.collection}: scanned={result.scanned} inserted={result.inserted} "
+                f"existing={result.existing} failed={result.failed} rows/s={result.rows_per_second:.0f}"
+            )
+            if result.resumed_from:
+                message = f"{message} (resumed after {result.resumed_from})"
+
+            if result.error:
+                self.stdout.write(self.style.ERROR(f"{message} error: {result.error}"))
+            elif result.failed:
+                self.stdout.write(self.style.WARNING(message))
+            else:
+                self.stdout.write(self.style.SUCCESS(message))
+
+        if all(result.error is None and not result.failed for result in results):
+            self.stdout.write(self.style.SUCCESS("PostgreSQL table synchronization completed successfully!"))
+        else:
+            self.stdout.write(self.style.ERROR("Some PostgreSQL table synchronizations failed!"))
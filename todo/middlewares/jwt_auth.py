@@ -14,7 +14,11 @@ from todo.exceptions.auth_exceptions import (
 )
 from todo.constants.messages import AuthErrorMessages, ApiErrors
 from todo.dto.responses.error_response import ApiErrorResponse, ApiErrorDetail
+from todo.repositories.membership_version_repository import MembershipVersionRepository
 from todo.repositories.user_repository import UserRepository
+from todo.services.user_role_service import UserRoleService
+from todo.utils.team_claims import reset_request_team_roles, set_request_team_roles
+from todo.utils.token_cache import verified_token_cache
 
 
 class JWTAuthenticationMiddleware:
@@ -30,7 +34,13 @@ class JWTAuthenticationMiddleware:
         try:
             auth_success = self._try_authentication(request)
             if auth_success:
-                response = self.get_response(request)
+                team_roles_token = set_request_team_roles(
+                    getattr(request, "user_id", None), getattr(request, "team_roles", None)
+                )
+                try:
+                    response = self.get_response(request)
+                finally:
+                    reset_request_team_roles(team_roles_token)
                 return self._process_response(request, response)
             else:
                 error_response = ApiErrorResponse(
@@ -70,9 +80,18 @@ class JWTAuthenticationMiddleware:
         try:
             access_token = request.COOKIES.get(settings.COOKIE_SETTINGS.get("ACCESS_COOKIE_NAME"))
             if access_token:
+                cached = verified_token_cache.get(access_token)
+                if cached:
+                    payload, user_email = cached
+                    request.user_id = payload["user_id"]
+                    request.user_email = user_email
+                    self._set_team_roles(request, payload)
+                    return True
                 try:
                     payload = validate_access_token(access_token)
                     self._set_user_data(request, payload)
+                    verified_token_cache.put(access_token, payload, request.user_email)
+                    self._set_team_roles(request, payload)
                     return True
                 except (TokenExpiredError, TokenInvalidError):
                     pass
@@ -94,11 +113,13 @@ class JWTAuthenticationMiddleware:
 
             user_data = {
                 "user_id": payload["user_id"],
+                **UserRoleService.get_team_claims(payload["user_id"]),
             }
 
             new_access_token = generate_access_token(user_data)
 
             self._set_user_data(request, payload)
+            request.team_roles = user_data.get("teams")
 
             request._new_access_token = new_access_token
             request._access_token_expires = settings.JWT_CONFIG["ACCESS_TOKEN_LIFETIME"]
@@ -120,6 +141,28 @@ class JWTAuthenticationMiddleware:
         request.user_id = user_id
         request.user_email = user.email_id
 
+    def _set_team_roles(self, request, payload):
+        """
+        Trust the team claims of an access token while the membership version of the user is the one
+        they were built at. Stale claims are replaced by a new access token with current claims.
+        """
+        request.team_roles = None
+        if "teams" not in payload or "mv" not in payload or not MembershipVersionRepository.is_enabled():
+            return
+
+        try:
+            if MembershipVersionRepository.get_version(request.user_id) == payload["mv"]:
+                request.team_roles = payload["teams"]
+                return
+
+            user_data = {"user_id": request.user_id, **UserRoleService.get_team_claims(request.user_id)}
+            request._new_access_token = generate_access_token(user_data)
+            request._access_token_expires = settings.JWT_CONFIG["ACCESS_TOKEN_LIFETIME"]
+            request.team_roles = user_data.get("teams")
+        except Exception:
+            # Authorize the request from the database
+            request.team_roles = None
+
     def _process_response(self, request, response):
         """Process response and set new cookies if token was refreshed"""
         if hasattr(request, "_new_access_token"):
@@ -0,0 +1,26 @@
+from django.conf import settings
+
+from todo.repositories.common.request_loader import end_request_scope, get_saved_lookups, start_request_scope
+
+SAVED_LOOKUPS_HEADER = "X-DB-Lookups-Saved"
+
+
+class RequestLoaderMiddleware:
+    """
+    Scopes the request loaders of the repositories to each request, so that a model looked up by id
+    several times in a request is read once. In DEBUG, or with REQUEST_LOADER_DEBUG_HEADER, responses
+    report the lookups that were answered without reading the database.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        token = start_request_scope()
+        try:
+            response = self.get_response(request)
+            if settings.DEBUG or getattr(settings, "REQUEST_LOADER_DEBUG_HEADER", False):
+                response[SAVED_LOOKUPS_HEADER] = str(get_saved_lookups())
+        finally:
+            end_request_scope(token)
+        return response
@@ -1,11 +1,15 @@
 import logging
+from functools import cached_property
+from typing import Tuple
+
 from django.http import JsonResponse
-from django.urls import resolve
+from django.urls import resolve, reverse
 from rest_framework import status
 
 from todo.constants.messages import ApiErrors
 from todo.constants.role import RoleScope
 from todo.services.user_role_service import UserRoleService
+from todo.utils.team_claims import get_request_team_roles
 
 logger = logging.getLogger(__name__)
 
@@ -14,8 +18,13 @@ class TeamAccessMiddleware:
     """
     Middleware to handle team access control for specific routes.
     Only applies to routes that contain 'teams/<team_id>' pattern.
+
+    Paths that do not start like a protected route are passed through without resolving them.
     """
 
+    # Placeholder reversed into the protected routes to find the path prefix before the team id
+    _TEAM_ID_PLACEHOLDER = "__team_id__"
+
     def __init__(self, get_response):
         self.get_response = get_response
         self.protected_routes = [
@@ -23,7 +32,19 @@ class TeamAccessMiddleware:
             "team_activity_timeline",
         ]
 
+    @cached_property
+    def protected_path_prefixes(self) -> Tuple[str, ...]:
+        """Path prefixes of the protected routes, reversed once on first use when the URLconf is loaded."""
+        prefixes = set()
+        for route_name in self.protected_routes:
+            path = reverse(route_name, kwargs={"team_id": self._TEAM_ID_PLACEHOLDER})
+            prefixes.add(path[: path.index(self._TEAM_ID_PLACEHOLDER)])
+        return tuple(prefixes)
+
     def __call__(self, request):
+        if not request.path_info.startswith(self.protected_path_prefixes):
+            return self.get_response(request)
+
         resolved_url = resolve(request.path_info)
         route_name = resolved_url.url_name
 
@@ -36,9 +57,13 @@ class TeamAccessMiddleware:
 
                 user_id = getattr(request, "user_id", None)
 
-                user_team_roles = UserRoleService.get_user_roles(
-                    user_id=user_id, scope=RoleScope.TEAM.value, team_id=team_id
-                )
+                team_roles = get_request_team_roles(user_id)
+                if team_roles is not None:
+                    user_team_roles = team_roles.get(team_id)
+                else:
+                    user_team_roles = UserRoleService.get_user_roles(
+                        user_id=user_id, scope=RoleScope.TEAM.value, team_id=team_id
+                    )
 
                 if not user_team_roles:
                     return JsonResponse({"detail": ApiErrors.UNAUTHORIZED_TITLE}, status=status.HTTP_403_FORBIDDEN)
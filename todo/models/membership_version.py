@@ -0,0 +1,17 @@
+from datetime import datetime, timezone
+from typing import ClassVar
+from pydantic import Field
+from todo.models.common.document import Document
+
+
+class MembershipVersionModel(Document):
+    """
+    Version of the team memberships and team roles of a user, bumped by every write to them.
+    Access tokens carry the version their team claims were built from.
+    """
+
+    collection_name: ClassVar[str] = "membership_versions"
+
+    user_id: str
+    version: int = 0
+    updated_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
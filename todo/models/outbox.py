@@ -0,0 +1,28 @@
+from datetime import datetime, timezone
+from typing import Any, ClassVar, Dict, Literal
+from pydantic import Field
+from todo.models.common.document import Document
+
+OUTBOX_STATUS_PENDING = "pending"
+OUTBOX_STATUS_DEAD = "dead"
+
+
+class OutboxEventModel(Document):
+    """
+    A pending Postgres sync for a MongoDB write. Appended by the dual-write service
+    (in the writer's Mongo session when there is one) and drained by `manage.py run_sync_relay`.
+    """
+
+    collection_name: ClassVar[str] = "outbox"
+
+    target_collection: str
+    mongo_id: str
+    operation: Literal["create", "update", "delete"]
+    data: Dict[str, Any] = Field(default_factory=dict)
+    # "<target_collection>:<mongo_id>", events sharing a key are applied in insertion order
+    key: str
+    status: Literal["pending", "dead"] = OUTBOX_STATUS_PENDING
+    attempts: int = 0
+    last_error: str | None = None
+    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    next_attempt_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
@@ -0,0 +1,27 @@
+from datetime import datetime, timezone
+from typing import ClassVar, Dict, Literal
+from pydantic import Field
+from todo.models.common.document import Document
+
+SYNC_CHECKPOINT_STATUS_RUNNING = "running"
+SYNC_CHECKPOINT_STATUS_COMPLETED = "completed"
+
+
+class SyncCheckpointModel(Document):
+    """
+    Progress of a chunked pass of a Mongo-to-Postgres job over one collection, so that an
+    interrupted run can resume after the last chunk it finished.
+    """
+
+    collection_name: ClassVar[str] = "sync_checkpoints"
+
+    job: str
+    target_collection: str
+    # "<job>:<target_collection>", unique
+    key: str
+    # _id of the last document of the last finished chunk, None before the first chunk
+    last_id: str | None = None
+    status: Literal["running", "completed"] = SYNC_CHECKPOINT_STATUS_RUNNING
+    counters: Dict[str, int] = Field(default_factory=dict)
+    started_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    updated_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
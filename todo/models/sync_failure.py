@@ -0,0 +1,29 @@
+from datetime import datetime, timezone
+from typing import Any, ClassVar, Dict, Literal
+from pydantic import Field
+from todo.models.common.document import Document
+
+SYNC_FAILURE_STATUS_PENDING = "pending"
+SYNC_FAILURE_STATUS_DEAD = "dead"
+
+
+class SyncFailureModel(Document):
+    """
+    The latest failed Postgres sync of a document, with the payload to apply again.
+    Retried by `manage.py run_sync_retry` until it succeeds or is parked as dead.
+    """
+
+    collection_name: ClassVar[str] = "sync_failures"
+
+    target_collection: str
+    mongo_id: str
+    operation: Literal["create", "update", "delete"]
+    data: Dict[str, Any] = Field(default_factory=dict)
+    # "<target_collection>:<mongo_id>", unique: a newer failure replaces the payload of an older one
+    key: str
+    status: Literal["pending", "dead"] = SYNC_FAILURE_STATUS_PENDING
+    attempts: int = 0
+    last_error: str | None = None
+    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    failed_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    next_attempt_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
@@ -1,5 +1,5 @@
-from pydantic import BaseModel, Field, ConfigDict
-from typing import ClassVar, List
+from pydantic import BaseModel, Field, ConfigDict, validator
+from typing import ClassVar, List, Literal
 from datetime import datetime
 
 from todo.constants.task import TaskPriority, TaskStatus
@@ -20,6 +20,24 @@ class DeferredDetailsModel(BaseModel):
         from_attributes = True
 
 
+class TaskAssigneeModel(BaseModel):
+    """
+    Snapshot of the active assignment of a task, stored on the task so that reads do not join task_details.
+    Kept up to date by TaskAssignmentRepository.
+    """
+
+    assignment_id: str
+    id: str  # Id of the user or team
+    type: Literal["user", "team"]
+    name: str | None = None
+    team_id: str | None = None
+    executor_id: str | None = None
+    created_by: str
+    updated_by: str | None = None
+    created_at: datetime
+    updated_at: datetime | None = None
+
+
 class TaskModel(Document):
     collection_name: ClassVar[str] = "tasks"
 
@@ -29,15 +47,25 @@ class TaskModel(Document):
     description: str | None = None
     priority: TaskPriority | None = TaskPriority.LOW
     status: TaskStatus | None = TaskStatus.TODO
+    # DEFERRED while deferredDetails.deferredTill is ahead, otherwise status; stored so that status filters use an index
+    effectiveStatus: TaskStatus | None = None
     isAcknowledged: bool = False
     labels: List[PyObjectId] | None = []
     isDeleted: bool = False
     deferredDetails: DeferredDetailsModel | None = None
+    assignee: TaskAssigneeModel | None = None
     startedAt: datetime | None = None
     dueAt: datetime | None = None
     createdAt: datetime
     updatedAt: datetime | None = None
+    # updatedAt, or createdAt for a task never updated; stored so that sorting by activity uses an index
+    lastActivity: datetime | None = None
     createdBy: str
     updatedBy: str | None = None
 
     model_config = ConfigDict(ser_enum="value")
+
+    @validator("assignee", pre=True)
+    def ignore_legacy_assignee(cls, v):
+        # Tasks written before the assignee moved to task_details store the assignee id here
+        return v if v is None or isinstance(v, (dict, TaskAssigneeModel)) else None
@@ -0,0 +1,20 @@
+from datetime import datetime, timezone
+from typing import ClassVar, Literal
+from pydantic import Field
+from todo.models.common.document import Document
+from todo.models.common.pyobjectid import PyObjectId
+
+
+class TaskVisibilityModel(Document):
+    """
+    Materialized (user, task) pair for a task the user can see because it is assigned
+    to them directly or to a team they are the POC of. Derived from task_details,
+    teams and user_team_details; rebuilt with `manage.py rebuild_task_visibility`.
+    """
+
+    collection_name: ClassVar[str] = "task_visibility"
+
+    user_id: str
+    task_id: PyObjectId
+    via: Literal["assignee", "team_poc"]
+    updated_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
@@ -1,22 +1,121 @@
+from typing import Optional, Tuple
+from bson import ObjectId
+from django.conf import settings
 from todo.models.audit_log import AuditLogModel
 from todo.repositories.common.mongo_repository import MongoRepository
+from todo.repositories.common.write_buffer import WriteBuffer
 from datetime import datetime, timezone
+from pymongo import ASCENDING, DESCENDING, IndexModel
+from pymongo.errors import BulkWriteError
 from todo.services.enhanced_dual_write_service import EnhancedDualWriteService
 
+DUPLICATE_KEY_ERROR = 11000
+
+# Position of an entry in a team timeline: its timestamp and, to order entries of the same timestamp, its ID
+TimelinePosition = Tuple[datetime, Optional[ObjectId]]
+
+# Fields of the audit logs shown in a team timeline
+TIMELINE_FIELDS = [
+    "task_id",
+    "team_id",
+    "previous_executor_id",
+    "new_executor_id",
+    "spoc_id",
+    "action",
+    "timestamp",
+    "status_from",
+    "status_to",
+    "performed_by",
+]
+
 
 class AuditLogRepository(MongoRepository):
     collection_name = AuditLogModel.collection_name
+    indexes = [
+        # Serves the pages of team timelines, which are ordered by timestamp and then ID
+        IndexModel(
+            [("team_id", ASCENDING), ("timestamp", DESCENDING), ("_id", DESCENDING)], name="team_id_timestamp_id"
+        ),
+    ]
+    # Written in batches off the request threads; timelines can be up to AUDIT_LOG_FLUSH_INTERVAL behind
+    write_buffer: WriteBuffer[AuditLogModel] = WriteBuffer(
+        "audit_logs",
+        lambda audit_logs: AuditLogRepository._write_many(audit_logs),
+        max_size=getattr(settings, "AUDIT_LOG_BUFFER_SIZE", 100),
+        interval=getattr(settings, "AUDIT_LOG_FLUSH_INTERVAL", 1.0),
+        enabled=getattr(settings, "AUDIT_LOG_BUFFER_ENABLED", True),
+        max_retries=getattr(settings, "AUDIT_LOG_WRITE_RETRIES", 3),
+    )
 
     @classmethod
     def create(cls, audit_log: AuditLogModel) -> AuditLogModel:
-        collection = cls.get_collection()
-        audit_log.timestamp = datetime.now(timezone.utc)
-        audit_log_dict = audit_log.model_dump(mode="json", by_alias=True, exclude_none=True)
-        insert_result = collection.insert_one(audit_log_dict)
-        audit_log.id = insert_result.inserted_id
+        return cls.create_many([audit_log])[0]
+
+    @classmethod
+    def create_many(cls, audit_logs: list[AuditLogModel]) -> list[AuditLogModel]:
+        """
+        Creates audit logs. They are written by the write buffer of the audit logs, with the IDs set here.
+        """
+        if not audit_logs:
+            return []
+
+        timestamp = datetime.now(timezone.utc)
+        for audit_log in audit_logs:
+            audit_log.timestamp = timestamp
+            audit_log.id = ObjectId()
+
+        cls.write_buffer.add_many(audit_logs)
+        return audit_logs
+
+    @classmethod
+    def flush(cls) -> None:
+        """Write the buffered audit logs now, in the calling thread."""
+        cls.write_buffer.flush()
+
+    @classmethod
+    def _write_many(cls, audit_logs: list[AuditLogModel]) -> None:
+        """
+        Writes audit logs with one insert and syncs them to Postgres in one batch.
+        """
+        audit_log_dicts = []
+        for audit_log in audit_logs:
+            audit_log_dict = audit_log.model_dump(mode="json", by_alias=True, exclude_none=True, exclude={"id"})
+            audit_log_dict["_id"] = audit_log.id
+            # Stored as a date, not as the JSON string of model_dump, so that timelines order and page by it
+            audit_log_dict["timestamp"] = audit_log.timestamp
+            audit_log_dicts.append(audit_log_dict)
+        try:
+            cls.get_collection().insert_many(audit_log_dicts, ordered=False)
+        except BulkWriteError as e:
+            # A retried batch may have been partly inserted already; only other errors fail the write
+            write_errors = e.details.get("writeErrors", [])
+            if e.details.get("writeConcernErrors") or any(
+                error.get("code") != DUPLICATE_KEY_ERROR for error in write_errors
+            ):
+                raise
 
         dual_write_service = EnhancedDualWriteService()
-        audit_log_data = {
+        dual_write_success = dual_write_service.batch_operations(
+            [
+                {
+                    "collection_name": "audit_logs",
+                    "operation": "create",
+                    "mongo_id": str(audit_log.id),
+                    "data": cls._get_postgres_data(audit_log),
+                }
+                for audit_log in audit_logs
+            ]
+        )
+
+        if not dual_write_success:
+            import logging
+
+            logger = logging.getLogger(__name__)
+            logger.warning(f"Failed to sync {len(audit_logs)} audit logs to Postgres")
+
+    @classmethod
+    def _get_postgres_data(cls, audit_log: AuditLogModel) -> dict:
+        return {
             "task_id": str(audit_log.task_id) if audit_log.task_id else None,
             "team_id": str(audit_log.team_id) if audit_log.team_id else None,
             "previous_executor_id": str(audit_log.previous_executor_id) if audit_log.previous_executor_id else None,
@@ -31,20 +130,45 @@ class AuditLogRepository(MongoRepository):
             "performed_by": str(audit_log.performed_by) if audit_log.performed_by else None,
         }
 
-        dual_write_success = dual_write_service.create_document(
-            collection_name="audit_logs", data=audit_log_data, mongo_id=str(audit_log.id)
-        )
-
-        if not dual_write_success:
-            import logging
-
-            logger = logging.getLogger(__name__)
-            logger.warning(f"Failed to sync audit log {audit_log.id} to Postgres")
+    @classmethod
+    def get_team_timeline(
+        cls,
+        team_id: str,
+        limit: int,
+        before: TimelinePosition | None = None,
+        since: TimelinePosition | None = None,
+    ) -> list[AuditLogModel]:
+        """
+        Get a page of the audit logs of a team, newest first, reading only the fields of the timeline.
 
-        return audit_log
+        Args:
+            before: Only logs older than this position, for the next page of the timeline
+            since: Only logs newer than this position, for polling. These are the oldest limit
+                logs after the position, so that polling again from the newest of them misses none.
+        """
+        query = {"team_id": team_id}
+        position = before or since
+        if position:
+            operator = "$lt" if before else "$gt"
+            timestamp, entry_id = position
+            if timestamp.tzinfo is None:
+                timestamp = timestamp.replace(tzinfo=timezone.utc)
+            if entry_id:
+                query["$or"] = [
+                    {"timestamp": {operator: timestamp}},
+                    {"timestamp": timestamp, "_id": {operator: entry_id}},
+                ]
+            else:
+                query["timestamp"] = {operator: timestamp}
 
-    @classmethod
-    def get_by_team_id(cls, team_id: str) -> list[AuditLogModel]:
-        collection = cls.get_collection()
-        logs = collection.find({"team_id": team_id}).sort("timestamp", -1)
-        return [AuditLogModel(**log) for log in logs]
+        direction = ASCENDING if since else DESCENDING
+        logs = (
+            cls.get_collection()
+            .find(query, {field: 1 for field in TIMELINE_FIELDS})
+            .sort([("timestamp", direction), ("_id", direction)])
+            .limit(limit)
+        )
+        timeline = [AuditLogModel(**log) for log in logs]
+        if since:
+            timeline.reverse()
+        return timeline
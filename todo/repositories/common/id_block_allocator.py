@@ -0,0 +1,64 @@
+import threading
+from typing import List
+
+from django.conf import settings
+from pymongo import ReturnDocument
+from pymongo.collection import Collection
+
+
+class IdBlockAllocator:
+    """
+    Hands out increasing ids from a counter document in the counters collection, reserving
+    block_size ids at a time so that the counter document is written once per block instead of
+    once per id. Every process reserves its own blocks: ids are unique but not allocated in order
+    across processes, and the ids left in the block of a process that exits are never used.
+    """
+
+    def __init__(self, counter_name: str, block_size: int | None = None):
+        """
+        Args:
+            block_size: Ids reserved at a time, TASK_DISPLAY_ID_BLOCK_SIZE by default
+        """
+        self.counter_name = counter_name
+        self.block_size = block_size
+        # Empty until the first id reserves a block
+        self._next_id = 1
+        self._block_end = 0
+        self._lock = threading.Lock()
+
+    def _reserve(self, counters_collection: Collection, count: int) -> int:
+        """
+        Reserve the next count ids of the counter.
+
+        Returns:
+            int: Last id reserved
+        """
+        counter = counters_collection.find_one_and_update(
+            {"_id": self.counter_name},
+            {"$inc": {"seq": count}},
+            upsert=True,
+            return_document=ReturnDocument.AFTER,
+        )
+        return counter["seq"]
+
+    def next_id(self, counters_collection: Collection) -> int:
+        return self.next_ids(counters_collection, 1)[0]
+
+    def next_ids(self, counters_collection: Collection, count: int) -> List[int]:
+        """
+        Get count ids, from the current block when it has enough left, otherwise from a new block.
+        More ids than a block holds are reserved with a single increment of their own.
+        """
+        with self._lock:
+            if self._block_end - self._next_id + 1 < count:
+                block_size = max(1, self.block_size or getattr(settings, "TASK_DISPLAY_ID_BLOCK_SIZE", 20))
+                if count > block_size:
+                    last_id = self._reserve(counters_collection, count)
+                    return list(range(last_id - count + 1, last_id + 1))
+
+                self._block_end = self._reserve(counters_collection, block_size)
+                self._next_id = self._block_end - block_size + 1
+
+            allocated_ids = list(range(self._next_id, self._next_id + count))
+            self._next_id += count
+            return allocated_ids
@@ -0,0 +1,189 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Generic, Iterable, List, TypeVar
+
+from django.conf import settings
+
+T = TypeVar("T")
+
+# Cached value of an id that has no document
+_MISSING = object()
+
+
+def _copy_model(model):
+    return model.model_copy()
+
+
+class ModelCache(Generic[T]):
+    """
+    Bounded LRU cache of models by id, with a TTL, shared by the threads of a process.
+
+    Ids without a document are cached too, for negative_ttl seconds. Every process has its own
+    cache: writes invalidate the cache of the process that made them, and the TTL bounds how
+    stale the other processes can be.
+    """
+
+    _registry: List["ModelCache"] = []
+
+    def __init__(
+        self,
+        name: str,
+        max_size: int | None = None,
+        ttl: float | None = None,
+        negative_ttl: float | None = None,
+        enabled: bool | None = None,
+        copy: Callable[[T], T] | None = None,
+    ):
+        """
+        Args:
+            copy: Copies a cached value for a caller, model_copy() by default
+        """
+        self.name = name
+        self.max_size = max_size or getattr(settings, "MODEL_CACHE_MAX_SIZE", 10000)
+        self.ttl = ttl if ttl is not None else getattr(settings, "MODEL_CACHE_TTL", 60)
+        self.negative_ttl = (
+            negative_ttl if negative_ttl is not None else getattr(settings, "MODEL_CACHE_NEGATIVE_TTL", 10)
+        )
+        self.enabled = enabled if enabled is not None else getattr(settings, "MODEL_CACHE_ENABLED", True)
+        self._copy = copy or _copy_model
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._negative_hits = 0
+        self._misses = 0
+        self._evictions = 0
+        # Bumped by every write, so that a load that raced with a write does not cache stale data
+        self._generation = 0
+        ModelCache._registry.append(self)
+
+    def _lookup(self, key: str, now: float) -> Any:
+        """Return the cached value, _MISSING for a cached unknown id, or None. Must hold the lock."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= now:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def _store(self, key: str, value: Any, now: float) -> None:
+        """Must hold the lock."""
+        ttl = self.negative_ttl if value is _MISSING else self.ttl
+        self._entries[key] = (now + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self._evictions += 1
+
+    def get(self, key: str, loader: Callable[[str], T | None]) -> T | None:
+        """
+        Get the model of an id, loading it with loader(key) on a miss.
+        """
+        if not self.enabled:
+            return loader(key)
+
+        with self._lock:
+            value = self._lookup(key, time.monotonic())
+            if value is _MISSING:
+                self._negative_hits += 1
+                return None
+            if value is not None:
+                self._hits += 1
+                return self._copy(value)
+            self._misses += 1
+            generation = self._generation
+
+        model = loader(key)
+        with self._lock:
+            if generation == self._generation:
+                self._store(key, _MISSING if model is None else model, time.monotonic())
+        return self._copy(model) if model is not None else None
+
+    def get_many(self, keys: Iterable[str], loader: Callable[[List[str]], Dict[str, T]]) -> Dict[str, T]:
+        """
+        Get the models of several ids, loading all the misses with one loader(keys) call.
+
+        Args:
+            loader: Returns the models of the ids that have a document, by id
+
+        Returns:
+            Dict[str, T]: Models of the ids that have a document, in the order of keys
+        """
+        keys = list(dict.fromkeys(keys))
+        if not self.enabled:
+            loaded = loader(keys) if keys else {}
+            return {key: loaded[key] for key in keys if key in loaded}
+
+        found = {}
+        missing = []
+        with self._lock:
+            now = time.monotonic()
+            for key in keys:
+                value = self._lookup(key, now)
+                if value is _MISSING:
+                    self._negative_hits += 1
+                elif value is not None:
+                    self._hits += 1
+                    found[key] = self._copy(value)
+                else:
+                    self._misses += 1
+                    missing.append(key)
+            generation = self._generation
+
+        if missing:
+            loaded = loader(missing)
+            with self._lock:
+                now = time.monotonic()
+                for key in missing:
+                    model = loaded.get(key)
+                    if generation == self._generation:
+                        self._store(key, _MISSING if model is None else model, now)
+                    if model is not None:
+                        found[key] = self._copy(model)
+
+        return {key: found[key] for key in keys if key in found}
+
+    def put(self, key: str, model: T) -> None:
+        """Cache the model written for an id."""
+        if not self.enabled:
+            return
+        with self._lock:
+            self._generation += 1
+            self._store(key, self._copy(model), time.monotonic())
+
+    def invalidate(self, key: str) -> None:
+        with self._lock:
+            self._generation += 1
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self._hits + self._negative_hits + self._misses
+            return {
+                "name": self.name,
+                "size": len(self._entries),
+                "hits": self._hits,
+                "negative_hits": self._negative_hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "hit_rate": (self._hits + self._negative_hits) / lookups if lookups else 0.0,
+            }
+
+    @classmethod
+    def get_all_stats(cls) -> List[Dict[str, Any]]:
+        """Statistics of every model cache of this process."""
+        return [cache.stats() for cache in cls._registry]
+
+    @classmethod
+    def clear_all(cls) -> None:
+        """Empty every model cache of this process."""
+        for cache in cls._registry:
+            cache.clear()
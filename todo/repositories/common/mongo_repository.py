@@ -1,4 +1,7 @@
 from abc import ABC
+from typing import List
+
+from pymongo import IndexModel
 
 from todo_project.db.config import DatabaseManager
 
@@ -7,11 +10,16 @@ class MongoRepository(ABC):
     collection = None
     collection_name = None
     database_manager = DatabaseManager()
+    indexes: List[IndexModel] = []
+
+    _index_registry: List[type["MongoRepository"]] = []
 
     def __init_subclass__(cls, **kwargs):
         super().__init_subclass__(**kwargs)
         if not hasattr(cls, "collection_name") or not isinstance(cls.collection_name, str):
             raise TypeError(f"Class {cls.__name__} must define a static `collection_name` field as a string.")
+        if "indexes" in cls.__dict__ and cls.indexes:
+            MongoRepository._index_registry.append(cls)
 
     @classmethod
     def get_collection(cls):
@@ -26,3 +34,10 @@ class MongoRepository(ABC):
     @classmethod
     def get_database(cls):
         return cls.database_manager.get_database()
+
+    @classmethod
+    def get_indexed_repositories(cls) -> List[type["MongoRepository"]]:
+        """
+        Get all repositories that declare indexes.
+        """
+        return list(MongoRepository._index_registry)
@@ -0,0 +1,118 @@
+from contextvars import ContextVar, Token
+from typing import Any, Callable, Dict, Generic, Iterable, List, TypeVar
+
+from django.conf import settings
+
+T = TypeVar("T")
+
+# Loaded id that has no document
+_MISSING = object()
+
+
+class _RequestScope:
+    """Models loaded during one request, by loader name and id."""
+
+    def __init__(self):
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        # Ids answered from entries instead of the database
+        self.saved_lookups = 0
+
+
+_request_scope: ContextVar[_RequestScope | None] = ContextVar("request_loader_scope", default=None)
+
+
+def start_request_scope() -> Token:
+    """Start remembering the models loaded by id, until end_request_scope."""
+    return _request_scope.set(_RequestScope() if getattr(settings, "REQUEST_LOADER_ENABLED", True) else None)
+
+
+def end_request_scope(token: Token) -> None:
+    _request_scope.reset(token)
+
+
+def get_saved_lookups() -> int:
+    """Number of ids of the current request answered without reading the database."""
+    scope = _request_scope.get()
+    return scope.saved_lookups if scope else 0
+
+
+def _copy_model(model):
+    return model.model_copy()
+
+
+class RequestLoader(Generic[T]):
+    """
+    Identity map of the models loaded by id during the current request, so that layers that look up
+    the same user, team or task again do not read it again. get_many loads all the ids that were not
+    loaded yet with one loader call.
+
+    Outside a request scope (management commands, background threads) every lookup goes to the loader.
+    Writes must invalidate the ids they change, or clear the loader when they change documents by query.
+    """
+
+    def __init__(self, name: str, copy: Callable[[T], T] | None = None):
+        """
+        Args:
+            copy: Copies a loaded value for a caller, model_copy() by default
+        """
+        self.name = name
+        self._copy = copy or _copy_model
+
+    def _entries(self) -> Dict[str, Any] | None:
+        scope = _request_scope.get()
+        if scope is None:
+            return None
+        return scope.entries.setdefault(self.name, {})
+
+    def get(self, key: str, loader: Callable[[str], T | None]) -> T | None:
+        """
+        Get the model of an id, loading it with loader(key) the first time it is looked up in the request.
+        """
+        entries = self._entries()
+        if entries is None:
+            return loader(key)
+
+        if key in entries:
+            _request_scope.get().saved_lookups += 1
+            value = entries[key]
+            return None if value is _MISSING else self._copy(value)
+
+        model = loader(key)
+        entries[key] = _MISSING if model is None else self._copy(model)
+        return model
+
+    def get_many(self, keys: Iterable[str], loader: Callable[[List[str]], Dict[str, T]]) -> Dict[str, T]:
+        """
+        Get the models of several ids, loading the ones not loaded yet in the request with one loader(keys) call.
+
+        Args:
+            loader: Returns the models of the ids that have a document, by id
+
+        Returns:
+            Dict[str, T]: Models of the ids that have a document, in the order of keys
+        """
+        keys = list(dict.fromkeys(keys))
+        entries = self._entries()
+        if entries is None:
+            loaded = loader(keys) if keys else {}
+            return {key: loaded[key] for key in keys if key in loaded}
+
+        missing = [key for key in keys if key not in entries]
+        _request_scope.get().saved_lookups += len(keys) - len(missing)
+        if missing:
+            loaded = loader(missing)
+            for key in missing:
+                model = loaded.get(key)
+                entries[key] = _MISSING if model is None else self._copy(model)
+
+        return {key: self._copy(entries[key]) for key in keys if entries[key] is not _MISSING}
+
+    def invalidate(self, key: str) -> None:
+        entries = self._entries()
+        if entries is not None:
+            entries.pop(key, None)
+
+    def clear(self) -> None:
+        entries = self._entries()
+        if entries is not None:
+            entries.clear()
@@ -0,0 +1,139 @@
+import atexit
+import logging
+import os
+import threading
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Generic, Iterable, List, Tuple, TypeVar
+
+from django.db import close_old_connections
+
+T = TypeVar("T")
+
+logger = logging.getLogger(__name__)
+
+
+class WriteBuffer(Generic[T]):
+    """
+    Buffers writes in memory and hands them to writer in batches from a background thread, every
+    interval seconds or as soon as max_size writes are waiting. Whatever is left is written when the
+    process exits.
+
+    Disabled, every write is handed to writer immediately by the caller, which gets any error it raises.
+
+    A batch whose writer raises is written again before the newer writes at the next flush, up to
+    max_retries times, and then dropped so that a failing database does not grow the buffer without
+    bound. Dropped batches are logged, counted in stats() and the latest of them kept in dropped.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        writer: Callable[[List[T]], None],
+        max_size: int = 100,
+        interval: float = 1.0,
+        enabled: bool = True,
+        max_retries: int = 3,
+        max_dropped: int = 10,
+    ):
+        self.name = name
+        self.writer = writer
+        self.max_size = max(1, max_size)
+        self.interval = interval
+        self.enabled = enabled
+        self.max_retries = max(0, max_retries)
+        # Latest batches dropped after max_retries failed writes
+        self.dropped: Deque[List[T]] = deque(maxlen=max_dropped)
+        self._items: List[T] = []
+        # Batches whose write failed, with their number of failed writes
+        self._retries: List[Tuple[List[T], int]] = []
+        self._written_count = 0
+        self._failed_write_count = 0
+        self._dropped_count = 0
+        self._lock = threading.Lock()
+        # Only one batch is written at a time, so that batches are written in the order they were added
+        self._write_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._pid: int | None = None
+        self._exit_handler_registered = False
+
+    def add(self, item: T) -> None:
+        self.add_many([item])
+
+    def add_many(self, items: Iterable[T]) -> None:
+        items = list(items)
+        if not items:
+            return
+        if not self.enabled:
+            self.writer(items)
+            return
+
+        with self._lock:
+            self._ensure_thread()
+            self._items.extend(items)
+            if len(self._items) >= self.max_size:
+                self._wake.set()
+
+    def flush(self) -> None:
+        """Write everything buffered, in the calling thread. Batches that fail are kept for the next flush."""
+        with self._write_lock:
+            with self._lock:
+                retries, self._retries = self._retries, []
+                items, self._items = self._items, []
+            for batch, failure_count in retries:
+                self._write(batch, failure_count)
+            for start in range(0, len(items), self.max_size):
+                self._write(items[start : start + self.max_size])
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "name": self.name,
+                "pending": len(self._items),
+                "retrying": sum(len(batch) for batch, _ in self._retries),
+                "written": self._written_count,
+                "failed_writes": self._failed_write_count,
+                "dropped": self._dropped_count,
+            }
+
+    def _ensure_thread(self) -> None:
+        # A forked worker does not inherit the thread of its parent
+        if self._thread is not None and self._pid == os.getpid() and self._thread.is_alive():
+            return
+        self._pid = os.getpid()
+        self._thread = threading.Thread(target=self._run, name=f"{self.name}-writer", daemon=True)
+        self._thread.start()
+        if not self._exit_handler_registered:
+            atexit.register(self.flush)
+            self._exit_handler_registered = True
+
+    def _run(self) -> None:
+        while True:
+            self._wake.wait(self.interval)
+            self._wake.clear()
+            self.flush()
+            close_old_connections()
+
+    def _write(self, items: List[T], failure_count: int = 0) -> None:
+        try:
+            self.writer(items)
+        except Exception as e:
+            failure_count += 1
+            with self._lock:
+                self._failed_write_count += 1
+                if failure_count <= self.max_retries:
+                    self._retries.append((items, failure_count))
+                else:
+                    self._dropped_count += len(items)
+                    self.dropped.append(items)
+            if failure_count <= self.max_retries:
+                logger.warning(
+                    f"Failed to write {len(items)} buffered {self.name} "
+                    f"(attempt {failure_count} of {self.max_retries + 1}), retrying: {str(e)}"
+                )
+            else:
+                logger.error(f"Dropped {len(items)} buffered {self.name} after {failure_count} failed writes: {str(e)}")
+            return
+
+        with self._lock:
+            self._written_count += len(items)
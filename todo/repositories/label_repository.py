@@ -1,21 +1,27 @@
-from typing import List, Tuple
+from typing import Dict, List, Tuple
 from bson import ObjectId
 import re
 
 from todo.models.label import LabelModel
 from todo.repositories.common.mongo_repository import MongoRepository
+from todo.repositories.common.request_loader import RequestLoader
 
 
 class LabelRepository(MongoRepository):
     collection_name = LabelModel.collection_name
+    request_loader: RequestLoader[LabelModel] = RequestLoader("labels")
 
     @classmethod
     def list_by_ids(cls, ids: List[ObjectId]) -> List[LabelModel]:
         if len(ids) == 0:
             return []
+        return list(cls.request_loader.get_many([str(label_id) for label_id in ids], cls._find_by_ids).values())
+
+    @classmethod
+    def _find_by_ids(cls, ids: List[str]) -> Dict[str, LabelModel]:
         labels_collection = cls.get_collection()
-        labels_cursor = labels_collection.find({"_id": {"$in": ids}})
-        return [LabelModel(**label) for label in labels_cursor]
+        labels_cursor = labels_collection.find({"_id": {"$in": [ObjectId(label_id) for label_id in ids]}})
+        return {str(label["_id"]): LabelModel(**label) for label in labels_cursor}
 
     @classmethod
     def get_all(cls, page, limit, search) -> Tuple[int, List[LabelModel]]:
@@ -0,0 +1,59 @@
+import logging
+from datetime import datetime, timezone
+from typing import Iterable
+
+from django.conf import settings
+from pymongo import ASCENDING, IndexModel, UpdateOne
+
+from todo.models.membership_version import MembershipVersionModel
+from todo.repositories.common.mongo_repository import MongoRepository
+
+logger = logging.getLogger(__name__)
+
+
+class MembershipVersionRepository(MongoRepository):
+    """
+    Per-user membership versions, which revoke the team claims of access tokens issued before a
+    membership or team role write.
+    """
+
+    collection_name = MembershipVersionModel.collection_name
+    indexes = [
+        IndexModel([("user_id", ASCENDING)], name="user_id", unique=True),
+    ]
+
+    @classmethod
+    def is_enabled(cls) -> bool:
+        return getattr(settings, "JWT_TEAM_CLAIMS_ENABLED", True)
+
+    @classmethod
+    def get_version(cls, user_id: str) -> int:
+        document = cls.get_collection().find_one({"user_id": str(user_id)}, {"version": 1})
+        return document["version"] if document else 0
+
+    @classmethod
+    def bump(cls, user_ids: Iterable[str]) -> None:
+        """
+        Bump the membership version of users, with one bulk write. Called last by membership and team
+        role writes, which fail with its error: without the bump, the team claims of the users would
+        stay valid until their access tokens expire.
+        """
+        if not cls.is_enabled():
+            return
+
+        user_ids = {str(user_id) for user_id in user_ids}
+        if not user_ids:
+            return
+
+        now = datetime.now(timezone.utc)
+        try:
+            cls.get_collection().bulk_write(
+                [
+                    UpdateOne({"user_id": user_id}, {"$inc": {"version": 1}, "$set": {"updated_at": now}}, upsert=True)
+                    for user_id in sorted(user_ids)
+                ],
+                ordered=False,
+            )
+        except Exception as e:
+            logger.error(f"Failed to bump membership version of users {', '.join(sorted(user_ids))}: {str(e)}")
+            raise
@@ -0,0 +1,147 @@
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Tuple
+
+from bson import ObjectId
+from pymongo import ASCENDING, IndexModel, UpdateOne
+
+from todo.models.outbox import OUTBOX_STATUS_DEAD, OUTBOX_STATUS_PENDING, OutboxEventModel
+from todo.repositories.common.mongo_repository import MongoRepository
+from todo.utils.bson_utils import to_bson_value
+from todo.utils.retry_utils import get_retry_backoff
+
+
+class OutboxRepository(MongoRepository):
+    """
+    Queue of Postgres sync events. Writers append events next to their Mongo write, in the same
+    session when they run in a transaction, and the sync relay drains them in insertion order.
+    """
+
+    collection_name = OutboxEventModel.collection_name
+    indexes = [
+        IndexModel([("status", ASCENDING), ("created_at", ASCENDING), ("_id", ASCENDING)], name="status_created_at"),
+        IndexModel([("status", ASCENDING), ("next_attempt_at", ASCENDING)], name="status_next_attempt_at"),
+    ]
+
+    @classmethod
+    def enqueue(
+        cls, target_collection: str, operation: str, mongo_id: str, data: Dict[str, Any], session=None
+    ) -> ObjectId:
+        return cls.enqueue_many(
+            [{"collection_name": target_collection, "operation": operation, "mongo_id": mongo_id, "data": data}],
+            session=session,
+        )[0]
+
+    @classmethod
+    def enqueue_many(cls, operations: List[Dict[str, Any]], session=None) -> List[ObjectId]:
+        """
+        Append sync events. Takes operations in the dual-write batch format:
+        {"collection_name", "operation", "mongo_id", "data"}.
+
+        Args:
+            operations: Operations to enqueue, in the order they must be applied
+            session: Mongo session of the calling write, so the events commit with it
+
+        Returns:
+            List[ObjectId]: Ids of the inserted events
+        """
+        if not operations:
+            return []
+
+        now = datetime.now(timezone.utc)
+        events = []
+        for operation in operations:
+            mongo_id = str(operation["mongo_id"])
+            event = OutboxEventModel(
+                target_collection=operation["collection_name"],
+                mongo_id=mongo_id,
+                operation=operation["operation"],
+                data=to_bson_value(operation.get("data") or {}),
+                key=f"{operation['collection_name']}:{mongo_id}",
+                created_at=now,
+                next_attempt_at=now,
+            )
+            events.append(event.model_dump(by_alias=True, exclude_none=True))
+
+        result = cls.get_collection().insert_many(events, ordered=True, session=session)
+        return result.inserted_ids
+
+    @classmethod
+    def get_ready_events(cls, limit: int, now: datetime | None = None) -> List[Dict[str, Any]]:
+        """
+        Get the oldest pending events that are due. Documents with an event waiting for a retry
+        are left out entirely so that their later events are not applied ahead of it.
+        """
+        now = now or datetime.now(timezone.utc)
+        collection = cls.get_collection()
+
+        blocked_keys = collection.distinct("key", {"status": OUTBOX_STATUS_PENDING, "next_attempt_at": {"$gt": now}})
+        query = {"status": OUTBOX_STATUS_PENDING, "next_attempt_at": {"$lte": now}}
+        if blocked_keys:
+            query["key"] = {"$nin": blocked_keys}
+
+        return list(collection.find(query).sort([("created_at", ASCENDING), ("_id", ASCENDING)]).limit(limit))
+
+    @classmethod
+    def mark_synced(cls, event_ids: List[ObjectId]) -> int:
+        if not event_ids:
+            return 0
+        return cls.get_collection().delete_many({"_id": {"$in": event_ids}}).deleted_count
+
+    @classmethod
+    def mark_failed(
+        cls,
+        failures: List[Tuple[Dict[str, Any], str]],
+        max_attempts: int,
+        retry_delay: int,
+        now: datetime | None = None,
+    ) -> int:
+        """
+        Schedule failed events for a retry with exponential backoff, or park them as dead once
+        they have used max_attempts.
+
+        Args:
+            failures: (event, error message) pairs
+            max_attempts: Number of attempts after which an event is parked
+            retry_delay: Delay before the first retry, in seconds
+
+        Returns:
+            int: Number of events parked as dead
+        """
+        if not failures:
+            return 0
+
+        now = now or datetime.now(timezone.utc)
+        operations = []
+        dead_count = 0
+        for event, error in failures:
+            attempts = event.get("attempts", 0) + 1
+            update = {"attempts": attempts, "last_error": error}
+            if attempts >= max_attempts:
+                update["status"] = OUTBOX_STATUS_DEAD
+                dead_count += 1
+            else:
+                update["next_attempt_at"] = now + get_retry_backoff(attempts, retry_delay)
+            operations.append(UpdateOne({"_id": event["_id"]}, {"$set": update}))
+
+        cls.get_collection().bulk_write(operations, ordered=False)
+        return dead_count
+
+    @classmethod
+    def get_lag_metrics(cls, now: datetime | None = None) -> Dict[str, Any]:
+        """
+        Returns:
+            Dict: pending and dead event counts, and the age in seconds of the oldest pending event
+        """
+        now = now or datetime.now(timezone.utc)
+        collection = cls.get_collection()
+
+        oldest = collection.find_one(
+            {"status": OUTBOX_STATUS_PENDING},
+            {"created_at": 1},
+            sort=[("created_at", ASCENDING), ("_id", ASCENDING)],
+        )
+        return {
+            "pending": collection.count_documents({"status": OUTBOX_STATUS_PENDING}),
+            "dead": collection.count_documents({"status": OUTBOX_STATUS_DEAD}),
+            "oldest_pending_age_seconds": (now - oldest["created_at"]).total_seconds() if oldest else 0.0,
+        }
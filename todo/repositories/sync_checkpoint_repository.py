@@ -0,0 +1,76 @@
+from datetime import datetime, timezone
+from typing import Dict
+
+from pymongo import ASCENDING, IndexModel, ReturnDocument
+
+from todo.models.sync_checkpoint import (
+    SYNC_CHECKPOINT_STATUS_COMPLETED,
+    SYNC_CHECKPOINT_STATUS_RUNNING,
+    SyncCheckpointModel,
+)
+from todo.repositories.common.mongo_repository import MongoRepository
+
+
+class SyncCheckpointRepository(MongoRepository):
+    """
+    Checkpoints of chunked Mongo-to-Postgres jobs, one document per job and collection.
+    """
+
+    collection_name = SyncCheckpointModel.collection_name
+    indexes = [
+        IndexModel([("key", ASCENDING)], name="key", unique=True),
+    ]
+
+    @classmethod
+    def get(cls, job: str, target_collection: str) -> SyncCheckpointModel | None:
+        document = cls.get_collection().find_one({"key": f"{job}:{target_collection}"})
+        if document:
+            return SyncCheckpointModel(**document)
+        return None
+
+    @classmethod
+    def start(cls, job: str, target_collection: str) -> SyncCheckpointModel:
+        """
+        Start a pass over a collection from its first document, discarding any previous progress.
+        """
+        now = datetime.now(timezone.utc)
+        document = cls.get_collection().find_one_and_update(
+            {"key": f"{job}:{target_collection}"},
+            {
+                "$set": {
+                    "job": job,
+                    "target_collection": target_collection,
+                    "last_id": None,
+                    "status": SYNC_CHECKPOINT_STATUS_RUNNING,
+                    "counters": {},
+                    "started_at": now,
+                    "updated_at": now,
+                }
+            },
+            upsert=True,
+            return_document=ReturnDocument.AFTER,
+        )
+        return SyncCheckpointModel(**document)
+
+    @classmethod
+    def save_progress(cls, job: str, target_collection: str, last_id: str, counters: Dict[str, int]) -> None:
+        """
+        Record that every document up to and including last_id was processed.
+        """
+        cls.get_collection().update_one(
+            {"key": f"{job}:{target_collection}"},
+            {"$set": {"last_id": last_id, "counters": counters, "updated_at": datetime.now(timezone.utc)}},
+        )
+
+    @classmethod
+    def complete(cls, job: str, target_collection: str, counters: Dict[str, int]) -> None:
+        cls.get_collection().update_one(
+            {"key": f"{job}:{target_collection}"},
+            {
+                "$set": {
+                    "status": SYNC_CHECKPOINT_STATUS_COMPLETED,
+                    "counters": counters,
+                    "updated_at": datetime.now(timezone.utc),
+                }
+            },
+        )
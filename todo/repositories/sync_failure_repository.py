@@ -0,0 +1,203 @@
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Tuple
+
+from pymongo import ASCENDING, DESCENDING, DeleteOne, IndexModel, ReturnDocument, UpdateOne
+
+from todo.models.sync_failure import SYNC_FAILURE_STATUS_DEAD, SYNC_FAILURE_STATUS_PENDING, SyncFailureModel
+from todo.repositories.common.mongo_repository import MongoRepository
+from todo.utils.bson_utils import to_bson_value
+from todo.utils.retry_utils import get_retry_backoff
+
+
+class SyncFailureRepository(MongoRepository):
+    """
+    Durable store of failed Postgres syncs, one document per synced document. Every write
+    overwrites the whole Postgres row, so only the latest failed payload needs to be retried.
+    """
+
+    collection_name = SyncFailureModel.collection_name
+    indexes = [
+        IndexModel([("key", ASCENDING)], name="key", unique=True),
+        IndexModel([("status", ASCENDING), ("next_attempt_at", ASCENDING)], name="status_next_attempt_at"),
+        IndexModel([("failed_at", DESCENDING)], name="failed_at"),
+    ]
+
+    @classmethod
+    def record(
+        cls,
+        target_collection: str,
+        operation: str,
+        mongo_id: str,
+        data: Dict[str, Any],
+        error: str,
+        retry_delay: int,
+    ) -> SyncFailureModel:
+        """
+        Store a failed sync, replacing the payload of a previous failure of the same document.
+        The first retry is scheduled retry_delay seconds later.
+        """
+        now = datetime.now(timezone.utc)
+        mongo_id = str(mongo_id)
+        document = cls.get_collection().find_one_and_update(
+            {"key": f"{target_collection}:{mongo_id}"},
+            {
+                "$set": {
+                    "target_collection": target_collection,
+                    "mongo_id": mongo_id,
+                    "operation": operation,
+                    "data": to_bson_value(data or {}),
+                    "status": SYNC_FAILURE_STATUS_PENDING,
+                    "attempts": 0,
+                    "last_error": error,
+                    "failed_at": now,
+                    "next_attempt_at": now + get_retry_backoff(1, retry_delay),
+                },
+                "$setOnInsert": {"created_at": now},
+            },
+            upsert=True,
+            return_document=ReturnDocument.AFTER,
+        )
+        return SyncFailureModel(**document)
+
+    @classmethod
+    def get_by_key(cls, target_collection: str, mongo_id: str) -> SyncFailureModel | None:
+        document = cls.get_collection().find_one({"key": f"{target_collection}:{mongo_id}"})
+        if document:
+            return SyncFailureModel(**document)
+        return None
+
+    @classmethod
+    def get_due(cls, limit: int, now: datetime | None = None) -> List[SyncFailureModel]:
+        now = now or datetime.now(timezone.utc)
+        cursor = (
+            cls.get_collection()
+            .find({"status": SYNC_FAILURE_STATUS_PENDING, "next_attempt_at": {"$lte": now}})
+            .sort("next_attempt_at", ASCENDING)
+            .limit(limit)
+        )
+        return [SyncFailureModel(**document) for document in cursor]
+
+    @classmethod
+    def resolve(cls, failures: List[SyncFailureModel]) -> int:
+        """
+        Remove failures that were synced. A failure recorded again while it was being retried
+        carries a newer payload and is kept.
+        """
+        if not failures:
+            return 0
+        operations = [DeleteOne({"_id": failure.id, "failed_at": failure.failed_at}) for failure in failures]
+        return cls.get_collection().bulk_write(operations, ordered=False).deleted_count
+
+    @classmethod
+    def mark_failed(
+        cls,
+        failures: List[Tuple[SyncFailureModel, str]],
+        max_attempts: int,
+        retry_delay: int,
+        now: datetime | None = None,
+    ) -> int:
+        """
+        Schedule the next retry with exponential backoff, or park the failure as dead once it
+        has used max_attempts retries.
+
+        Args:
+            failures: (failure, error message) pairs
+            max_attempts: Number of retries after which a failure is parked
+            retry_delay: Delay before the first retry, in seconds
+
+        Returns:
+            int: Number of failures parked as dead
+        """
+        if not failures:
+            return 0
+
+        now = now or datetime.now(timezone.utc)
+        operations = []
+        dead_count = 0
+        for failure, error in failures:
+            attempts = failure.attempts + 1
+            update = {"attempts": attempts, "last_error": error}
+            if attempts >= max_attempts:
+                update["status"] = SYNC_FAILURE_STATUS_DEAD
+                dead_count += 1
+            else:
+                update["next_attempt_at"] = now + get_retry_backoff(attempts + 1, retry_delay)
+            operations.append(UpdateOne({"_id": failure.id, "failed_at": failure.failed_at}, {"$set": update}))
+
+        cls.get_collection().bulk_write(operations, ordered=False)
+        return dead_count
+
+    @classmethod
+    def requeue(cls, target_collection: str, mongo_id: str) -> bool:
+        """
+        Make a failure, including a dead one, due for an immediate retry with a fresh attempt count.
+        """
+        result = cls.get_collection().update_one(
+            {"key": f"{target_collection}:{mongo_id}"},
+            {
+                "$set": {
+                    "status": SYNC_FAILURE_STATUS_PENDING,
+                    "attempts": 0,
+                    "next_attempt_at": datetime.now(timezone.utc),
+                }
+            },
+        )
+        return result.matched_count > 0
+
+    @classmethod
+    def get_metrics(cls, recent_limit: int = 10) -> Dict[str, Any]:
+        """
+        Returns:
+            Dict: failure counts by status and by collection, and the most recent failures
+        """
+        collection = cls.get_collection()
+        counts = list(
+            collection.aggregate(
+                [{"$group": {"_id": {"status": "$status", "collection": "$target_collection"}, "count": {"$sum": 1}}}]
+            )
+        )
+
+        metrics = {
+            "total_failures": 0,
+            "pending": 0,
+            "dead": 0,
+            "failures_by_collection": {},
+        }
+        for row in counts:
+            status = row["_id"]["status"]
+            target_collection = row["_id"]["collection"]
+            metrics["total_failures"] += row["count"]
+            metrics[status] = metrics.get(status, 0) + row["count"]
+            metrics["failures_by_collection"][target_collection] = (
+                metrics["failures_by_collection"].get(target_collection, 0) + row["count"]
+            )
+
+        recent = (
+            collection.find(
+                {},
+                {
+                    "target_collection": 1,
+                    "mongo_id": 1,
+                    "operation": 1,
+                    "status": 1,
+                    "attempts": 1,
+                    "last_error": 1,
+                    "failed_at": 1,
+                },
+            )
+            .sort("failed_at", DESCENDING)
+            .limit(recent_limit)
+        )
+        metrics["recent_failures"] = [
+            {
+                "collection": failure["target_collection"],
+                "mongo_id": failure["mongo_id"],
+                "operation": failure["operation"],
+                "status": failure["status"],
+                "attempts": failure["attempts"],
+                "error": failure.get("last_error"),
+                "timestamp": failure["failed_at"],
+            }
+            for failure in recent
+        ]
+        return metrics
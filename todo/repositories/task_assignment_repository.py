@@ -1,18 +1,51 @@
+import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
-from typing import Optional, List
+from typing import Dict, Iterable, Optional, List
 from bson import ObjectId
+from django.conf import settings
+from pymongo import ASCENDING, IndexModel, UpdateOne
 
 from todo.exceptions.task_exceptions import TaskNotFoundException
+from todo.models.task import TaskAssigneeModel, TaskModel
 from todo.models.task_assignment import TaskAssignmentModel
+from todo.models.team import TeamModel
+from todo.models.user import UserModel
 from todo.repositories.common.mongo_repository import MongoRepository
+from todo.repositories.common.request_loader import RequestLoader
 from todo.models.common.pyobjectid import PyObjectId
 from todo.constants.task import TaskStatus
 from todo.services.enhanced_dual_write_service import EnhancedDualWriteService
 from todo.repositories.audit_log_repository import AuditLogRepository, AuditLogModel
+from todo.repositories.task_visibility_repository import TaskVisibilityRepository
+
+logger = logging.getLogger(__name__)
+
+# Copies renamed users and teams into assignee snapshots off the request thread
+_name_propagation_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="assignee-name")
 
 
 class TaskAssignmentRepository(MongoRepository):
     collection_name = TaskAssignmentModel.collection_name
+    # Active assignments by task ID
+    request_loader: RequestLoader[TaskAssignmentModel] = RequestLoader("task_assignments")
+    indexes = [
+        IndexModel(
+            [("task_id", ASCENDING)],
+            name="task_id_active",
+            partialFilterExpression={"is_active": True},
+        ),
+        IndexModel(
+            [("assignee_id", ASCENDING), ("user_type", ASCENDING)],
+            name="assignee_id_user_type_active",
+            partialFilterExpression={"is_active": True},
+        ),
+        IndexModel(
+            [("team_id", ASCENDING)],
+            name="team_id_active",
+            partialFilterExpression={"is_active": True},
+        ),
+    ]
 
     @classmethod
     def create(cls, task_assignment: TaskAssignmentModel) -> TaskAssignmentModel:
@@ -25,20 +58,10 @@ class TaskAssignmentRepository(MongoRepository):
         task_assignment.id = insert_result.inserted_id
 
         dual_write_service = EnhancedDualWriteService()
-        task_assignment_data = {
-            "task_mongo_id": str(task_assignment.task_id),
-            "assignee_id": str(task_assignment.assignee_id),
-            "user_type": task_assignment.user_type,
-            "team_id": str(task_assignment.team_id) if task_assignment.team_id else None,
-            "is_active": task_assignment.is_active,
-            "created_at": task_assignment.created_at,
-            "updated_at": task_assignment.updated_at,
-            "created_by": str(task_assignment.created_by),
-            "updated_by": str(task_assignment.updated_by) if task_assignment.updated_by else None,
-        }
-
         dual_write_success = dual_write_service.create_document(
-            collection_name="task_assignments", data=task_assignment_data, mongo_id=str(task_assignment.id)
+            collection_name="task_assignments",
+            data=cls._get_postgres_data(task_assignment),
+            mongo_id=str(task_assignment.id),
         )
 
         if not dual_write_success:
@@ -47,27 +70,124 @@ class TaskAssignmentRepository(MongoRepository):
             logger = logging.getLogger(__name__)
             logger.warning(f"Failed to sync task assignment {task_assignment.id} to Postgres")
 
+        TaskVisibilityRepository.refresh_for_task(str(task_assignment.task_id))
+        cls.refresh_assignee_snapshots([task_assignment.task_id])
+
         return task_assignment
 
+    @classmethod
+    def create_many(cls, task_assignments: List[TaskAssignmentModel]) -> List[TaskAssignmentModel]:
+        """
+        Creates assignments of tasks that have no active assignment, with one insert. Their Postgres sync,
+        task visibility and assignee snapshots are written in one batch each.
+        """
+        if not task_assignments:
+            return []
+
+        collection = cls.get_collection()
+        created_at = datetime.now(timezone.utc)
+        for task_assignment in task_assignments:
+            task_assignment.created_at = created_at
+            task_assignment.updated_at = None
+
+        insert_result = collection.insert_many(
+            [
+                task_assignment.model_dump(mode="json", by_alias=True, exclude_none=True)
+                for task_assignment in task_assignments
+            ]
+        )
+        for task_assignment, inserted_id in zip(task_assignments, insert_result.inserted_ids):
+            task_assignment.id = inserted_id
+
+        dual_write_service = EnhancedDualWriteService()
+        dual_write_success = dual_write_service.batch_operations(
+            [
+                {
+                    "collection_name": "task_assignments",
+                    "operation": "create",
+                    "mongo_id": str(task_assignment.id),
+                    "data": cls._get_postgres_data(task_assignment),
+                }
+                for task_assignment in task_assignments
+            ]
+        )
+
+        if not dual_write_success:
+            logger.warning(f"Failed to sync {len(task_assignments)} task assignments to Postgres")
+
+        task_ids = [task_assignment.task_id for task_assignment in task_assignments]
+        TaskVisibilityRepository.refresh_for_tasks(task_ids)
+        cls.refresh_assignee_snapshots(task_ids)
+
+        return task_assignments
+
+    @classmethod
+    def _get_postgres_data(cls, task_assignment: TaskAssignmentModel) -> dict:
+        return {
+            "task_mongo_id": str(task_assignment.task_id),
+            "assignee_id": str(task_assignment.assignee_id),
+            "user_type": task_assignment.user_type,
+            "team_id": str(task_assignment.team_id) if task_assignment.team_id else None,
+            "is_active": task_assignment.is_active,
+            "created_at": task_assignment.created_at,
+            "updated_at": task_assignment.updated_at,
+            "created_by": str(task_assignment.created_by),
+            "updated_by": str(task_assignment.updated_by) if task_assignment.updated_by else None,
+        }
+
     @classmethod
     def get_by_task_id(cls, task_id: str) -> Optional[TaskAssignmentModel]:
         """
         Get the task assignment for a specific task.
         """
-        collection = cls.get_collection()
         try:
-            # Try with ObjectId first
-            task_assignment_data = collection.find_one({"task_id": ObjectId(task_id), "is_active": True})
-            if not task_assignment_data:
-                # Try with string if ObjectId doesn't work
-                task_assignment_data = collection.find_one({"task_id": task_id, "is_active": True})
-
-            if task_assignment_data:
-                return TaskAssignmentModel(**task_assignment_data)
-            return None
+            return cls.request_loader.get(str(task_id), cls._find_by_task_id)
         except Exception:
             return None
 
+    @classmethod
+    def _find_by_task_id(cls, task_id: str) -> Optional[TaskAssignmentModel]:
+        collection = cls.get_collection()
+        # Try with ObjectId first
+        task_assignment_data = collection.find_one({"task_id": ObjectId(task_id), "is_active": True})
+        if not task_assignment_data:
+            # Try with string if ObjectId doesn't work
+            task_assignment_data = collection.find_one({"task_id": task_id, "is_active": True})
+
+        if task_assignment_data:
+            return TaskAssignmentModel(**task_assignment_data)
+        return None
+
+    @classmethod
+    def get_by_task_ids(cls, task_ids: List[str]) -> List[TaskAssignmentModel]:
+        """
+        Get the active task assignments for multiple tasks, reading the ones not loaded yet in the
+        request in a single query. Matches task_id stored either as ObjectId or as string.
+        """
+        if not task_ids:
+            return []
+
+        try:
+            return list(
+                cls.request_loader.get_many([str(task_id) for task_id in task_ids], cls._find_by_task_ids).values()
+            )
+        except Exception:
+            return []
+
+    @classmethod
+    def _find_by_task_ids(cls, task_ids: List[str]) -> Dict[str, TaskAssignmentModel]:
+        task_id_values = []
+        for task_id in task_ids:
+            task_id_values.append(task_id)
+            if ObjectId.is_valid(task_id):
+                task_id_values.append(ObjectId(task_id))
+
+        task_assignments_data = cls.get_collection().find({"task_id": {"$in": task_id_values}, "is_active": True})
+        task_assignments = {}
+        for data in task_assignments_data:
+            task_assignments.setdefault(str(data["task_id"]), TaskAssignmentModel(**data))
+        return task_assignments
+
     @classmethod
     def get_by_assignee_id(cls, assignee_id: str, user_type: str) -> List[TaskAssignmentModel]:
         """
@@ -132,6 +252,8 @@ class TaskAssignmentRepository(MongoRepository):
                 },
             )
 
+            cls._invalidate_loaded_tasks([task_id])
+
             # Sync deactivation to PostgreSQL
             if current_assignment:
                 dual_write_service = EnhancedDualWriteService()
@@ -229,6 +351,9 @@ class TaskAssignmentRepository(MongoRepository):
                     logger = logging.getLogger(__name__)
                     logger.warning(f"Failed to sync task assignment deletion {current_assignment.id} to Postgres")
 
+                TaskVisibilityRepository.refresh_for_task(task_id)
+                cls.refresh_assignee_snapshots([task_id])
+
             return result.modified_count > 0
         except Exception:
             return False
@@ -292,6 +417,9 @@ class TaskAssignmentRepository(MongoRepository):
                     logger = logging.getLogger(__name__)
                     logger.warning(f"Failed to sync task assignment update {current_assignment.id} to Postgres")
 
+                TaskVisibilityRepository.refresh_for_task(task_id)
+                cls.refresh_assignee_snapshots([task_id])
+
             return result.modified_count > 0
         except Exception:
             return False
@@ -354,6 +482,9 @@ class TaskAssignmentRepository(MongoRepository):
                     logger = logging.getLogger(__name__)
                     logger.warning(f"Failed to sync task assignment deactivation {active_assignments.id} to Postgres")
 
+                TaskVisibilityRepository.refresh_for_task(task_id)
+                cls.refresh_assignee_snapshots([task_id])
+
             return result.modified_count > 0
         except Exception:
             return False
@@ -425,21 +556,24 @@ class TaskAssignmentRepository(MongoRepository):
                         session=session,
                     )
 
-                    for assignment in user_task_assignments:
-                        AuditLogRepository.create(
+                    AuditLogRepository.create_many(
+                        [
                             AuditLogModel(
                                 task_id=PyObjectId(assignment["task_id"]),
                                 team_id=PyObjectId(team_id),
                                 action="assigned_to_team",
                                 performed_by=PyObjectId(performed_by_user_id),
                             )
-                        )
+                            for assignment in user_task_assignments
+                        ]
+                    )
 
                     tasks_collection.update_many(
                         {"_id": {"$in": tasks_to_reset_status_ids}},
                         {
                             "$set": {
                                 "status": TaskStatus.TODO.value,
+                                "effectiveStatus": TaskStatus.TODO.value,
                                 "updated_at": now,
                                 "updated_by": ObjectId(performed_by_user_id),
                             }
@@ -451,6 +585,7 @@ class TaskAssignmentRepository(MongoRepository):
                         {
                             "$set": {
                                 "status": TaskStatus.TODO.value,
+                                "effectiveStatus": TaskStatus.TODO.value,
                                 "deferredDetails": None,
                                 "updated_at": now,
                                 "updated_by": ObjectId(performed_by_user_id),
@@ -459,6 +594,7 @@ class TaskAssignmentRepository(MongoRepository):
                         session=session,
                     )
 
+                    cls._invalidate_loaded_tasks()
                     tasks_by_id = {task["_id"]: task for task in active_tasks}
                     operations = []
                     dual_write_service = EnhancedDualWriteService()
@@ -510,14 +646,154 @@ class TaskAssignmentRepository(MongoRepository):
                                 }
                             )
 
-                    dual_write_success = dual_write_service.batch_operations(operations)
+                    dual_write_success = dual_write_service.batch_operations(operations, session=session)
                     if not dual_write_success:
                         import logging
 
                         logger = logging.getLogger(__name__)
                         logger.warning("Failed to sync task reassignments to Postgres")
 
-                        return False
-                return True
+                TaskVisibilityRepository.refresh_for_tasks(not_done_tasks_ids)
+                cls.refresh_assignee_snapshots(not_done_tasks_ids)
+                return dual_write_success
             except Exception:
                 return False
+
+    @classmethod
+    def _build_assignee_snapshots(cls, task_ids: List[ObjectId]) -> Dict[ObjectId, dict | None]:
+        """
+        Compute the assignee snapshot of each task from its active assignment, None for unassigned tasks.
+        """
+        database = cls.get_database()
+        task_id_values = [value for task_id in task_ids for value in (task_id, str(task_id))]
+        # Oldest first, so that the latest assignment wins if a task has several active ones
+        assignments = (
+            cls.get_collection()
+            .find({"task_id": {"$in": task_id_values}, "is_active": True})
+            .sort("created_at", ASCENDING)
+        )
+        assignments_by_task_id = {ObjectId(str(assignment["task_id"])): assignment for assignment in assignments}
+
+        assignee_ids = {"user": set(), "team": set()}
+        for assignment in assignments_by_task_id.values():
+            if assignment.get("user_type") in assignee_ids and ObjectId.is_valid(str(assignment["assignee_id"])):
+                assignee_ids[assignment["user_type"]].add(ObjectId(str(assignment["assignee_id"])))
+
+        # Deleted teams are left without a name, so that their tasks are shown unassigned
+        names = {}
+        for user_type, model, extra_filter in (("user", UserModel, {}), ("team", TeamModel, {"is_deleted": False})):
+            if assignee_ids[user_type]:
+                for doc in database[model.collection_name].find(
+                    {"_id": {"$in": list(assignee_ids[user_type])}, **extra_filter}, {"name": 1}
+                ):
+                    names[(user_type, str(doc["_id"]))] = doc.get("name")
+
+        snapshots: Dict[ObjectId, dict | None] = {task_id: None for task_id in task_ids}
+        for task_id, assignment in assignments_by_task_id.items():
+            assignee_id = str(assignment["assignee_id"])
+            snapshots[task_id] = TaskAssigneeModel(
+                assignment_id=str(assignment["_id"]),
+                id=assignee_id,
+                type=assignment["user_type"],
+                name=names.get((assignment["user_type"], assignee_id)),
+                team_id=str(assignment["team_id"]) if assignment.get("team_id") else None,
+                executor_id=str(assignment["executor_id"]) if assignment.get("executor_id") else None,
+                created_by=str(assignment["created_by"]),
+                updated_by=str(assignment["updated_by"]) if assignment.get("updated_by") else None,
+                created_at=assignment["created_at"],
+                updated_at=assignment.get("updated_at"),
+            ).model_dump()
+        return snapshots
+
+    @classmethod
+    def _invalidate_loaded_tasks(cls, task_ids: Iterable | None = None) -> None:
+        """
+        Drop the assignments and tasks of the given task IDs from the request loaders, all of them
+        without task_ids.
+        """
+        from todo.repositories.task_repository import TaskRepository
+
+        if task_ids is None:
+            cls.request_loader.clear()
+            TaskRepository.request_loader.clear()
+            return
+        for task_id in task_ids:
+            cls.request_loader.invalidate(str(task_id))
+            TaskRepository.request_loader.invalidate(str(task_id))
+
+    @classmethod
+    def refresh_assignee_snapshots(cls, task_ids: Iterable) -> bool:
+        """
+        Recompute the assignee snapshot stored on the given tasks. Safe to call repeatedly.
+        """
+        task_ids = list(task_ids)
+        cls._invalidate_loaded_tasks(task_ids)
+        task_object_ids = list({ObjectId(str(task_id)) for task_id in task_ids if ObjectId.is_valid(str(task_id))})
+        if not task_object_ids:
+            return True
+
+        try:
+            snapshots = cls._build_assignee_snapshots(task_object_ids)
+            operations = [
+                UpdateOne({"_id": task_id}, {"$set": {"assignee": snapshot}}) for task_id, snapshot in snapshots.items()
+            ]
+            cls.get_database()[TaskModel.collection_name].bulk_write(operations, ordered=False)
+            return True
+        except Exception as e:
+            logger.error(
+                f"Failed to refresh the assignee snapshot of {len(task_object_ids)} task(s): {str(e)}. "
+                "Run `python manage.py rebuild_task_assignee_snapshots` to repair."
+            )
+            return False
+
+    @classmethod
+    def rebuild_assignee_snapshots(cls, batch_size: int = 500) -> int:
+        """
+        Recompute the assignee snapshot of every task that has an active assignment or a stored snapshot,
+        in batches.
+
+        Returns:
+            int: Number of tasks processed
+        """
+        assigned_task_ids = cls.get_collection().distinct("task_id", {"is_active": True})
+        snapshot_task_ids = cls.get_database()[TaskModel.collection_name].distinct("_id", {"assignee": {"$ne": None}})
+        task_ids = sorted(
+            {ObjectId(str(task_id)) for task_id in assigned_task_ids if ObjectId.is_valid(str(task_id))}
+            | set(snapshot_task_ids)
+        )
+
+        for start in range(0, len(task_ids), batch_size):
+            batch = task_ids[start : start + batch_size]
+            if not cls.refresh_assignee_snapshots(batch):
+                raise RuntimeError(f"Failed to rebuild assignee snapshots for batch starting at {start}")
+        return len(task_ids)
+
+    @classmethod
+    def propagate_assignee_name(cls, assignee_id: str, user_type: str, name: str) -> None:
+        """
+        Copy the new name of a user or team into the assignee snapshots of its tasks, in a background thread.
+        """
+        if not getattr(settings, "ASSIGNEE_NAME_PROPAGATION_ENABLED", True):
+            return
+        _name_propagation_executor.submit(cls.set_assignee_name, str(assignee_id), user_type, name)
+
+    @classmethod
+    def set_assignee_name(cls, assignee_id: str, user_type: str, name: str) -> int:
+        """
+        Runs on the name propagation thread, outside any request, so there are no loaded tasks to drop.
+
+        Returns:
+            int: Number of task snapshots that had another name
+        """
+        try:
+            result = cls.get_database()[TaskModel.collection_name].update_many(
+                {"assignee.id": str(assignee_id), "assignee.type": user_type, "assignee.name": {"$ne": name}},
+                {"$set": {"assignee.name": name}},
+            )
+            return result.modified_count
+        except Exception as e:
+            logger.error(
+                f"Failed to propagate the name of {user_type} {assignee_id} to assignee snapshots: {str(e)}. "
+                "Run `python manage.py rebuild_task_assignee_snapshots` to repair."
+            )
+            return 0
@@ -1,11 +1,14 @@
 from datetime import datetime, timezone
-from typing import List
+from typing import Any, Dict, Iterable, List, Tuple
 from bson import ObjectId
-from pymongo import ReturnDocument
+from pymongo import ASCENDING, DESCENDING, IndexModel, ReturnDocument, UpdateOne
 
 from todo.exceptions.task_exceptions import TaskNotFoundException
 from todo.models.task import TaskModel
+from todo.repositories.common.id_block_allocator import IdBlockAllocator
+from todo.repositories.common.model_cache import ModelCache
 from todo.repositories.common.mongo_repository import MongoRepository
+from todo.repositories.common.request_loader import RequestLoader
 from todo.repositories.task_assignment_repository import TaskAssignmentRepository
 from todo.constants.messages import ApiErrors, RepositoryErrors
 from todo.constants.task import (
@@ -15,52 +18,104 @@ from todo.constants.task import (
     SORT_ORDER_DESC,
     TaskStatus,
 )
-from todo.repositories.team_repository import UserTeamDetailsRepository
+from todo.repositories.task_visibility_repository import TaskVisibilityRepository
 from todo.services.enhanced_dual_write_service import EnhancedDualWriteService
 from todo.models.postgres import PostgresTask, PostgresDeferredDetails
 
 
+LAST_ACTIVITY_FIELD = "lastActivity"
+# Assignee snapshot field tasks are sorted by for SORT_FIELD_ASSIGNEE
+ASSIGNEE_NAME_FIELD = "assignee.name"
+# Computes lastActivity of tasks written before it was stored
+LAST_ACTIVITY_EXPRESSION = {"$ifNull": [{"$toDate": "$updatedAt"}, {"$toDate": "$createdAt"}]}
+# BSON types in the order MongoDB sorts them, for the types tasks are sorted by. Missing fields sort as null.
+SORT_TYPE_ORDER = [
+    (type(None), ["null"]),
+    ((int, float), ["int", "long", "double", "decimal"]),
+    (str, ["string"]),
+    (dict, ["object"]),
+    (list, ["array"]),
+    (ObjectId, ["objectId"]),
+    (bool, ["bool"]),
+    (datetime, ["date"]),
+]
+# Status filters match on this field, kept in sync by writes and by the deferral expiry job
+EFFECTIVE_STATUS_FIELD = "effectiveStatus"
+# Computes effectiveStatus of tasks written before it was stored
+EFFECTIVE_STATUS_EXPRESSION = {
+    "$cond": [{"$gt": ["$deferredDetails.deferredTill", "$$NOW"]}, TaskStatus.DEFERRED.value, "$status"]
+}
+
+_display_id_allocator = IdBlockAllocator("taskDisplayId")
+
+
+def _statuses_except(*excluded: TaskStatus) -> List[str]:
+    return [status.value for status in TaskStatus if status not in excluded]
+
+
 class TaskRepository(MongoRepository):
     collection_name = TaskModel.collection_name
-
-    @classmethod
-    def _get_team_task_ids(cls, team_id: str) -> List[ObjectId]:
-        team_tasks = TaskAssignmentRepository.get_collection().find({"team_id": team_id, "is_active": True})
-        team_task_ids = [ObjectId(task["task_id"]) for task in team_tasks]
-        return list(set(team_task_ids))
+    request_loader: RequestLoader[TaskModel] = RequestLoader("tasks")
+    # Titles of tasks by ID, for views that only show titles
+    titles_cache: ModelCache[str] = ModelCache("task_titles", copy=str)
+    indexes = [
+        IndexModel(
+            [(EFFECTIVE_STATUS_FIELD, ASCENDING), ("deferredDetails.deferredTill", ASCENDING)],
+            name="effectiveStatus_deferredTill",
+        ),
+        IndexModel([("updatedAt", DESCENDING)], name="updatedAt"),
+        # The sort fields followed by _id, so that keyset pages seek and sort on an index
+        IndexModel([(LAST_ACTIVITY_FIELD, DESCENDING), ("_id", DESCENDING)], name="lastActivity_id"),
+        IndexModel([("createdAt", DESCENDING), ("_id", DESCENDING)], name="createdAt_id"),
+        IndexModel([("dueAt", ASCENDING), ("_id", ASCENDING)], name="dueAt_id"),
+        IndexModel([("priority", ASCENDING), ("_id", ASCENDING)], name="priority_id"),
+        IndexModel(
+            [("createdBy", ASCENDING), ("createdAt", DESCENDING)],
+            name="createdBy_createdAt_not_deleted",
+            partialFilterExpression={"isDeleted": False},
+        ),
+        IndexModel([("assignee.team_id", ASCENDING), (LAST_ACTIVITY_FIELD, DESCENDING)], name="assignee_team_id"),
+        IndexModel([("assignee.id", ASCENDING), ("assignee.type", ASCENDING)], name="assignee_id_type"),
+        IndexModel([(ASSIGNEE_NAME_FIELD, ASCENDING), ("_id", ASCENDING)], name="assignee_name_id"),
+    ]
 
     @classmethod
     def _build_status_filter(cls, status_filter: str = None) -> dict:
+        """
+        Filter tasks by the status they are listed under. Tasks whose deferral has ended but that the
+        deferral expiry job has not moved back yet are matched by their status, so that the filter does
+        not depend on the job having run.
+        """
         now = datetime.now(timezone.utc)
-
         if status_filter == TaskStatus.DEFERRED.value:
-            return {
-                "$and": [
-                    {"deferredDetails": {"$ne": None}},
-                    {"deferredDetails.deferredTill": {"$gt": now}},
-                ]
-            }
+            return {EFFECTIVE_STATUS_FIELD: TaskStatus.DEFERRED.value, "deferredDetails.deferredTill": {"$gt": now}}
 
         elif status_filter == TaskStatus.DONE.value:
-            return {
-                "$or": [
-                    {"deferredDetails": None},
-                    {"deferredDetails.deferredTill": {"$lt": now}},
-                ]
-            }
+            statuses = _statuses_except(TaskStatus.DEFERRED)
 
         else:
-            return {
-                "$and": [
-                    {"status": {"$ne": TaskStatus.DONE.value}},
-                    {
-                        "$or": [
-                            {"deferredDetails": None},
-                            {"deferredDetails.deferredTill": {"$lt": now}},
-                        ]
-                    },
-                ]
-            }
+            statuses = _statuses_except(TaskStatus.DEFERRED, TaskStatus.DONE)
+
+        return {
+            "$or": [
+                {EFFECTIVE_STATUS_FIELD: {"$in": statuses}},
+                {
+                    EFFECTIVE_STATUS_FIELD: TaskStatus.DEFERRED.value,
+                    "deferredDetails.deferredTill": {"$lte": now},
+                    "status": {"$in": statuses},
+                },
+            ]
+        }
+
+    @classmethod
+    def get_effective_status(cls, task: TaskModel) -> TaskStatus | None:
+        """
+        Get the status a task is listed under: DEFERRED while it is deferred, otherwise its status.
+        """
+        deferred_till = task.deferredDetails.deferredTill if task.deferredDetails else None
+        if deferred_till and deferred_till > datetime.now(timezone.utc):
+            return TaskStatus.DEFERRED
+        return TaskStatus(task.status) if task.status else None
 
     @classmethod
     def list(
@@ -73,39 +128,23 @@ class TaskRepository(MongoRepository):
         team_id: str = None,
         status_filter: str = None,
     ) -> List[TaskModel]:
+        if user_id and not team_id:
+            page_stages = cls._build_page_stages(page, limit, sort_by, order)
+            return [TaskModel(**task) for task in cls._aggregate_listed(page_stages, user_id, team_id, status_filter)]
+
         tasks_collection = cls.get_collection()
 
-        base_filter = cls._build_status_filter(status_filter)
-
-        if team_id:
-            all_team_task_ids = cls._get_team_task_ids(team_id)
-            query_filter = {"$and": [base_filter, {"_id": {"$in": all_team_task_ids}}]}
-        elif user_id:
-            assigned_task_ids = cls._get_assigned_task_ids_for_user(user_id)
-            query_filter = {"$and": [base_filter, {"_id": {"$in": assigned_task_ids}}]}
-        else:
-            query_filter = base_filter
+        query_filter = cls._build_list_filter(team_id, status_filter)
 
         if sort_by == SORT_FIELD_UPDATED_AT:
             sort_direction = -1 if order == SORT_ORDER_DESC else 1
-            pipeline = [
-                {"$match": query_filter},
-                {"$addFields": {"lastActivity": {"$ifNull": [{"$toDate": "$updatedAt"}, {"$toDate": "$createdAt"}]}}},
-                {"$sort": {"lastActivity": sort_direction}},
-                {"$skip": (page - 1) * limit},
-                {"$limit": limit},
-                {"$project": {"lastActivity": 0}},
-            ]
-            tasks_cursor = tasks_collection.aggregate(pipeline)
-            return [TaskModel(**task) for task in tasks_cursor]
-
-        if sort_by == SORT_FIELD_PRIORITY:
+            sort_criteria = [(LAST_ACTIVITY_FIELD, sort_direction)]
+        elif sort_by == SORT_FIELD_PRIORITY:
             sort_direction = 1 if order == SORT_ORDER_DESC else -1
             sort_criteria = [(sort_by, sort_direction)]
         elif sort_by == SORT_FIELD_ASSIGNEE:
-            # Assignee sorting is no longer supported since assignee is in separate collection
             sort_direction = -1 if order == SORT_ORDER_DESC else 1
-            sort_criteria = [("createdAt", sort_direction)]
+            sort_criteria = [(ASSIGNEE_NAME_FIELD, sort_direction)]
         else:
             sort_direction = -1 if order == SORT_ORDER_DESC else 1
             sort_criteria = [(sort_by, sort_direction)]
@@ -114,58 +153,298 @@ class TaskRepository(MongoRepository):
         return [TaskModel(**task) for task in tasks_cursor]
 
     @classmethod
-    def _get_assigned_task_ids_for_user(cls, user_id: str) -> List[ObjectId]:
-        """Get task IDs where user is assigned (either directly or as team member)."""
-        direct_assignments = TaskAssignmentRepository.get_by_assignee_id(user_id, "user")
-        direct_task_ids = [assignment.task_id for assignment in direct_assignments]
+    def list_with_count(
+        cls,
+        page: int,
+        limit: int,
+        sort_by: str,
+        order: str,
+        user_id: str = None,
+        team_id: str = None,
+        status_filter: str = None,
+        include_total: bool = True,
+    ) -> Tuple[List[TaskModel], int | None]:
+        """
+        A page of tasks, ordered like `list`, and the total number of tasks matching the same filter, read
+        with one aggregation: the filter is built once and a $facet returns both the page and the total.
+
+        Args:
+            include_total: Count the matching tasks; without it the page is read with no $facet
+
+        Returns:
+            The tasks of the page, and the total or None when include_total is False
+        """
+        page_stages = cls._build_page_stages(page, limit, sort_by, order)
+
+        if not include_total:
+            tasks = cls._aggregate_listed(page_stages, user_id, team_id, status_filter)
+            return [TaskModel(**task) for task in tasks], None
+
+        facet_stage = {"$facet": {"tasks": page_stages, "total": [{"$count": "count"}]}}
+        result = next(cls._aggregate_listed([facet_stage], user_id, team_id, status_filter), None) or {}
+        total = result["total"][0]["count"] if result.get("total") else 0
+        return [TaskModel(**task) for task in result.get("tasks", [])], total
+
+    @classmethod
+    def _build_page_stages(cls, page: int, limit: int, sort_by: str, order: str) -> List[dict]:
+        """
+        Aggregation stages sorting tasks like `list` and selecting one page of them.
+        """
+        page_window = [{"$skip": (page - 1) * limit}, {"$limit": limit}]
 
-        # Get teams where user is a member
-        from todo.repositories.team_repository import TeamRepository
+        if sort_by == SORT_FIELD_UPDATED_AT:
+            sort_stage = {"$sort": {LAST_ACTIVITY_FIELD: -1 if order == SORT_ORDER_DESC else 1}}
+        elif sort_by == SORT_FIELD_PRIORITY:
+            sort_stage = {"$sort": {sort_by: 1 if order == SORT_ORDER_DESC else -1}}
+        elif sort_by == SORT_FIELD_ASSIGNEE:
+            sort_stage = {"$sort": {ASSIGNEE_NAME_FIELD: -1 if order == SORT_ORDER_DESC else 1}}
+        else:
+            sort_stage = {"$sort": {sort_by: -1 if order == SORT_ORDER_DESC else 1}}
+        return [sort_stage, *page_window]
 
-        user_teams = UserTeamDetailsRepository.get_by_user_id(user_id)
-        team_ids = [str(team.team_id) for team in user_teams]
+    @classmethod
+    def _build_list_filter(cls, team_id: str = None, status_filter: str = None) -> dict:
+        base_filter = cls._build_status_filter(status_filter)
 
-        # Get tasks assigned to those teams (only if user is POC)
-        team_task_ids = []
-        if team_ids:
-            # Get teams where user is POC
-            poc_teams = TeamRepository.get_collection().find(
-                {
-                    "_id": {"$in": [ObjectId(team_id) for team_id in team_ids]},
-                    "is_deleted": False,
-                    "poc_id": {"$in": [ObjectId(user_id), user_id]},
+        if team_id:
+            return {"$and": [base_filter, {"assignee.team_id": team_id}]}
+        return base_filter
+
+    @classmethod
+    def _aggregate_listed(
+        cls, stages: List[dict], user_id: str = None, team_id: str = None, status_filter: str = None
+    ) -> Iterable[dict]:
+        """
+        Run stages over the tasks listed for a team, a user or everyone. The tasks of a user are read from
+        task_visibility on its user_id_task_id index and joined to the tasks matching the filter, so that
+        the IDs of the tasks the user can see are not read into the app and sent back in the query.
+        """
+        query_filter = cls._build_list_filter(team_id, status_filter)
+        if team_id or not user_id:
+            return cls.get_collection().aggregate([{"$match": query_filter}, *stages])
+
+        pipeline = [
+            {"$match": {"user_id": str(user_id)}},
+            {
+                "$lookup": {
+                    "from": cls.collection_name,
+                    "localField": "task_id",
+                    "foreignField": "_id",
+                    "pipeline": [{"$match": query_filter}],
+                    "as": "task",
                 }
+            },
+            {"$unwind": "$task"},
+            {"$replaceRoot": {"newRoot": "$task"}},
+            *stages,
+        ]
+        return TaskVisibilityRepository.get_collection().aggregate(pipeline)
+
+    @classmethod
+    def _get_sort_field(cls, sort_by: str, order: str) -> Tuple[str, int]:
+        """
+        Get the stored field tasks are ordered by and the sort direction, matching the ordering used by `list`.
+        """
+        if sort_by == SORT_FIELD_UPDATED_AT:
+            return LAST_ACTIVITY_FIELD, -1 if order == SORT_ORDER_DESC else 1
+        if sort_by == SORT_FIELD_PRIORITY:
+            return sort_by, 1 if order == SORT_ORDER_DESC else -1
+        if sort_by == SORT_FIELD_ASSIGNEE:
+            return ASSIGNEE_NAME_FIELD, -1 if order == SORT_ORDER_DESC else 1
+        return sort_by, -1 if order == SORT_ORDER_DESC else 1
+
+    @classmethod
+    def _get_sort_type_index(cls, value: Any) -> int:
+        # bool is checked before int, which it subclasses
+        if isinstance(value, bool):
+            return next(index for index, (python_type, _) in enumerate(SORT_TYPE_ORDER) if python_type is bool)
+        for index, (python_type, _) in enumerate(SORT_TYPE_ORDER):
+            if isinstance(value, python_type):
+                return index
+        raise ValueError(f"Unsupported sort value type: {type(value).__name__}")
+
+    @classmethod
+    def _build_seek_filter(cls, sort_field: str, sort_direction: int, after_value: Any, after_id: ObjectId) -> dict:
+        """
+        Build the filter matching tasks that come after (after_value, after_id) in the (sort field, _id)
+        ordering. Comparisons only match values of the same BSON type, so values of the types MongoDB
+        sorts after (or, descending, before) the type of after_value are matched by type.
+        """
+        id_operator = "$gt" if sort_direction == 1 else "$lt"
+        clauses = []
+        if after_value is not None:
+            clauses.append({sort_field: {id_operator: after_value}})
+        clauses.append({sort_field: after_value, "_id": {id_operator: after_id}})
+
+        type_index = cls._get_sort_type_index(after_value)
+        following = SORT_TYPE_ORDER[type_index + 1 :] if sort_direction == 1 else SORT_TYPE_ORDER[1:type_index]
+        following_types = [bson_type for _, bson_types in following for bson_type in bson_types]
+        if following_types:
+            clauses.append({sort_field: {"$type": following_types}})
+        if sort_direction == -1 and after_value is not None:
+            clauses.append({sort_field: None})
+        return {"$or": clauses}
+
+    @classmethod
+    def list_after(
+        cls,
+        limit: int,
+        sort_by: str,
+        order: str,
+        user_id: str = None,
+        team_id: str = None,
+        status_filter: str = None,
+        after: Tuple[Any, ObjectId] | None = None,
+    ) -> Tuple[List[TaskModel], Tuple[Any, ObjectId] | None]:
+        """
+        Keyset pagination over tasks. Seeks past the (sort field, _id) position given in `after`
+        instead of skipping documents, on the (sort field, _id) indexes, so the cost does not grow with
+        the depth of the page.
+
+        Returns:
+            The tasks of the page and the position of the last task if more tasks follow, otherwise None
+        """
+        sort_field, sort_direction = cls._get_sort_field(sort_by, order)
+        seek_filter = cls._build_seek_filter(sort_field, sort_direction, *after) if after is not None else None
+
+        if user_id and not team_id:
+            stages = [
+                {"$sort": {sort_field: sort_direction, "_id": sort_direction}},
+                {"$limit": limit + 1},
+            ]
+            if seek_filter:
+                stages.insert(0, {"$match": seek_filter})
+            task_docs = list(cls._aggregate_listed(stages, user_id, team_id, status_filter))
+        else:
+            query_filter = cls._build_list_filter(team_id, status_filter)
+            if seek_filter:
+                query_filter = {"$and": [query_filter, seek_filter]}
+            task_docs = list(
+                cls.get_collection()
+                .find(query_filter)
+                .sort([(sort_field, sort_direction), ("_id", sort_direction)])
+                .limit(limit + 1)
             )
+        has_more = len(task_docs) > limit
+        task_docs = task_docs[:limit]
 
-            poc_team_ids = [str(team["_id"]) for team in poc_teams]
+        next_after = None
+        if has_more and task_docs:
+            next_after = (cls._get_field_value(task_docs[-1], sort_field), task_docs[-1]["_id"])
 
-            # Get team assignments for POC teams
-            if poc_team_ids:
-                team_assignments = TaskAssignmentRepository.get_collection().find(
-                    {"assignee_id": {"$in": poc_team_ids}, "user_type": "team", "is_active": True}
-                )
-                team_task_ids = [ObjectId(assignment["task_id"]) for assignment in team_assignments]
+        return [TaskModel(**task_doc) for task_doc in task_docs], next_after
 
-        return direct_task_ids + team_task_ids
+    @classmethod
+    def _get_field_value(cls, doc: dict, field: str) -> Any:
+        """Get the value of a dotted field of a document, None where it is missing like in MongoDB sorts."""
+        value = doc
+        for part in field.split("."):
+            if not isinstance(value, dict):
+                return None
+            value = value.get(part)
+        return value
+
+    @classmethod
+    def is_task_visible_to_user(cls, task_id: str, user_id: str) -> bool:
+        """Check whether the task is assigned to the user (either directly or as POC of an assigned team)."""
+        return TaskVisibilityRepository.is_visible(user_id, task_id)
 
     @classmethod
     def count(cls, user_id: str = None, team_id: str = None, status_filter: str = None) -> int:
+        if user_id and not team_id:
+            # The tasks the user can see and the tasks they created, each counted once
+            created_filter = {"$and": [cls._build_status_filter(status_filter), {"createdBy": user_id}]}
+            stages = [
+                {"$project": {"_id": 1}},
+                {
+                    "$unionWith": {
+                        "coll": cls.collection_name,
+                        "pipeline": [{"$match": created_filter}, {"$project": {"_id": 1}}],
+                    }
+                },
+                {"$group": {"_id": "$_id"}},
+                {"$count": "count"},
+            ]
+            result = next(cls._aggregate_listed(stages, user_id, team_id, status_filter), None)
+            return result["count"] if result else 0
+
+        return cls.get_collection().count_documents(cls._build_list_filter(team_id, status_filter))
+
+    @classmethod
+    def backfill_last_activity(cls, batch_size: int = 1000) -> int:
+        """
+        Store lastActivity on the tasks written before it was stored, batch_size tasks at a time.
+
+        Returns:
+            int: Number of tasks updated
+        """
         tasks_collection = cls.get_collection()
+        missing_filter = {LAST_ACTIVITY_FIELD: {"$exists": False}}
+
+        updated_count = 0
+        while True:
+            task_ids = [task["_id"] for task in tasks_collection.find(missing_filter, {"_id": 1}).limit(batch_size)]
+            if not task_ids:
+                return updated_count
+            result = tasks_collection.update_many(
+                {"_id": {"$in": task_ids}, **missing_filter},
+                [{"$set": {LAST_ACTIVITY_FIELD: LAST_ACTIVITY_EXPRESSION}}],
+            )
+            updated_count += result.modified_count
 
-        base_filter = cls._build_status_filter(status_filter)
+    @classmethod
+    def backfill_effective_status(cls, batch_size: int = 1000) -> int:
+        """
+        Store effectiveStatus on the tasks written before it was stored, batch_size tasks at a time.
 
-        if team_id:
-            all_team_task_ids = cls._get_team_task_ids(team_id)
-            query_filter = {"$and": [base_filter, {"_id": {"$in": all_team_task_ids}}]}
-
-        elif user_id:
-            assigned_task_ids = cls._get_assigned_task_ids_for_user(user_id)
-            query_filter = {
-                "$and": [base_filter, {"$or": [{"createdBy": user_id}, {"_id": {"$in": assigned_task_ids}}]}]
-            }
-        else:
-            query_filter = base_filter
-        return tasks_collection.count_documents(query_filter)
+        Returns:
+            int: Number of tasks updated
+        """
+        tasks_collection = cls.get_collection()
+        missing_filter = {EFFECTIVE_STATUS_FIELD: {"$exists": False}}
+
+        updated_count = 0
+        while True:
+            task_ids = [task["_id"] for task in tasks_collection.find(missing_filter, {"_id": 1}).limit(batch_size)]
+            if not task_ids:
+                return updated_count
+            result = tasks_collection.update_many(
+                {"_id": {"$in": task_ids}, **missing_filter},
+                [{"$set": {EFFECTIVE_STATUS_FIELD: EFFECTIVE_STATUS_EXPRESSION}}],
+            )
+            updated_count += result.modified_count
+
+    @classmethod
+    def expire_deferrals(cls, now: datetime | None = None) -> int:
+        """
+        Move the tasks whose deferral has ended back to their status. Run by the deferral expiry job,
+        outside any request, so there are no loaded tasks to drop.
+
+        Returns:
+            int: Number of tasks updated
+        """
+        tasks_collection = cls.get_collection()
+        result = tasks_collection.update_many(
+            {
+                EFFECTIVE_STATUS_FIELD: TaskStatus.DEFERRED.value,
+                "deferredDetails.deferredTill": {"$lte": now or datetime.now(timezone.utc)},
+            },
+            [{"$set": {EFFECTIVE_STATUS_FIELD: "$status"}}],
+        )
+        return result.modified_count
+
+    @classmethod
+    def get_next_deferral_expiry(cls) -> datetime | None:
+        """
+        Get the earliest time a deferred task is due to move back to its status.
+        """
+        tasks_collection = cls.get_collection()
+        task = tasks_collection.find_one(
+            {EFFECTIVE_STATUS_FIELD: TaskStatus.DEFERRED.value},
+            {"deferredDetails.deferredTill": 1},
+            sort=[("deferredDetails.deferredTill", ASCENDING)],
+        )
+        return task["deferredDetails"]["deferredTill"] if task else None
 
     @classmethod
     def get_all(cls) -> List[TaskModel]:
@@ -183,7 +462,8 @@ class TaskRepository(MongoRepository):
     @classmethod
     def create(cls, task: TaskModel) -> TaskModel:
         """
-        Creates a new task in the repository with a unique displayId, using atomic counter operations.
+        Creates a new task in the repository with a unique displayId, taken from a block of ids
+        reserved on the taskDisplayId counter.
 
         Args:
             task (TaskModel): Task to create
@@ -191,72 +471,162 @@ class TaskRepository(MongoRepository):
         Returns:
             TaskModel: Created task with displayId
         """
+        try:
+            next_number = _display_id_allocator.next_id(cls.get_database().counters)
+
+            task.displayId = f"#{next_number}"
+            task.createdAt = datetime.now(timezone.utc)
+            task.updatedAt = None
+            task.lastActivity = task.createdAt
+            task.effectiveStatus = cls.get_effective_status(task)
+
+            dual_write_service = EnhancedDualWriteService()
+            if dual_write_service.enabled and dual_write_service.use_outbox:
+                # The outbox event of the task is committed with the task
+                with cls.get_client().start_session() as session, session.start_transaction():
+                    cls._insert_task(task, dual_write_service, session)
+            else:
+                cls._insert_task(task, dual_write_service)
+            return task
+
+        except Exception as e:
+            raise ValueError(RepositoryErrors.TASK_CREATION_FAILED.format(str(e)))
+
+    @classmethod
+    def _insert_task(cls, task: TaskModel, dual_write_service: EnhancedDualWriteService, session=None) -> None:
         tasks_collection = cls.get_collection()
-        client = cls.get_client()
-
-        with client.start_session() as session:
-            try:
-                with session.start_transaction():
-                    # Atomically increment and get the next counter value
-                    db = cls.get_database()
-                    counter_result = db.counters.find_one_and_update(
-                        {"_id": "taskDisplayId"}, {"$inc": {"seq": 1}}, return_document=True, session=session
-                    )
 
-                    if not counter_result:
-                        db.counters.insert_one({"_id": "taskDisplayId", "seq": 1}, session=session)
-                        next_number = 1
-                    else:
-                        next_number = counter_result["seq"]
-
-                    task.displayId = f"#{next_number}"
-                    task.createdAt = datetime.now(timezone.utc)
-                    task.updatedAt = None
-
-                    # Ensure createdAt is properly set
-                    if not task.createdAt:
-                        task.createdAt = datetime.now(timezone.utc)
-
-                    task_dict = task.model_dump(mode="json", by_alias=True, exclude_none=True)
-                    insert_result = tasks_collection.insert_one(task_dict, session=session)
-
-                    task.id = insert_result.inserted_id
-
-                    dual_write_service = EnhancedDualWriteService()
-
-                    task_data = {
-                        "title": task.title,
-                        "description": task.description,
-                        "priority": task.priority,
-                        "status": task.status,
-                        "displayId": task.displayId,
-                        "isAcknowledged": task.isAcknowledged,
-                        "isDeleted": task.isDeleted,
-                        "startedAt": task.startedAt,
-                        "dueAt": task.dueAt,
-                        "createdAt": task.createdAt or datetime.now(timezone.utc),
-                        "updatedAt": task.updatedAt,
-                        "createdBy": str(task.createdBy),
-                        "updatedBy": str(task.updatedBy) if task.updatedBy else None,
-                    }
+        task_dict = task.model_dump(mode="json", by_alias=True, exclude_none=True)
+        # Stored as a date, not an ISO string, so that it sorts with the dates of updates
+        task_dict[LAST_ACTIVITY_FIELD] = task.lastActivity
+        insert_result = tasks_collection.insert_one(task_dict, session=session)
 
-                    dual_write_success = dual_write_service.create_document(
-                        collection_name="tasks", data=task_data, mongo_id=str(task.id)
-                    )
+        task.id = insert_result.inserted_id
+
+        dual_write_success = dual_write_service.create_document(
+            collection_name="tasks", data=cls._get_postgres_task_data(task), mongo_id=str(task.id), session=session
+        )
 
-                    if not dual_write_success:
-                        import logging
+        if not dual_write_success:
+            import logging
+
+            logger = logging.getLogger(__name__)
+            logger.warning(f"Failed to sync task {task.id} to Postgres")
 
-                        logger = logging.getLogger(__name__)
-                        logger.warning(f"Failed to sync task {task.id} to Postgres")
+    @classmethod
+    def create_many(cls, tasks: List[TaskModel]) -> List[TaskModel]:
+        """
+        Creates tasks with one insert, taking their displayIds from a single reservation on the counter.
 
-                    return task
+        Args:
+            tasks (List[TaskModel]): Tasks to create
 
-            except Exception as e:
-                raise ValueError(RepositoryErrors.TASK_CREATION_FAILED.format(str(e)))
+        Returns:
+            List[TaskModel]: Created tasks with displayId, in the given order
+        """
+        if not tasks:
+            return []
+
+        try:
+            display_numbers = _display_id_allocator.next_ids(cls.get_database().counters, len(tasks))
+
+            now = datetime.now(timezone.utc)
+            for task, display_number in zip(tasks, display_numbers):
+                task.displayId = f"#{display_number}"
+                task.createdAt = now
+                task.updatedAt = None
+                task.lastActivity = now
+                task.effectiveStatus = cls.get_effective_status(task)
+
+            dual_write_service = EnhancedDualWriteService()
+            if dual_write_service.enabled and dual_write_service.use_outbox:
+                # The outbox events of the tasks are committed with the tasks
+                with cls.get_client().start_session() as session, session.start_transaction():
+                    cls._insert_tasks(tasks, dual_write_service, session)
+            else:
+                cls._insert_tasks(tasks, dual_write_service)
+            return tasks
+
+        except Exception as e:
+            raise ValueError(RepositoryErrors.TASK_CREATION_FAILED.format(str(e)))
+
+    @classmethod
+    def _insert_tasks(cls, tasks: List[TaskModel], dual_write_service: EnhancedDualWriteService, session=None) -> None:
+        tasks_collection = cls.get_collection()
+
+        task_dicts = []
+        for task in tasks:
+            task_dict = task.model_dump(mode="json", by_alias=True, exclude_none=True)
+            task_dict[LAST_ACTIVITY_FIELD] = task.lastActivity
+            task_dicts.append(task_dict)
+        insert_result = tasks_collection.insert_many(task_dicts, session=session)
+
+        for task, inserted_id in zip(tasks, insert_result.inserted_ids):
+            task.id = inserted_id
+
+        dual_write_success = dual_write_service.batch_operations(
+            [
+                {
+                    "collection_name": "tasks",
+                    "operation": "create",
+                    "mongo_id": str(task.id),
+                    "data": cls._get_postgres_task_data(task),
+                }
+                for task in tasks
+            ],
+            session=session,
+        )
+
+        if not dual_write_success:
+            import logging
+
+            logger = logging.getLogger(__name__)
+            logger.warning(f"Failed to sync {len(tasks)} tasks to Postgres")
+
+    @classmethod
+    def _get_postgres_task_data(cls, task: TaskModel) -> dict:
+        return {
+            "title": task.title,
+            "description": task.description,
+            "priority": task.priority,
+            "status": task.status,
+            "displayId": task.displayId,
+            "isAcknowledged": task.isAcknowledged,
+            "isDeleted": task.isDeleted,
+            "startedAt": task.startedAt,
+            "dueAt": task.dueAt,
+            "createdAt": task.createdAt,
+            "updatedAt": task.updatedAt,
+            "createdBy": str(task.createdBy),
+            "updatedBy": str(task.updatedBy) if task.updatedBy else None,
+        }
+
+    @classmethod
+    def _store_effective_statuses(cls, task_models: List[TaskModel]) -> None:
+        """
+        Store the effectiveStatus of the tasks whose stored value no longer matches their status and deferral.
+        """
+        operations = []
+        for task_model in task_models:
+            effective_status = cls.get_effective_status(task_model)
+            if task_model.effectiveStatus != effective_status:
+                operations.append(
+                    UpdateOne(
+                        {"_id": task_model.id},
+                        {"$set": {EFFECTIVE_STATUS_FIELD: effective_status.value if effective_status else None}},
+                    )
+                )
+                task_model.effectiveStatus = effective_status
+                cls.request_loader.invalidate(str(task_model.id))
+        if operations:
+            cls.get_collection().bulk_write(operations, ordered=False)
 
     @classmethod
     def get_by_id(cls, task_id: str) -> TaskModel | None:
+        return cls.request_loader.get(str(task_id), cls._find_by_id)
+
+    @classmethod
+    def _find_by_id(cls, task_id: str) -> TaskModel | None:
         tasks_collection = cls.get_collection()
         task_data = tasks_collection.find_one({"_id": ObjectId(task_id)})
         if task_data:
@@ -274,19 +644,21 @@ class TaskRepository(MongoRepository):
         # Check if user is the creator
         if user_id != task.get("createdBy"):
             # Check if user is assigned to this task
-            assigned_task_ids = cls._get_assigned_task_ids_for_user(user_id)
-            if task_id not in assigned_task_ids:
+            if not cls.is_task_visible_to_user(task_id, user_id):
                 raise PermissionError(ApiErrors.UNAUTHORIZED_TITLE)
 
         # Deactivate assignee relationship for this task
         TaskAssignmentRepository.deactivate_by_task_id(str(task_id), user_id)
 
+        now = datetime.now(timezone.utc)
+        cls.request_loader.invalidate(str(task_id))
         deleted_task_data = tasks_collection.find_one_and_update(
             {"_id": task_id},
             {
                 "$set": {
                     "isDeleted": True,
-                    "updatedAt": datetime.now(timezone.utc),
+                    "updatedAt": now,
+                    LAST_ACTIVITY_FIELD: now,
                     "updatedBy": user_id,
                 }
             },
@@ -307,12 +679,15 @@ class TaskRepository(MongoRepository):
         except Exception:
             return None
 
-        update_data_with_timestamp = {**update_data, "updatedAt": datetime.now(timezone.utc)}
+        now = datetime.now(timezone.utc)
+        update_data_with_timestamp = {**update_data, "updatedAt": now, LAST_ACTIVITY_FIELD: now}
         update_data_with_timestamp.pop("_id", None)
         update_data_with_timestamp.pop("id", None)
 
         tasks_collection = cls.get_collection()
 
+        cls.request_loader.invalidate(str(obj_id))
+        cls.titles_cache.invalidate(str(obj_id))
         updated_task_doc = tasks_collection.find_one_and_update(
             {"_id": obj_id}, {"$set": update_data_with_timestamp}, return_document=ReturnDocument.AFTER
         )
@@ -320,25 +695,12 @@ class TaskRepository(MongoRepository):
         if updated_task_doc:
             task_model = TaskModel(**updated_task_doc)
 
-            dual_write_service = EnhancedDualWriteService()
-            task_data = {
-                "title": task_model.title,
-                "description": task_model.description,
-                "priority": task_model.priority,
-                "status": task_model.status,
-                "displayId": task_model.displayId,
-                "isAcknowledged": task_model.isAcknowledged,
-                "isDeleted": task_model.isDeleted,
-                "startedAt": task_model.startedAt,
-                "dueAt": task_model.dueAt,
-                "createdAt": task_model.createdAt,
-                "updatedAt": task_model.updatedAt,
-                "createdBy": str(task_model.createdBy),
-                "updatedBy": str(task_model.updatedBy) if task_model.updatedBy else None,
-            }
+            # Changing status or deferredDetails changes the status the task is listed under
+            cls._store_effective_statuses([task_model])
 
+            dual_write_service = EnhancedDualWriteService()
             dual_write_success = dual_write_service.update_document(
-                collection_name="tasks", data=task_data, mongo_id=str(task_model.id)
+                collection_name="tasks", data=cls._get_postgres_task_data(task_model), mongo_id=str(task_model.id)
             )
 
             if not dual_write_success:
@@ -355,28 +717,96 @@ class TaskRepository(MongoRepository):
         return None
 
     @classmethod
-    def get_tasks_for_user(cls, user_id: str, page: int, limit: int, status_filter: str = None) -> List[TaskModel]:
+    def update_many(cls, updates: Dict[str, dict]) -> Dict[str, TaskModel]:
+        """
+        Apply a partial update to each task with one bulk write, and sync the updated tasks to Postgres
+        in one batch.
+
+        Args:
+            updates: Fields to set by task ID
+
+        Returns:
+            Dict[str, TaskModel]: Updated tasks by ID, without the tasks that do not exist
+        """
+        if not updates:
+            return {}
+
+        now = datetime.now(timezone.utc)
+        operations = []
+        for task_id, update_data in updates.items():
+            update_data_with_timestamp = {**update_data, "updatedAt": now, LAST_ACTIVITY_FIELD: now}
+            update_data_with_timestamp.pop("_id", None)
+            update_data_with_timestamp.pop("id", None)
+            operations.append(UpdateOne({"_id": ObjectId(task_id)}, {"$set": update_data_with_timestamp}))
+            cls.request_loader.invalidate(str(task_id))
+            cls.titles_cache.invalidate(str(task_id))
+
         tasks_collection = cls.get_collection()
-        assigned_task_ids = cls._get_assigned_task_ids_for_user(user_id)
+        tasks_collection.bulk_write(operations, ordered=False)
 
-        base_filter = cls._build_status_filter(status_filter)
+        task_models = [
+            TaskModel(**task_doc)
+            for task_doc in tasks_collection.find({"_id": {"$in": [ObjectId(task_id) for task_id in updates]}})
+        ]
+        cls._store_effective_statuses(task_models)
 
-        query = {"$and": [base_filter, {"_id": {"$in": assigned_task_ids}}]}
-        tasks_cursor = tasks_collection.find(query).skip((page - 1) * limit).limit(limit)
-        return [TaskModel(**task) for task in tasks_cursor]
+        dual_write_service = EnhancedDualWriteService()
+        dual_write_success = dual_write_service.batch_operations(
+            [
+                {
+                    "collection_name": "tasks",
+                    "operation": "update",
+                    "mongo_id": str(task_model.id),
+                    "data": cls._get_postgres_task_data(task_model),
+                }
+                for task_model in task_models
+            ]
+        )
+
+        if not dual_write_success:
+            import logging
+
+            logger = logging.getLogger(__name__)
+            logger.warning(f"Failed to sync {len(task_models)} task updates to Postgres")
+
+        return {str(task_model.id): task_model for task_model in task_models}
+
+    @classmethod
+    def get_tasks_for_user(cls, user_id: str, page: int, limit: int, status_filter: str = None) -> List[TaskModel]:
+        page_window = [{"$skip": (page - 1) * limit}, {"$limit": limit}]
+        tasks = cls._aggregate_listed(page_window, user_id=user_id, status_filter=status_filter)
+        return [TaskModel(**task) for task in tasks]
 
     @classmethod
     def get_by_ids(cls, task_ids: List[str]) -> List[TaskModel]:
         """
-        Get multiple tasks by their IDs in a single database query.
-        Returns only the tasks that exist.
+        Get multiple tasks by their IDs, reading the ones not loaded yet in the request in a single
+        database query. Returns only the tasks that exist.
         """
         if not task_ids:
             return []
+        return list(cls.request_loader.get_many([str(task_id) for task_id in task_ids], cls._find_by_ids).values())
+
+    @classmethod
+    def get_titles_by_ids(cls, task_ids: List[str]) -> Dict[str, str]:
+        """
+        Get the titles of tasks by ID, reading only the titles of the ones that are not cached in a single query.
+        Tasks that do not exist are left out.
+        """
+        return cls.titles_cache.get_many([str(task_id) for task_id in task_ids], cls._find_titles_by_ids)
+
+    @classmethod
+    def _find_titles_by_ids(cls, task_ids: List[str]) -> Dict[str, str]:
+        object_ids = [ObjectId(task_id) for task_id in task_ids if ObjectId.is_valid(task_id)]
+        cursor = cls.get_collection().find({"_id": {"$in": object_ids}}, {"title": 1})
+        return {str(doc["_id"]): doc.get("title") for doc in cursor}
+
+    @classmethod
+    def _find_by_ids(cls, task_ids: List[str]) -> Dict[str, TaskModel]:
         tasks_collection = cls.get_collection()
         object_ids = [ObjectId(task_id) for task_id in task_ids]
         cursor = tasks_collection.find({"_id": {"$in": object_ids}})
-        return [TaskModel(**doc) for doc in cursor]
+        return {str(doc["_id"]): TaskModel(**doc) for doc in cursor}
 
     @classmethod
     def _handle_deferred_details_sync(cls, task_id: str, deferred_details: dict) -> None:
@@ -0,0 +1,191 @@
+import logging
+from datetime import datetime, timezone
+from typing import Dict, Iterable, List, Set, Tuple
+
+from bson import ObjectId
+from pymongo import ASCENDING, DeleteMany, IndexModel, UpdateOne
+
+from todo.models.task_assignment import TaskAssignmentModel
+from todo.models.task_visibility import TaskVisibilityModel
+from todo.models.team import TeamModel, UserTeamDetailsModel
+from todo.repositories.common.mongo_repository import MongoRepository
+
+logger = logging.getLogger(__name__)
+
+
+def _id_forms(value) -> list:
+    """Ids are stored either as ObjectId or as string depending on the write path; match both."""
+    values = [str(value)]
+    if ObjectId.is_valid(str(value)):
+        values.append(ObjectId(str(value)))
+    return values
+
+
+class TaskVisibilityRepository(MongoRepository):
+    """
+    Maintains the task_visibility collection: one document per (user_id, task_id) for every
+    task a user can see through an active assignment. A user sees a task when it is assigned
+    to them directly, or when it is assigned to a team they are an active member and the POC of.
+
+    Assignment, team membership and POC write paths call refresh_for_task / refresh_for_team.
+    """
+
+    collection_name = TaskVisibilityModel.collection_name
+    indexes = [
+        IndexModel([("user_id", ASCENDING), ("task_id", ASCENDING)], name="user_id_task_id", unique=True),
+        IndexModel([("task_id", ASCENDING)], name="task_id"),
+    ]
+
+    @classmethod
+    def get_task_ids_for_user(cls, user_id: str, task_ids: Iterable | None = None) -> List[ObjectId]:
+        """
+        Get the IDs of the tasks the user can see, only among task_ids when given.
+        """
+        query = {"user_id": str(user_id)}
+        if task_ids is not None:
+            query["task_id"] = {
+                "$in": [ObjectId(str(task_id)) for task_id in task_ids if ObjectId.is_valid(str(task_id))]
+            }
+        # Covered by the user_id_task_id index
+        cursor = cls.get_collection().find(query, {"task_id": 1, "_id": 0})
+        return [doc["task_id"] for doc in cursor]
+
+    @classmethod
+    def is_visible(cls, user_id: str, task_id: str) -> bool:
+        doc = cls.get_collection().find_one({"user_id": str(user_id), "task_id": ObjectId(str(task_id))}, {"_id": 1})
+        return doc is not None
+
+    @classmethod
+    def _compute_visibility(cls, task_ids: List[ObjectId]) -> Dict[ObjectId, Dict[str, str]]:
+        """
+        Compute who can see each task from the source collections.
+
+        Returns:
+            Mapping of task id to {user_id: via}
+        """
+        database = cls.get_database()
+        assignment_values = [value for task_id in task_ids for value in _id_forms(task_id)]
+        assignments = list(
+            database[TaskAssignmentModel.collection_name].find(
+                {"task_id": {"$in": assignment_values}, "is_active": True},
+                {"task_id": 1, "assignee_id": 1, "user_type": 1},
+            )
+        )
+
+        visibility: Dict[ObjectId, Dict[str, str]] = {task_id: {} for task_id in task_ids}
+        team_task_ids: List[Tuple[str, ObjectId]] = []
+        for assignment in assignments:
+            task_id = ObjectId(str(assignment["task_id"]))
+            assignee_id = str(assignment["assignee_id"])
+            if assignment.get("user_type") == "user":
+                visibility[task_id][assignee_id] = "assignee"
+            elif assignment.get("user_type") == "team":
+                team_task_ids.append((assignee_id, task_id))
+
+        if not team_task_ids:
+            return visibility
+
+        team_ids = {team_id for team_id, _ in team_task_ids}
+        teams = database[TeamModel.collection_name].find(
+            {
+                "_id": {"$in": [ObjectId(team_id) for team_id in team_ids if ObjectId.is_valid(team_id)]},
+                "is_deleted": False,
+            },
+            {"poc_id": 1},
+        )
+        poc_by_team = {str(team["_id"]): str(team["poc_id"]) for team in teams if team.get("poc_id")}
+
+        active_pocs: Set[Tuple[str, str]] = set()
+        if poc_by_team:
+            memberships = database[UserTeamDetailsModel.collection_name].find(
+                {
+                    "team_id": {"$in": [value for team_id in poc_by_team for value in _id_forms(team_id)]},
+                    "user_id": {"$in": [value for poc_id in poc_by_team.values() for value in _id_forms(poc_id)]},
+                    "is_active": True,
+                },
+                {"team_id": 1, "user_id": 1},
+            )
+            active_pocs = {(str(membership["team_id"]), str(membership["user_id"])) for membership in memberships}
+
+        for team_id, task_id in team_task_ids:
+            poc_id = poc_by_team.get(team_id)
+            if poc_id and (team_id, poc_id) in active_pocs:
+                visibility[task_id].setdefault(poc_id, "team_poc")
+
+        return visibility
+
+    @classmethod
+    def refresh_for_tasks(cls, task_ids: Iterable) -> bool:
+        """
+        Recompute the visibility entries of the given tasks. Safe to call repeatedly.
+        """
+        task_object_ids = list({ObjectId(str(task_id)) for task_id in task_ids if ObjectId.is_valid(str(task_id))})
+        if not task_object_ids:
+            return True
+
+        try:
+            visibility = cls._compute_visibility(task_object_ids)
+            now = datetime.now(timezone.utc)
+            operations = []
+            for task_id, users in visibility.items():
+                operations.append(DeleteMany({"task_id": task_id, "user_id": {"$nin": list(users)}}))
+                for user_id, via in users.items():
+                    operations.append(
+                        UpdateOne(
+                            {"user_id": user_id, "task_id": task_id},
+                            {"$set": {"via": via, "updated_at": now}},
+                            upsert=True,
+                        )
+                    )
+            cls.get_collection().bulk_write(operations, ordered=False)
+            return True
+        except Exception as e:
+            logger.error(
+                f"Failed to refresh task visibility for {len(task_object_ids)} task(s): {str(e)}. "
+                "Run `python manage.py rebuild_task_visibility` to repair."
+            )
+            return False
+
+    @classmethod
+    def refresh_for_task(cls, task_id: str) -> bool:
+        return cls.refresh_for_tasks([task_id])
+
+    @classmethod
+    def refresh_for_team(cls, team_id: str) -> bool:
+        """
+        Recompute visibility of every task assigned to the team, e.g. after a POC or membership change.
+        """
+        try:
+            task_ids = cls.get_database()[TaskAssignmentModel.collection_name].distinct(
+                "task_id", {"assignee_id": {"$in": _id_forms(team_id)}, "user_type": "team", "is_active": True}
+            )
+        except Exception as e:
+            logger.error(
+                f"Failed to load tasks of team {team_id} for visibility refresh: {str(e)}. "
+                "Run `python manage.py rebuild_task_visibility` to repair."
+            )
+            return False
+        return cls.refresh_for_tasks(task_ids)
+
+    @classmethod
+    def rebuild(cls, batch_size: int = 500) -> int:
+        """
+        Recompute visibility for every task that has an active assignment or an existing
+        visibility entry, in batches.
+
+        Returns:
+            int: Number of tasks processed
+        """
+        database = cls.get_database()
+        assigned_task_ids = database[TaskAssignmentModel.collection_name].distinct("task_id", {"is_active": True})
+        visible_task_ids = cls.get_collection().distinct("task_id")
+        task_ids = sorted(
+            {ObjectId(str(task_id)) for task_id in assigned_task_ids if ObjectId.is_valid(str(task_id))}
+            | set(visible_task_ids)
+        )
+
+        for start in range(0, len(task_ids), batch_size):
+            batch = task_ids[start : start + batch_size]
+            if not cls.refresh_for_tasks(batch):
+                raise RuntimeError(f"Failed to rebuild task visibility for batch starting at {start}")
+        return len(task_ids)
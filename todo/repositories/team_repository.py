@@ -1,15 +1,31 @@
 from datetime import datetime, timezone
 from typing import Optional
 from bson import ObjectId
-from pymongo import ReturnDocument
+from pymongo import ASCENDING, IndexModel, InsertOne, ReturnDocument, UpdateOne
 
 from todo.models.team import TeamModel, UserTeamDetailsModel
+from todo.repositories.common.model_cache import ModelCache
+from todo.repositories.membership_version_repository import MembershipVersionRepository
 from todo.repositories.common.mongo_repository import MongoRepository
+from todo.repositories.common.request_loader import RequestLoader
+from todo.repositories.task_assignment_repository import TaskAssignmentRepository
 from todo.services.enhanced_dual_write_service import EnhancedDualWriteService
+from todo.repositories.task_visibility_repository import TaskVisibilityRepository
+from todo.utils.team_claims import get_request_team_roles
 
 
 class TeamRepository(MongoRepository):
     collection_name = TeamModel.collection_name
+    indexes = [
+        IndexModel(
+            [("invite_code", ASCENDING)],
+            name="invite_code_not_deleted",
+            partialFilterExpression={"is_deleted": False},
+        ),
+    ]
+    # Teams that are not deleted
+    cache: ModelCache[TeamModel] = ModelCache("teams")
+    request_loader: RequestLoader[TeamModel] = RequestLoader("teams")
 
     @classmethod
     def create(cls, team: TeamModel) -> TeamModel:
@@ -23,6 +39,8 @@ class TeamRepository(MongoRepository):
         team_dict = team.model_dump(mode="json", by_alias=True, exclude_none=True)
         insert_result = teams_collection.insert_one(team_dict)
         team.id = insert_result.inserted_id
+        if not team.is_deleted:
+            cls.cache.put(str(team.id), team)
 
         dual_write_service = EnhancedDualWriteService()
         team_data = {
@@ -54,15 +72,46 @@ class TeamRepository(MongoRepository):
         """
         Get a team by its ID.
         """
-        teams_collection = cls.get_collection()
         try:
-            team_data = teams_collection.find_one({"_id": ObjectId(team_id), "is_deleted": False})
-            if team_data:
-                return TeamModel(**team_data)
-            return None
+            return cls.request_loader.get(str(team_id), cls._get_cached_by_id)
         except Exception:
             return None
 
+    @classmethod
+    def get_by_ids(cls, team_ids: list[str]) -> list[TeamModel]:
+        """
+        Get multiple teams by their IDs, reading the ones that are not loaded or cached in a single query.
+        Returns only the teams that exist and are not deleted.
+        """
+        if not team_ids:
+            return []
+
+        try:
+            return list(
+                cls.request_loader.get_many([str(team_id) for team_id in team_ids], cls._get_cached_by_ids).values()
+            )
+        except Exception:
+            return []
+
+    @classmethod
+    def _get_cached_by_id(cls, team_id: str) -> Optional[TeamModel]:
+        return cls.cache.get(team_id, cls._find_by_id)
+
+    @classmethod
+    def _get_cached_by_ids(cls, team_ids: list[str]) -> dict[str, TeamModel]:
+        return cls.cache.get_many(team_ids, cls._find_by_ids)
+
+    @classmethod
+    def _find_by_id(cls, team_id: str) -> Optional[TeamModel]:
+        team_data = cls.get_collection().find_one({"_id": ObjectId(team_id), "is_deleted": False})
+        return TeamModel(**team_data) if team_data else None
+
+    @classmethod
+    def _find_by_ids(cls, team_ids: list[str]) -> dict[str, TeamModel]:
+        object_ids = [ObjectId(team_id) for team_id in team_ids]
+        teams_data = cls.get_collection().find({"_id": {"$in": object_ids}, "is_deleted": False})
+        return {str(team_data["_id"]): TeamModel(**team_data) for team_data in teams_data}
+
     @classmethod
     def get_by_invite_code(cls, invite_code: str) -> Optional[TeamModel]:
         """
@@ -98,10 +147,23 @@ class TeamRepository(MongoRepository):
                 return_document=ReturnDocument.AFTER,
             )
 
+            cls.request_loader.invalidate(str(team_id))
             if updated_doc:
-                return TeamModel(**updated_doc)
+                team = TeamModel(**updated_doc)
+                if team.is_deleted:
+                    cls.cache.invalidate(str(team_id))
+                else:
+                    cls.cache.put(str(team_id), team)
+                if "poc_id" in update_data:
+                    TaskVisibilityRepository.refresh_for_team(team_id)
+                if "name" in update_data:
+                    TaskAssignmentRepository.propagate_assignee_name(str(team_id), "team", team.name)
+                return team
+            cls.cache.invalidate(str(team_id))
             return None
         except Exception:
+            cls.cache.invalidate(str(team_id))
+            cls.request_loader.invalidate(str(team_id))
             return None
 
     @classmethod
@@ -119,12 +181,26 @@ class TeamRepository(MongoRepository):
         """
         Check if the given user is a member of the given team.
         """
+        team_roles = get_request_team_roles(user_id)
+        if team_roles is not None:
+            return str(team_id) in team_roles
+
         team_members = UserTeamDetailsRepository.get_users_by_team_id(team_id)
         return user_id in team_members
 
 
 class UserTeamDetailsRepository(MongoRepository):
     collection_name = UserTeamDetailsModel.collection_name
+    indexes = [
+        IndexModel(
+            [("user_id", ASCENDING)],
+            name="user_id_active",
+            partialFilterExpression={"is_active": True},
+        ),
+        IndexModel([("team_id", ASCENDING), ("user_id", ASCENDING)], name="team_id_user_id"),
+    ]
+    # IDs of the teams a user is an active member of, by user ID
+    team_ids_cache: ModelCache[list[str]] = ModelCache("user_team_ids", copy=list)
 
     @classmethod
     def create(cls, user_team: UserTeamDetailsModel) -> UserTeamDetailsModel:
@@ -160,6 +236,10 @@ class UserTeamDetailsRepository(MongoRepository):
             logger = logging.getLogger(__name__)
             logger.warning(f"Failed to sync user team details {user_team.id} to Postgres")
 
+        TaskVisibilityRepository.refresh_for_team(str(user_team.team_id))
+        cls.invalidate_team_ids([user_team.user_id])
+        MembershipVersionRepository.bump([user_team.user_id])
+
         return user_team
 
     @classmethod
@@ -183,27 +263,37 @@ class UserTeamDetailsRepository(MongoRepository):
         for i, user_team in enumerate(user_teams):
             user_team.id = insert_result.inserted_ids[i]
 
-        dual_write_service = EnhancedDualWriteService()
-        for user_team in user_teams:
-            user_team_data = {
-                "user_id": str(user_team.user_id),
-                "team_id": str(user_team.team_id),
-                "created_by": str(user_team.created_by),
-                "updated_by": str(user_team.updated_by),
-                "is_active": user_team.is_active,
-                "created_at": user_team.created_at,
-                "updated_at": user_team.updated_at,
+        operations = [
+            {
+                "collection_name": "user_team_details",
+                "operation": "create",
+                "mongo_id": str(user_team.id),
+                "data": {
+                    "user_id": str(user_team.user_id),
+                    "team_id": str(user_team.team_id),
+                    "created_by": str(user_team.created_by),
+                    "updated_by": str(user_team.updated_by),
+                    "is_active": user_team.is_active,
+                    "created_at": user_team.created_at,
+                    "updated_at": user_team.updated_at,
+                },
             }
+            for user_team in user_teams
+        ]
 
-            dual_write_success = dual_write_service.create_document(
-                collection_name="user_team_details", data=user_team_data, mongo_id=str(user_team.id)
-            )
+        dual_write_service = EnhancedDualWriteService()
+        dual_write_success = dual_write_service.batch_operations(operations)
 
-            if not dual_write_success:
-                import logging
+        if not dual_write_success:
+            import logging
+
+            logger = logging.getLogger(__name__)
+            logger.warning(f"Failed to sync {len(user_teams)} user team details to Postgres")
 
-                logger = logging.getLogger(__name__)
-                logger.warning(f"Failed to sync user team details {user_team.id} to Postgres")
+        for team_id in {str(user_team.team_id) for user_team in user_teams}:
+            TaskVisibilityRepository.refresh_for_team(team_id)
+        cls.invalidate_team_ids(user_team.user_id for user_team in user_teams)
+        MembershipVersionRepository.bump(user_team.user_id for user_team in user_teams)
 
         return user_teams
 
@@ -219,6 +309,24 @@ class UserTeamDetailsRepository(MongoRepository):
         except Exception:
             return []
 
+    @classmethod
+    def get_team_ids_by_user_id(cls, user_id: str) -> list[str]:
+        """
+        Get the IDs of the teams a user is an active member of, cached until the memberships of the user change.
+        """
+        return cls.team_ids_cache.get(str(user_id), cls._find_team_ids_by_user_id)
+
+    @classmethod
+    def _find_team_ids_by_user_id(cls, user_id: str) -> list[str]:
+        memberships = cls.get_collection().find({"user_id": user_id, "is_active": True}, {"team_id": 1})
+        return [str(membership["team_id"]) for membership in memberships]
+
+    @classmethod
+    def invalidate_team_ids(cls, user_ids) -> None:
+        """Drop the cached team IDs of users whose memberships changed."""
+        for user_id in {str(user_id) for user_id in user_ids}:
+            cls.team_ids_cache.invalidate(user_id)
+
     @classmethod
     def get_users_by_team_id(cls, team_id: str) -> list[str]:
         """
@@ -258,6 +366,86 @@ class UserTeamDetailsRepository(MongoRepository):
         except Exception:
             return []
 
+    @classmethod
+    def get_members_with_task_counts(cls, team_id: str) -> list[dict]:
+        """
+        Get the active members of a team with one aggregation: their name, when they were added, and
+        the number of tasks assigned to them that are also assigned to the team.
+
+        The assignment lookups use the assignee_id_user_type_active and task_id_active indexes of the
+        task assignments. Ids are matched both as strings and as ObjectIds, as older documents store either.
+
+        Returns:
+            list[dict]: user_id, name, added_on and tasks_assigned_count of each member whose user exists
+        """
+        team_assignee_ids = [team_id, ObjectId(team_id)] if ObjectId.is_valid(team_id) else [team_id]
+        pipeline = [
+            {"$match": {"team_id": team_id, "is_active": True}},
+            {
+                "$lookup": {
+                    "from": "users",
+                    "let": {"userId": {"$convert": {"input": "$user_id", "to": "objectId", "onError": None}}},
+                    "pipeline": [{"$match": {"$expr": {"$eq": ["$_id", "$$userId"]}}}, {"$project": {"name": 1}}],
+                    "as": "user",
+                }
+            },
+            {"$unwind": "$user"},
+            {"$addFields": {"assignee_ids": [{"$toString": "$user._id"}, "$user._id"]}},
+            {
+                "$lookup": {
+                    "from": TaskAssignmentRepository.collection_name,
+                    "localField": "assignee_ids",
+                    "foreignField": "assignee_id",
+                    "pipeline": [
+                        {"$match": {"user_type": "user", "is_active": True}},
+                        {
+                            "$project": {
+                                "task_ids": [
+                                    {"$toString": "$task_id"},
+                                    {"$convert": {"input": "$task_id", "to": "objectId", "onError": None}},
+                                ]
+                            }
+                        },
+                        {
+                            "$lookup": {
+                                "from": TaskAssignmentRepository.collection_name,
+                                "localField": "task_ids",
+                                "foreignField": "task_id",
+                                "pipeline": [
+                                    {
+                                        "$match": {
+                                            "assignee_id": {"$in": team_assignee_ids},
+                                            "user_type": "team",
+                                            "is_active": True,
+                                        }
+                                    },
+                                    {"$limit": 1},
+                                ],
+                                "as": "team_assignments",
+                            }
+                        },
+                        {"$match": {"team_assignments": {"$ne": []}}},
+                        {"$group": {"_id": {"$arrayElemAt": ["$task_ids", 0]}}},
+                        {"$count": "count"},
+                    ],
+                    "as": "assigned_tasks",
+                }
+            },
+            {
+                "$project": {
+                    "_id": 0,
+                    "user_id": {"$toString": "$user._id"},
+                    "name": "$user.name",
+                    "added_on": "$created_at",
+                    "tasks_assigned_count": {"$ifNull": [{"$arrayElemAt": ["$assigned_tasks.count", 0]}, 0]},
+                }
+            },
+        ]
+        try:
+            return list(cls.get_collection().aggregate(pipeline))
+        except Exception:
+            return []
+
     @classmethod
     def get_by_team_id(cls, team_id: str) -> list[UserTeamDetailsModel]:
         """
@@ -314,6 +502,10 @@ class UserTeamDetailsRepository(MongoRepository):
                     logger = logging.getLogger(__name__)
                     logger.warning(f"Failed to sync user team removal {current_relationship['_id']} to Postgres")
 
+                TaskVisibilityRepository.refresh_for_team(team_id)
+                cls.invalidate_team_ids([user_id])
+                MembershipVersionRepository.bump([user_id])
+
             return result.modified_count > 0
         except Exception:
             return False
@@ -343,6 +535,9 @@ class UserTeamDetailsRepository(MongoRepository):
                         }
                     },
                 )
+                TaskVisibilityRepository.refresh_for_team(team_id)
+                cls.invalidate_team_ids([user_id])
+                MembershipVersionRepository.bump([user_id])
                 return UserTeamDetailsModel(**existing_relationship)
             else:
                 # User is already active in the team
@@ -363,24 +558,139 @@ class UserTeamDetailsRepository(MongoRepository):
     def update_team_members(cls, team_id: str, member_ids: list[str], updated_by_user_id: str) -> bool:
         """
         Update team members by replacing the current members with the new list.
+
+        The memberships to deactivate, reactivate and create are written with one bulk write and
+        synced to Postgres in one batch.
         """
         try:
-            # Get current team members
-            current_members = cls.get_users_by_team_id(team_id)
-
-            # Find members to remove (in current but not in new list)
-            members_to_remove = [user_id for user_id in current_members if user_id not in member_ids]
-
-            # Find members to add (in new list but not in current)
-            members_to_add = [user_id for user_id in member_ids if user_id not in current_members]
+            collection = cls.get_collection()
+            current_members = set(cls.get_users_by_team_id(team_id))
+            new_members = dict.fromkeys(member_ids)
+
+            members_to_remove = [user_id for user_id in current_members if user_id not in new_members]
+            members_to_add = [user_id for user_id in new_members if user_id not in current_members]
+            if not members_to_remove and not members_to_add:
+                return True
+
+            # A user can have several memberships of the team, e.g. one deactivated by an earlier removal
+            # and one created when they joined again
+            relationships_by_user = {}
+            for relationship in collection.find(
+                {"team_id": team_id, "user_id": {"$in": members_to_remove + members_to_add}}
+            ):
+                relationships_by_user.setdefault(relationship["user_id"], []).append(relationship)
+            current_time = datetime.now(timezone.utc)
+            operations = []
+            updated_relationships = []
+            created_relationships = []
 
-            # Remove members
             for user_id in members_to_remove:
-                cls.remove_user_from_team(team_id, user_id, updated_by_user_id)
+                for relationship in relationships_by_user.get(user_id, []):
+                    if not relationship.get("is_active", True):
+                        continue
+                    operations.append(
+                        UpdateOne(
+                            {"_id": relationship["_id"], "is_active": True},
+                            {
+                                "$set": {
+                                    "is_active": False,
+                                    "updated_by": updated_by_user_id,
+                                    "updated_at": current_time,
+                                }
+                            },
+                        )
+                    )
+                    updated_relationships.append({**relationship, "is_active": False})
 
-            # Add new members
             for user_id in members_to_add:
-                cls.add_user_to_team(team_id, user_id, "1", updated_by_user_id)  # Default role_id is "1"
+                relationships = relationships_by_user.get(user_id, [])
+                if any(relationship.get("is_active", True) for relationship in relationships):
+                    continue
+                # A deactivated membership is reactivated instead of creating another one
+                relationship = relationships[0] if relationships else None
+                if relationship:
+                    operations.append(
+                        UpdateOne(
+                            {"_id": relationship["_id"]},
+                            {
+                                "$set": {
+                                    "is_active": True,
+                                    "role_id": "1",  # Default role_id is "1"
+                                    "updated_by": updated_by_user_id,
+                                    "updated_at": current_time,
+                                }
+                            },
+                        )
+                    )
+                    updated_relationships.append({**relationship, "is_active": True})
+                else:
+                    user_team = UserTeamDetailsModel(
+                        user_id=user_id,
+                        team_id=team_id,
+                        role_id="1",
+                        is_active=True,
+                        created_by=updated_by_user_id,
+                        updated_by=updated_by_user_id,
+                        created_at=current_time,
+                        updated_at=current_time,
+                    )
+                    user_team_dict = user_team.model_dump(mode="json", by_alias=True, exclude_none=True)
+                    user_team_dict["_id"] = ObjectId()
+                    operations.append(InsertOne(user_team_dict))
+                    created_relationships.append(user_team_dict)
+
+            if operations:
+                collection.bulk_write(operations, ordered=False)
+
+            sync_operations = [
+                {
+                    "collection_name": "user_team_details",
+                    "operation": "update",
+                    "mongo_id": str(relationship["_id"]),
+                    "data": {
+                        "user_id": str(relationship["user_id"]),
+                        "team_id": str(relationship["team_id"]),
+                        "is_active": relationship["is_active"],
+                        "created_by": str(relationship["created_by"]),
+                        "updated_by": str(updated_by_user_id),
+                        "created_at": relationship["created_at"],
+                        "updated_at": current_time,
+                    },
+                }
+                for relationship in updated_relationships
+            ] + [
+                {
+                    "collection_name": "user_team_details",
+                    "operation": "create",
+                    "mongo_id": str(relationship["_id"]),
+                    "data": {
+                        "user_id": relationship["user_id"],
+                        "team_id": relationship["team_id"],
+                        "created_by": relationship["created_by"],
+                        "updated_by": relationship["updated_by"],
+                        "is_active": True,
+                        "created_at": current_time,
+                        "updated_at": current_time,
+                    },
+                }
+                for relationship in created_relationships
+            ]
+            if sync_operations:
+                dual_write_service = EnhancedDualWriteService()
+                dual_write_success = dual_write_service.batch_operations(sync_operations)
+
+                if not dual_write_success:
+                    import logging
+
+                    logger = logging.getLogger(__name__)
+                    logger.warning(
+                        f"Failed to sync {len(sync_operations)} member changes of team {team_id} to Postgres"
+                    )
+
+            changed_user_ids = members_to_remove + members_to_add
+            TaskVisibilityRepository.refresh_for_team(team_id)
+            cls.invalidate_team_ids(changed_user_ids)
+            MembershipVersionRepository.bump(changed_user_ids)
 
             return True
         except Exception:
@@ -1,17 +1,31 @@
 from datetime import datetime, timezone
-from typing import Optional, List
+from typing import Dict, Optional, List
 from pymongo.collection import ReturnDocument
-from pymongo import ASCENDING
+from pymongo import ASCENDING, IndexModel
 
 from todo.models.user import UserModel
 from todo.models.common.pyobjectid import PyObjectId
 from todo_project.db.config import DatabaseManager
+from todo.repositories.common.model_cache import ModelCache
+from todo.repositories.common.mongo_repository import MongoRepository
+from todo.repositories.common.request_loader import RequestLoader
+from todo.repositories.task_assignment_repository import TaskAssignmentRepository
 from todo.constants.messages import RepositoryErrors
 from todo.exceptions.auth_exceptions import UserNotFoundException, APIException
 from todo.services.enhanced_dual_write_service import EnhancedDualWriteService
+from todo.utils.token_cache import verified_token_cache
 
 
-class UserRepository:
+class UserRepository(MongoRepository):
+    collection_name = UserModel.collection_name
+    indexes = [
+        IndexModel([("google_id", ASCENDING)], name="google_id", unique=True),
+    ]
+    cache: ModelCache[UserModel] = ModelCache("users")
+    # Names of users by ID, for views that only show names
+    names_cache: ModelCache[str] = ModelCache("user_names", copy=str)
+    request_loader: RequestLoader[UserModel] = RequestLoader("users")
+
     @classmethod
     def _get_collection(cls):
         return DatabaseManager().get_collection("users")
@@ -19,30 +33,59 @@ class UserRepository:
     @classmethod
     def get_by_id(cls, user_id: str) -> Optional[UserModel]:
         try:
-            collection = cls._get_collection()
-            object_id = PyObjectId(user_id)
-            doc = collection.find_one({"_id": object_id})
-            return UserModel(**doc) if doc else None
+            return cls.request_loader.get(str(user_id), cls._get_cached_by_id)
         except Exception as e:
             raise UserNotFoundException() from e
 
     @classmethod
     def get_by_ids(cls, user_ids: List[str]) -> List[UserModel]:
         """
-        Get multiple users by their IDs in a single database query.
+        Get multiple users by their IDs, reading the ones that are not loaded or cached in a single database query.
         Returns only the users that exist.
         """
         try:
             if not user_ids:
                 return []
 
-            collection = cls._get_collection()
-            object_ids = [PyObjectId(user_id) for user_id in user_ids]
-            cursor = collection.find({"_id": {"$in": object_ids}})
-            return [UserModel(**doc) for doc in cursor]
+            return list(
+                cls.request_loader.get_many([str(user_id) for user_id in user_ids], cls._get_cached_by_ids).values()
+            )
         except Exception as e:
             raise UserNotFoundException() from e
 
+    @classmethod
+    def _get_cached_by_id(cls, user_id: str) -> Optional[UserModel]:
+        return cls.cache.get(user_id, cls._find_by_id)
+
+    @classmethod
+    def _get_cached_by_ids(cls, user_ids: List[str]) -> Dict[str, UserModel]:
+        return cls.cache.get_many(user_ids, cls._find_by_ids)
+
+    @classmethod
+    def get_names_by_ids(cls, user_ids: List[str]) -> Dict[str, str]:
+        """
+        Get the names of users by ID, reading only the names of the ones that are not cached in a single query.
+        Users that do not exist are left out.
+        """
+        return cls.names_cache.get_many([str(user_id) for user_id in user_ids], cls._find_names_by_ids)
+
+    @classmethod
+    def _find_names_by_ids(cls, user_ids: List[str]) -> Dict[str, str]:
+        object_ids = [PyObjectId(user_id) for user_id in user_ids if PyObjectId.is_valid(user_id)]
+        cursor = cls._get_collection().find({"_id": {"$in": object_ids}}, {"name": 1})
+        return {str(doc["_id"]): doc.get("name") for doc in cursor}
+
+    @classmethod
+    def _find_by_id(cls, user_id: str) -> Optional[UserModel]:
+        doc = cls._get_collection().find_one({"_id": PyObjectId(user_id)})
+        return UserModel(**doc) if doc else None
+
+    @classmethod
+    def _find_by_ids(cls, user_ids: List[str]) -> Dict[str, UserModel]:
+        object_ids = [PyObjectId(user_id) for user_id in user_ids]
+        cursor = cls._get_collection().find({"_id": {"$in": object_ids}})
+        return {str(doc["_id"]): UserModel(**doc) for doc in cursor}
+
     @classmethod
     def create_or_update(cls, user_data: dict) -> UserModel:
         try:
@@ -69,6 +112,12 @@ class UserRepository:
                 raise APIException(RepositoryErrors.USER_OPERATION_FAILED)
 
             user_model = UserModel(**result)
+            cls.cache.put(str(user_model.id), user_model)
+            cls.names_cache.put(str(user_model.id), user_model.name)
+            cls.request_loader.invalidate(str(user_model.id))
+            # Cached access tokens hold the email of the user
+            verified_token_cache.invalidate_user(str(user_model.id))
+            TaskAssignmentRepository.propagate_assignee_name(str(user_model.id), "user", user_model.name)
 
             dual_write_service = EnhancedDualWriteService()
             user_data_for_postgres = {
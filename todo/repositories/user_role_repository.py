@@ -2,8 +2,12 @@ from datetime import datetime, timezone
 from typing import List, Optional
 import logging
 from bson import ObjectId
+from django.conf import settings
+from pymongo import ASCENDING, IndexModel
 
 from todo.models.user_role import UserRoleModel
+from todo.repositories.common.model_cache import ModelCache
+from todo.repositories.membership_version_repository import MembershipVersionRepository
 from todo.repositories.common.mongo_repository import MongoRepository
 from todo.constants.role import RoleScope, RoleName
 from todo.services.enhanced_dual_write_service import EnhancedDualWriteService
@@ -11,8 +15,33 @@ from todo.services.enhanced_dual_write_service import EnhancedDualWriteService
 logger = logging.getLogger(__name__)
 
 
+def _copy_roles(roles: List[UserRoleModel]) -> List[UserRoleModel]:
+    return [role.model_copy() for role in roles]
+
+
 class UserRoleRepository(MongoRepository):
     collection_name = UserRoleModel.collection_name
+    indexes = [
+        IndexModel(
+            [("user_id", ASCENDING), ("scope", ASCENDING), ("team_id", ASCENDING)],
+            name="user_id_scope_team_id_active",
+            partialFilterExpression={"is_active": True},
+        ),
+        IndexModel(
+            [("team_id", ASCENDING), ("scope", ASCENDING)],
+            name="team_id_scope_active",
+            partialFilterExpression={"is_active": True},
+        ),
+    ]
+    # Active roles of a user in a scope and team, the data of every permission check.
+    # Writes of this process invalidate it; the short TTL bounds how stale other processes can be.
+    roles_cache: ModelCache[List[UserRoleModel]] = ModelCache(
+        "user_roles", ttl=getattr(settings, "ROLE_CACHE_TTL", 10), copy=_copy_roles
+    )
+
+    @classmethod
+    def _roles_cache_key(cls, user_id: str, scope_value: str, team_id: Optional[str]) -> str:
+        return f"{user_id}:{scope_value}:{team_id or ''}"
 
     @classmethod
     def create(cls, user_role: UserRoleModel) -> UserRoleModel:
@@ -39,6 +68,7 @@ class UserRoleRepository(MongoRepository):
         user_role_dict = user_role.model_dump(mode="json", by_alias=True, exclude_none=True)
         result = collection.insert_one(user_role_dict)
         user_role.id = result.inserted_id
+        cls.roles_cache.invalidate(cls._roles_cache_key(user_role.user_id, scope_value, user_role.team_id))
 
         dual_write_service = EnhancedDualWriteService()
         user_role_data = {
@@ -61,32 +91,37 @@ class UserRoleRepository(MongoRepository):
             logger = logging.getLogger(__name__)
             logger.warning(f"Failed to sync user role {user_role.id} to Postgres")
 
+        MembershipVersionRepository.bump([user_role.user_id])
         return user_role
 
     @classmethod
     def get_user_roles(
         cls, user_id: Optional[str] = None, scope: Optional["RoleScope"] = None, team_id: Optional[str] = None
     ) -> List[UserRoleModel]:
-        collection = cls.get_collection()
-
         query = {"is_active": True}
+        scope_value = (scope.value if hasattr(scope, "value") else scope) if scope else None
 
         if user_id:
             query["user_id"] = user_id
 
         if scope:
-            scope_value = scope.value if hasattr(scope, "value") else scope
             query["scope"] = scope_value
 
         if team_id:
             query["team_id"] = team_id
-        elif scope and (scope.value if hasattr(scope, "value") else scope) == "GLOBAL":
+        elif scope_value == "GLOBAL":
             query["team_id"] = None
 
-        roles = []
-        for doc in collection.find(query):
-            roles.append(UserRoleModel(**doc))
-        return roles
+        # Only the roles of one user in one scope and team are cached, so that a write invalidates one key
+        if user_id and scope_value and (team_id or scope_value == "GLOBAL"):
+            return cls.roles_cache.get(
+                cls._roles_cache_key(user_id, scope_value, team_id), lambda _: cls._find_user_roles(query)
+            )
+        return cls._find_user_roles(query)
+
+    @classmethod
+    def _find_user_roles(cls, query: dict) -> List[UserRoleModel]:
+        return [UserRoleModel(**doc) for doc in cls.get_collection().find(query)]
 
     @classmethod
     def get_by_user_role_scope_team(cls, user_id: str, role_id: str, scope: str, team_id: Optional[str] = None):
@@ -117,6 +152,85 @@ class UserRoleRepository(MongoRepository):
         user_role = UserRoleModel(user_id=user_id, role_name=role_name, scope=scope, team_id=team_id, is_active=True)
         return cls.create(user_role)
 
+    @classmethod
+    def assign_role_to_users(
+        cls, user_ids: List[str], role_name: "RoleName", scope: "RoleScope", team_id: Optional[str] = None
+    ) -> List[UserRoleModel]:
+        """
+        Assign a role to several users with one lookup of the users that already have it, one insert
+        and one batched Postgres sync. Users that already have the role keep their existing role.
+        """
+        user_ids = list(dict.fromkeys(str(user_id) for user_id in user_ids))
+        if not user_ids:
+            return []
+
+        collection = cls.get_collection()
+        role_name_value = role_name.value if hasattr(role_name, "value") else role_name
+        scope_value = scope.value if hasattr(scope, "value") else scope
+
+        existing = {
+            doc["user_id"]: UserRoleModel(**doc)
+            for doc in collection.find(
+                {
+                    "user_id": {"$in": user_ids},
+                    "role_name": role_name_value,
+                    "scope": scope_value,
+                    "team_id": team_id,
+                    "is_active": True,
+                }
+            )
+        }
+        created_at = datetime.now(timezone.utc)
+        new_roles = [
+            UserRoleModel(
+                user_id=user_id,
+                role_name=role_name,
+                scope=scope,
+                team_id=team_id,
+                is_active=True,
+                created_at=created_at,
+            )
+            for user_id in user_ids
+            if user_id not in existing
+        ]
+        if not new_roles:
+            return [existing[user_id] for user_id in user_ids]
+
+        insert_result = collection.insert_many(
+            [user_role.model_dump(mode="json", by_alias=True, exclude_none=True) for user_role in new_roles]
+        )
+        for user_role, inserted_id in zip(new_roles, insert_result.inserted_ids):
+            user_role.id = inserted_id
+            cls.roles_cache.invalidate(cls._roles_cache_key(user_role.user_id, scope_value, team_id))
+
+        dual_write_service = EnhancedDualWriteService()
+        dual_write_success = dual_write_service.batch_operations(
+            [
+                {
+                    "collection_name": "user_roles",
+                    "operation": "create",
+                    "mongo_id": str(user_role.id),
+                    "data": {
+                        "user_id": user_role.user_id,
+                        "role_name": role_name_value,
+                        "scope": scope_value,
+                        "team_id": user_role.team_id,
+                        "is_active": user_role.is_active,
+                        "created_at": user_role.created_at,
+                        "created_by": user_role.created_by,
+                    },
+                }
+                for user_role in new_roles
+            ]
+        )
+
+        if not dual_write_success:
+            logger.warning(f"Failed to sync {len(new_roles)} user roles to Postgres")
+
+        MembershipVersionRepository.bump(user_role.user_id for user_role in new_roles)
+        created = {user_role.user_id: user_role for user_role in new_roles}
+        return [existing.get(user_id) or created[user_id] for user_id in user_ids]
+
     @classmethod
     def remove_role_by_id(cls, user_id: str, role_id: str, scope: str, team_id: Optional[str] = None) -> bool:
         """Remove a role from a user by role_id - simple deactivation."""
@@ -141,6 +255,7 @@ class UserRoleRepository(MongoRepository):
         result = collection.update_one(query, {"$set": {"is_active": False}})
 
         if result.modified_count > 0:
+            cls.roles_cache.invalidate(cls._roles_cache_key(user_id, scope, current_role.get("team_id")))
             dual_write_service = EnhancedDualWriteService()
             user_role_data = {
                 "user_id": str(current_role["user_id"]),
@@ -162,4 +277,6 @@ class UserRoleRepository(MongoRepository):
                 logger = logging.getLogger(__name__)
                 logger.warning(f"Failed to sync user role removal {current_role['_id']} to Postgres")
 
+            MembershipVersionRepository.bump([user_id])
+
         return result.modified_count > 0
@@ -1,6 +1,9 @@
 from bson import ObjectId
 from todo.repositories.common.mongo_repository import MongoRepository
+from todo.repositories.membership_version_repository import MembershipVersionRepository
 from todo.services.enhanced_dual_write_service import EnhancedDualWriteService
+from todo.repositories.task_visibility_repository import TaskVisibilityRepository
+from todo.repositories.team_repository import UserTeamDetailsRepository as TeamMembershipRepository
 
 
 class UserTeamDetailsRepository(MongoRepository):
@@ -64,5 +67,8 @@ class UserTeamDetailsRepository(MongoRepository):
                         logger = logging.getLogger(__name__)
                         logger.warning(f"Failed to sync user team details deletion {document['_id']} to Postgres")
 
+                    TaskVisibilityRepository.refresh_for_team(team_id)
+                    TeamMembershipRepository.invalidate_team_ids([user_id])
+                    MembershipVersionRepository.bump([user_id])
                     return True
         return False
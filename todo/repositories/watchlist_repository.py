@@ -6,6 +6,7 @@ from todo.repositories.common.mongo_repository import MongoRepository
 from todo.models.watchlist import WatchlistModel
 from todo.dto.watchlist_dto import WatchlistDTO
 from bson import ObjectId
+from pymongo import ASCENDING, IndexModel
 from todo.services.enhanced_dual_write_service import EnhancedDualWriteService
 
 
@@ -23,6 +24,9 @@ def _convert_objectids_to_str(obj):
 
 class WatchlistRepository(MongoRepository):
     collection_name = WatchlistModel.collection_name
+    indexes = [
+        IndexModel([("userId", ASCENDING), ("taskId", ASCENDING)], name="userId_taskId"),
+    ]
 
     @classmethod
     def get_by_user_and_task(cls, user_id: str, task_id: str) -> Optional[WatchlistModel]:
@@ -34,6 +38,19 @@ class WatchlistRepository(MongoRepository):
             return WatchlistModel(**doc)
         return None
 
+    @classmethod
+    def get_by_user_and_task_ids(cls, user_id: str, task_ids: List[str]) -> List[WatchlistModel]:
+        if not task_ids:
+            return []
+
+        docs = cls.get_collection().find({"userId": user_id, "taskId": {"$in": task_ids}})
+        watchlist_models = []
+        for doc in docs:
+            if "updatedBy" in doc and doc["updatedBy"]:
+                doc["updatedBy"] = str(doc["updatedBy"])
+            watchlist_models.append(WatchlistModel(**doc))
+        return watchlist_models
+
     @classmethod
     def create(cls, watchlist_model: WatchlistModel) -> WatchlistModel:
         doc = watchlist_model.model_dump(by_alias=True)
@@ -94,9 +111,7 @@ class WatchlistRepository(MongoRepository):
                         {
                             "$addFields": {
                                 "lastAdded": {"$ifNull": [{"$toDate": "$updatedAt"}, {"$toDate": "$createdAt"}]},
-                                "lastActivity": {
-                                    "$ifNull": [{"$toDate": "$task.updatedAt"}, {"$toDate": "$task.createdAt"}]
-                                },
+                                "lastActivity": "$task.lastActivity",
                             }
                         },
                         {
@@ -121,63 +136,6 @@ class WatchlistRepository(MongoRepository):
                                 "as": "created_by_user",
                             }
                         },
-                        {
-                            "$lookup": {
-                                "from": "task_details",
-                                "let": {"taskIdStr": "$taskId"},
-                                "pipeline": [
-                                    {
-                                        "$match": {
-                                            "$expr": {
-                                                "$and": [
-                                                    {"$eq": ["$task_id", {"$toObjectId": "$$taskIdStr"}]},
-                                                    {"$eq": ["$is_active", True]},
-                                                ]
-                                            }
-                                        }
-                                    }
-                                ],
-                                "as": "assignment",
-                            }
-                        },
-                        {
-                            "$lookup": {
-                                "from": "users",
-                                "let": {"assigneeId": {"$arrayElemAt": ["$assignment.assignee_id", 0]}},
-                                "pipeline": [
-                                    {
-                                        "$match": {
-                                            "$expr": {
-                                                "$and": [
-                                                    {"$eq": ["$_id", "$$assigneeId"]},
-                                                    {"$eq": [{"$arrayElemAt": ["$assignment.user_type", 0]}, "user"]},
-                                                ]
-                                            }
-                                        }
-                                    }
-                                ],
-                                "as": "assignee_user",
-                            }
-                        },
-                        {
-                            "$lookup": {
-                                "from": "teams",
-                                "let": {"assigneeId": {"$arrayElemAt": ["$assignment.assignee_id", 0]}},
-                                "pipeline": [
-                                    {
-                                        "$match": {
-                                            "$expr": {
-                                                "$and": [
-                                                    {"$eq": ["$_id", "$$assigneeId"]},
-                                                    {"$eq": [{"$arrayElemAt": ["$assignment.user_type", 0]}, "team"]},
-                                                ]
-                                            }
-                                        }
-                                    }
-                                ],
-                                "as": "assignee_team",
-                            }
-                        },
                         {
                             "$replaceRoot": {
                                 "newRoot": {
@@ -197,31 +155,13 @@ class WatchlistRepository(MongoRepository):
                                             },
                                             "assignee": {
                                                 "$cond": {
-                                                    "if": {"$gt": [{"$size": "$assignee_user"}, 0]},
+                                                    "if": {"$ifNull": ["$task.assignee.name", False]},
                                                     "then": {
-                                                        "assignee_id": {
-                                                            "$toString": {"$arrayElemAt": ["$assignee_user._id", 0]}
-                                                        },
-                                                        "assignee_name": {"$arrayElemAt": ["$assignee_user.name", 0]},
-                                                        "user_type": "user",
-                                                    },
-                                                    "else": {
-                                                        "$cond": {
-                                                            "if": {"$gt": [{"$size": "$assignee_team"}, 0]},
-                                                            "then": {
-                                                                "assignee_id": {
-                                                                    "$toString": {
-                                                                        "$arrayElemAt": ["$assignee_team._id", 0]
-                                                                    }
-                                                                },
-                                                                "assignee_name": {
-                                                                    "$arrayElemAt": ["$assignee_team.name", 0]
-                                                                },
-                                                                "user_type": "team",
-                                                            },
-                                                            "else": None,
-                                                        }
+                                                        "assignee_id": "$task.assignee.id",
+                                                        "assignee_name": "$task.assignee.name",
+                                                        "user_type": "$task.assignee.type",
                                                     },
+                                                    "else": None,
                                                 }
                                             },
                                         },
@@ -244,11 +184,7 @@ class WatchlistRepository(MongoRepository):
 
         tasks = [_convert_objectids_to_str(doc) for doc in result.get("data", [])]
 
-        # If assignee is null, try to fetch it separately
         for task in tasks:
-            if not task.get("assignee"):
-                task["assignee"] = cls._get_assignee_for_task(task.get("taskId"))
-
             # If createdBy is null or still an ID, try to fetch user details separately
             if not task.get("createdBy") or (
                 isinstance(task.get("createdBy"), str) and ObjectId.is_valid(task.get("createdBy", ""))
@@ -259,44 +195,6 @@ class WatchlistRepository(MongoRepository):
 
         return count, tasks
 
-    @classmethod
-    def _get_assignee_for_task(cls, task_id: str):
-        """
-        Fallback method to get assignee details for a task.
-        """
-        if not task_id:
-            return None
-
-        try:
-            from todo.repositories.task_assignment_repository import TaskAssignmentRepository
-            from todo.repositories.user_repository import UserRepository
-            from todo.repositories.team_repository import TeamRepository
-
-            # Get task assignment
-            assignment = TaskAssignmentRepository.get_by_task_id(task_id)
-            if not assignment:
-                return None
-
-            assignee_id = str(assignment.assignee_id)
-            user_type = assignment.user_type
-
-            if user_type == "user":
-                # Get user details
-                user = UserRepository.get_by_id(assignee_id)
-                if user:
-                    return {"assignee_id": assignee_id, "assignee_name": user.name, "user_type": "user"}
-            elif user_type == "team":
-                # Get team details
-                team = TeamRepository.get_by_id(assignee_id)
-                if team:
-                    return {"assignee_id": assignee_id, "assignee_name": team.name, "user_type": "team"}
-
-        except Exception:
-            # If any error occurs, return None
-            return None
-
-        return None
-
     @classmethod
     def _get_user_dto_for_id(cls, user_id: str):
         """
@@ -0,0 +1,41 @@
+from rest_framework import serializers
+from bson import ObjectId
+
+from todo.constants.messages import ValidationErrors
+from todo.constants.task import BULK_TASKS_MAX_ITEMS
+from todo.serializers.update_task_serializer import UpdateTaskSerializer
+
+
+class BulkTaskSerializer(serializers.Serializer):
+    tasks = serializers.ListField(
+        child=serializers.DictField(),
+        allow_empty=False,
+        max_length=BULK_TASKS_MAX_ITEMS,
+        error_messages={
+            "empty": ValidationErrors.BULK_TASKS_REQUIRED,
+            "max_length": ValidationErrors.BULK_TASKS_LIMIT_EXCEEDED.format(BULK_TASKS_MAX_ITEMS),
+        },
+        help_text=f"Tasks to process, at most {BULK_TASKS_MAX_ITEMS}",
+    )
+
+
+class BulkUpdateTaskSerializer(UpdateTaskSerializer):
+    """A task of a bulk update: the fields of UpdateTaskSerializer and the ID of the task."""
+
+    id = serializers.CharField(required=False, help_text="ID of the task to update")
+
+    def validate_id(self, value):
+        if not ObjectId.is_valid(value):
+            raise serializers.ValidationError(ValidationErrors.INVALID_OBJECT_ID.format(value))
+        return value
+
+    def validate_assignee(self, value):
+        if value:
+            raise serializers.ValidationError(ValidationErrors.BULK_ASSIGNEE_UPDATE_NOT_SUPPORTED)
+        return None
+
+    def validate(self, data):
+        # Validated as partial, which does not enforce required fields
+        if "id" not in data:
+            raise serializers.ValidationError({"id": ValidationErrors.BULK_TASK_ID_REQUIRED})
+        return super().validate(data)
@@ -1,7 +1,9 @@
 from rest_framework import serializers
 from django.conf import settings
 
+from todo.constants.messages import ValidationErrors
 from todo.constants.task import SORT_FIELDS, SORT_ORDERS, SORT_FIELD_UPDATED_AT, SORT_FIELD_DEFAULT_ORDERS, TaskStatus
+from todo.utils.cursor_utils import decode_cursor
 
 
 class CaseInsensitiveChoiceField(serializers.ChoiceField):
@@ -30,6 +32,8 @@ class GetTaskQueryParamsSerializer(serializers.Serializer):
         },
     )
 
+    cursor = serializers.CharField(required=False, allow_blank=True, trim_whitespace=True)
+
     profile = serializers.BooleanField(required=False, error_messages={"invalid": "profile must be a boolean value."})
 
     sort_by = serializers.ChoiceField(
@@ -44,6 +48,9 @@ class GetTaskQueryParamsSerializer(serializers.Serializer):
 
     teamId = serializers.CharField(required=False, allow_blank=False, allow_null=True)
 
+    # Skips counting the matching tasks; the next link is then given whenever the page is full
+    includeTotal = serializers.BooleanField(required=False, default=True)
+
     status = CaseInsensitiveChoiceField(
         choices=[status.value for status in TaskStatus],
         required=False,
@@ -57,4 +64,13 @@ class GetTaskQueryParamsSerializer(serializers.Serializer):
             sort_by = validated_data.get("sort_by", SORT_FIELD_UPDATED_AT)
             validated_data["order"] = SORT_FIELD_DEFAULT_ORDERS[sort_by]
 
+        if validated_data.get("cursor"):
+            try:
+                cursor = decode_cursor(validated_data["cursor"])
+            except ValueError:
+                raise serializers.ValidationError({"cursor": ValidationErrors.INVALID_CURSOR})
+            if cursor.sort_by != validated_data["sort_by"] or cursor.order != validated_data["order"]:
+                raise serializers.ValidationError({"cursor": ValidationErrors.CURSOR_SORT_MISMATCH})
+            validated_data["cursor"] = cursor
+
         return validated_data
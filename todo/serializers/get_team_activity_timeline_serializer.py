@@ -0,0 +1,61 @@
+from bson import ObjectId
+from datetime import datetime, timezone
+from django.conf import settings
+from django.utils.dateparse import parse_datetime
+from rest_framework import serializers
+
+from todo.constants.messages import ValidationErrors
+
+
+def parse_timeline_position(value: str):
+    """
+    Parse a timeline position, a timestamp optionally followed by a comma and the ID of an entry.
+
+    Returns:
+        tuple: The timestamp, in UTC, and the ObjectId of the entry or None
+    """
+    timestamp_value, _, entry_id = value.partition(",")
+    try:
+        timestamp = parse_datetime(timestamp_value.strip())
+    except ValueError:
+        timestamp = None
+    if timestamp is None or (entry_id and not ObjectId.is_valid(entry_id.strip())):
+        raise serializers.ValidationError(ValidationErrors.INVALID_TIMELINE_POSITION)
+
+    if timestamp.tzinfo is None:
+        timestamp = timestamp.replace(tzinfo=timezone.utc)
+    return timestamp.astimezone(timezone.utc), ObjectId(entry_id.strip()) if entry_id else None
+
+
+def format_timeline_position(timestamp: datetime, entry_id) -> str:
+    """Format the position of a timeline entry for the before and since parameters."""
+    if timestamp.tzinfo is None:
+        timestamp = timestamp.replace(tzinfo=timezone.utc)
+    return f"{timestamp.astimezone(timezone.utc).isoformat().replace('+00:00', 'Z')},{entry_id}"
+
+
+class GetTeamActivityTimelineQueryParamsSerializer(serializers.Serializer):
+    limit = serializers.IntegerField(
+        required=False,
+        default=settings.REST_FRAMEWORK["DEFAULT_PAGINATION_SETTINGS"]["DEFAULT_PAGE_LIMIT"],
+        min_value=1,
+        max_value=settings.REST_FRAMEWORK["DEFAULT_PAGINATION_SETTINGS"]["MAX_PAGE_LIMIT"],
+        error_messages={
+            "min_value": "limit must be greater than or equal to 1",
+        },
+    )
+    before = serializers.CharField(
+        required=False, help_text="Position of the last entry of the previous page: timestamp[,id]"
+    )
+    since = serializers.CharField(required=False, help_text="Position of the newest entry already read: timestamp[,id]")
+
+    def validate_before(self, value):
+        return parse_timeline_position(value)
+
+    def validate_since(self, value):
+        return parse_timeline_position(value)
+
+    def validate(self, attrs):
+        if attrs.get("before") and attrs.get("since"):
+            raise serializers.ValidationError({"since": ValidationErrors.TIMELINE_BEFORE_AND_SINCE})
+        return attrs
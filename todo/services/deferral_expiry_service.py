@@ -0,0 +1,52 @@
+import logging
+import time
+from datetime import datetime, timezone
+
+from todo.repositories.task_repository import TaskRepository
+
+logger = logging.getLogger(__name__)
+
+
+class DeferralExpiryService:
+    """
+    Moves deferred tasks back to their status once deferredDetails.deferredTill has passed, so that
+    the effectiveStatus tasks are filtered by stays accurate. Sleeps until the next deferral ends,
+    but at most poll_interval seconds, to pick up deferrals made in the meantime.
+    """
+
+    def __init__(self):
+        self._stopped = False
+
+    def run_once(self) -> int:
+        """
+        Expire the deferrals that have ended.
+
+        Returns:
+            int: Number of tasks moved back to their status
+        """
+        expired_count = TaskRepository.expire_deferrals()
+        if expired_count:
+            logger.info(f"Deferral expiry: {expired_count} tasks moved back to their status")
+        return expired_count
+
+    def _seconds_until_next_expiry(self, poll_interval: float) -> float:
+        next_expiry = TaskRepository.get_next_deferral_expiry()
+        if next_expiry is None:
+            return poll_interval
+        if next_expiry.tzinfo is None:
+            next_expiry = next_expiry.replace(tzinfo=timezone.utc)
+        seconds = (next_expiry - datetime.now(timezone.utc)).total_seconds()
+        return min(max(seconds, 0), poll_interval)
+
+    def run(self, poll_interval: float = 60.0) -> None:
+        """
+        Expire deferrals until stopped.
+        """
+        self._stopped = False
+
+        while not self._stopped:
+            self.run_once()
+            time.sleep(self._seconds_until_next_expiry(poll_interval))
+
+    def stop(self) -> None:
+        self._stopped = True
@@ -42,6 +42,12 @@ class DualWriteService:
         "team_creation_invite_codes": PostgresTeamCreationInviteCode,
     }
 
+    # MongoDB documents that have a Postgres row, for collections where not all of them do.
+    # Postgres labels have no is_deleted field: deleting a label removes its row.
+    SYNCED_DOCUMENT_FILTERS = {
+        "labels": {"isDeleted": {"$ne": True}},
+    }
+
     def __init__(self):
         self.sync_failures = []
 
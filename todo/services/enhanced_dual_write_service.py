@@ -1,23 +1,55 @@
 import logging
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from django.conf import settings
+from django.core.exceptions import FieldDoesNotExist
+from django.db import transaction
+from django.utils import timezone
 
+from todo.models.postgres import PostgresTask, PostgresTaskLabel
+from todo.repositories.outbox_repository import OutboxRepository
+from todo.repositories.sync_failure_repository import SyncFailureRepository
 from todo.services.dual_write_service import DualWriteService
+from todo.services.sync_retry_service import SyncRetryService
 
 logger = logging.getLogger(__name__)
 
+# Rows written per INSERT statement in batch mode
+BULK_BATCH_SIZE = 500
+# Fields an upsert must not overwrite on an existing row, like update_document
+BULK_PRESERVED_FIELDS = {"created_at", "mongo_id"}
+
+
+def _has_field(model, field_name: str) -> bool:
+    try:
+        model._meta.get_field(field_name)
+        return True
+    except FieldDoesNotExist:
+        return False
+
+
+def _operation(collection_name: str, operation: str, mongo_id: str, data: Dict[str, Any] | None = None) -> dict:
+    return {"collection_name": collection_name, "operation": operation, "mongo_id": mongo_id, "data": data or {}}
+
 
 class EnhancedDualWriteService(DualWriteService):
     """
     Enhanced dual-write service that provides additional functionality.
     Extends the base DualWriteService with batch operations and enhanced monitoring.
+
+    With DUAL_WRITE_OUTBOX_ENABLED, writes are not applied to Postgres here: they are appended
+    to the outbox collection (in the caller's Mongo session when one is given) and applied by
+    the `run_sync_relay` worker. Otherwise failed writes are stored in sync_failures with their
+    payload and retried by the `run_sync_retry` worker.
     """
 
     def __init__(self):
         super().__init__()
         self.enabled = getattr(settings, "DUAL_WRITE_ENABLED", True)
+        self.use_outbox = getattr(settings, "DUAL_WRITE_OUTBOX_ENABLED", False)
+        self.retry_delay = getattr(settings, "DUAL_WRITE_RETRY_DELAY", 5)
+        self.store_failures = getattr(settings, "DUAL_WRITE_FAILURE_STORE_ENABLED", True)
 
-    def create_document(self, collection_name: str, data: Dict[str, Any], mongo_id: str) -> bool:
+    def create_document(self, collection_name: str, data: Dict[str, Any], mongo_id: str, session=None) -> bool:
         """
         Create a document in both MongoDB and Postgres.
         """
@@ -25,9 +57,15 @@ class EnhancedDualWriteService(DualWriteService):
             logger.debug("Dual-write is disabled, skipping Postgres sync")
             return True
 
-        return super().create_document(collection_name, data, mongo_id)
+        if self.use_outbox:
+            return self._enqueue([_operation(collection_name, "create", mongo_id, data)], session)
 
-    def update_document(self, collection_name: str, mongo_id: str, data: Dict[str, Any]) -> bool:
+        success = super().create_document(collection_name, data, mongo_id)
+        if not success:
+            self._store_failure(collection_name, "create", mongo_id, data)
+        return success
+
+    def update_document(self, collection_name: str, mongo_id: str, data: Dict[str, Any], session=None) -> bool:
         """
         Update a document in both MongoDB and Postgres.
         """
@@ -35,9 +73,15 @@ class EnhancedDualWriteService(DualWriteService):
             logger.debug("Dual-write is disabled, skipping Postgres sync")
             return True
 
-        return super().update_document(collection_name, mongo_id, data)
+        if self.use_outbox:
+            return self._enqueue([_operation(collection_name, "update", mongo_id, data)], session)
+
+        success = super().update_document(collection_name, mongo_id, data)
+        if not success:
+            self._store_failure(collection_name, "update", mongo_id, data)
+        return success
 
-    def delete_document(self, collection_name: str, mongo_id: str) -> bool:
+    def delete_document(self, collection_name: str, mongo_id: str, session=None) -> bool:
         """
         Delete a document from both MongoDB and Postgres.
         """
@@ -45,9 +89,15 @@ class EnhancedDualWriteService(DualWriteService):
             logger.debug("Dual-write is disabled, skipping Postgres sync")
             return True
 
-        return super().delete_document(collection_name, mongo_id)
+        if self.use_outbox:
+            return self._enqueue([_operation(collection_name, "delete", mongo_id)], session)
 
-    def batch_operations(self, operations: list) -> bool:
+        success = super().delete_document(collection_name, mongo_id)
+        if not success:
+            self._store_failure(collection_name, "delete", mongo_id)
+        return success
+
+    def batch_operations(self, operations: list, session=None) -> bool:
         """
         Perform multiple operations in batch.
         """
@@ -55,42 +105,252 @@ class EnhancedDualWriteService(DualWriteService):
             logger.debug("Dual-write is disabled, skipping Postgres sync")
             return True
 
+        if self.use_outbox:
+            return self._enqueue(operations, session)
+
         return self._batch_operations_sync(operations)
 
+    def _enqueue(self, operations: list, session=None) -> bool:
+        """
+        Append operations to the outbox.
+
+        A failure inside a transaction is re-raised so that the Mongo write is rolled back with it;
+        without a session there is nothing to roll back and it is reported like a sync failure.
+        """
+        try:
+            OutboxRepository.enqueue_many(operations, session=session)
+            return True
+        except Exception as e:
+            if session is not None:
+                raise
+            for op in operations:
+                self._record_sync_failure(
+                    op["collection_name"], str(op["mongo_id"]), f"Failed to enqueue sync: {str(e)}"
+                )
+            return False
+
     def _batch_operations_sync(self, operations: list) -> bool:
-        """Perform batch operations synchronously."""
-        success_count = 0
+        """
+        Perform batch operations in a single Postgres transaction.
+
+        Creates and updates are merged per document, grouped by collection and written with one
+        upsert per group; deletes are applied with one query per collection. A group that fails is
+        retried one operation at a time so that failures are still recorded per document.
+        Documents deleted and then written again within the batch are applied one at a time, in order.
+        """
+        upsert_groups: Dict[tuple, Dict[str, tuple]] = {}
+        delete_groups: Dict[str, Dict[str, list]] = {}
+        sequential: Dict[tuple, list] = {}
+        valid_operations = []
         failure_count = 0
 
         for op in operations:
             try:
                 collection_name = op["collection_name"]
-                data = op.get("data", {})
-                mongo_id = op["mongo_id"]
+                mongo_id = str(op["mongo_id"])
                 operation = op["operation"]
+            except (KeyError, TypeError) as e:
+                logger.error(f"Error processing operation {op}: {str(e)}")
+                failure_count += 1
+                continue
+            if operation not in ("create", "update", "delete"):
+                logger.error(f"Unknown operation: {operation}")
+                failure_count += 1
+                continue
+            valid_operations.append(op)
+            sequential.setdefault((collection_name, mongo_id), []).append(op)
+
+        for (collection_name, mongo_id), document_ops in list(sequential.items()):
+            kinds = [op["operation"] for op in document_ops]
+            if "delete" in kinds[:-1]:
+                continue
+            del sequential[(collection_name, mongo_id)]
+            if kinds[-1] == "delete":
+                delete_groups.setdefault(collection_name, {})[mongo_id] = document_ops
+                continue
+            try:
+                postgres_data = {}
+                for op in document_ops:
+                    postgres_data.update(
+                        self._transform_data_for_postgres(collection_name, op.get("data", {}), mongo_id)
+                    )
+            except Exception as e:
+                logger.error(f"Error processing operation {document_ops[-1]}: {str(e)}")
+                self._store_failure(
+                    collection_name, document_ops[-1]["operation"], mongo_id, document_ops[-1].get("data"), str(e)
+                )
+                failure_count += len(document_ops)
+                continue
+            group_key = (collection_name, tuple(sorted(postgres_data)))
+            upsert_groups.setdefault(group_key, {})[mongo_id] = (postgres_data, document_ops)
 
-                if operation == "create":
-                    success = super().create_document(collection_name, data, mongo_id)
-                elif operation == "update":
-                    success = super().update_document(collection_name, mongo_id, data)
-                elif operation == "delete":
-                    success = super().delete_document(collection_name, mongo_id)
-                else:
-                    logger.error(f"Unknown operation: {operation}")
-                    failure_count += 1
-                    continue
+        success_count = 0
+        try:
+            with transaction.atomic():
+                for (collection_name, _), documents in upsert_groups.items():
+                    group_ops = [op for _, document_ops in documents.values() for op in document_ops]
+                    try:
+                        with transaction.atomic():
+                            self._bulk_upsert(
+                                collection_name,
+                                {mongo_id: postgres_data for mongo_id, (postgres_data, _) in documents.items()},
+                            )
+                        success_count += len(group_ops)
+                    except Exception as e:
+                        logger.warning(f"Bulk upsert into {collection_name} failed, applying one by one: {str(e)}")
+                        succeeded, failed = self._apply_operations(group_ops)
+                        success_count += succeeded
+                        failure_count += failed
+
+                for collection_name, documents in delete_groups.items():
+                    group_ops = [op for document_ops in documents.values() for op in document_ops]
+                    try:
+                        with transaction.atomic():
+                            self._bulk_delete(collection_name, list(documents))
+                        success_count += len(group_ops)
+                    except Exception as e:
+                        logger.warning(f"Bulk delete from {collection_name} failed, applying one by one: {str(e)}")
+                        succeeded, failed = self._apply_operations(group_ops)
+                        success_count += succeeded
+                        failure_count += failed
+
+                for document_ops in sequential.values():
+                    succeeded, failed = self._apply_operations(document_ops)
+                    success_count += succeeded
+                    failure_count += failed
+        except Exception as e:
+            logger.error(f"Batch sync transaction failed: {str(e)}")
+            for op in valid_operations:
+                self._store_failure(op["collection_name"], op["operation"], op["mongo_id"], op.get("data"), str(e))
+            failure_count = len(operations)
+            success_count = 0
 
-                if success:
-                    success_count += 1
-                else:
-                    failure_count += 1
+        logger.info(f"Batch sync completed. Success: {success_count}, Failures: {failure_count}")
+        return failure_count == 0
+
+    def _apply_operations(self, operations: list) -> Tuple[int, int]:
+        """
+        Apply operations one at a time, storing failures per document.
 
+        Returns:
+            Tuple[int, int]: Number of succeeded and failed operations
+        """
+        success_count = 0
+        failure_count = 0
+
+        for op in operations:
+            collection_name = op["collection_name"]
+            mongo_id = str(op["mongo_id"])
+            try:
+                if op["operation"] == "create":
+                    success = super().create_document(collection_name, op.get("data", {}), mongo_id)
+                elif op["operation"] == "update":
+                    success = super().update_document(collection_name, mongo_id, op.get("data", {}))
+                else:
+                    success = super().delete_document(collection_name, mongo_id)
             except Exception as e:
                 logger.error(f"Error processing operation {op}: {str(e)}")
+                success = False
+
+            if success:
+                success_count += 1
+            else:
+                self._store_failure(collection_name, op["operation"], mongo_id, op.get("data"))
                 failure_count += 1
 
-        logger.info(f"Batch sync completed. Success: {success_count}, Failures: {failure_count}")
-        return failure_count == 0
+        return success_count, failure_count
+
+    def _store_failure(
+        self,
+        collection_name: str,
+        operation: str,
+        mongo_id: str,
+        data: Dict[str, Any] | None = None,
+        error: str | None = None,
+    ) -> None:
+        """Save a failed sync with its payload so that it is retried."""
+        if not self.store_failures:
+            return
+        if error is None:
+            recorded = [failure for failure in self.sync_failures if failure["mongo_id"] == str(mongo_id)]
+            error = recorded[-1]["error"] if recorded else f"Failed to sync {collection_name}:{mongo_id}"
+        try:
+            SyncFailureRepository.record(collection_name, operation, mongo_id, data or {}, error, self.retry_delay)
+        except Exception as e:
+            logger.error(f"Failed to store sync failure for {collection_name}:{mongo_id}: {str(e)}")
+
+    def _bulk_upsert(self, collection_name: str, documents: Dict[str, Dict[str, Any]]) -> None:
+        """
+        Insert or update documents of one collection with a single upsert on mongo_id.
+
+        Args:
+            documents: Transformed Postgres data by mongo_id, all with the same fields
+        """
+        postgres_model = self._get_postgres_model(collection_name)
+        if not postgres_model:
+            raise ValueError(f"No Postgres model found for collection: {collection_name}")
+
+        now = timezone.now()
+        # Models stamp these in save(), which bulk_create does not call
+        stamped_fields = [field for field in ("created_at", "updated_at") if _has_field(postgres_model, field)]
+        labels_by_mongo_id = {}
+        instances = []
+        for mongo_id, postgres_data in documents.items():
+            data = dict(postgres_data)
+            if collection_name == "tasks":
+                labels_by_mongo_id[mongo_id] = data.pop("labels", [])
+            for field in stamped_fields:
+                if data.get(field) is None:
+                    data[field] = now
+            instances.append(postgres_model(**data))
+
+        update_fields = [field for field in data if field not in BULK_PRESERVED_FIELDS]
+        if _has_field(postgres_model, "last_sync_at"):
+            update_fields.append("last_sync_at")
+
+        postgres_model.objects.bulk_create(
+            instances,
+            batch_size=BULK_BATCH_SIZE,
+            update_conflicts=True,
+            unique_fields=["mongo_id"],
+            update_fields=update_fields,
+        )
+
+        if labels_by_mongo_id:
+            self._bulk_sync_task_labels(labels_by_mongo_id)
+
+    def _bulk_sync_task_labels(self, labels_by_mongo_id: Dict[str, List[str]]) -> None:
+        """Replace the labels of several tasks with one delete and one insert."""
+        task_pks = dict(
+            PostgresTask.objects.filter(mongo_id__in=list(labels_by_mongo_id)).values_list("mongo_id", "pk")
+        )
+        PostgresTaskLabel.objects.filter(task_id__in=list(task_pks.values())).delete()
+        PostgresTaskLabel.objects.bulk_create(
+            [
+                PostgresTaskLabel(task_id=task_pks[mongo_id], label_mongo_id=label_mongo_id)
+                for mongo_id, labels in labels_by_mongo_id.items()
+                if mongo_id in task_pks
+                for label_mongo_id in dict.fromkeys(str(label) for label in labels if label)
+            ],
+            batch_size=BULK_BATCH_SIZE,
+        )
+
+    def _bulk_delete(self, collection_name: str, mongo_ids: List[str]) -> None:
+        """Soft delete documents of one collection, or delete them if the model has no is_deleted field."""
+        postgres_model = self._get_postgres_model(collection_name)
+        if not postgres_model:
+            raise ValueError(f"No Postgres model found for collection: {collection_name}")
+
+        queryset = postgres_model.objects.filter(mongo_id__in=mongo_ids)
+        if not _has_field(postgres_model, "is_deleted"):
+            queryset.delete()
+            return
+
+        now = timezone.now()
+        update = {"is_deleted": True, "sync_status": "SYNCED", "sync_error": None, "last_sync_at": now}
+        if _has_field(postgres_model, "updated_at"):
+            update["updated_at"] = now
+        queryset.update(**update)
 
     def get_sync_status(self, collection_name: str, mongo_id: str) -> Optional[str]:
         """
@@ -118,26 +378,14 @@ class EnhancedDualWriteService(DualWriteService):
 
     def get_sync_metrics(self) -> Dict[str, Any]:
         """
-        Get metrics about sync operations.
+        Get metrics about sync operations from the sync failure store.
 
         Returns:
             Dict: Sync metrics
         """
         try:
-            metrics = {
-                "total_failures": len(self.sync_failures),
-                "failures_by_collection": {},
-                "recent_failures": self.sync_failures[-10:] if self.sync_failures else [],
-                "enabled": self.enabled,
-            }
-
-            # Count failures by collection
-            for failure in self.sync_failures:
-                collection = failure["collection"]
-                if collection not in metrics["failures_by_collection"]:
-                    metrics["failures_by_collection"][collection] = 0
-                metrics["failures_by_collection"][collection] += 1
-
+            metrics = SyncFailureRepository.get_metrics()
+            metrics["enabled"] = self.enabled
             return metrics
         except Exception as e:
             logger.error(f"Error getting sync metrics: {str(e)}")
@@ -145,7 +393,7 @@ class EnhancedDualWriteService(DualWriteService):
 
     def retry_failed_sync(self, collection_name: str, mongo_id: str) -> bool:
         """
-        Retry a failed sync operation.
+        Retry a stored failed sync now, including one that was parked as dead.
 
         Args:
             collection_name: Name of the MongoDB collection
@@ -155,25 +403,8 @@ class EnhancedDualWriteService(DualWriteService):
             bool: True if retry was successful, False otherwise
         """
         try:
-            # Find the failure record
-            failure_record = None
-            for failure in self.sync_failures:
-                if failure["collection"] == collection_name and failure["mongo_id"] == mongo_id:
-                    failure_record = failure
-                    break
-
-            if not failure_record:
-                logger.warning(f"No failure record found for {collection_name}:{mongo_id}")
-                return False
-
-            # Remove from failures list
-            self.sync_failures.remove(failure_record)
-
-            # Retry the operation (this would need the original data)
-            # For now, just log the retry attempt
             logger.info(f"Retrying sync for {collection_name}:{mongo_id}")
-
-            return True
+            return SyncRetryService().retry(collection_name, mongo_id)
         except Exception as e:
             logger.error(f"Error retrying failed sync for {collection_name}:{mongo_id}: {str(e)}")
             return False
@@ -1,28 +1,77 @@
 import logging
-from django.db import connection
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from itertools import islice
+from typing import Any, Dict, List
+
+from bson import ObjectId
 from django.conf import settings
+from django.db import close_old_connections, connection, connections, transaction
+from django.utils import timezone
 
-from todo_project.db.config import DatabaseManager
+from todo.models.postgres import PostgresDeferredDetails, PostgresTask
+from todo.models.sync_checkpoint import SYNC_CHECKPOINT_STATUS_RUNNING
+from todo.repositories.sync_checkpoint_repository import SyncCheckpointRepository
 from todo.services.dual_write_service import DualWriteService
+from todo.services.enhanced_dual_write_service import BULK_BATCH_SIZE, EnhancedDualWriteService
+from todo_project.db.config import DatabaseManager
 
 logger = logging.getLogger(__name__)
 
+BACKFILL_JOB = "backfill"
+# Timestamps the Postgres models stamp in save(), which bulk_create does not call
+STAMPED_FIELDS = ("created_at", "updated_at")
+
+
+@dataclass
+class BackfillResult:
+    collection: str
+    # Documents read from MongoDB by this run
+    scanned: int = 0
+    # inserted, existing and failed count from the start of the backfill, including resumed runs
+    inserted: int = 0
+    # Documents that already had a Postgres row
+    existing: int = 0
+    failed: int = 0
+    seconds: float = 0.0
+    resumed_from: str | None = None
+    # Skipped without reading MongoDB: the table already has as many rows as the collection
+    up_to_date: bool = False
+    error: str | None = None
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.scanned / self.seconds if self.seconds else 0.0
+
 
 class PostgresSyncService:
     """
     Service to synchronize PostgreSQL tables with MongoDB data.
-    Checks if tables exist and copies data from MongoDB if needed.
-    Currently handles labels and roles tables only.
+    Backfills the rows missing from the table of every collection of DualWriteService.COLLECTION_MODEL_MAP.
+
+    Each collection is streamed in _id order, batch_size documents at a time. The mongo_ids of a batch
+    that already have a row are read with one query and the others are inserted with bulk_create,
+    together with the labels and deferred details of tasks. Progress is checkpointed after every batch.
     """
 
-    def __init__(self):
+    def __init__(self, batch_size: int = 1000, workers: int = 1):
         self.db_manager = DatabaseManager()
-        self.dual_write_service = DualWriteService()
+        self.dual_write_service = EnhancedDualWriteService()
         self.enabled = getattr(settings, "POSTGRES_SYNC_ENABLED", True)
+        self.batch_size = batch_size
+        self.workers = workers
 
-    def sync_all_tables(self) -> bool:
+    def sync_all_tables(
+        self, collection_names: List[str] | None = None, force: bool = False, resume: bool = False
+    ) -> bool:
         """
-        Synchronize labels and roles PostgreSQL tables with MongoDB data.
+        Backfill PostgreSQL tables with MongoDB data, every mapped collection by default.
+
+        Args:
+            collection_names: Collections to backfill
+            force: Backfill tables that already have as many rows as their collection
+            resume: Continue an interrupted backfill after its last finished batch
 
         Returns:
             bool: True if all syncs completed successfully, False otherwise
@@ -31,198 +80,221 @@ class PostgresSyncService:
             logger.info("PostgreSQL sync is disabled, skipping")
             return True
 
-        logger.info("Starting PostgreSQL table synchronization for labels and roles")
-        logger.info(f"PostgreSQL sync enabled: {self.enabled}")
+        results = self.backfill(collection_names, force=force, resume=resume)
+        success_count = sum(1 for result in results if result.error is None and not result.failed)
+        logger.info(f"PostgreSQL sync completed - {success_count}/{len(results)} tables synced successfully")
+        return success_count == len(results)
 
-        sync_operations = [
-            ("labels", self._sync_labels_table),
-            ("roles", self._sync_roles_table),
-        ]
+    def backfill(
+        self, collection_names: List[str] | None = None, force: bool = False, resume: bool = False
+    ) -> List[BackfillResult]:
+        """
+        Backfill collections, up to `workers` at a time.
+        """
+        collection_names = collection_names or list(DualWriteService.COLLECTION_MODEL_MAP)
+        unknown = [name for name in collection_names if name not in DualWriteService.COLLECTION_MODEL_MAP]
+        if unknown:
+            raise ValueError(f"No Postgres model found for collections: {', '.join(unknown)}")
 
-        success_count = 0
-        total_operations = len(sync_operations)
+        if self.workers <= 1 or len(collection_names) == 1:
+            return [self.backfill_collection(name, force, resume) for name in collection_names]
 
-        for table_name, sync_func in sync_operations:
-            try:
-                logger.info(f"Syncing table: {table_name}")
-                if sync_func():
-                    logger.info(f"Successfully synced table: {table_name}")
-                    success_count += 1
-                else:
-                    logger.error(f"Failed to sync table: {table_name}")
-            except Exception as e:
-                logger.error(f"Error syncing table {table_name}: {str(e)}")
+        with ThreadPoolExecutor(max_workers=min(self.workers, len(collection_names))) as executor:
+            return list(executor.map(lambda name: self._backfill_in_thread(name, force, resume), collection_names))
 
-        logger.info(f"PostgreSQL sync completed - {success_count}/{total_operations} tables synced successfully")
-        return success_count == total_operations
+    def _backfill_in_thread(self, collection_name: str, force: bool, resume: bool) -> BackfillResult:
+        try:
+            return self.backfill_collection(collection_name, force, resume)
+        finally:
+            # Django connections are per thread; do not leak one per pool thread
+            connections.close_all()
 
-    def _check_table_exists(self, table_name: str) -> bool:
-        """
-        Check if a PostgreSQL table exists.
+    def backfill_collection(self, collection_name: str, force: bool = False, resume: bool = False) -> BackfillResult:
+        close_old_connections()
 
-        Args:
-            table_name: Name of the table to check
+        result = BackfillResult(collection=collection_name)
+        table_name = DualWriteService.COLLECTION_MODEL_MAP[collection_name]._meta.db_table
+        if not self._check_table_exists(table_name):
+            logger.warning(f"Table {table_name} does not exist, skipping sync")
+            return result
 
-        Returns:
-            bool: True if table exists, False otherwise
-        """
+        started = time.monotonic()
         try:
-            with connection.cursor() as cursor:
-                cursor.execute(
-                    """
-                    SELECT EXISTS (
-                        SELECT FROM information_schema.tables 
-                        WHERE table_schema = 'public' 
-                        AND table_name = %s
-                    );
-                """,
-                    [table_name],
-                )
-                return cursor.fetchone()[0]
+            self._stream_collection(collection_name, force, resume, result)
         except Exception as e:
-            logger.error(f"Error checking if table {table_name} exists: {str(e)}")
-            return False
+            result.error = str(e)
+            logger.error(f"Error syncing table {table_name}: {str(e)}")
+
+        result.seconds = time.monotonic() - started
+        if not result.up_to_date:
+            logger.info(
+                f"Backfilled {collection_name}: scanned={result.scanned} inserted={result.inserted} "
+                f"existing={result.existing} failed={result.failed} rows_per_second={result.rows_per_second:.0f}"
+            )
+        return result
+
+    def _stream_collection(self, collection_name: str, force: bool, resume: bool, result: BackfillResult) -> None:
+        checkpoint = SyncCheckpointRepository.get(BACKFILL_JOB, collection_name) if resume else None
+        if checkpoint and checkpoint.status == SYNC_CHECKPOINT_STATUS_RUNNING and checkpoint.last_id:
+            result.resumed_from = checkpoint.last_id
+            for counter in ("inserted", "existing", "failed"):
+                setattr(result, counter, checkpoint.counters.get(counter, 0))
+        elif not force and self._is_up_to_date(collection_name):
+            result.up_to_date = True
+            return
+        else:
+            SyncCheckpointRepository.start(BACKFILL_JOB, collection_name)
+
+        query = dict(DualWriteService.SYNCED_DOCUMENT_FILTERS.get(collection_name, {}))
+        if result.resumed_from:
+            last_id = result.resumed_from
+            query["_id"] = {"$gt": ObjectId(last_id) if ObjectId.is_valid(last_id) else last_id}
+
+        cursor = self.db_manager.get_collection(collection_name).find(query).sort("_id", 1).batch_size(self.batch_size)
+        try:
+            while documents := list(islice(cursor, self.batch_size)):
+                self._backfill_batch(collection_name, documents, result)
+                SyncCheckpointRepository.save_progress(
+                    BACKFILL_JOB, collection_name, str(documents[-1]["_id"]), self._get_counters(result)
+                )
+        finally:
+            cursor.close()
+        SyncCheckpointRepository.complete(BACKFILL_JOB, collection_name, self._get_counters(result))
 
-    def _get_mongo_collection_count(self, collection_name: str) -> int:
-        """
-        Get the count of documents in a MongoDB collection.
+    def _backfill_batch(self, collection_name: str, documents: List[Dict[str, Any]], result: BackfillResult) -> None:
+        postgres_model = DualWriteService.COLLECTION_MODEL_MAP[collection_name]
+        mongo_ids = [str(document["_id"]) for document in documents]
+        existing_ids = set(postgres_model.objects.filter(mongo_id__in=mongo_ids).values_list("mongo_id", flat=True))
+        missing = [document for document in documents if str(document["_id"]) not in existing_ids]
 
-        Args:
-            collection_name: Name of the MongoDB collection
+        result.scanned += len(documents)
+        result.existing += len(existing_ids)
+        if not missing:
+            return
 
-        Returns:
-            int: Number of documents in the collection
-        """
         try:
-            collection = self.db_manager.get_collection(collection_name)
-
-            # Labels use isDeleted field for soft deletes
-            if collection_name == "labels":
-                return collection.count_documents({"isDeleted": {"$ne": True}})
-            else:
-                # For roles and other collections without soft delete, count all documents
-                return collection.count_documents({})
-
+            with transaction.atomic():
+                self._bulk_insert(collection_name, missing)
+            result.inserted += len(missing)
         except Exception as e:
-            logger.error(f"Error getting count for collection {collection_name}: {str(e)}")
-            return 0
+            logger.warning(f"Bulk insert of {len(missing)} {collection_name} failed, inserting one at a time: {str(e)}")
+            inserted = self._insert_one_at_a_time(collection_name, missing)
+            result.inserted += inserted
+            result.failed += len(missing) - inserted
 
-    def _get_postgres_table_count(self, table_name: str) -> int:
+    def _bulk_insert(self, collection_name: str, documents: List[Dict[str, Any]]) -> None:
+        """
+        Insert documents with one bulk_create, and the labels and deferred details of tasks with one more each.
         """
-        Get the count of records in a PostgreSQL table.
+        postgres_model = DualWriteService.COLLECTION_MODEL_MAP[collection_name]
+        now = timezone.now()
+        stamped_fields = [name for name in STAMPED_FIELDS if any(f.name == name for f in postgres_model._meta.fields)]
+
+        instances = []
+        labels_by_mongo_id = {}
+        for document in documents:
+            mongo_id = str(document["_id"])
+            postgres_data = self.dual_write_service._transform_data_for_postgres(collection_name, document, mongo_id)
+            if collection_name == "tasks":
+                labels_by_mongo_id[mongo_id] = postgres_data.pop("labels", None) or []
+            for name in stamped_fields:
+                if postgres_data.get(name) is None:
+                    postgres_data[name] = now
+            instances.append(postgres_model(**postgres_data))
+
+        postgres_model.objects.bulk_create(instances, batch_size=BULK_BATCH_SIZE)
+
+        if collection_name == "tasks":
+            self.dual_write_service._bulk_sync_task_labels(labels_by_mongo_id)
+            self._bulk_insert_deferred_details(documents)
+
+    def _bulk_insert_deferred_details(self, documents: List[Dict[str, Any]]) -> None:
+        deferred_details_by_mongo_id = {
+            str(document["_id"]): document["deferredDetails"]
+            for document in documents
+            if document.get("deferredDetails")
+        }
+        if not deferred_details_by_mongo_id:
+            return
+
+        task_pks = dict(
+            PostgresTask.objects.filter(mongo_id__in=list(deferred_details_by_mongo_id)).values_list("mongo_id", "pk")
+        )
+        PostgresDeferredDetails.objects.bulk_create(
+            [
+                PostgresDeferredDetails(
+                    task_id=task_pks[mongo_id],
+                    deferred_at=deferred_details.get("deferredAt"),
+                    deferred_till=deferred_details.get("deferredTill"),
+                    deferred_by=str(deferred_details["deferredBy"]) if deferred_details.get("deferredBy") else None,
+                )
+                for mongo_id, deferred_details in deferred_details_by_mongo_id.items()
+                if mongo_id in task_pks
+            ],
+            batch_size=BULK_BATCH_SIZE,
+        )
 
-        Args:
-            table_name: Name of the PostgreSQL table
+    def _insert_one_at_a_time(self, collection_name: str, documents: List[Dict[str, Any]]) -> int:
+        """
+        Insert documents in a savepoint each, so that one invalid document does not fail the others.
 
         Returns:
-            int: Number of records in the table
+            int: Number of inserted documents
         """
-        try:
-            with connection.cursor() as cursor:
-                cursor.execute(f"SELECT COUNT(*) FROM {table_name};")
-                return cursor.fetchone()[0]
-        except Exception as e:
-            logger.error(f"Error getting count for table {table_name}: {str(e)}")
-            return 0
-
-    def _sync_labels_table(self) -> bool:
-        """Synchronize the labels table."""
-        table_name = "postgres_labels"
-
-        if not self._check_table_exists(table_name):
-            logger.warning(f"Table {table_name} does not exist, skipping sync")
-            return True
-
-        mongo_count = self._get_mongo_collection_count("labels")
-        postgres_count = self._get_postgres_table_count(table_name)
+        inserted = 0
+        for document in documents:
+            try:
+                with transaction.atomic():
+                    self._bulk_insert(collection_name, [document])
+                inserted += 1
+            except Exception as e:
+                logger.error(f"Error syncing {collection_name} {document.get('_id')}: {str(e)}")
+        return inserted
 
+    def _is_up_to_date(self, collection_name: str) -> bool:
+        mongo_count = self._get_mongo_collection_count(collection_name)
+        postgres_count = DualWriteService.COLLECTION_MODEL_MAP[collection_name].objects.count()
         if postgres_count >= mongo_count:
-            logger.info(f"Labels table already has {postgres_count} records, MongoDB has {mongo_count}. Skipping sync.")
+            logger.info(
+                f"Table for {collection_name} already has {postgres_count} records, "
+                f"MongoDB has {mongo_count}. Skipping sync."
+            )
             return True
+        return False
 
-        logger.info(f"Syncing labels: MongoDB has {mongo_count} records, PostgreSQL has {postgres_count} records")
-        logger.info(f"Will sync {mongo_count - postgres_count} labels to PostgreSQL")
-
-        try:
-            collection = self.db_manager.get_collection("labels")
-            labels = collection.find({"isDeleted": {"$ne": True}})
-
-            synced_count = 0
-            for label in labels:
-                try:
-                    # Check if label already exists in PostgreSQL
-                    from todo.models.postgres.label import PostgresLabel
-
-                    existing = PostgresLabel.objects.filter(mongo_id=str(label["_id"])).first()
-                    if existing:
-                        continue
-
-                    # Transform data for PostgreSQL
-                    postgres_data = self.dual_write_service._transform_label_data(label)
-                    postgres_data["mongo_id"] = str(label["_id"])
-                    postgres_data["sync_status"] = "SYNCED"
-
-                    logger.debug(f"Creating label in PostgreSQL: {postgres_data}")
-
-                    # Create in PostgreSQL
-                    PostgresLabel.objects.create(**postgres_data)
-                    synced_count += 1
-
-                except Exception as e:
-                    logger.error(f"Error syncing label {label.get('_id')}: {str(e)}")
-                    continue
+    def _check_table_exists(self, table_name: str) -> bool:
+        """
+        Check if a PostgreSQL table exists.
 
-            logger.info(f"Successfully synced {synced_count} labels to PostgreSQL")
-            return True
+        Args:
+            table_name: Name of the table to check
 
+        Returns:
+            bool: True if table exists, False otherwise
+        """
+        try:
+            return table_name in connection.introspection.table_names()
         except Exception as e:
-            logger.error(f"Error syncing labels table: {str(e)}")
+            logger.error(f"Error checking if table {table_name} exists: {str(e)}")
             return False
 
-    def _sync_roles_table(self) -> bool:
-        """Synchronize the roles table."""
-        table_name = "postgres_roles"
-
-        if not self._check_table_exists(table_name):
-            logger.warning(f"Table {table_name} does not exist, skipping sync")
-            return True
-
-        mongo_count = self._get_mongo_collection_count("roles")
-        postgres_count = self._get_postgres_table_count(table_name)
-
-        if postgres_count >= mongo_count:
-            logger.info(f"Roles table already has {postgres_count} records, MongoDB has {mongo_count}. Skipping sync.")
-            return True
-
-        logger.info(f"Syncing roles: MongoDB has {mongo_count} records, PostgreSQL has {postgres_count} records")
-
-        try:
-            collection = self.db_manager.get_collection("roles")
-            roles = collection.find({})
-
-            synced_count = 0
-            for role in roles:
-                try:
-                    from todo.models.postgres.role import PostgresRole
-
-                    existing = PostgresRole.objects.filter(mongo_id=str(role["_id"])).first()
-                    if existing:
-                        continue
-
-                    postgres_data = self.dual_write_service._transform_role_data(role)
-                    postgres_data["mongo_id"] = str(role["_id"])
-                    postgres_data["sync_status"] = "SYNCED"
-
-                    PostgresRole.objects.create(**postgres_data)
-                    synced_count += 1
-
-                except Exception as e:
-                    logger.error(f"Error syncing role {role.get('_id')}: {str(e)}")
-                    continue
+    def _get_mongo_collection_count(self, collection_name: str) -> int:
+        """
+        Get the count of documents of a MongoDB collection that have a Postgres row.
 
-            logger.info(f"Successfully synced {synced_count} roles to PostgreSQL")
-            return True
+        Args:
+            collection_name: Name of the MongoDB collection
 
-        except Exception as e:
-            logger.error(f"Error syncing roles table: {str(e)}")
-            return False
+        Returns:
+            int: Number of documents in the collection
+        """
+        collection = self.db_manager.get_collection(collection_name)
+        return collection.count_documents(DualWriteService.SYNCED_DOCUMENT_FILTERS.get(collection_name, {}))
+
+    def _get_counters(self, result: BackfillResult) -> Dict[str, int]:
+        return {
+            "scanned": result.scanned,
+            "inserted": result.inserted,
+            "existing": result.existing,
+            "failed": result.failed,
+        }
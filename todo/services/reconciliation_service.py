@@ -0,0 +1,348 @@
+import hashlib
+import json
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from enum import Enum
+from typing import Any, Dict, List, Tuple
+
+from bson import ObjectId
+from django.db import close_old_connections, connections
+
+from todo.models.postgres import PostgresTaskLabel
+from todo.models.sync_checkpoint import SYNC_CHECKPOINT_STATUS_RUNNING
+from todo.repositories.sync_checkpoint_repository import SyncCheckpointRepository
+from todo.services.dual_write_service import DualWriteService
+from todo.services.enhanced_dual_write_service import EnhancedDualWriteService
+from todo_project.db.config import DatabaseManager
+
+logger = logging.getLogger(__name__)
+
+RECONCILE_JOB = "reconcile"
+# Sync metadata, and timestamps that the Postgres models stamp themselves in save()
+UNCOMPARED_FIELDS = {"mongo_id", "sync_status", "sync_error", "created_at", "updated_at"}
+# Number of differing ids kept per collection for the report
+MAX_SAMPLE_IDS = 20
+
+CHECKPOINT_COUNTERS = (
+    "rows",
+    "chunks",
+    "mismatched_chunks",
+    "missing",
+    "extra",
+    "different",
+    "repaired",
+    "repair_failed",
+)
+
+
+def _normalize(value: Any) -> Any:
+    """
+    Bring a Mongo or Postgres value to a common form. Datetimes are compared in UTC at
+    millisecond precision, the precision of BSON dates.
+    """
+    if isinstance(value, Enum):
+        value = value.value
+    if isinstance(value, datetime):
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        value = value.astimezone(timezone.utc)
+        return value.replace(microsecond=value.microsecond // 1000 * 1000).isoformat()
+    if isinstance(value, ObjectId):
+        return str(value)
+    if isinstance(value, dict):
+        return {str(key): _normalize(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_normalize(item) for item in value]
+    return value
+
+
+def _hash_row(row: Dict[str, Any]) -> str:
+    return hashlib.sha1(json.dumps(row, sort_keys=True, default=str).encode()).hexdigest()
+
+
+def _hash_chunk(row_hashes: Dict[str, str]) -> str:
+    digest = hashlib.sha1()
+    for mongo_id in sorted(row_hashes):
+        digest.update(f"{mongo_id}:{row_hashes[mongo_id]}\n".encode())
+    return digest.hexdigest()
+
+
+def _to_mongo_id(mongo_id: str) -> Any:
+    return ObjectId(mongo_id) if ObjectId.is_valid(mongo_id) else mongo_id
+
+
+@dataclass
+class ReconcileResult:
+    collection: str
+    # Mongo documents and Postgres rows compared, including the runs this one resumed
+    rows: int = 0
+    chunks: int = 0
+    mismatched_chunks: int = 0
+    # Documents without a Postgres row
+    missing: int = 0
+    # Postgres rows without a Mongo document
+    extra: int = 0
+    # Documents whose Postgres row has different values
+    different: int = 0
+    repaired: int = 0
+    repair_failed: int = 0
+    # Rows compared by this run, and how long it took
+    scanned: int = 0
+    seconds: float = 0.0
+    resumed_from: str | None = None
+    sample_ids: List[str] = field(default_factory=list)
+    error: str | None = None
+
+    @property
+    def in_sync(self) -> bool:
+        return self.error is None and self.missing + self.extra + self.different == self.repaired
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.scanned / self.seconds if self.seconds else 0.0
+
+
+class ReconciliationService:
+    """
+    Compares the Mongo collections of DualWriteService.COLLECTION_MODEL_MAP with their Postgres
+    tables in _id-ordered chunks. Each side of a chunk is hashed from the fields the dual-write
+    transforms produce; only chunks whose hashes differ are diffed row by row, and repaired when
+    `repair` is set by writing the Mongo documents to Postgres and deleting the rows without one.
+
+    Progress is checkpointed after every chunk and an interrupted run resumes where it stopped.
+    Up to `workers` collections are reconciled at a time; the chunks of one collection are walked
+    in order so that the checkpoint stays a single position.
+    """
+
+    def __init__(self, chunk_size: int = 1000, workers: int = 4, repair: bool = False):
+        self.chunk_size = chunk_size
+        self.workers = workers
+        self.repair = repair
+        self.db_manager = DatabaseManager()
+
+    def reconcile(self, collection_names: List[str] | None = None, restart: bool = False) -> List[ReconcileResult]:
+        """
+        Reconcile collections, all of them by default.
+
+        Args:
+            restart: Start from the first document even when a previous run was interrupted
+        """
+        collection_names = collection_names or list(DualWriteService.COLLECTION_MODEL_MAP)
+        unknown = [name for name in collection_names if name not in DualWriteService.COLLECTION_MODEL_MAP]
+        if unknown:
+            raise ValueError(f"No Postgres model found for collections: {', '.join(unknown)}")
+
+        if self.workers <= 1 or len(collection_names) == 1:
+            return [self.reconcile_collection(name, restart) for name in collection_names]
+
+        with ThreadPoolExecutor(max_workers=min(self.workers, len(collection_names))) as executor:
+            return list(executor.map(lambda name: self._reconcile_in_thread(name, restart), collection_names))
+
+    def _reconcile_in_thread(self, collection_name: str, restart: bool) -> ReconcileResult:
+        try:
+            return self.reconcile_collection(collection_name, restart)
+        finally:
+            # Django connections are per thread; do not leak one per pool thread
+            connections.close_all()
+
+    def reconcile_collection(self, collection_name: str, restart: bool = False) -> ReconcileResult:
+        close_old_connections()
+
+        result = ReconcileResult(collection=collection_name)
+        checkpoint = None if restart else SyncCheckpointRepository.get(RECONCILE_JOB, collection_name)
+        if checkpoint and checkpoint.status == SYNC_CHECKPOINT_STATUS_RUNNING and checkpoint.last_id:
+            result.resumed_from = checkpoint.last_id
+            for counter in CHECKPOINT_COUNTERS:
+                setattr(result, counter, checkpoint.counters.get(counter, 0))
+        else:
+            SyncCheckpointRepository.start(RECONCILE_JOB, collection_name)
+
+        dual_write_service = EnhancedDualWriteService()
+        fields = self._get_compared_fields(dual_write_service, collection_name)
+        last_id = result.resumed_from
+        started = time.monotonic()
+
+        try:
+            while True:
+                documents = self._get_mongo_chunk(collection_name, last_id)
+                upper_id = str(documents[-1]["_id"]) if documents else None
+                rows = self._get_postgres_chunk(collection_name, fields, last_id, upper_id)
+                if not documents and not rows:
+                    break
+
+                self._reconcile_chunk(dual_write_service, collection_name, fields, documents, rows, result)
+                last_id = upper_id or rows[-1]["mongo_id"]
+                SyncCheckpointRepository.save_progress(
+                    RECONCILE_JOB, collection_name, last_id, self._get_counters(result)
+                )
+
+            SyncCheckpointRepository.complete(RECONCILE_JOB, collection_name, self._get_counters(result))
+        except Exception as e:
+            result.error = str(e)
+            logger.error(f"Reconciliation of {collection_name} stopped after {last_id}: {str(e)}")
+
+        result.seconds = time.monotonic() - started
+        logger.info(
+            f"Reconciled {collection_name}: rows={result.rows} mismatched_chunks={result.mismatched_chunks} "
+            f"missing={result.missing} extra={result.extra} different={result.different} "
+            f"repaired={result.repaired} rows_per_second={result.rows_per_second:.0f}"
+        )
+        return result
+
+    def _reconcile_chunk(
+        self,
+        dual_write_service: EnhancedDualWriteService,
+        collection_name: str,
+        fields: List[str],
+        documents: List[Dict[str, Any]],
+        rows: List[Dict[str, Any]],
+        result: ReconcileResult,
+    ) -> None:
+        mongo_hashes = {}
+        for document in documents:
+            mongo_id = str(document["_id"])
+            mongo_hashes[mongo_id] = _hash_row(
+                self._normalize_document(dual_write_service, collection_name, fields, document)
+            )
+        postgres_hashes = {
+            row["mongo_id"]: _hash_row({name: _normalize(row.get(name)) for name in fields}) for row in rows
+        }
+
+        result.chunks += 1
+        result.rows += len(documents) + len(rows)
+        result.scanned += len(documents) + len(rows)
+        if _hash_chunk(mongo_hashes) == _hash_chunk(postgres_hashes):
+            return
+
+        result.mismatched_chunks += 1
+        missing, extra, different = self._diff(mongo_hashes, postgres_hashes)
+        result.missing += len(missing)
+        result.extra += len(extra)
+        result.different += len(different)
+        result.sample_ids.extend((missing + extra + different)[: MAX_SAMPLE_IDS - len(result.sample_ids)])
+
+        if self.repair:
+            to_write = set(missing) | set(different)
+            repaired, failed = self._repair(
+                dual_write_service,
+                collection_name,
+                [document for document in documents if str(document["_id"]) in to_write],
+                extra,
+            )
+            result.repaired += repaired
+            result.repair_failed += failed
+
+    def _diff(
+        self, mongo_hashes: Dict[str, str], postgres_hashes: Dict[str, str]
+    ) -> Tuple[List[str], List[str], List[str]]:
+        """
+        Returns:
+            Tuple[List[str], List[str], List[str]]: Ids missing from Postgres, only in Postgres, and differing
+        """
+        missing = [mongo_id for mongo_id in mongo_hashes if mongo_id not in postgres_hashes]
+        extra = [mongo_id for mongo_id in postgres_hashes if mongo_id not in mongo_hashes]
+        different = [
+            mongo_id
+            for mongo_id, row_hash in mongo_hashes.items()
+            if mongo_id in postgres_hashes and postgres_hashes[mongo_id] != row_hash
+        ]
+        return missing, extra, different
+
+    def _repair(
+        self,
+        dual_write_service: EnhancedDualWriteService,
+        collection_name: str,
+        documents: List[Dict[str, Any]],
+        extra_ids: List[str],
+    ) -> Tuple[int, int]:
+        """
+        Write documents to Postgres with one bulk upsert and delete the rows that have no document.
+
+        Returns:
+            Tuple[int, int]: Number of repaired and failed rows
+        """
+        failed = 0
+        if documents:
+            dual_write_service.clear_sync_failures()
+            dual_write_service._batch_operations_sync(
+                [
+                    {
+                        "collection_name": collection_name,
+                        "operation": "update",
+                        "mongo_id": str(document["_id"]),
+                        "data": document,
+                    }
+                    for document in documents
+                ]
+            )
+            failed = len({failure["mongo_id"] for failure in dual_write_service.get_sync_failures()})
+
+        if extra_ids:
+            postgres_model = dual_write_service._get_postgres_model(collection_name)
+            try:
+                postgres_model.objects.filter(mongo_id__in=extra_ids).delete()
+            except Exception as e:
+                logger.error(f"Failed to delete {len(extra_ids)} orphaned {collection_name} rows: {str(e)}")
+                failed += len(extra_ids)
+
+        return len(documents) + len(extra_ids) - failed, failed
+
+    def _get_compared_fields(self, dual_write_service: DualWriteService, collection_name: str) -> List[str]:
+        postgres_model = dual_write_service._get_postgres_model(collection_name)
+        model_fields = {model_field.attname for model_field in postgres_model._meta.concrete_fields}
+        transformed = dual_write_service._transform_data_for_postgres(collection_name, {}, "")
+        fields = sorted(name for name in transformed if name in model_fields and name not in UNCOMPARED_FIELDS)
+        if collection_name == "tasks":
+            fields.append("labels")
+        return fields
+
+    def _normalize_document(
+        self, dual_write_service: DualWriteService, collection_name: str, fields: List[str], document: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        transformed = dual_write_service._transform_data_for_postgres(collection_name, document, str(document["_id"]))
+        row = {name: _normalize(transformed.get(name)) for name in fields}
+        if "labels" in row:
+            row["labels"] = sorted({label for label in row["labels"] or [] if label})
+        return row
+
+    def _get_mongo_chunk(self, collection_name: str, after_id: str | None) -> List[Dict[str, Any]]:
+        query = dict(DualWriteService.SYNCED_DOCUMENT_FILTERS.get(collection_name, {}))
+        if after_id:
+            query["_id"] = {"$gt": _to_mongo_id(after_id)}
+        cursor = self.db_manager.get_collection(collection_name).find(query).sort("_id", 1).limit(self.chunk_size)
+        return list(cursor)
+
+    def _get_postgres_chunk(
+        self, collection_name: str, fields: List[str], after_id: str | None, upper_id: str | None
+    ) -> List[Dict[str, Any]]:
+        """
+        Rows in (after_id, upper_id]. Without upper_id, the Mongo collection has no more documents
+        and the next chunk_size rows are returned.
+        """
+        postgres_model = DualWriteService.COLLECTION_MODEL_MAP[collection_name]
+        queryset = postgres_model.objects.filter(mongo_id__isnull=False)
+        if after_id:
+            queryset = queryset.filter(mongo_id__gt=after_id)
+        if upper_id:
+            queryset = queryset.filter(mongo_id__lte=upper_id)
+
+        columns = [name for name in fields if name != "labels"]
+        queryset = queryset.order_by("mongo_id").values("mongo_id", *columns)
+        rows = list(queryset if upper_id else queryset[: self.chunk_size])
+
+        if "labels" in fields and rows:
+            labels_by_mongo_id = {row["mongo_id"]: [] for row in rows}
+            task_labels = PostgresTaskLabel.objects.filter(task__mongo_id__in=list(labels_by_mongo_id)).values_list(
+                "task__mongo_id", "label_mongo_id"
+            )
+            for mongo_id, label_mongo_id in task_labels:
+                labels_by_mongo_id[mongo_id].append(label_mongo_id)
+            for row in rows:
+                row["labels"] = sorted(set(labels_by_mongo_id[row["mongo_id"]]))
+        return rows
+
+    def _get_counters(self, result: ReconcileResult) -> Dict[str, int]:
+        return {counter: getattr(result, counter) for counter in CHECKPOINT_COUNTERS}
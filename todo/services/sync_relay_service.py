@@ -0,0 +1,142 @@
+import logging
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Dict, Tuple
+
+from django.conf import settings
+from django.db import close_old_connections
+
+from todo.repositories.outbox_repository import OutboxRepository
+from todo.services.dual_write_service import DualWriteService
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class RelayBatchResult:
+    fetched: int = 0
+    synced: int = 0
+    failed: int = 0
+    dead: int = 0
+    # Events left for a later batch because an earlier event of the same document failed
+    deferred: int = 0
+    # Time between the enqueue and the sync of the most recent event synced in the batch
+    lag_seconds: float | None = None
+
+
+class SyncRelayService:
+    """
+    Drains the outbox into Postgres. Events are applied in insertion order; when an event fails,
+    the later events of the same document wait until it is synced or parked as dead.
+
+    Ordering is only guaranteed with a single relay process.
+    """
+
+    def __init__(self, batch_size: int = 100, max_attempts: int | None = None, retry_delay: int | None = None):
+        self.batch_size = batch_size
+        self.max_attempts = max_attempts or getattr(settings, "DUAL_WRITE_RETRY_ATTEMPTS", 3)
+        self.retry_delay = retry_delay if retry_delay is not None else getattr(settings, "DUAL_WRITE_RETRY_DELAY", 5)
+        self.dual_write_service = DualWriteService()
+        self._stopped = False
+
+    def _apply(self, event: Dict[str, Any]) -> Tuple[bool, str]:
+        """
+        Apply one event to Postgres.
+
+        Creates are applied as upserts: an event can be retried after Postgres committed it.
+
+        Returns:
+            Tuple[bool, str]: Whether the event was synced, and the error when it was not
+        """
+        collection_name = event["target_collection"]
+        mongo_id = event["mongo_id"]
+        operation = event["operation"]
+
+        self.dual_write_service.clear_sync_failures()
+        if operation in ("create", "update"):
+            success = self.dual_write_service.update_document(collection_name, mongo_id, event.get("data") or {})
+        elif operation == "delete":
+            success = self.dual_write_service.delete_document(collection_name, mongo_id)
+        else:
+            return False, f"Unknown operation: {operation}"
+
+        if success:
+            return True, ""
+        failures = self.dual_write_service.get_sync_failures()
+        return False, failures[-1]["error"] if failures else f"Failed to sync {collection_name}:{mongo_id}"
+
+    def run_once(self) -> RelayBatchResult:
+        """
+        Sync one batch of due outbox events.
+        """
+        close_old_connections()
+
+        result = RelayBatchResult()
+        events = OutboxRepository.get_ready_events(self.batch_size)
+        result.fetched = len(events)
+
+        synced_ids = []
+        failures = []
+        failed_keys = set()
+        last_synced_created_at = None
+
+        for event in events:
+            if event["key"] in failed_keys:
+                result.deferred += 1
+                continue
+
+            try:
+                success, error = self._apply(event)
+            except Exception as e:
+                success, error = False, str(e)
+
+            if success:
+                synced_ids.append(event["_id"])
+                last_synced_created_at = event["created_at"]
+            else:
+                failed_keys.add(event["key"])
+                failures.append((event, error))
+
+        now = datetime.now(timezone.utc)
+        OutboxRepository.mark_synced(synced_ids)
+        result.dead = OutboxRepository.mark_failed(failures, self.max_attempts, self.retry_delay, now)
+        result.synced = len(synced_ids)
+        result.failed = len(failures)
+        if last_synced_created_at is not None:
+            result.lag_seconds = (now - last_synced_created_at).total_seconds()
+
+        if result.dead:
+            logger.error(f"{result.dead} outbox events exceeded {self.max_attempts} attempts and were parked")
+        return result
+
+    def run(self, poll_interval: float = 1.0, metrics_interval: float = 60.0, drain: bool = False) -> None:
+        """
+        Sync batches until stopped. Sleeps for poll_interval whenever a batch is not full, and logs
+        the outbox lag every metrics_interval seconds.
+
+        Args:
+            drain: Return as soon as there are no more due events
+        """
+        self._stopped = False
+        last_metrics_at = 0.0
+
+        while not self._stopped:
+            result = self.run_once()
+            if result.fetched:
+                logger.info(
+                    f"Sync relay batch: synced={result.synced} failed={result.failed} dead={result.dead} "
+                    f"deferred={result.deferred} lag_seconds={result.lag_seconds}"
+                )
+
+            if time.monotonic() - last_metrics_at >= metrics_interval:
+                logger.info(f"Sync relay outbox metrics: {OutboxRepository.get_lag_metrics()}")
+                last_metrics_at = time.monotonic()
+
+            if result.fetched < self.batch_size:
+                if drain:
+                    return
+                time.sleep(poll_interval)
+
+    def stop(self) -> None:
+        self._stopped = True
@@ -0,0 +1,169 @@
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Tuple
+
+from django.conf import settings
+from django.db import close_old_connections, connections
+
+from todo.models.sync_failure import SyncFailureModel
+from todo.repositories.sync_failure_repository import SyncFailureRepository
+from todo.services.dual_write_service import DualWriteService
+
+logger = logging.getLogger(__name__)
+
+RETRY_STATUS_SYNCED = "synced"
+RETRY_STATUS_SUPERSEDED = "superseded"
+RETRY_STATUS_FAILED = "failed"
+
+
+@dataclass
+class RetryBatchResult:
+    fetched: int = 0
+    synced: int = 0
+    # Failures dropped because a later write of the same document already reached Postgres
+    superseded: int = 0
+    failed: int = 0
+    dead: int = 0
+
+
+class SyncRetryService:
+    """
+    Retries the failed syncs stored in sync_failures with exponential backoff, up to
+    DUAL_WRITE_RETRY_ATTEMPTS retries starting DUAL_WRITE_RETRY_DELAY seconds after the failure.
+    A batch is retried by at most `workers` threads at a time.
+    """
+
+    def __init__(
+        self,
+        batch_size: int = 50,
+        workers: int = 4,
+        max_attempts: int | None = None,
+        retry_delay: int | None = None,
+    ):
+        self.batch_size = batch_size
+        self.workers = workers
+        self.max_attempts = max_attempts or getattr(settings, "DUAL_WRITE_RETRY_ATTEMPTS", 3)
+        self.retry_delay = retry_delay if retry_delay is not None else getattr(settings, "DUAL_WRITE_RETRY_DELAY", 5)
+        self._stopped = False
+
+    def _is_superseded(self, dual_write_service: DualWriteService, failure: SyncFailureModel) -> bool:
+        postgres_model = dual_write_service._get_postgres_model(failure.target_collection)
+        if not postgres_model:
+            return False
+        last_sync_at = (
+            postgres_model.objects.filter(mongo_id=failure.mongo_id).values_list("last_sync_at", flat=True).first()
+        )
+        return last_sync_at is not None and last_sync_at > failure.failed_at
+
+    def retry_failure(self, failure: SyncFailureModel) -> Tuple[str, str]:
+        """
+        Apply the stored payload of a failure to Postgres. Creates are applied as upserts.
+
+        Returns:
+            Tuple[str, str]: Retry status, and the error when it failed
+        """
+        dual_write_service = DualWriteService()
+        try:
+            if self._is_superseded(dual_write_service, failure):
+                return RETRY_STATUS_SUPERSEDED, ""
+
+            if failure.operation == "delete":
+                success = dual_write_service.delete_document(failure.target_collection, failure.mongo_id)
+            else:
+                success = dual_write_service.update_document(failure.target_collection, failure.mongo_id, failure.data)
+        except Exception as e:
+            return RETRY_STATUS_FAILED, str(e)
+
+        if success:
+            return RETRY_STATUS_SYNCED, ""
+        failures = dual_write_service.get_sync_failures()
+        return RETRY_STATUS_FAILED, failures[-1]["error"] if failures else "Retry failed"
+
+    def _retry_in_thread(self, failure: SyncFailureModel) -> Tuple[str, str]:
+        try:
+            return self.retry_failure(failure)
+        finally:
+            # Django connections are per thread; do not leak one per pool thread
+            connections.close_all()
+
+    def run_once(self) -> RetryBatchResult:
+        """
+        Retry one batch of due failures.
+        """
+        close_old_connections()
+
+        result = RetryBatchResult()
+        failures = SyncFailureRepository.get_due(self.batch_size)
+        result.fetched = len(failures)
+        if not failures:
+            return result
+
+        with ThreadPoolExecutor(max_workers=max(1, min(self.workers, len(failures)))) as executor:
+            outcomes = list(executor.map(self._retry_in_thread, failures))
+
+        resolved = []
+        still_failing = []
+        for failure, (status, error) in zip(failures, outcomes):
+            if status == RETRY_STATUS_FAILED:
+                still_failing.append((failure, error))
+                continue
+            resolved.append(failure)
+            if status == RETRY_STATUS_SUPERSEDED:
+                result.superseded += 1
+            else:
+                result.synced += 1
+
+        SyncFailureRepository.resolve(resolved)
+        result.dead = SyncFailureRepository.mark_failed(still_failing, self.max_attempts, self.retry_delay)
+        result.failed = len(still_failing)
+
+        if result.dead:
+            logger.error(f"{result.dead} sync failures exceeded {self.max_attempts} retries and were parked")
+        return result
+
+    def retry(self, collection_name: str, mongo_id: str) -> bool:
+        """
+        Retry the stored failure of one document now, whatever its status.
+
+        Returns:
+            bool: True if the document is in sync afterwards, False otherwise
+        """
+        if not SyncFailureRepository.requeue(collection_name, mongo_id):
+            logger.warning(f"No failure record found for {collection_name}:{mongo_id}")
+            return False
+
+        failure = SyncFailureRepository.get_by_key(collection_name, mongo_id)
+        status, error = self.retry_failure(failure)
+        if status == RETRY_STATUS_FAILED:
+            SyncFailureRepository.mark_failed([(failure, error)], self.max_attempts, self.retry_delay)
+            return False
+
+        SyncFailureRepository.resolve([failure])
+        return True
+
+    def run(self, poll_interval: float = 5.0, drain: bool = False) -> None:
+        """
+        Retry batches until stopped, sleeping for poll_interval whenever a batch is not full.
+
+        Args:
+            drain: Return as soon as there are no more due failures
+        """
+        self._stopped = False
+
+        while not self._stopped:
+            result = self.run_once()
+            if result.fetched:
+                logger.info(
+                    f"Sync retry batch: synced={result.synced} superseded={result.superseded} "
+                    f"failed={result.failed} dead={result.dead}"
+                )
+
+            if result.fetched < self.batch_size:
+                if drain:
+                    return
+                time.sleep(poll_interval)
+
+    def stop(self) -> None:
+        self._stopped = True
@@ -1,4 +1,4 @@
-from typing import List
+from typing import Dict, Iterable, List, Set
 from dataclasses import dataclass
 from django.core.exceptions import ValidationError
 from django.urls import reverse_lazy
@@ -11,6 +11,7 @@ from todo.dto.task_assignment_dto import CreateTaskAssignmentDTO
 from todo.dto.user_dto import UserDTO
 from todo.dto.responses.get_tasks_response import GetTasksResponse
 from todo.dto.responses.create_task_response import CreateTaskResponse
+from todo.dto.responses.bulk_task_response import BulkTaskResult
 
 from todo.dto.responses.error_response import (
     ApiErrorResponse,
@@ -27,6 +28,7 @@ from todo.models.common.pyobjectid import PyObjectId
 from todo.repositories.task_repository import TaskRepository
 from todo.repositories.label_repository import LabelRepository
 from todo.repositories.team_repository import TeamRepository
+from todo.repositories.task_visibility_repository import TaskVisibilityRepository
 from todo.constants.task import (
     TaskStatus,
     TaskPriority,
@@ -46,6 +48,16 @@ import math
 from todo.models.audit_log import AuditLogModel
 from todo.repositories.audit_log_repository import AuditLogRepository
 from todo.services.task_assignment_service import TaskAssignmentService
+from todo.utils.cursor_utils import TaskCursor, encode_cursor
+
+
+@dataclass
+class _BulkReferences:
+    """IDs of the users, teams and labels referenced by a bulk request that exist."""
+
+    user_ids: Set[str]
+    team_ids: Set[str]
+    label_ids: Set[str]
 
 
 @dataclass
@@ -74,7 +86,16 @@ class TaskService:
         user_id: str,
         team_id: str = None,
         status_filter: str = None,
+        cursor: TaskCursor | str | None = None,
+        include_total: bool = True,
     ) -> GetTasksResponse:
+        """
+        Args:
+            cursor: Position decoded and checked against the sort by GetTaskQueryParamsSerializer; an empty
+                string starts cursor pagination at the first page
+            include_total: Count the matching tasks to build the next link; without the count, a next link
+                is given whenever the page is full
+        """
         try:
             cls._validate_pagination_params(page, limit)
 
@@ -92,17 +113,26 @@ class TaskService:
                         },
                     )
 
-            tasks = TaskRepository.list(
-                page, limit, sort_by, order, user_id, team_id=team_id, status_filter=status_filter
+            if cursor is not None:
+                return cls._get_tasks_by_cursor(cursor or None, limit, sort_by, order, user_id, team_id, status_filter)
+
+            tasks, total_count = TaskRepository.list_with_count(
+                page,
+                limit,
+                sort_by,
+                order,
+                user_id,
+                team_id=team_id,
+                status_filter=status_filter,
+                include_total=include_total,
             )
-            total_count = TaskRepository.count(user_id, team_id=team_id, status_filter=status_filter)
 
             if not tasks:
                 return GetTasksResponse(tasks=[], links=None)
 
-            task_dtos = [cls.prepare_task_dto(task, user_id) for task in tasks]
+            task_dtos = cls.prepare_task_dtos(tasks, user_id)
 
-            links = cls._build_pagination_links(page, limit, total_count, sort_by, order)
+            links = cls._build_pagination_links(page, limit, total_count, sort_by, order, page_size=len(tasks))
 
             return GetTasksResponse(tasks=task_dtos, links=links)
 
@@ -123,6 +153,41 @@ class TaskService:
                 },
             )
 
+    @classmethod
+    def _get_tasks_by_cursor(
+        cls,
+        cursor: TaskCursor | None,
+        limit: int,
+        sort_by: str,
+        order: str,
+        user_id: str,
+        team_id: str = None,
+        status_filter: str = None,
+    ) -> GetTasksResponse:
+        """
+        Cursor mode: seeks past the position of `cursor` and skips the total count.
+        Without a cursor, returns the first page.
+        """
+        after = (cursor.value, cursor.last_id) if cursor else None
+
+        tasks, next_after = TaskRepository.list_after(
+            limit, sort_by, order, user_id, team_id=team_id, status_filter=status_filter, after=after
+        )
+
+        if not tasks:
+            return GetTasksResponse(tasks=[], links=None)
+
+        task_dtos = cls.prepare_task_dtos(tasks, user_id)
+
+        next_link = None
+        if next_after:
+            next_cursor = encode_cursor(
+                TaskCursor(sort_by=sort_by, order=order, value=next_after[0], last_id=next_after[1])
+            )
+            next_link = cls.build_cursor_url(next_cursor, limit, sort_by, order, team_id, status_filter)
+
+        return GetTasksResponse(tasks=task_dtos, links=LinksData(next=next_link, prev=None))
+
     @classmethod
     def _validate_pagination_params(cls, page: int, limit: int) -> None:
         if page < 1:
@@ -135,14 +200,19 @@ class TaskService:
             raise ValidationError(f"Maximum limit of {PaginationConfig.MAX_LIMIT} exceeded")
 
     @classmethod
-    def _build_pagination_links(cls, page: int, limit: int, total_count: int, sort_by: str, order: str) -> LinksData:
-        """Build pagination links with sort parameters"""
+    def _build_pagination_links(
+        cls, page: int, limit: int, total_count: int | None, sort_by: str, order: str, page_size: int | None = None
+    ) -> LinksData:
+        """Build pagination links with sort parameters. Without total_count, the next link is given when the page is full."""
 
-        total_pages = math.ceil(total_count / limit)
+        if total_count is None:
+            has_next = page_size is not None and page_size >= limit
+        else:
+            has_next = page < math.ceil(total_count / limit)
         next_link = None
         prev_link = None
 
-        if page < total_pages:
+        if has_next:
             next_link = cls.build_page_url(page + 1, limit, sort_by, order)
 
         if page > 1:
@@ -156,6 +226,18 @@ class TaskService:
         query_params = urlencode({"page": page, "limit": limit, "sort_by": sort_by, "order": order})
         return f"{base_url}?{query_params}"
 
+    @classmethod
+    def build_cursor_url(
+        cls, cursor: str, limit: int, sort_by: str, order: str, team_id: str = None, status_filter: str = None
+    ) -> str:
+        base_url = reverse_lazy("tasks")
+        params = {"cursor": cursor, "limit": limit, "sort_by": sort_by, "order": order}
+        if team_id:
+            params["teamId"] = team_id
+        if status_filter:
+            params["status"] = status_filter
+        return f"{base_url}?{urlencode(params)}"
+
     @classmethod
     def prepare_task_dto(cls, task_model: TaskModel, user_id: str = None) -> TaskDTO:
         label_dtos = cls._prepare_label_dtos(task_model.labels) if task_model.labels else []
@@ -165,8 +247,7 @@ class TaskService:
             cls.prepare_deferred_details_dto(task_model.deferredDetails) if task_model.deferredDetails else None
         )
 
-        assignee_details = TaskAssignmentRepository.get_by_task_id(str(task_model.id))
-        assignee_dto = cls._prepare_assignee_dto(assignee_details) if assignee_details else None
+        assignee_dto = cls._build_assignee_dto(task_model)
 
         # Check if task is in user's watchlist
         in_watchlist = None
@@ -175,10 +256,94 @@ class TaskService:
             if watchlist_entry:
                 in_watchlist = watchlist_entry.isActive
 
-        task_status = task_model.status
+        return cls._build_task_dto(
+            task_model, label_dtos, assignee_dto, deferred_details, in_watchlist, created_by, updated_by
+        )
+
+    @classmethod
+    def prepare_task_dtos(cls, task_models: List[TaskModel], user_id: str = None) -> List[TaskDTO]:
+        """
+        Build DTOs for a page of tasks. Related users, labels and watchlist entries are
+        fetched with one query each for the whole page and the DTOs are then assembled
+        from in-memory maps. Assignees are read from the snapshot stored on each task.
+        """
+        if not task_models:
+            return []
+
+        task_ids = [str(task_model.id) for task_model in task_models]
+
+        user_ids = set()
+        label_ids = {}
+        for task_model in task_models:
+            for label_id in task_model.labels or []:
+                label_ids[str(label_id)] = label_id
+            for related_user_id in (task_model.createdBy, task_model.updatedBy):
+                if related_user_id:
+                    user_ids.add(str(related_user_id))
+            if task_model.deferredDetails and task_model.deferredDetails.deferredBy:
+                user_ids.add(str(task_model.deferredDetails.deferredBy))
+
+        users_by_id = {str(user.id): user for user in UserRepository.get_by_ids(list(user_ids))}
+        labels_by_id = {str(label.id): label for label in LabelRepository.list_by_ids(list(label_ids.values()))}
+
+        watchlist_by_task_id = {}
+        if user_id:
+            for entry in WatchlistRepository.get_by_user_and_task_ids(user_id, task_ids):
+                watchlist_by_task_id[entry.taskId] = entry
+
+        def user_dto(related_user_id: str) -> UserDTO:
+            user = users_by_id.get(str(related_user_id))
+            if not user:
+                raise UserNotFoundException(related_user_id)
+            return UserDTO(id=str(related_user_id), name=user.name)
+
+        task_dtos = []
+        for task_model in task_models:
+            task_id = str(task_model.id)
+
+            label_dtos = [
+                LabelDTO(id=str(label.id), name=label.name, color=label.color)
+                for label in (labels_by_id.get(str(label_id)) for label_id in task_model.labels or [])
+                if label
+            ]
+            created_by = user_dto(task_model.createdBy) if task_model.createdBy else None
+            updated_by = user_dto(task_model.updatedBy) if task_model.updatedBy else None
+
+            deferred_details = None
+            if task_model.deferredDetails:
+                deferred_details = DeferredDetailsDTO(
+                    deferredAt=task_model.deferredDetails.deferredAt,
+                    deferredTill=task_model.deferredDetails.deferredTill,
+                    deferredBy=user_dto(task_model.deferredDetails.deferredBy),
+                )
+
+            assignee_dto = cls._build_assignee_dto(task_model)
+
+            in_watchlist = None
+            watchlist_entry = watchlist_by_task_id.get(task_id)
+            if watchlist_entry:
+                in_watchlist = watchlist_entry.isActive
+
+            task_dtos.append(
+                cls._build_task_dto(
+                    task_model, label_dtos, assignee_dto, deferred_details, in_watchlist, created_by, updated_by
+                )
+            )
 
-        if task_model.deferredDetails and task_model.deferredDetails.deferredTill > datetime.now(timezone.utc):
-            task_status = TaskStatus.DEFERRED.value
+        return task_dtos
+
+    @classmethod
+    def _build_task_dto(
+        cls,
+        task_model: TaskModel,
+        label_dtos: List[LabelDTO],
+        assignee_dto: TaskAssignmentDTO | None,
+        deferred_details: DeferredDetailsDTO | None,
+        in_watchlist: bool | None,
+        created_by: UserDTO | None,
+        updated_by: UserDTO | None,
+    ) -> TaskDTO:
+        task_status = TaskRepository.get_effective_status(task_model)
 
         return TaskDTO(
             id=str(task_model.id),
@@ -214,34 +379,25 @@ class TaskService:
         ]
 
     @classmethod
-    def _prepare_assignee_dto(cls, assignee_details: TaskAssignmentModel) -> TaskAssignmentDTO:
-        """Prepare assignee DTO from assignee task details."""
-        assignee_id = str(assignee_details.assignee_id)
-
-        # Get assignee details based on user_type
-        if assignee_details.user_type == "user":
-            assignee = UserRepository.get_by_id(assignee_id)
-        elif assignee_details.user_type == "team":
-            assignee = TeamRepository.get_by_id(assignee_id)
-        else:
-            return None
-
-        if not assignee:
+    def _build_assignee_dto(cls, task_model: TaskModel) -> TaskAssignmentDTO | None:
+        """Build the assignee DTO from the assignee snapshot of the task, None if the assignee no longer exists."""
+        assignee = task_model.assignee
+        if not assignee or assignee.name is None:
             return None
 
         return TaskAssignmentDTO(
-            id=str(assignee_details.id),
-            task_id=str(assignee_details.task_id),
-            assignee_id=assignee_id,
+            id=assignee.assignment_id,
+            task_id=str(task_model.id),
+            assignee_id=assignee.id,
             assignee_name=assignee.name,
-            user_type=assignee_details.user_type,
-            executor_id=str(assignee_details.executor_id) if assignee_details.executor_id else None,
-            team_id=str(assignee_details.team_id) if assignee_details.team_id else None,
-            is_active=assignee_details.is_active,
-            created_by=str(assignee_details.created_by),
-            updated_by=str(assignee_details.updated_by) if assignee_details.updated_by else None,
-            created_at=assignee_details.created_at,
-            updated_at=assignee_details.updated_at,
+            user_type=assignee.type,
+            executor_id=assignee.executor_id,
+            team_id=assignee.team_id,
+            is_active=True,
+            created_by=assignee.created_by,
+            updated_by=assignee.updated_by,
+            created_at=assignee.created_at,
+            updated_at=assignee.updated_at,
         )
 
     @classmethod
@@ -288,6 +444,67 @@ class TaskService:
             return None
         return enum_type[value].value
 
+    @classmethod
+    def _build_update_payload(cls, validated_data: dict) -> dict:
+        update_payload = {}
+        enum_fields = {"priority": TaskPriority, "status": TaskStatus}
+
+        for field, value in validated_data.items():
+            if field == "labels":
+                update_payload[field] = cls._process_labels_for_update(
+                    value
+                )  # Only convert to ObjectId, do not check existence
+            elif field in enum_fields:
+                update_payload[field] = cls._process_enum_for_update(enum_fields[field], value)
+            elif field in cls.DIRECT_ASSIGNMENT_FIELDS:
+                update_payload[field] = value
+        return update_payload
+
+    @classmethod
+    def _build_task_update_payload(cls, current_task: TaskModel, validated_data: dict) -> dict:
+        """
+        Build the update of a task from the validated fields of a task update, for the single and the bulk
+        task updates. Moving to IN_PROGRESS stamps startedAt, any other status but DEFERRED ends a deferral,
+        and DEFERRED keeps the current status, since tasks are deferred with the defer action.
+        """
+        update_payload = {}
+        enum_fields = {"priority": TaskPriority, "status": TaskStatus}
+
+        for field, value in validated_data.items():
+            if field in ("id", "assignee"):
+                continue  # Identify the task or are handled separately
+
+            # Skip if the value is the same as current task
+            current_value = getattr(current_task, field, None)
+            if current_value == value:
+                continue
+
+            if field == "labels":
+                update_payload[field] = cls._process_labels_for_update(value)
+            elif field in enum_fields:
+                # For enums, we need to get the name if it's an enum instance, or process as string
+                if hasattr(value, "name"):
+                    update_payload[field] = value.value
+                else:
+                    update_payload[field] = cls._process_enum_for_update(enum_fields[field], value)
+            elif field in cls.DIRECT_ASSIGNMENT_FIELDS:
+                update_payload[field] = value
+
+        new_status = validated_data.get("status")
+        if isinstance(new_status, TaskStatus):
+            new_status = new_status.value
+
+        if new_status == TaskStatus.IN_PROGRESS.value and not current_task.startedAt:
+            update_payload["startedAt"] = datetime.now(timezone.utc)
+
+        if new_status is not None and new_status != TaskStatus.DEFERRED.value and current_task.deferredDetails:
+            update_payload["deferredDetails"] = None
+
+        if new_status == TaskStatus.DEFERRED.value:
+            update_payload["status"] = TaskStatus(current_task.status).value if current_task.status else None
+
+        return update_payload
+
     @classmethod
     def update_task(cls, task_id: str, validated_data: dict, user_id: str) -> TaskDTO:
         current_task = TaskRepository.get_by_id(task_id)
@@ -298,8 +515,7 @@ class TaskService:
         # Check if user is the creator
         if current_task.createdBy != user_id:
             # Check if user is assigned to this task
-            assigned_task_ids = TaskRepository._get_assigned_task_ids_for_user(user_id)
-            if current_task.id not in assigned_task_ids:
+            if not TaskRepository.is_task_visible_to_user(current_task.id, user_id):
                 raise PermissionError(ApiErrors.UNAUTHORIZED_TITLE)
 
         # Handle assignee updates if provided
@@ -321,18 +537,7 @@ class TaskService:
         old_status = getattr(current_task, "status", None)
         new_status = validated_data.get("status")
 
-        update_payload = {}
-        enum_fields = {"priority": TaskPriority, "status": TaskStatus}
-
-        for field, value in validated_data.items():
-            if field == "labels":
-                update_payload[field] = cls._process_labels_for_update(
-                    value
-                )  # Only convert to ObjectId, do not check existence
-            elif field in enum_fields:
-                update_payload[field] = cls._process_enum_for_update(enum_fields[field], value)
-            elif field in cls.DIRECT_ASSIGNMENT_FIELDS:
-                update_payload[field] = value
+        update_payload = cls._build_update_payload(validated_data)
 
         # Handle assignee updates separately
         if "assignee" in validated_data:
@@ -381,8 +586,7 @@ class TaskService:
         # Check if user is the creator
         if current_task.createdBy != user_id:
             # Check if user is assigned to this task
-            assigned_task_ids = TaskRepository._get_assigned_task_ids_for_user(user_id)
-            if current_task.id not in assigned_task_ids:
+            if not TaskRepository.is_task_visible_to_user(current_task.id, user_id):
                 raise PermissionError(ApiErrors.UNAUTHORIZED_TITLE)
 
         # Validate assignee if provided
@@ -400,44 +604,7 @@ class TaskService:
                 if not team_data:
                     raise ValueError(f"Team not found: {assignee_id}")
 
-        # Prepare update payload for task fields
-        update_payload = {}
-        enum_fields = {"priority": TaskPriority, "status": TaskStatus}
-
-        # Process task fields from validated_data
-        for field, value in validated_data.items():
-            if field == "assignee":
-                continue  # Handle assignee separately
-
-            # Skip if the value is the same as current task
-            current_value = getattr(current_task, field, None)
-            if current_value == value:
-                continue
-
-            if field == "labels":
-                update_payload[field] = cls._process_labels_for_update(value)
-            elif field in enum_fields:
-                # For enums, we need to get the name if it's an enum instance, or process as string
-                if hasattr(value, "name"):
-                    update_payload[field] = value.value
-                else:
-                    update_payload[field] = cls._process_enum_for_update(enum_fields[field], value)
-            elif field in cls.DIRECT_ASSIGNMENT_FIELDS:
-                update_payload[field] = value
-
-        # Handle startedAt logic
-        if validated_data.get("status") == TaskStatus.IN_PROGRESS and not current_task.startedAt:
-            update_payload["startedAt"] = datetime.now(timezone.utc)
-
-        if (
-            validated_data.get("status") is not None
-            and validated_data.get("status") != TaskStatus.DEFERRED.value
-            and current_task.deferredDetails
-        ):
-            update_payload["deferredDetails"] = None
-
-        if validated_data.get("status") == TaskStatus.DEFERRED.value:
-            update_payload["status"] = current_task.status
+        update_payload = cls._build_task_update_payload(current_task, validated_data)
 
         # Update task if there are changes
         if update_payload:
@@ -456,6 +623,8 @@ class TaskService:
                 validated_data["assignee"]["user_type"],
                 user_id,
             )
+            # Read the assignee snapshot written by the assignment
+            updated_task = TaskRepository.get_by_id(task_id) or updated_task
 
         return cls.prepare_task_dto(updated_task, user_id)
 
@@ -473,8 +642,7 @@ class TaskService:
         # Check if user is the creator
         if current_task.createdBy != user_id:
             # Check if user is assigned to this task
-            assigned_task_ids = TaskRepository._get_assigned_task_ids_for_user(user_id)
-            if current_task.id not in assigned_task_ids:
+            if not TaskRepository.is_task_visible_to_user(current_task.id, user_id):
                 raise PermissionError(ApiErrors.UNAUTHORIZED_TITLE)
 
         # Validate assignee if provided
@@ -536,6 +704,8 @@ class TaskService:
                 dto.assignee["user_type"],
                 user_id,
             )
+            # Read the assignee snapshot written by the assignment
+            updated_task = TaskRepository.get_by_id(task_id) or updated_task
 
         return cls.prepare_task_dto(updated_task, user_id)
 
@@ -549,8 +719,7 @@ class TaskService:
         # Check if user is the creator
         if current_task.createdBy != user_id:
             # Check if user is assigned to this task
-            assigned_task_ids = TaskRepository._get_assigned_task_ids_for_user(user_id)
-            if current_task.id not in assigned_task_ids:
+            if not TaskRepository.is_task_visible_to_user(current_task.id, user_id):
                 raise PermissionError(ApiErrors.UNAUTHORIZED_TITLE)
 
         if current_task.status == TaskStatus.DONE:
@@ -580,6 +749,7 @@ class TaskService:
 
         update_payload = {
             "status": TaskStatus.TODO.value,
+            "effectiveStatus": TaskStatus.DEFERRED.value,
             "deferredDetails": deferred_details.model_dump(),
             "updatedBy": user_id,
         }
@@ -649,6 +819,8 @@ class TaskService:
                     team_id=team_id,
                 )
                 TaskAssignmentService.create_task_assignment(assignee_dto, created_task.createdBy)
+                # Read the assignee snapshot written by the assignment
+                created_task = TaskRepository.get_by_id(str(created_task.id)) or created_task
 
             task_dto = cls.prepare_task_dto(created_task, dto.createdBy)
             return CreateTaskResponse(data=task_dto)
@@ -683,6 +855,305 @@ class TaskService:
                 )
             )
 
+    @classmethod
+    def bulk_create_tasks(cls, dtos: Dict[int, CreateTaskDTO], user_id: str) -> List[BulkTaskResult]:
+        """
+        Create the tasks of a bulk request, given by their position in the request. Referenced users,
+        teams and labels are checked with one query each, and the tasks, their assignments and audit
+        logs are written with one insert each. Tasks that were created when a later write fails are
+        reported as created, with their ID and the error, so that they are not created again on retry.
+        """
+        user_ids, team_ids, label_ids = set(), set(), set()
+        for dto in dtos.values():
+            label_ids.update(dto.labels)
+            if dto.assignee:
+                if dto.assignee.get("user_type") == "user":
+                    user_ids.add(dto.assignee["assignee_id"])
+                else:
+                    team_ids.add(dto.assignee["assignee_id"])
+                if dto.assignee.get("team_id"):
+                    team_ids.add(dto.assignee["team_id"])
+
+        references = _BulkReferences(
+            user_ids={str(user.id) for user in UserRepository.get_by_ids(list(user_ids))},
+            team_ids={str(team.id) for team in TeamRepository.get_by_ids(list(team_ids))},
+            label_ids=cls._get_existing_label_ids(label_ids),
+        )
+
+        results = []
+        pending = []
+        now = datetime.now(timezone.utc)
+        for index, dto in dtos.items():
+            errors = cls._get_missing_reference_errors(references, dto.assignee, dto.labels)
+            if errors:
+                results.append(BulkTaskResult(index=index, statusCode=404, errors=errors))
+                continue
+
+            task = TaskModel(
+                id=None,
+                title=dto.title,
+                description=dto.description,
+                priority=dto.priority,
+                status=dto.status,
+                labels=dto.labels,
+                dueAt=dto.dueAt,
+                startedAt=now if dto.status == TaskStatus.IN_PROGRESS else None,
+                createdAt=now,
+                isAcknowledged=False,
+                isDeleted=False,
+                createdBy=dto.createdBy,
+            )
+            pending.append((index, dto, task))
+
+        if not pending:
+            return results
+
+        try:
+            created_tasks = TaskRepository.create_many([task for _, _, task in pending])
+        except Exception as e:
+            results.extend(cls._bulk_server_error_results([index for index, _, _ in pending], e))
+            return results
+
+        try:
+            assignments = []
+            audit_logs = []
+            for _, dto, task in pending:
+                if not dto.assignee:
+                    continue
+                assignee_id = dto.assignee["assignee_id"]
+                user_type = dto.assignee["user_type"]
+                team_id = assignee_id if user_type == "team" else dto.assignee.get("team_id")
+
+                assignments.append(
+                    TaskAssignmentModel(
+                        task_id=PyObjectId(task.id),
+                        assignee_id=PyObjectId(assignee_id),
+                        user_type=user_type,
+                        created_by=PyObjectId(dto.createdBy),
+                        updated_by=None,
+                        team_id=PyObjectId(team_id) if team_id else None,
+                    )
+                )
+                if team_id:
+                    audit_logs.append(
+                        AuditLogModel(
+                            task_id=task.id,
+                            team_id=PyObjectId(team_id),
+                            action="assigned_to_team" if user_type == "team" else "assigned_to_member",
+                            performed_by=PyObjectId(dto.createdBy),
+                        )
+                    )
+
+            if assignments:
+                TaskAssignmentRepository.create_many(assignments)
+                AuditLogRepository.create_many(audit_logs)
+                # Read the assignee snapshots written by the assignments
+                tasks_by_id = {
+                    str(task.id): task for task in TaskRepository.get_by_ids([str(task.id) for task in created_tasks])
+                }
+                created_tasks = [tasks_by_id.get(str(task.id), task) for task in created_tasks]
+
+            task_dtos = cls.prepare_task_dtos(created_tasks, user_id)
+        except Exception as e:
+            detail = str(e) if settings.DEBUG else ApiErrors.INTERNAL_SERVER_ERROR
+            results.extend(
+                BulkTaskResult(
+                    index=index,
+                    statusCode=201,
+                    id=str(task.id),
+                    errors=[
+                        ApiErrorDetail(
+                            source={ApiErrorSource.PARAMETER: "server"},
+                            title=ApiErrors.UNEXPECTED_ERROR,
+                            detail=ApiErrors.TASK_CREATED_WITH_ERRORS.format(task.id, detail),
+                        )
+                    ],
+                )
+                for (index, _, task) in pending
+            )
+            return results
+
+        results.extend(
+            BulkTaskResult(index=index, statusCode=201, id=task_dto.id, data=task_dto)
+            for (index, _, _), task_dto in zip(pending, task_dtos)
+        )
+        return results
+
+    @classmethod
+    def bulk_update_tasks(cls, updates: Dict[int, dict], user_id: str) -> List[BulkTaskResult]:
+        """
+        Apply the partial updates of a bulk request, given by their position in the request with the
+        ID of their task under "id". Tasks, visibility and labels are read with one query each, the
+        updates are written with one bulk write and status changes are audited with one insert.
+        """
+        task_ids = {update["id"] for update in updates.values()}
+        tasks_by_id = {str(task.id): task for task in TaskRepository.get_by_ids(list(task_ids))}
+
+        visible_task_ids = set()
+        other_task_ids = [task_id for task_id, task in tasks_by_id.items() if task.createdBy != user_id]
+        if other_task_ids:
+            visible_task_ids = {
+                str(task_id) for task_id in TaskVisibilityRepository.get_task_ids_for_user(user_id, other_task_ids)
+            }
+
+        label_ids = {label_id for update in updates.values() for label_id in update.get("labels") or []}
+        references = _BulkReferences(user_ids=set(), team_ids=set(), label_ids=cls._get_existing_label_ids(label_ids))
+
+        results = []
+        pending = []
+        payloads = {}
+        seen_task_ids = set()
+        for index, update in sorted(updates.items()):
+            task_id = update["id"]
+            task = tasks_by_id.get(task_id)
+
+            if task_id in seen_task_ids:
+                results.append(
+                    cls._bulk_error_result(
+                        index, 400, "id", ApiErrors.VALIDATION_ERROR, ValidationErrors.DUPLICATE_BULK_TASK_ID, task_id
+                    )
+                )
+            elif not task:
+                results.append(
+                    cls._bulk_error_result(
+                        index, 404, "id", ApiErrors.TASK_NOT_FOUND_TITLE, ApiErrors.TASK_NOT_FOUND, task_id
+                    )
+                )
+            elif task.createdBy != user_id and task_id not in visible_task_ids:
+                results.append(
+                    cls._bulk_error_result(index, 403, "id", ApiErrors.UNAUTHORIZED_TITLE, ApiErrors.UNAUTHORIZED_TITLE)
+                )
+            else:
+                seen_task_ids.add(task_id)
+                errors = cls._get_missing_reference_errors(references, None, update.get("labels") or [])
+                if errors:
+                    results.append(BulkTaskResult(index=index, statusCode=404, errors=errors))
+                    continue
+
+                update_payload = cls._build_task_update_payload(task, update)
+                if update_payload:
+                    update_payload["updatedBy"] = user_id
+                    payloads[task_id] = update_payload
+                pending.append((index, task_id, task))
+
+        if not pending:
+            return results
+
+        try:
+            updated_tasks_by_id = TaskRepository.update_many(payloads)
+
+            audit_logs = []
+            for index, task_id, task in pending:
+                new_status = payloads.get(task_id, {}).get("status")
+                old_status = TaskStatus(task.status).value if task.status else None
+                if old_status and new_status and old_status != new_status:
+                    audit_logs.append(
+                        AuditLogModel(
+                            task_id=task.id,
+                            action="status_changed",
+                            status_from=old_status,
+                            status_to=new_status,
+                            performed_by=PyObjectId(user_id),
+                        )
+                    )
+            AuditLogRepository.create_many(audit_logs)
+
+            updated_pending = []
+            for index, task_id, task in pending:
+                if task_id not in payloads:
+                    updated_pending.append((index, task))
+                elif task_id in updated_tasks_by_id:
+                    updated_pending.append((index, updated_tasks_by_id[task_id]))
+                else:
+                    # Deleted since it was read
+                    results.append(
+                        cls._bulk_error_result(
+                            index, 404, "id", ApiErrors.TASK_NOT_FOUND_TITLE, ApiErrors.TASK_NOT_FOUND, task_id
+                        )
+                    )
+
+            task_dtos = cls.prepare_task_dtos([task for _, task in updated_pending], user_id)
+        except Exception as e:
+            results.extend(cls._bulk_server_error_results([index for index, _, _ in pending], e))
+            return results
+
+        results.extend(
+            BulkTaskResult(index=index, statusCode=200, data=task_dto)
+            for (index, _), task_dto in zip(updated_pending, task_dtos)
+        )
+        return results
+
+    @classmethod
+    def _get_existing_label_ids(cls, label_ids: Iterable[str]) -> Set[str]:
+        return {
+            str(label.id)
+            for label in LabelRepository.list_by_ids([PyObjectId(label_id) for label_id in set(label_ids)])
+        }
+
+    @classmethod
+    def _get_missing_reference_errors(
+        cls, references: "_BulkReferences", assignee: dict | None, label_ids: List[str]
+    ) -> List[ApiErrorDetail]:
+        errors = []
+        if assignee:
+            assignee_id = assignee["assignee_id"]
+            if assignee["user_type"] == "user" and assignee_id not in references.user_ids:
+                errors.append(
+                    ApiErrorDetail(
+                        source={ApiErrorSource.PARAMETER: "assignee_id"},
+                        title=ApiErrors.RESOURCE_NOT_FOUND_TITLE,
+                        detail=ApiErrors.USER_NOT_FOUND.format(assignee_id),
+                    )
+                )
+            elif assignee["user_type"] == "team" and assignee_id not in references.team_ids:
+                errors.append(
+                    ApiErrorDetail(
+                        source={ApiErrorSource.PARAMETER: "assignee_id"},
+                        title=ApiErrors.RESOURCE_NOT_FOUND_TITLE,
+                        detail=ApiErrors.TEAM_NOT_FOUND.format(assignee_id),
+                    )
+                )
+            if assignee.get("team_id") and assignee["team_id"] not in references.team_ids:
+                errors.append(
+                    ApiErrorDetail(
+                        source={ApiErrorSource.PARAMETER: "team_id"},
+                        title=ApiErrors.RESOURCE_NOT_FOUND_TITLE,
+                        detail=ApiErrors.TEAM_NOT_FOUND.format(assignee["team_id"]),
+                    )
+                )
+
+        missing_label_ids = [label_id for label_id in label_ids if label_id not in references.label_ids]
+        if missing_label_ids:
+            errors.append(
+                ApiErrorDetail(
+                    source={ApiErrorSource.PARAMETER: "labels"},
+                    title=ApiErrors.INVALID_LABELS,
+                    detail=ValidationErrors.MISSING_LABEL_IDS.format(", ".join(missing_label_ids)),
+                )
+            )
+        return errors
+
+    @classmethod
+    def _bulk_error_result(
+        cls, index: int, status_code: int, parameter: str, title: str, detail: str, *detail_args
+    ) -> BulkTaskResult:
+        return BulkTaskResult(
+            index=index,
+            statusCode=status_code,
+            errors=[
+                ApiErrorDetail(
+                    source={ApiErrorSource.PARAMETER: parameter}, title=title, detail=detail.format(*detail_args)
+                )
+            ],
+        )
+
+    @classmethod
+    def _bulk_server_error_results(cls, indexes: List[int], error: Exception) -> List[BulkTaskResult]:
+        detail = str(error) if settings.DEBUG else ApiErrors.INTERNAL_SERVER_ERROR
+        return [
+            cls._bulk_error_result(index, 500, "server", ApiErrors.UNEXPECTED_ERROR, "{0}", detail) for index in indexes
+        ]
+
     @classmethod
     def delete_task(cls, task_id: str, user_id: str) -> None:
         deleted_task_model = TaskRepository.delete_by_id(task_id, user_id)
@@ -703,5 +1174,5 @@ class TaskService:
         if not tasks:
             return GetTasksResponse(tasks=[], links=None)
 
-        task_dtos = [cls.prepare_task_dto(task, user_id) for task in tasks]
+        task_dtos = cls.prepare_task_dtos(tasks, user_id)
         return GetTasksResponse(tasks=task_dtos, links=None)
@@ -183,6 +183,16 @@ class TeamService:
             logger = logging.getLogger(__name__)
             logger.warning(f"Failed to assign role {role_name} to user {user_id} in team {team_id}")
 
+    @classmethod
+    def _assign_users_role(cls, user_ids: List[str], team_id: str, role_name: str):
+        """Helper method to assign a role to several users with one write, using the new role system."""
+        if not UserRoleService.assign_role_to_users(user_ids, role_name, "TEAM", team_id):
+            # Don't fail adding the members if role assignment fails
+            import logging
+
+            logger = logging.getLogger(__name__)
+            logger.warning(f"Failed to assign role {role_name} to {len(user_ids)} users in team {team_id}")
+
     @classmethod
     def get_user_teams(cls, user_id: str) -> GetUserTeamsResponse:
         """
@@ -198,29 +208,27 @@ class TeamService:
             ValueError: If getting user teams fails
         """
         try:
-            # Get user-team relationships
-            user_team_details = UserTeamDetailsRepository.get_by_user_id(user_id)
+            # IDs of the teams of the user, cached until the memberships of the user change
+            team_ids = UserTeamDetailsRepository.get_team_ids_by_user_id(user_id)
 
-            if not user_team_details:
+            if not team_ids:
                 return GetUserTeamsResponse(teams=[], total=0)
 
-            # Get team details for each relationship
-            teams = []
-            for user_team in user_team_details:
-                team = TeamRepository.get_by_id(str(user_team.team_id))
-                if team:
-                    team_dto = TeamDTO(
-                        id=str(team.id),
-                        name=team.name,
-                        description=team.description,
-                        poc_id=str(team.poc_id) if team.poc_id else None,
-                        invite_code=team.invite_code,
-                        created_by=str(team.created_by),
-                        updated_by=str(team.updated_by),
-                        created_at=team.created_at,
-                        updated_at=team.updated_at,
-                    )
-                    teams.append(team_dto)
+            # Teams that are not deleted, read in a single query
+            teams = [
+                TeamDTO(
+                    id=str(team.id),
+                    name=team.name,
+                    description=team.description,
+                    poc_id=str(team.poc_id) if team.poc_id else None,
+                    invite_code=team.invite_code,
+                    created_by=str(team.created_by),
+                    updated_by=str(team.updated_by),
+                    created_at=team.created_at,
+                    updated_at=team.updated_at,
+                )
+                for team in TeamRepository.get_by_ids(team_ids)
+            ]
 
             return GetUserTeamsResponse(teams=teams, total=len(teams))
 
@@ -405,24 +413,20 @@ class TeamService:
                 raise ValueError(f"Team with id {team_id} not found")
 
             # Check if the user adding members is already a team member
-            from todo.repositories.team_repository import UserTeamDetailsRepository
-
-            user_teams = UserTeamDetailsRepository.get_by_user_id(added_by_user_id)
-            user_is_member = any(str(user_team.team_id) == team_id and user_team.is_active for user_team in user_teams)
-
-            if not user_is_member:
+            if not TeamRepository.is_user_team_member(team_id, added_by_user_id):
                 raise ValueError("You must be a member of the team to add other members")
 
             # Validate that all users exist
             from todo.repositories.user_repository import UserRepository
 
+            member_ids = list(dict.fromkeys(member_ids))
+            found_user_ids = {str(user.id) for user in UserRepository.get_by_ids(member_ids)}
             for member_id in member_ids:
-                user = UserRepository.get_by_id(member_id)
-                if not user:
+                if member_id not in found_user_ids:
                     raise ValueError(f"User with id {member_id} not found")
 
             # Check if any users are already team members
-            existing_members = UserTeamDetailsRepository.get_users_by_team_id(team_id)
+            existing_members = set(UserTeamDetailsRepository.get_users_by_team_id(team_id))
             already_members = [member_id for member_id in member_ids if member_id in existing_members]
 
             if already_members:
@@ -448,19 +452,20 @@ class TeamService:
                 UserTeamDetailsRepository.create_many(new_user_teams)
 
                 # NEW: Assign default member roles using new role system
-                for member_id in member_ids:
-                    cls._assign_user_role(member_id, team_id, RoleName.MEMBER.value)
+                cls._assign_users_role(member_ids, team_id, RoleName.MEMBER.value)
 
             # Audit log for team member addition
-            for member_id in member_ids:
-                AuditLogRepository.create(
+            AuditLogRepository.create_many(
+                [
                     AuditLogModel(
                         team_id=team.id,
                         action="member_added_to_team",
                         performed_by=PyObjectId(added_by_user_id),
                         details={"added_member_id": member_id},
                     )
-                )
+                    for member_id in member_ids
+                ]
+            )
 
             # Return updated team details
             return TeamDTO(
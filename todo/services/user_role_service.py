@@ -1,8 +1,12 @@
 from typing import List, Dict, Any, Optional
 import logging
 
+from django.conf import settings
+
+from todo.repositories.membership_version_repository import MembershipVersionRepository
 from todo.repositories.user_role_repository import UserRoleRepository
 from todo.constants.role import DEFAULT_TEAM_ROLE, VALID_ROLE_NAMES_BY_SCOPE, RoleScope, RoleName
+from todo.utils.team_claims import get_request_team_roles
 
 logger = logging.getLogger(__name__)
 
@@ -42,6 +46,32 @@ class UserRoleService:
             logger.error(f"Failed to assign role: {str(e)}")
             return False
 
+    @classmethod
+    def assign_role_to_users(
+        cls, user_ids: List[str], role_name: str, scope: str, team_id: Optional[str] = None
+    ) -> bool:
+        try:
+            if not user_ids:
+                return True
+
+            if not cls._validate_role(role_name, scope):
+                logger.error(f"Invalid role '{role_name}' for scope '{scope}'")
+                return False
+
+            if scope == "TEAM" and not team_id:
+                logger.error("team_id is required for TEAM scope roles")
+                return False
+
+            if scope == "GLOBAL" and team_id:
+                logger.error("team_id should not be provided for GLOBAL scope roles")
+                return False
+
+            UserRoleRepository.assign_role_to_users(user_ids, RoleName(role_name), RoleScope(scope), team_id)
+            return True
+        except Exception as e:
+            logger.error(f"Failed to assign role to users: {str(e)}")
+            return False
+
     @classmethod
     def remove_role_by_id(cls, user_id: str, role_id: str, scope: str, team_id: Optional[str] = None) -> bool:
         try:
@@ -81,11 +111,48 @@ class UserRoleService:
     @classmethod
     def has_role(cls, user_id: str, role_name: str, scope: str, team_id: Optional[str] = None) -> bool:
         try:
+            if scope == RoleScope.TEAM.value and team_id:
+                team_roles = get_request_team_roles(user_id)
+                if team_roles is not None:
+                    return role_name in team_roles.get(str(team_id), [])
+
             user_roles = cls.get_user_roles(user_id, scope, team_id)
             return any(role["role_name"] == role_name for role in user_roles)
         except Exception:
             return False
 
+    @classmethod
+    def get_team_claims(cls, user_id: str) -> Dict[str, Any]:
+        """
+        Team claims of an access token: the roles of the user in every team they are a member of, and
+        the membership version they were read at.
+
+        Returns:
+            Dict[str, Any]: "teams" and "mv" claims, empty when team claims are disabled, the user is in
+            more than JWT_TEAM_CLAIMS_MAX_TEAMS teams or they could not be read
+        """
+        if not MembershipVersionRepository.is_enabled():
+            return {}
+
+        try:
+            from todo.repositories.team_repository import UserTeamDetailsRepository
+
+            # Read before the memberships, so that a write made meanwhile leaves the claims stale
+            version = MembershipVersionRepository.get_version(user_id)
+            teams = {str(user_team.team_id): [] for user_team in UserTeamDetailsRepository.get_by_user_id(user_id)}
+            if len(teams) > getattr(settings, "JWT_TEAM_CLAIMS_MAX_TEAMS", 50):
+                return {}
+
+            for role in UserRoleRepository.get_user_roles(user_id, RoleScope.TEAM):
+                if role.team_id in teams:
+                    teams[role.team_id].append(
+                        role.role_name.value if hasattr(role.role_name, "value") else role.role_name
+                    )
+            return {"teams": teams, "mv": version}
+        except Exception as e:
+            logger.error(f"Failed to get team claims of user {user_id}: {str(e)}")
+            return {}
+
     @classmethod
     def assign_default_team_role(cls, user_id: str, team_id: str) -> bool:
         return cls.assign_role(user_id, DEFAULT_TEAM_ROLE, "TEAM", team_id)
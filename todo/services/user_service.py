@@ -8,7 +8,6 @@ from todo.exceptions.auth_exceptions import (
 from rest_framework.exceptions import ValidationError as DRFValidationError
 from typing import List, Tuple
 from todo.dto.user_dto import UserDTO, UsersDTO
-from todo.repositories.task_assignment_repository import TaskAssignmentRepository
 
 
 class UserService:
@@ -39,41 +38,31 @@ class UserService:
 
     @classmethod
     def get_users_by_ids(cls, user_ids: list[str]) -> list[UserDTO]:
-        users = []
-        for user_id in user_ids:
-            user = UserRepository.get_by_id(user_id)
-            if user:
-                users.append(
-                    UserDTO(
-                        id=str(user.id),
-                        name=user.name,
-                        email_id=user.email_id,
-                        created_at=user.created_at,
-                        updated_at=user.updated_at,
-                    )
-                )
-        return users
+        return [
+            UserDTO(
+                id=str(user.id),
+                name=user.name,
+                email_id=user.email_id,
+                created_at=user.created_at,
+                updated_at=user.updated_at,
+            )
+            for user in UserRepository.get_by_ids(user_ids)
+        ]
 
     @classmethod
     def get_users_by_team_id(cls, team_id: str) -> list[UserDTO]:
         from todo.repositories.team_repository import UserTeamDetailsRepository
 
-        users_and_added_on = UserTeamDetailsRepository.get_users_and_added_on_by_team_id(team_id)
-        user_ids = [entry["user_id"] for entry in users_and_added_on]
-        added_on_map = {entry["user_id"]: entry["added_on"] for entry in users_and_added_on}
-        users = cls.get_users_by_ids(user_ids)
-        # Attach addedOn to each user dto
-        for user in users:
-            user.addedOn = added_on_map.get(user.id)
-            # Compute tasksAssignedCount: tasks assigned to both user and team
-            user_task_ids = set(
-                [str(assignment.task_id) for assignment in TaskAssignmentRepository.get_by_assignee_id(user.id, "user")]
-            )
-            team_task_ids = set(
-                [str(assignment.task_id) for assignment in TaskAssignmentRepository.get_by_assignee_id(team_id, "team")]
+        return [
+            UserDTO(
+                id=member["user_id"],
+                name=member["name"],
+                addedOn=member.get("added_on"),
+                # Tasks assigned to both the user and the team
+                tasksAssignedCount=member["tasks_assigned_count"],
             )
-            user.tasksAssignedCount = len(user_task_ids & team_task_ids)
-        return users
+            for member in UserTeamDetailsRepository.get_members_with_task_counts(team_id)
+        ]
 
     @classmethod
     def _validate_google_user_data(cls, google_user_data: dict) -> None:
@@ -4,8 +4,11 @@ from django.test import TransactionTestCase, override_settings
 from django.conf import settings
 from pymongo import MongoClient
 from todo.models.user import UserModel
+from todo.repositories.audit_log_repository import AuditLogRepository
+from todo.repositories.common.model_cache import ModelCache
 from todo.tests.testcontainers.shared_mongo import get_shared_mongo_container
 from todo.utils.jwt_utils import generate_token_pair
+from todo.utils.token_cache import verified_token_cache
 from todo_project.db.config import DatabaseManager
 from rest_framework.test import APIClient
 from todo.tests.fixtures.user import google_auth_user_payload
@@ -28,6 +31,11 @@ class BaseMongoTestCase(TransactionTestCase):
         DatabaseManager().get_database()
 
     def setUp(self):
+        # Audit logs still buffered from the previous test are written before the collections are emptied,
+        # and the per-process caches are emptied with them
+        AuditLogRepository.flush()
+        ModelCache.clear_all()
+        verified_token_cache.clear()
         for collection in self.db.list_collection_names():
             self.db[collection].delete_many({})
 
@@ -4,6 +4,7 @@ from bson import ObjectId
 from django.urls import reverse
 from todo.constants.messages import ApiErrors, ValidationErrors
 from todo.constants.task import TaskPriority, TaskStatus
+from todo.repositories.task_assignment_repository import TaskAssignmentRepository
 from todo.tests.integration.base_mongo_test import AuthenticatedMongoTestCase
 from todo.tests.fixtures.task import tasks_db_data
 
@@ -47,6 +48,7 @@ class TaskDeferAPIIntegrationTest(AuthenticatedMongoTestCase):
             "updated_at": None,
         }
         self.db.task_details.insert_one(assignee_details)
+        TaskAssignmentRepository.refresh_assignee_snapshots([new_id])
 
         return str(new_id)
 
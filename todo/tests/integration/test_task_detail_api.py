@@ -3,6 +3,7 @@ from django.urls import reverse
 from bson import ObjectId
 from datetime import datetime, timezone
 from todo.tests.fixtures.task import tasks_db_data
+from todo.repositories.task_assignment_repository import TaskAssignmentRepository
 from todo.tests.integration.base_mongo_test import AuthenticatedMongoTestCase
 from todo.constants.messages import ApiErrors, ValidationErrors
 
@@ -34,6 +35,7 @@ class TaskDetailAPIIntegrationTest(AuthenticatedMongoTestCase):
             "updated_at": None,
         }
         self.db.task_details.insert_one(assignee_details)
+        TaskAssignmentRepository.refresh_assignee_snapshots([self.task_doc["_id"]])
 
         self.existing_task_id = str(self.task_doc["_id"])
         self.non_existent_id = str(ObjectId())
@@ -4,6 +4,7 @@ from http import HTTPStatus
 from bson import ObjectId
 from django.urls import reverse
 from todo.constants.messages import ApiErrors, ValidationErrors
+from todo.repositories.task_assignment_repository import TaskAssignmentRepository
 from todo.tests.integration.base_mongo_test import AuthenticatedMongoTestCase
 from todo.tests.fixtures.task import tasks_db_data
 
@@ -39,6 +40,7 @@ class TaskUpdateAPIIntegrationTest(AuthenticatedMongoTestCase):
             "updated_at": None,
         }
         self.db.task_details.insert_one(assignee_details)
+        TaskAssignmentRepository.refresh_assignee_snapshots([self.task_id])
 
         self.valid_id = str(self.task_id)
         self.missing_id = str(ObjectId())
@@ -4,6 +4,7 @@ from bson import ObjectId
 from datetime import datetime, timezone
 
 from todo.tests.fixtures.task import tasks_db_data
+from todo.repositories.task_assignment_repository import TaskAssignmentRepository
 from todo.tests.integration.base_mongo_test import AuthenticatedMongoTestCase
 from todo.constants.messages import ValidationErrors, ApiErrors
 
@@ -37,6 +38,7 @@ class TaskDeleteAPIIntegrationTest(AuthenticatedMongoTestCase):
             "updated_at": None,
         }
         self.db.task_details.insert_one(assignee_details)
+        TaskAssignmentRepository.refresh_assignee_snapshots([task_doc["_id"]])
 
         self.existing_task_id = str(task_doc["_id"])
         self.non_existent_id = str(ObjectId())
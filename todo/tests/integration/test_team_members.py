@@ -0,0 +1,130 @@
+from datetime import datetime, timezone
+from unittest.mock import patch
+
+from bson import ObjectId
+from pymongo.collection import Collection
+
+from todo.services.user_service import UserService
+from todo.tests.integration.base_mongo_test import BaseMongoTestCase
+from todo_project.db.config import DatabaseManager
+from todo_project.db.indexes import ensure_indexes
+
+
+class TeamMembersIntegrationTests(BaseMongoTestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # The member listing relies on the declared task_details and user_team_details indexes
+        ensure_indexes(DatabaseManager().get_database())
+
+    def setUp(self):
+        super().setUp()
+        self.team_id = str(ObjectId())
+        self.other_team_id = str(ObjectId())
+
+    def _seed_team(self, member_count: int) -> dict[str, int]:
+        """
+        Add member_count members to the team. Member i gets i % 4 tasks assigned to both them and the
+        team (with ids stored as strings or ObjectIds), one task assigned to them only, one task assigned
+        to them and another team, and one inactive assignment of a team task.
+
+        Returns:
+            dict[str, int]: Expected tasksAssignedCount of each member
+        """
+        now = datetime.now(timezone.utc)
+        users, memberships, assignments = [], [], []
+        expected_counts = {}
+
+        def assign(task_id, assignee_id, user_type, is_active=True):
+            assignments.append(
+                {
+                    "task_id": task_id,
+                    "assignee_id": assignee_id,
+                    "user_type": user_type,
+                    "is_active": is_active,
+                    "created_by": assignee_id,
+                    "created_at": now,
+                }
+            )
+
+        for index in range(member_count):
+            user_id = ObjectId()
+            users.append({"_id": user_id, "name": f"Member {index}", "email_id": f"member{index}@example.com"})
+            memberships.append(
+                {
+                    "user_id": str(user_id),
+                    "team_id": self.team_id,
+                    "is_active": True,
+                    "created_at": now,
+                    "created_by": str(user_id),
+                    "updated_by": str(user_id),
+                }
+            )
+
+            for task_index in range(index % 4):
+                task_id = ObjectId()
+                if task_index % 2:
+                    assign(task_id, user_id, "user")
+                    assign(task_id, ObjectId(self.team_id), "team")
+                else:
+                    assign(str(task_id), str(user_id), "user")
+                    assign(str(task_id), self.team_id, "team")
+            expected_counts[str(user_id)] = index % 4
+
+            assign(str(ObjectId()), str(user_id), "user")
+            other_team_task_id = str(ObjectId())
+            assign(other_team_task_id, str(user_id), "user")
+            assign(other_team_task_id, self.other_team_id, "team")
+            inactive_task_id = str(ObjectId())
+            assign(inactive_task_id, str(user_id), "user", is_active=False)
+            assign(inactive_task_id, self.team_id, "team")
+
+        memberships.append(
+            {
+                "user_id": str(ObjectId()),
+                "team_id": self.team_id,
+                "is_active": False,
+                "created_at": now,
+                "created_by": self.team_id,
+                "updated_by": self.team_id,
+            }
+        )
+        self.db.users.insert_many(users)
+        self.db.user_team_details.insert_many(memberships)
+        self.db.task_details.insert_many(assignments)
+        return expected_counts
+
+    def test_get_users_by_team_id_counts_tasks_assigned_to_member_and_team(self):
+        expected_counts = self._seed_team(8)
+
+        members = UserService.get_users_by_team_id(self.team_id)
+
+        self.assertEqual({member.id: member.tasksAssignedCount for member in members}, expected_counts)
+        self.assertTrue(all(member.name.startswith("Member ") for member in members))
+        self.assertTrue(all(member.addedOn is not None for member in members))
+
+    def test_get_users_by_team_id_skips_memberships_without_user(self):
+        self.db.user_team_details.insert_one(
+            {"user_id": str(ObjectId()), "team_id": self.team_id, "is_active": True, "created_at": datetime.now()}
+        )
+
+        self.assertEqual(UserService.get_users_by_team_id(self.team_id), [])
+
+    def test_get_users_by_team_id_reads_teams_of_any_size_with_one_aggregation(self):
+        for member_count in (10, 100, 1000):
+            with self.subTest(member_count=member_count):
+                for collection in ("users", "user_team_details", "task_details"):
+                    self.db[collection].delete_many({})
+                expected_counts = self._seed_team(member_count)
+
+                with (
+                    patch.object(Collection, "aggregate", autospec=True, side_effect=Collection.aggregate) as aggregate,
+                    patch.object(Collection, "find", autospec=True, side_effect=Collection.find) as find,
+                    patch.object(Collection, "find_one", autospec=True, side_effect=Collection.find_one) as find_one,
+                ):
+                    members = UserService.get_users_by_team_id(self.team_id)
+
+                self.assertEqual({member.id: member.tasksAssignedCount for member in members}, expected_counts)
+                self.assertEqual(aggregate.call_count, 1)
+                find.assert_not_called()
+                find_one.assert_not_called()
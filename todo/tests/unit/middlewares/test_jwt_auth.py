@@ -2,14 +2,21 @@ from unittest import TestCase
 from unittest.mock import Mock, patch
 from django.http import HttpRequest, JsonResponse
 from django.conf import settings
+from django.test import override_settings
 from rest_framework import status
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
 import json
+import time
 from todo.middlewares.jwt_auth import (
     JWTAuthenticationMiddleware,
     get_current_user_info,
 )
 from todo.constants.messages import AuthErrorMessages
 from todo.models.user import UserModel
+from todo.utils.jwt_utils import generate_access_token, validate_access_token
+from todo.utils.team_claims import get_request_team_roles
+from todo.utils.token_cache import VerifiedTokenCache
 
 
 class JWTAuthenticationMiddlewareTests(TestCase):
@@ -53,6 +60,8 @@ class JWTAuthenticationMiddlewareTests(TestCase):
         self.assertEqual(self.request.user_email, "test@example.com")
         self.get_response.assert_called_once_with(self.request)
 
+    # Team claims of new tokens are read from the database; they are tested in JWTTeamClaimsTests
+    @override_settings(JWT_TEAM_CLAIMS_ENABLED=False)
     @patch("todo.middlewares.jwt_auth.validate_access_token")
     @patch("todo.middlewares.jwt_auth.validate_refresh_token")
     @patch("todo.middlewares.jwt_auth.generate_access_token")
@@ -100,6 +109,148 @@ class JWTAuthenticationMiddlewareTests(TestCase):
         self.assertEqual(response_data["message"], AuthErrorMessages.AUTHENTICATION_REQUIRED)
 
 
+def _rsa_jwt_config() -> dict:
+    private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    return {
+        **settings.JWT_CONFIG,
+        "ALGORITHM": "RS256",
+        "PRIVATE_KEY": private_key.private_bytes(
+            serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8, serialization.NoEncryption()
+        ).decode(),
+        "PUBLIC_KEY": private_key.public_key()
+        .public_bytes(serialization.Encoding.PEM, serialization.PublicFormat.SubjectPublicKeyInfo)
+        .decode(),
+    }
+
+
+@patch("todo.middlewares.jwt_auth.UserRepository.get_by_id")
+class JWTAuthenticationCacheTests(TestCase):
+    def setUp(self):
+        self.cache = VerifiedTokenCache(enabled=True)
+        cache_patcher = patch("todo.middlewares.jwt_auth.verified_token_cache", self.cache)
+        cache_patcher.start()
+        self.addCleanup(cache_patcher.stop)
+        self.middleware = JWTAuthenticationMiddleware(Mock(return_value=JsonResponse({"data": "test"})))
+        self.token = generate_access_token({"user_id": "123"})
+
+    def _request(self, token: str | None = None) -> Mock:
+        request = Mock(spec=HttpRequest)
+        request.COOKIES = {settings.COOKIE_SETTINGS.get("ACCESS_COOKIE_NAME"): token or self.token}
+        return request
+
+    def _mock_user(self, mock_get_user) -> None:
+        mock_user = Mock(spec=UserModel)
+        mock_user.email_id = "test@example.com"
+        mock_get_user.return_value = mock_user
+
+    def test_verified_token_is_served_from_cache(self, mock_get_user):
+        self._mock_user(mock_get_user)
+
+        with patch("todo.middlewares.jwt_auth.validate_access_token", wraps=validate_access_token) as mock_validate:
+            for _ in range(3):
+                request = self._request()
+                self.assertTrue(self.middleware._try_authentication(request))
+
+        self.assertEqual((request.user_id, request.user_email), ("123", "test@example.com"))
+        mock_validate.assert_called_once()
+        mock_get_user.assert_called_once_with("123")
+
+    def test_invalidated_user_is_verified_again(self, mock_get_user):
+        self._mock_user(mock_get_user)
+        self.middleware._try_authentication(self._request())
+
+        self.cache.invalidate_user("123")
+        mock_get_user.return_value = None
+
+        self.assertFalse(self.middleware._try_authentication(self._request()))
+
+    def test_invalid_token_is_not_cached(self, mock_get_user):
+        self._mock_user(mock_get_user)
+
+        self.assertFalse(self.middleware._try_authentication(self._request("invalid-token")))
+
+        self.assertEqual(self.cache.stats()["size"], 0)
+
+    def test_benchmark_authentications_per_second(self, mock_get_user):
+        """
+        RS256 access tokens: a cached token skips the signature check and the user lookup, which
+        dominate an authentication.
+        """
+        self._mock_user(mock_get_user)
+        authentications = 1000
+
+        def authentications_per_second() -> float:
+            requests = [self._request() for _ in range(authentications)]
+            started = time.perf_counter()
+            for request in requests:
+                self.middleware._try_authentication(request)
+            seconds = time.perf_counter() - started
+            self.assertTrue(all(request.user_id == "123" for request in requests))
+            return authentications / seconds
+
+        with override_settings(JWT_CONFIG=_rsa_jwt_config()):
+            self.token = generate_access_token({"user_id": "123"})
+            self.cache.enabled = False
+            uncached = authentications_per_second()
+            self.cache.enabled = True
+            cached = authentications_per_second()
+
+        self.assertGreaterEqual(cached, uncached * 2)
+
+
+@patch("todo.middlewares.jwt_auth.MembershipVersionRepository.get_version")
+class JWTTeamClaimsTests(TestCase):
+    def setUp(self):
+        settings_override = override_settings(JWT_TEAM_CLAIMS_ENABLED=True)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+        self.middleware = JWTAuthenticationMiddleware(Mock(return_value=JsonResponse({"data": "test"})))
+        self.request = Mock(spec=HttpRequest)
+        self.request.user_id = "123"
+        self.payload = {"user_id": "123", "teams": {"team-1": ["member", "admin"]}, "mv": 4}
+
+    def test_current_team_claims_are_trusted(self, mock_get_version):
+        mock_get_version.return_value = 4
+
+        self.middleware._set_team_roles(self.request, self.payload)
+
+        self.assertEqual(self.request.team_roles, {"team-1": ["member", "admin"]})
+        self.assertFalse(hasattr(self.request, "_new_access_token"))
+
+    @patch("todo.middlewares.jwt_auth.UserRoleService.get_team_claims")
+    def test_stale_team_claims_are_replaced_by_new_token(self, mock_get_team_claims, mock_get_version):
+        mock_get_version.return_value = 5
+        mock_get_team_claims.return_value = {"teams": {"team-1": ["member"]}, "mv": 5}
+
+        self.middleware._set_team_roles(self.request, self.payload)
+
+        self.assertEqual(self.request.team_roles, {"team-1": ["member"]})
+        new_payload = validate_access_token(self.request._new_access_token)
+        self.assertEqual((new_payload["teams"], new_payload["mv"]), ({"team-1": ["member"]}, 5))
+
+    def test_token_without_team_claims_is_authorized_from_database(self, mock_get_version):
+        self.middleware._set_team_roles(self.request, {"user_id": "123"})
+
+        self.assertIsNone(self.request.team_roles)
+        mock_get_version.assert_not_called()
+
+    def test_team_roles_are_scoped_to_request(self, mock_get_version):
+        mock_get_version.return_value = 4
+        seen = []
+        self.middleware.get_response = Mock(
+            side_effect=lambda request: seen.append(get_request_team_roles("123")) or JsonResponse({})
+        )
+        self.request.path = "/v1/teams/team-1"
+        self.request.COOKIES = {}
+
+        with patch.object(self.middleware, "_try_authentication") as mock_auth:
+            mock_auth.side_effect = lambda request: self.middleware._set_team_roles(request, self.payload) or True
+            self.middleware(self.request)
+
+        self.assertEqual(seen, [{"team-1": ["member", "admin"]}])
+        self.assertIsNone(get_request_team_roles("123"))
+
+
 class AuthUtilityFunctionsTests(TestCase):
     def setUp(self):
         self.request = Mock(spec=HttpRequest)
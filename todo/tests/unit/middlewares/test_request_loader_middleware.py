@@ -0,0 +1,41 @@
+from unittest import TestCase
+from unittest.mock import MagicMock, Mock
+from django.http import HttpRequest, JsonResponse
+from django.test import override_settings
+
+from todo.middlewares.request_loader_middleware import SAVED_LOOKUPS_HEADER, RequestLoaderMiddleware
+from todo.repositories.common.request_loader import RequestLoader, get_saved_lookups
+
+
+class RequestLoaderMiddlewareTests(TestCase):
+    def setUp(self):
+        self.loader = RequestLoader("test")
+        self.load = MagicMock(return_value=None)
+        self.request = Mock(spec=HttpRequest)
+
+    def _get_response(self, request):
+        self.loader.get("1", self.load)
+        self.loader.get("1", self.load)
+        return JsonResponse({"data": "success"})
+
+    @override_settings(DEBUG=True)
+    def test_reports_saved_lookups_in_debug(self):
+        response = RequestLoaderMiddleware(self._get_response)(self.request)
+
+        self.load.assert_called_once_with("1")
+        self.assertEqual(response[SAVED_LOOKUPS_HEADER], "1")
+
+    @override_settings(DEBUG=False, REQUEST_LOADER_DEBUG_HEADER=False)
+    def test_omits_header_outside_debug(self):
+        response = RequestLoaderMiddleware(self._get_response)(self.request)
+
+        self.assertNotIn(SAVED_LOOKUPS_HEADER, response)
+
+    def test_each_request_gets_its_own_scope(self):
+        middleware = RequestLoaderMiddleware(self._get_response)
+
+        middleware(self.request)
+        middleware(self.request)
+
+        self.assertEqual(self.load.call_count, 2)
+        self.assertEqual(get_saved_lookups(), 0)
@@ -6,6 +6,7 @@ import json
 
 from todo.middlewares.team_access_middleware import TeamAccessMiddleware
 from todo.constants.messages import ApiErrors
+from todo.utils.team_claims import reset_request_team_roles, set_request_team_roles
 
 
 class TeamAccessMiddlewareTests(TestCase):
@@ -43,6 +44,23 @@ class TeamAccessMiddlewareTests(TestCase):
             response_data = json.loads(response.content)
             self.assertEqual(response_data["detail"], ApiErrors.UNAUTHORIZED_TITLE)
 
+    @patch("todo.middlewares.team_access_middleware.resolve")
+    @patch("todo.middlewares.team_access_middleware.UserRoleService.get_user_roles")
+    def test_team_claims_authorize_without_role_query(self, mock_get_roles, mock_resolve):
+        mock_resolve.return_value.url_name = "team_detail"
+        mock_resolve.return_value.kwargs = {"team_id": "team123"}
+        token = set_request_team_roles("user123", {"team123": ["member"]})
+        try:
+            allowed = self.middleware(self.request)
+            mock_resolve.return_value.kwargs = {"team_id": "other-team"}
+            denied = self.middleware(self.request)
+        finally:
+            reset_request_team_roles(token)
+
+        self.assertEqual(allowed.status_code, 200)
+        self.assertEqual(denied.status_code, status.HTTP_403_FORBIDDEN)
+        mock_get_roles.assert_not_called()
+
     @patch("todo.middlewares.team_access_middleware.resolve")
     def test_unprotected_route_bypasses_middleware(self, mock_resolve):
         mock_resolve.return_value.url_name = "task_list"
@@ -53,6 +71,19 @@ class TeamAccessMiddlewareTests(TestCase):
         self.assertEqual(response.status_code, 200)
         self.get_response.assert_called_once_with(self.request)
 
+    @patch("todo.middlewares.team_access_middleware.resolve")
+    def test_path_outside_protected_prefixes_is_not_resolved(self, mock_resolve):
+        self.request.path_info = "/v1/tasks"
+
+        response = self.middleware(self.request)
+
+        self.assertEqual(response.status_code, 200)
+        mock_resolve.assert_not_called()
+        self.get_response.assert_called_once_with(self.request)
+
+    def test_protected_path_prefixes_are_compiled_from_routes(self):
+        self.assertEqual(self.middleware.protected_path_prefixes, ("/v1/teams/",))
+
     @patch("todo.middlewares.team_access_middleware.resolve")
     def test_middleware_handles_exception_with_500(self, mock_resolve):
         mock_resolve.return_value.url_name = "team_detail"
@@ -0,0 +1,42 @@
+from unittest import TestCase
+from unittest.mock import MagicMock
+from django.test import override_settings
+from pymongo import ReturnDocument
+
+from todo.repositories.common.id_block_allocator import IdBlockAllocator
+
+
+def _counters(*block_ends: int) -> MagicMock:
+    counters = MagicMock()
+    counters.find_one_and_update.side_effect = [{"_id": "testCounter", "seq": end} for end in block_ends]
+    return counters
+
+
+class IdBlockAllocatorTests(TestCase):
+    def test_hands_out_ids_from_reserved_block(self):
+        counters = _counters(3, 6)
+        allocator = IdBlockAllocator("testCounter", block_size=3)
+
+        ids = [allocator.next_id(counters) for _ in range(4)]
+
+        self.assertEqual(ids, [1, 2, 3, 4])
+        self.assertEqual(counters.find_one_and_update.call_count, 2)
+        counters.find_one_and_update.assert_called_with(
+            {"_id": "testCounter"}, {"$inc": {"seq": 3}}, upsert=True, return_document=ReturnDocument.AFTER
+        )
+
+    def test_skips_ids_reserved_by_other_processes(self):
+        counters = _counters(2, 10)
+        allocator = IdBlockAllocator("testCounter", block_size=2)
+
+        ids = [allocator.next_id(counters) for _ in range(3)]
+
+        self.assertEqual(ids, [1, 2, 9])
+
+    @override_settings(TASK_DISPLAY_ID_BLOCK_SIZE=50)
+    def test_block_size_defaults_to_setting(self):
+        counters = _counters(50)
+        allocator = IdBlockAllocator("testCounter")
+
+        self.assertEqual(allocator.next_id(counters), 1)
+        self.assertEqual(counters.find_one_and_update.call_args[0][1], {"$inc": {"seq": 50}})
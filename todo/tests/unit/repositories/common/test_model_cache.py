@@ -0,0 +1,104 @@
+from unittest import TestCase
+from unittest.mock import MagicMock, patch
+from bson import ObjectId
+
+from todo.models.user import UserModel
+from todo.repositories.common.model_cache import ModelCache
+from todo.tests.fixtures.user import users_db_data
+
+
+def _user(**fields) -> UserModel:
+    return UserModel(**{**users_db_data[0], "_id": ObjectId(), **fields})
+
+
+class ModelCacheTests(TestCase):
+    def setUp(self):
+        self.cache = ModelCache("test", max_size=2, ttl=60, negative_ttl=10, enabled=True)
+
+    def test_get_loads_once_and_returns_copies(self):
+        user = _user()
+        loader = MagicMock(return_value=user)
+
+        first = self.cache.get("1", loader)
+        first.name = "changed"
+        second = self.cache.get("1", loader)
+
+        loader.assert_called_once_with("1")
+        self.assertEqual(second.name, user.name)
+        self.assertEqual(self.cache.stats()["hits"], 1)
+
+    def test_unknown_ids_are_cached_until_negative_ttl(self):
+        loader = MagicMock(return_value=None)
+
+        with patch("todo.repositories.common.model_cache.time.monotonic", side_effect=[0, 0, 5, 11, 11]):
+            self.assertIsNone(self.cache.get("missing", loader))
+            self.assertIsNone(self.cache.get("missing", loader))
+            self.assertIsNone(self.cache.get("missing", loader))
+
+        self.assertEqual(loader.call_count, 2)
+        self.assertEqual(self.cache.stats()["negative_hits"], 1)
+
+    def test_least_recently_used_entry_is_evicted(self):
+        users = {key: _user() for key in ("1", "2", "3")}
+        loader = MagicMock(side_effect=users.get)
+
+        self.cache.get("1", loader)
+        self.cache.get("2", loader)
+        self.cache.get("1", loader)
+        self.cache.get("3", loader)
+        self.cache.get("1", loader)
+        self.cache.get("2", loader)
+
+        self.assertEqual([call.args[0] for call in loader.call_args_list], ["1", "2", "3", "2"])
+        self.assertEqual(self.cache.stats()["evictions"], 2)
+
+    def test_get_many_loads_only_misses_in_one_call(self):
+        cached, loaded = _user(), _user()
+        self.cache.put("1", cached)
+        loader = MagicMock(return_value={"2": loaded})
+
+        result = self.cache.get_many(["2", "1", "3", "2"], loader)
+
+        loader.assert_called_once_with(["2", "3"])
+        self.assertEqual(list(result), ["2", "1"])
+        self.assertEqual(self.cache.get_many(["3"], loader), {})
+        self.assertEqual(loader.call_count, 1)
+
+    def test_put_and_invalidate_replace_cached_model(self):
+        self.cache.put("1", _user(name="old"))
+        self.cache.put("1", _user(name="new"))
+        self.assertEqual(self.cache.get("1", MagicMock()).name, "new")
+
+        self.cache.invalidate("1")
+        loader = MagicMock(return_value=None)
+        self.assertIsNone(self.cache.get("1", loader))
+        loader.assert_called_once_with("1")
+
+    def test_load_racing_with_a_write_is_not_cached(self):
+        def loader(key):
+            self.cache.put("other", _user())
+            return _user(name="stale")
+
+        self.cache.get("1", loader)
+
+        fresh = MagicMock(return_value=_user(name="fresh"))
+        self.assertEqual(self.cache.get("1", fresh).name, "fresh")
+
+    def test_disabled_cache_always_loads(self):
+        cache = ModelCache("disabled", enabled=False)
+        loader = MagicMock(return_value=_user())
+
+        cache.get("1", loader)
+        cache.get("1", loader)
+
+        self.assertEqual(loader.call_count, 2)
+        self.assertEqual(cache.stats()["size"], 0)
+
+    def test_stats_report_hit_rate(self):
+        loader = MagicMock(return_value=_user())
+        for _ in range(4):
+            self.cache.get("1", loader)
+
+        stats = self.cache.stats()
+        self.assertEqual((stats["hits"], stats["misses"], stats["hit_rate"]), (3, 1, 0.75))
+        self.assertIn(stats, ModelCache.get_all_stats())
@@ -1,5 +1,6 @@
 from unittest import TestCase
 from unittest.mock import MagicMock, patch
+from pymongo import IndexModel
 from todo.repositories.common.mongo_repository import MongoRepository
 from todo_project.db.config import DatabaseManager
 
@@ -55,3 +56,18 @@ class MongoRepositoryTests(TestCase):
         TestRepository.get_collection()
 
         mock_get_collection.assert_called_once_with("test_collection")
+
+    def test_subclass_with_indexes_is_registered(self):
+        class IndexedRepository(MongoRepository):
+            collection_name = "indexed_collection"
+            indexes = [IndexModel([("field", 1)], name="field")]
+
+        self.addCleanup(MongoRepository._index_registry.remove, IndexedRepository)
+
+        self.assertIn(IndexedRepository, MongoRepository.get_indexed_repositories())
+
+    def test_subclass_without_indexes_is_not_registered(self):
+        class PlainRepository(MongoRepository):
+            collection_name = "plain_collection"
+
+        self.assertNotIn(PlainRepository, MongoRepository.get_indexed_repositories())
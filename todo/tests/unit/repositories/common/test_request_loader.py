@@ -0,0 +1,145 @@
+from unittest import TestCase
+from unittest.mock import MagicMock, patch
+from bson import ObjectId
+from django.test import override_settings
+
+from todo.models.task import TaskModel
+from todo.models.user import UserModel
+from todo.repositories.common.request_loader import (
+    RequestLoader,
+    end_request_scope,
+    get_saved_lookups,
+    start_request_scope,
+)
+from todo.repositories.task_repository import TaskRepository
+from todo.tests.fixtures.task import tasks_db_data
+from todo.tests.fixtures.user import users_db_data
+
+
+def _user(**fields) -> UserModel:
+    return UserModel(**{**users_db_data[0], "_id": ObjectId(), **fields})
+
+
+class RequestLoaderTests(TestCase):
+    def setUp(self):
+        self.loader = RequestLoader("test")
+        self.token = start_request_scope()
+
+    def tearDown(self):
+        end_request_scope(self.token)
+
+    def test_get_loads_once_per_request_and_returns_copies(self):
+        load = MagicMock(return_value=_user(name="Loaded User"))
+
+        first = self.loader.get("1", load)
+        first.name = "changed"
+        second = self.loader.get("1", load)
+
+        load.assert_called_once_with("1")
+        self.assertEqual(second.name, "Loaded User")
+        self.assertEqual(get_saved_lookups(), 1)
+
+    def test_unknown_ids_are_remembered(self):
+        load = MagicMock(return_value=None)
+
+        self.assertIsNone(self.loader.get("missing", load))
+        self.assertIsNone(self.loader.get("missing", load))
+
+        load.assert_called_once_with("missing")
+
+    def test_get_many_loads_only_ids_not_loaded_yet(self):
+        users = {"1": _user(), "2": _user()}
+        self.loader.get("1", lambda key: users[key])
+        load_many = MagicMock(side_effect=lambda keys: {key: users[key] for key in keys if key in users})
+
+        result = self.loader.get_many(["2", "1", "3", "2"], load_many)
+
+        load_many.assert_called_once_with(["2", "3"])
+        self.assertEqual(list(result), ["2", "1"])
+        self.assertEqual(get_saved_lookups(), 1)
+        self.assertEqual(self.loader.get("3", MagicMock()), None)
+
+    def test_invalidate_and_clear_reload_on_next_lookup(self):
+        load = MagicMock(side_effect=lambda key: _user())
+        self.loader.get("1", load)
+        self.loader.get("2", load)
+
+        self.loader.invalidate("1")
+        self.loader.get("1", load)
+        self.loader.clear()
+        self.loader.get("2", load)
+
+        self.assertEqual(load.call_count, 4)
+
+    def test_scopes_do_not_share_loaded_models(self):
+        load = MagicMock(side_effect=lambda key: _user())
+        self.loader.get("1", load)
+
+        token = start_request_scope()
+        try:
+            self.loader.get("1", load)
+            self.assertEqual(get_saved_lookups(), 0)
+        finally:
+            end_request_scope(token)
+
+        self.assertEqual(load.call_count, 2)
+
+    def test_lookups_outside_a_request_always_load(self):
+        load = MagicMock(side_effect=lambda key: _user())
+        end_request_scope(self.token)
+        try:
+            self.loader.get("1", load)
+            self.loader.get("1", load)
+        finally:
+            self.token = start_request_scope()
+
+        self.assertEqual(load.call_count, 2)
+
+    @override_settings(REQUEST_LOADER_ENABLED=False)
+    def test_disabled_loader_always_loads(self):
+        load = MagicMock(side_effect=lambda key: _user())
+        token = start_request_scope()
+        try:
+            self.loader.get("1", load)
+            self.loader.get("1", load)
+        finally:
+            end_request_scope(token)
+
+        self.assertEqual(load.call_count, 2)
+
+
+class TaskRequestLoaderTests(TestCase):
+    def setUp(self):
+        self.token = start_request_scope()
+        self.task_data = {**tasks_db_data[0], "_id": ObjectId()}
+        self.task_id = str(self.task_data["_id"])
+
+    def tearDown(self):
+        end_request_scope(self.token)
+
+    @patch("todo.repositories.task_repository.TaskRepository.get_collection")
+    def test_get_by_id_after_get_by_ids_does_not_read_again(self, mock_get_collection):
+        mock_get_collection.return_value.find.return_value = [self.task_data]
+
+        tasks = TaskRepository.get_by_ids([self.task_id])
+        task = TaskRepository.get_by_id(self.task_id)
+
+        self.assertEqual(str(tasks[0].id), self.task_id)
+        self.assertIsInstance(task, TaskModel)
+        mock_get_collection.return_value.find_one.assert_not_called()
+
+    @patch("todo.repositories.task_repository.EnhancedDualWriteService")
+    @patch("todo.repositories.task_repository.TaskRepository.get_collection")
+    def test_update_drops_the_loaded_task(self, mock_get_collection, mock_dual_write_service_class):
+        mock_collection = mock_get_collection.return_value
+        mock_collection.find_one.return_value = self.task_data
+        updated_task_data = {**self.task_data, "title": "Updated title"}
+        mock_collection.find_one_and_update.return_value = updated_task_data
+        TaskRepository.get_by_id(self.task_id)
+
+        TaskRepository.update(self.task_id, {"title": "Updated title"})
+        mock_collection.find_one.return_value = updated_task_data
+        task = TaskRepository.get_by_id(self.task_id)
+
+        self.assertEqual(task.title, "Updated title")
+        self.assertEqual(mock_collection.find_one.call_count, 2)
@@ -0,0 +1,86 @@
+import threading
+from unittest import TestCase
+from unittest.mock import MagicMock, patch
+
+from todo.repositories.common.write_buffer import WriteBuffer
+
+
+@patch("todo.repositories.common.write_buffer.atexit.register")
+class WriteBufferTests(TestCase):
+    def test_disabled_buffer_writes_immediately(self, mock_register):
+        writer = MagicMock()
+        buffer = WriteBuffer("test", writer, enabled=False)
+
+        buffer.add("a")
+
+        writer.assert_called_once_with(["a"])
+        mock_register.assert_not_called()
+
+    def test_flush_writes_buffered_items_in_batches_of_max_size(self, mock_register):
+        writer = MagicMock()
+        buffer = WriteBuffer("test", writer, max_size=10, interval=60)
+        buffer.add_many(["a", "b", "c"])
+        writer.assert_not_called()
+
+        buffer.max_size = 2
+        buffer.flush()
+
+        self.assertEqual([call.args[0] for call in writer.call_args_list], [["a", "b"], ["c"]])
+        mock_register.assert_called_once_with(buffer.flush)
+
+    def test_reaching_max_size_writes_in_background(self, _):
+        written = threading.Event()
+        writer = MagicMock(side_effect=lambda items: written.set())
+        buffer = WriteBuffer("test", writer, max_size=2, interval=60)
+
+        buffer.add("a")
+        buffer.add("b")
+
+        self.assertTrue(written.wait(5))
+        writer.assert_called_once_with(["a", "b"])
+
+    def test_interval_writes_in_background(self, _):
+        written = threading.Event()
+        writer = MagicMock(side_effect=lambda items: written.set())
+        buffer = WriteBuffer("test", writer, max_size=100, interval=0.05)
+
+        buffer.add("a")
+
+        self.assertTrue(written.wait(5))
+        writer.assert_called_once_with(["a"])
+
+    def test_disabled_buffer_raises_writer_errors_to_caller(self, _):
+        buffer = WriteBuffer("test", MagicMock(side_effect=RuntimeError("down")), enabled=False)
+
+        with self.assertRaises(RuntimeError):
+            buffer.add("a")
+
+    def test_failed_batch_is_written_again_before_newer_items(self, _):
+        writer = MagicMock(side_effect=[RuntimeError("down"), None, None])
+        buffer = WriteBuffer("test", writer, max_size=10, interval=60)
+        buffer.add("a")
+
+        with self.assertLogs("todo.repositories.common.write_buffer", level="WARNING"):
+            buffer.flush()
+        self.assertEqual(buffer.stats()["retrying"], 1)
+        buffer.add("b")
+        buffer.flush()
+
+        self.assertEqual([call.args[0] for call in writer.call_args_list], [["a"], ["a"], ["b"]])
+        self.assertEqual(buffer.stats()["written"], 2)
+        self.assertEqual(buffer.stats()["failed_writes"], 1)
+
+    def test_batch_is_dropped_after_max_retries(self, _):
+        writer = MagicMock(side_effect=RuntimeError("down"))
+        buffer = WriteBuffer("test", writer, max_size=10, interval=60, max_retries=2)
+        buffer.add_many(["a", "b"])
+
+        with self.assertLogs("todo.repositories.common.write_buffer", level="WARNING") as logs:
+            for _ in range(4):
+                buffer.flush()
+
+        self.assertEqual(writer.call_count, 3)
+        self.assertEqual(list(buffer.dropped), [["a", "b"]])
+        self.assertEqual(buffer.stats()["dropped"], 2)
+        self.assertEqual(buffer.stats()["retrying"], 0)
+        self.assertIn("Dropped 2 buffered test", logs.output[-1])
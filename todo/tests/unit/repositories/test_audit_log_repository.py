@@ -0,0 +1,158 @@
+from datetime import datetime, timezone
+from unittest import TestCase
+from unittest.mock import MagicMock, patch
+from bson import ObjectId
+from pymongo import ASCENDING, DESCENDING
+from pymongo.errors import BulkWriteError
+
+from todo.models.audit_log import AuditLogModel
+from todo.repositories.audit_log_repository import TIMELINE_FIELDS, AuditLogRepository
+from todo.repositories.common.write_buffer import WriteBuffer
+from todo.serializers.get_team_activity_timeline_serializer import parse_timeline_position
+
+
+class AuditLogRepositoryTimelineTests(TestCase):
+    def setUp(self) -> None:
+        self.mock_collection = MagicMock()
+        self.patcher_collection = patch.object(AuditLogRepository, "get_collection", return_value=self.mock_collection)
+        self.patcher_collection.start()
+        self.team_id = str(ObjectId())
+        self.timestamp = datetime(2025, 1, 2, 10, 0, 0, 500000, tzinfo=timezone.utc)
+        self.logs = [
+            {"_id": ObjectId(), "team_id": self.team_id, "action": "team_updated", "timestamp": "2025-01-01T09:00:00Z"},
+            {"_id": ObjectId(), "team_id": self.team_id, "action": "team_updated", "timestamp": "2025-01-01T10:00:00Z"},
+        ]
+        self.mock_cursor = self.mock_collection.find.return_value.sort.return_value.limit
+        self.mock_cursor.return_value = self.logs
+
+    def tearDown(self) -> None:
+        self.patcher_collection.stop()
+
+    def test_first_page_reads_newest_logs_with_projection(self):
+        AuditLogRepository.get_team_timeline(self.team_id, 20)
+
+        self.mock_collection.find.assert_called_once_with(
+            {"team_id": self.team_id}, {field: 1 for field in TIMELINE_FIELDS}
+        )
+        self.mock_collection.find.return_value.sort.assert_called_once_with(
+            [("timestamp", DESCENDING), ("_id", DESCENDING)]
+        )
+        self.mock_cursor.assert_called_once_with(20)
+
+    def test_before_position_reads_older_logs(self):
+        entry_id = ObjectId()
+
+        AuditLogRepository.get_team_timeline(self.team_id, 20, before=(self.timestamp, entry_id))
+
+        query = self.mock_collection.find.call_args.args[0]
+        self.assertEqual(
+            query["$or"],
+            [
+                {"timestamp": {"$lt": self.timestamp}},
+                {"timestamp": self.timestamp, "_id": {"$lt": entry_id}},
+            ],
+        )
+
+    def test_bounds_without_microseconds_or_in_other_offsets_compare_as_dates(self):
+        entry_id = ObjectId()
+        for value in ("2025-01-01T09:00:00Z", "2025-01-01T14:30:00+05:30"):
+            with self.subTest(value=value):
+                AuditLogRepository.get_team_timeline(
+                    self.team_id, 20, before=parse_timeline_position(f"{value},{entry_id}")
+                )
+
+                query = self.mock_collection.find.call_args.args[0]
+                self.assertEqual(
+                    query["$or"],
+                    [
+                        {"timestamp": {"$lt": datetime(2025, 1, 1, 9, tzinfo=timezone.utc)}},
+                        {"timestamp": datetime(2025, 1, 1, 9, tzinfo=timezone.utc), "_id": {"$lt": entry_id}},
+                    ],
+                )
+
+    def test_naive_bound_is_read_as_utc(self):
+        AuditLogRepository.get_team_timeline(self.team_id, 20, since=(datetime(2025, 1, 1, 9), None))
+
+        query = self.mock_collection.find.call_args.args[0]
+        self.assertEqual(query["timestamp"], {"$gt": datetime(2025, 1, 1, 9, tzinfo=timezone.utc)})
+
+    def test_since_timestamp_reads_oldest_newer_logs_and_returns_newest_first(self):
+        timeline = AuditLogRepository.get_team_timeline(self.team_id, 20, since=(self.timestamp, None))
+
+        query = self.mock_collection.find.call_args.args[0]
+        self.assertEqual(query["timestamp"], {"$gt": self.timestamp})
+        self.mock_collection.find.return_value.sort.assert_called_once_with(
+            [("timestamp", ASCENDING), ("_id", ASCENDING)]
+        )
+        self.assertEqual([log.id for log in timeline], [self.logs[1]["_id"], self.logs[0]["_id"]])
+
+
+@patch("todo.repositories.audit_log_repository.EnhancedDualWriteService")
+class AuditLogRepositoryWriteTests(TestCase):
+    def setUp(self) -> None:
+        self.mock_collection = MagicMock()
+        self.patcher_collection = patch.object(AuditLogRepository, "get_collection", return_value=self.mock_collection)
+        self.patcher_collection.start()
+        self.team_id = str(ObjectId())
+
+    def tearDown(self) -> None:
+        self.patcher_collection.stop()
+
+    def _audit_log(self, action="team_updated"):
+        return AuditLogModel(team_id=self.team_id, action=action)
+
+    def test_create_sets_id_and_writes_when_buffer_is_disabled(self, mock_dual_write_service):
+        with patch.object(
+            AuditLogRepository,
+            "write_buffer",
+            WriteBuffer("audit_logs", AuditLogRepository._write_many, enabled=False),
+        ):
+            audit_log = AuditLogRepository.create(self._audit_log())
+
+        self.assertIsInstance(audit_log.id, ObjectId)
+        inserted_docs = self.mock_collection.insert_many.call_args.args[0]
+        self.assertEqual(inserted_docs[0]["_id"], audit_log.id)
+        self.assertEqual(inserted_docs[0]["team_id"], self.team_id)
+        self.assertEqual(inserted_docs[0]["timestamp"], audit_log.timestamp)
+        self.assertIsInstance(inserted_docs[0]["timestamp"], datetime)
+        operations = mock_dual_write_service.return_value.batch_operations.call_args.args[0]
+        self.assertEqual(operations[0]["mongo_id"], str(audit_log.id))
+
+    def test_write_raises_to_caller_when_buffer_is_disabled(self, mock_dual_write_service):
+        self.mock_collection.insert_many.side_effect = Exception("connection lost")
+
+        with patch.object(
+            AuditLogRepository,
+            "write_buffer",
+            WriteBuffer("audit_logs", AuditLogRepository._write_many, enabled=False),
+        ):
+            with self.assertRaises(Exception):
+                AuditLogRepository.create(self._audit_log())
+
+        mock_dual_write_service.return_value.batch_operations.assert_not_called()
+
+    def test_rewrite_of_partly_inserted_batch_ignores_duplicate_keys(self, mock_dual_write_service):
+        self.mock_collection.insert_many.side_effect = BulkWriteError(
+            {"writeErrors": [{"code": 11000, "index": 0}], "writeConcernErrors": []}
+        )
+
+        AuditLogRepository._write_many([self._audit_log()])
+
+        mock_dual_write_service.return_value.batch_operations.assert_called_once()
+
+    @patch("todo.repositories.common.write_buffer.atexit.register")
+    def test_buffered_audit_logs_are_written_with_one_insert(self, _, mock_dual_write_service):
+        with patch.object(
+            AuditLogRepository,
+            "write_buffer",
+            WriteBuffer("audit_logs", AuditLogRepository._write_many, max_size=10, interval=60),
+        ):
+            AuditLogRepository.create(self._audit_log())
+            AuditLogRepository.create_many([self._audit_log("member_added_to_team") for _ in range(2)])
+            self.mock_collection.insert_many.assert_not_called()
+
+            AuditLogRepository.flush()
+
+        self.mock_collection.insert_many.assert_called_once()
+        self.assertEqual(len(self.mock_collection.insert_many.call_args.args[0]), 3)
+        mock_dual_write_service.return_value.batch_operations.assert_called_once()
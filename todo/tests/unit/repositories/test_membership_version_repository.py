@@ -0,0 +1,48 @@
+from unittest import TestCase
+from unittest.mock import MagicMock, patch
+from django.test import override_settings
+
+from todo.repositories.membership_version_repository import MembershipVersionRepository
+
+
+class MembershipVersionRepositoryTests(TestCase):
+    def setUp(self) -> None:
+        settings_override = override_settings(JWT_TEAM_CLAIMS_ENABLED=True)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+        self.mock_collection = MagicMock()
+        self.patcher_collection = patch.object(
+            MembershipVersionRepository, "get_collection", return_value=self.mock_collection
+        )
+        self.patcher_collection.start()
+
+    def tearDown(self) -> None:
+        self.patcher_collection.stop()
+
+    def test_get_version_defaults_to_zero(self):
+        self.mock_collection.find_one.return_value = None
+
+        self.assertEqual(MembershipVersionRepository.get_version("user-1"), 0)
+
+    def test_bump_upserts_every_user_with_one_write(self):
+        MembershipVersionRepository.bump(["user-2", "user-1", "user-2"])
+
+        self.mock_collection.bulk_write.assert_called_once()
+        operations = self.mock_collection.bulk_write.call_args[0][0]
+        self.assertEqual(
+            [operation._filter for operation in operations], [{"user_id": "user-1"}, {"user_id": "user-2"}]
+        )
+        self.assertTrue(all(operation._upsert for operation in operations))
+
+    def test_bump_failure_is_raised(self):
+        self.mock_collection.bulk_write.side_effect = Exception("Database error")
+
+        with self.assertLogs("todo.repositories.membership_version_repository", level="ERROR"):
+            with self.assertRaises(Exception):
+                MembershipVersionRepository.bump(["user-1"])
+
+    @override_settings(JWT_TEAM_CLAIMS_ENABLED=False)
+    def test_bump_is_skipped_when_disabled(self):
+        MembershipVersionRepository.bump(["user-1"])
+
+        self.mock_collection.bulk_write.assert_not_called()
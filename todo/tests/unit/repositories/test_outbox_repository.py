@@ -0,0 +1,96 @@
+from datetime import datetime, timedelta, timezone
+from unittest import TestCase
+from unittest.mock import MagicMock, patch
+from bson import ObjectId
+
+from todo.constants.task import TaskPriority, TaskStatus
+from todo.repositories.outbox_repository import OutboxRepository
+from todo.utils.retry_utils import MAX_RETRY_BACKOFF_SECONDS
+
+
+class OutboxRepositoryTests(TestCase):
+    def setUp(self):
+        self.collection = MagicMock()
+        self.patcher_collection = patch(
+            "todo.repositories.outbox_repository.OutboxRepository.get_collection", return_value=self.collection
+        )
+        self.patcher_collection.start()
+        self.now = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+    def tearDown(self):
+        self.patcher_collection.stop()
+
+    def test_enqueue_many_inserts_events_in_order_within_session(self):
+        session = MagicMock()
+        task_id = ObjectId()
+        operations = [
+            {
+                "collection_name": "tasks",
+                "operation": "create",
+                "mongo_id": task_id,
+                "data": {"priority": TaskPriority.HIGH, "status": TaskStatus.TODO, "labels": [ObjectId()]},
+            },
+            {"collection_name": "tasks", "operation": "delete", "mongo_id": str(task_id)},
+        ]
+
+        OutboxRepository.enqueue_many(operations, session=session)
+
+        events = self.collection.insert_many.call_args[0][0]
+        self.assertEqual(self.collection.insert_many.call_args.kwargs, {"ordered": True, "session": session})
+        self.assertEqual([event["operation"] for event in events], ["create", "delete"])
+        self.assertEqual({event["key"] for event in events}, {f"tasks:{task_id}"})
+        self.assertEqual(events[0]["mongo_id"], str(task_id))
+        self.assertEqual(events[0]["data"]["priority"], 1)
+        self.assertEqual(events[0]["data"]["status"], "TODO")
+        self.assertEqual(events[0]["status"], "pending")
+        self.assertEqual(events[0]["attempts"], 0)
+        self.assertNotIn("_id", events[0])
+
+    def test_enqueue_many_skips_empty_operations(self):
+        self.assertEqual(OutboxRepository.enqueue_many([]), [])
+        self.collection.insert_many.assert_not_called()
+
+    def test_get_ready_events_excludes_documents_waiting_for_retry(self):
+        self.collection.distinct.return_value = ["tasks:1"]
+
+        OutboxRepository.get_ready_events(50, self.now)
+
+        self.collection.distinct.assert_called_once_with(
+            "key", {"status": "pending", "next_attempt_at": {"$gt": self.now}}
+        )
+        self.collection.find.assert_called_once_with(
+            {"status": "pending", "next_attempt_at": {"$lte": self.now}, "key": {"$nin": ["tasks:1"]}}
+        )
+        self.collection.find.return_value.sort.return_value.limit.assert_called_once_with(50)
+
+    def test_mark_failed_backs_off_then_parks_event(self):
+        retried = {"_id": ObjectId(), "attempts": 1}
+        exhausted = {"_id": ObjectId(), "attempts": 2}
+
+        dead_count = OutboxRepository.mark_failed(
+            [(retried, "timeout"), (exhausted, "timeout")], max_attempts=3, retry_delay=5, now=self.now
+        )
+
+        self.assertEqual(dead_count, 1)
+        retry_update, dead_update = self.collection.bulk_write.call_args[0][0]
+        self.assertEqual(
+            retry_update._doc["$set"],
+            {"attempts": 2, "last_error": "timeout", "next_attempt_at": self.now + timedelta(seconds=10)},
+        )
+        self.assertEqual(dead_update._doc["$set"], {"attempts": 3, "last_error": "timeout", "status": "dead"})
+
+    def test_mark_failed_caps_backoff(self):
+        OutboxRepository.mark_failed([({"_id": ObjectId(), "attempts": 20}, "error")], 50, 5, self.now)
+
+        update = self.collection.bulk_write.call_args[0][0][0]
+        self.assertEqual(
+            update._doc["$set"]["next_attempt_at"], self.now + timedelta(seconds=MAX_RETRY_BACKOFF_SECONDS)
+        )
+
+    def test_get_lag_metrics(self):
+        self.collection.find_one.return_value = {"created_at": self.now - timedelta(seconds=30)}
+        self.collection.count_documents.side_effect = [4, 1]
+
+        metrics = OutboxRepository.get_lag_metrics(self.now)
+
+        self.assertEqual(metrics, {"pending": 4, "dead": 1, "oldest_pending_age_seconds": 30.0})
@@ -0,0 +1,94 @@
+from datetime import datetime, timedelta, timezone
+from unittest import TestCase
+from unittest.mock import MagicMock, patch
+from bson import ObjectId
+
+from todo.constants.task import TaskStatus
+from todo.models.sync_failure import SyncFailureModel
+from todo.repositories.sync_failure_repository import SyncFailureRepository
+
+
+class SyncFailureRepositoryTests(TestCase):
+    def setUp(self):
+        self.collection = MagicMock()
+        self.patcher_collection = patch(
+            "todo.repositories.sync_failure_repository.SyncFailureRepository.get_collection",
+            return_value=self.collection,
+        )
+        self.patcher_collection.start()
+        self.now = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+    def tearDown(self):
+        self.patcher_collection.stop()
+
+    def _failure(self, attempts: int = 0) -> SyncFailureModel:
+        return SyncFailureModel(
+            _id=ObjectId(),
+            target_collection="tasks",
+            mongo_id="abc",
+            operation="update",
+            key="tasks:abc",
+            attempts=attempts,
+            failed_at=self.now,
+        )
+
+    def test_record_upserts_latest_payload_per_document(self):
+        self.collection.find_one_and_update.return_value = self._failure().model_dump(by_alias=True)
+
+        SyncFailureRepository.record("tasks", "update", ObjectId(), {"status": TaskStatus.DONE}, "timeout", 5)
+
+        query, update = self.collection.find_one_and_update.call_args[0]
+        self.assertTrue(query["key"].startswith("tasks:"))
+        self.assertEqual(update["$set"]["data"], {"status": "DONE"})
+        self.assertEqual(update["$set"]["attempts"], 0)
+        self.assertEqual(update["$set"]["status"], "pending")
+        self.assertEqual(update["$set"]["next_attempt_at"] - update["$set"]["failed_at"], timedelta(seconds=5))
+        self.assertIn("created_at", update["$setOnInsert"])
+        self.assertTrue(self.collection.find_one_and_update.call_args.kwargs["upsert"])
+
+    def test_resolve_keeps_failures_recorded_again(self):
+        failure = self._failure()
+
+        SyncFailureRepository.resolve([failure])
+
+        delete = self.collection.bulk_write.call_args[0][0][0]
+        self.assertEqual(delete._filter, {"_id": failure.id, "failed_at": self.now})
+
+    def test_mark_failed_backs_off_then_parks_failure(self):
+        retried = self._failure(attempts=0)
+        exhausted = self._failure(attempts=2)
+
+        dead_count = SyncFailureRepository.mark_failed(
+            [(retried, "timeout"), (exhausted, "timeout")], max_attempts=3, retry_delay=5, now=self.now
+        )
+
+        self.assertEqual(dead_count, 1)
+        retry_update, dead_update = self.collection.bulk_write.call_args[0][0]
+        self.assertEqual(retry_update._doc["$set"]["attempts"], 1)
+        self.assertEqual(retry_update._doc["$set"]["next_attempt_at"], self.now + timedelta(seconds=10))
+        self.assertEqual(dead_update._doc["$set"], {"attempts": 3, "last_error": "timeout", "status": "dead"})
+
+    def test_get_metrics_groups_by_status_and_collection(self):
+        self.collection.aggregate.return_value = [
+            {"_id": {"status": "pending", "collection": "tasks"}, "count": 2},
+            {"_id": {"status": "dead", "collection": "tasks"}, "count": 1},
+            {"_id": {"status": "pending", "collection": "teams"}, "count": 1},
+        ]
+        self.collection.find.return_value.sort.return_value.limit.return_value = [
+            {
+                "target_collection": "tasks",
+                "mongo_id": "abc",
+                "operation": "update",
+                "status": "dead",
+                "attempts": 3,
+                "last_error": "timeout",
+                "failed_at": self.now,
+            }
+        ]
+
+        metrics = SyncFailureRepository.get_metrics()
+
+        self.assertEqual(metrics["total_failures"], 4)
+        self.assertEqual((metrics["pending"], metrics["dead"]), (3, 1))
+        self.assertEqual(metrics["failures_by_collection"], {"tasks": 3, "teams": 1})
+        self.assertEqual(metrics["recent_failures"][0]["error"], "timeout")
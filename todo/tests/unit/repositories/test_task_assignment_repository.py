@@ -0,0 +1,178 @@
+from datetime import datetime, timezone
+from unittest import TestCase
+from unittest.mock import MagicMock, patch
+from bson import ObjectId
+from django.test import override_settings
+from pymongo import UpdateOne
+
+from todo.models.task_assignment import TaskAssignmentModel
+from todo.repositories.task_assignment_repository import TaskAssignmentRepository
+
+
+class TaskAssigneeSnapshotTests(TestCase):
+    def setUp(self):
+        self.task_id = ObjectId()
+        self.user_id = ObjectId()
+        self.team_id = ObjectId()
+        self.created_at = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+        self.task_details = MagicMock()
+        self.tasks = MagicMock()
+        self.users = MagicMock()
+        self.teams = MagicMock()
+        collections = {"tasks": self.tasks, "users": self.users, "teams": self.teams}
+        database = MagicMock()
+        database.__getitem__.side_effect = collections.__getitem__
+
+        self.patcher_database = patch(
+            "todo.repositories.task_assignment_repository.TaskAssignmentRepository.get_database",
+            return_value=database,
+        )
+        self.patcher_collection = patch(
+            "todo.repositories.task_assignment_repository.TaskAssignmentRepository.get_collection",
+            return_value=self.task_details,
+        )
+        self.patcher_database.start()
+        self.patcher_collection.start()
+
+    def tearDown(self):
+        self.patcher_database.stop()
+        self.patcher_collection.stop()
+
+    def _set_assignments(self, assignments: list) -> None:
+        self.task_details.find.return_value.sort.return_value = assignments
+
+    def _assignment(self, **fields) -> dict:
+        return {
+            "_id": ObjectId(),
+            "task_id": str(self.task_id),
+            "assignee_id": self.user_id,
+            "user_type": "user",
+            "created_by": self.user_id,
+            "created_at": self.created_at,
+            **fields,
+        }
+
+    def _written_snapshot(self) -> dict | None:
+        [operation] = self.tasks.bulk_write.call_args[0][0]
+        self.assertIsInstance(operation, UpdateOne)
+        self.assertEqual(operation._filter, {"_id": self.task_id})
+        return operation._doc["$set"]["assignee"]
+
+    def test_refresh_stores_user_assignee_with_name(self):
+        assignment = self._assignment(team_id=self.team_id)
+        self._set_assignments([assignment])
+        self.users.find.return_value = [{"_id": self.user_id, "name": "Jane"}]
+
+        self.assertTrue(TaskAssignmentRepository.refresh_assignee_snapshots([str(self.task_id)]))
+
+        snapshot = self._written_snapshot()
+        self.assertEqual(snapshot["assignment_id"], str(assignment["_id"]))
+        self.assertEqual((snapshot["id"], snapshot["type"], snapshot["name"]), (str(self.user_id), "user", "Jane"))
+        self.assertEqual(snapshot["team_id"], str(self.team_id))
+        self.assertEqual(snapshot["created_at"], self.created_at)
+        self.teams.find.assert_not_called()
+        task_details_query = self.task_details.find.call_args[0][0]
+        self.assertEqual(task_details_query["task_id"], {"$in": [self.task_id, str(self.task_id)]})
+        self.assertTrue(task_details_query["is_active"])
+
+    def test_refresh_stores_team_assignee_with_team_name(self):
+        self._set_assignments([self._assignment(assignee_id=str(self.team_id), user_type="team")])
+        self.teams.find.return_value = [{"_id": self.team_id, "name": "Backend"}]
+
+        TaskAssignmentRepository.refresh_assignee_snapshots([self.task_id])
+
+        snapshot = self._written_snapshot()
+        self.assertEqual((snapshot["id"], snapshot["type"], snapshot["name"]), (str(self.team_id), "team", "Backend"))
+        self.users.find.assert_not_called()
+
+    def test_refresh_leaves_deleted_team_assignee_without_name(self):
+        self._set_assignments([self._assignment(assignee_id=str(self.team_id), user_type="team")])
+        self.teams.find.return_value = []
+
+        TaskAssignmentRepository.refresh_assignee_snapshots([self.task_id])
+
+        self.assertIsNone(self._written_snapshot()["name"])
+        self.assertEqual(self.teams.find.call_args[0][0], {"_id": {"$in": [self.team_id]}, "is_deleted": False})
+
+    def test_refresh_clears_snapshot_of_unassigned_task(self):
+        self._set_assignments([])
+
+        TaskAssignmentRepository.refresh_assignee_snapshots([self.task_id])
+
+        self.assertIsNone(self._written_snapshot())
+
+    def test_refresh_keeps_latest_active_assignment(self):
+        latest = self._assignment()
+        self._set_assignments([self._assignment(), latest])
+        self.users.find.return_value = []
+
+        TaskAssignmentRepository.refresh_assignee_snapshots([self.task_id])
+
+        snapshot = self._written_snapshot()
+        self.assertEqual(snapshot["assignment_id"], str(latest["_id"]))
+        self.assertIsNone(snapshot["name"])
+
+    def test_refresh_returns_false_on_failure(self):
+        self.task_details.find.side_effect = Exception("connection lost")
+
+        with self.assertLogs("todo.repositories.task_assignment_repository", level="ERROR"):
+            self.assertFalse(TaskAssignmentRepository.refresh_assignee_snapshots([self.task_id]))
+
+    def test_set_assignee_name_updates_only_stale_snapshots(self):
+        self.tasks.update_many.return_value.modified_count = 2
+
+        self.assertEqual(TaskAssignmentRepository.set_assignee_name(str(self.user_id), "user", "Jane Doe"), 2)
+
+        query, update = self.tasks.update_many.call_args[0]
+        self.assertEqual(
+            query, {"assignee.id": str(self.user_id), "assignee.type": "user", "assignee.name": {"$ne": "Jane Doe"}}
+        )
+        self.assertEqual(update, {"$set": {"assignee.name": "Jane Doe"}})
+
+    @override_settings(ASSIGNEE_NAME_PROPAGATION_ENABLED=True)
+    def test_propagate_assignee_name_runs_in_background(self):
+        with patch("todo.repositories.task_assignment_repository._name_propagation_executor") as mock_executor:
+            TaskAssignmentRepository.propagate_assignee_name(self.user_id, "user", "Jane Doe")
+
+        mock_executor.submit.assert_called_once_with(
+            TaskAssignmentRepository.set_assignee_name, str(self.user_id), "user", "Jane Doe"
+        )
+
+    @override_settings(ASSIGNEE_NAME_PROPAGATION_ENABLED=False)
+    def test_propagate_assignee_name_is_skipped_when_disabled(self):
+        with patch("todo.repositories.task_assignment_repository._name_propagation_executor") as mock_executor:
+            TaskAssignmentRepository.propagate_assignee_name(self.user_id, "user", "Jane Doe")
+
+        mock_executor.submit.assert_not_called()
+
+
+class TaskAssignmentCreateManyTests(TestCase):
+    @patch("todo.repositories.task_assignment_repository.TaskAssignmentRepository.refresh_assignee_snapshots")
+    @patch("todo.repositories.task_assignment_repository.TaskVisibilityRepository.refresh_for_tasks")
+    @patch("todo.repositories.task_assignment_repository.EnhancedDualWriteService")
+    @patch("todo.repositories.task_assignment_repository.TaskAssignmentRepository.get_collection")
+    def test_create_many_inserts_and_syncs_in_one_batch(
+        self, mock_get_collection, mock_dual_write_service_class, mock_refresh_visibility, mock_refresh_snapshots
+    ):
+        task_ids = [ObjectId(), ObjectId()]
+        inserted_ids = [ObjectId(), ObjectId()]
+        mock_get_collection.return_value.insert_many.return_value.inserted_ids = inserted_ids
+        task_assignments = [
+            TaskAssignmentModel(task_id=task_id, assignee_id=ObjectId(), user_type="user", created_by=ObjectId())
+            for task_id in task_ids
+        ]
+
+        result = TaskAssignmentRepository.create_many(task_assignments)
+
+        self.assertEqual([task_assignment.id for task_assignment in result], inserted_ids)
+        mock_get_collection.return_value.insert_many.assert_called_once()
+        operations = mock_dual_write_service_class.return_value.batch_operations.call_args[0][0]
+        self.assertEqual([operation["mongo_id"] for operation in operations], [str(i) for i in inserted_ids])
+        mock_refresh_visibility.assert_called_once_with(task_ids)
+        mock_refresh_snapshots.assert_called_once_with(task_ids)
+
+    @patch("todo.repositories.task_assignment_repository.TaskAssignmentRepository.get_collection")
+    def test_create_many_without_assignments_does_nothing(self, mock_get_collection):
+        self.assertEqual(TaskAssignmentRepository.create_many([]), [])
+        mock_get_collection.assert_not_called()
@@ -8,6 +8,7 @@ import copy
 
 from todo.exceptions.task_exceptions import TaskNotFoundException
 from todo.models.task import TaskModel
+from todo.repositories.common.model_cache import ModelCache
 from todo.repositories.task_repository import TaskRepository
 from todo.constants.task import (
     TaskPriority,
@@ -16,6 +17,7 @@ from todo.constants.task import (
     SORT_FIELD_DUE_AT,
     SORT_FIELD_CREATED_AT,
     SORT_FIELD_ASSIGNEE,
+    SORT_FIELD_UPDATED_AT,
     SORT_ORDER_ASC,
     SORT_ORDER_DESC,
 )
@@ -100,9 +102,136 @@ class TaskRepositoryTests(TestCase):
 
         self.mock_collection.count_documents.assert_called_once()
         actual_filter = self.mock_collection.count_documents.call_args[0][0]
-        self.assertIn("$and", actual_filter)
-        self.assertIn("status", actual_filter["$and"][0])
-        self.assertIn("$or", actual_filter["$and"][1])
+        active_filter, expired_deferral_filter = actual_filter["$or"]
+        self.assertEqual(active_filter, {"effectiveStatus": {"$in": ["TODO", "IN_PROGRESS", "BLOCKED"]}})
+        self.assertEqual(expired_deferral_filter["effectiveStatus"], "DEFERRED")
+        self.assertEqual(expired_deferral_filter["status"], {"$in": ["TODO", "IN_PROGRESS", "BLOCKED"]})
+        self.assertLessEqual(
+            expired_deferral_filter["deferredDetails.deferredTill"]["$lte"], datetime.now(timezone.utc)
+        )
+
+    def test_count_deferred_tasks_matches_effective_status_of_unexpired_deferrals(self):
+        self.mock_collection.count_documents.return_value = 3
+
+        TaskRepository.count(status_filter=TaskStatus.DEFERRED.value)
+
+        actual_filter = self.mock_collection.count_documents.call_args[0][0]
+        self.assertEqual(set(actual_filter), {"effectiveStatus", "deferredDetails.deferredTill"})
+        self.assertEqual(actual_filter["effectiveStatus"], "DEFERRED")
+        self.assertLessEqual(actual_filter["deferredDetails.deferredTill"]["$gt"], datetime.now(timezone.utc))
+
+    def test_count_done_tasks_includes_tasks_whose_deferral_ended(self):
+        TaskRepository.count(status_filter=TaskStatus.DONE.value)
+
+        actual_filter = self.mock_collection.count_documents.call_args[0][0]
+        active_filter, expired_deferral_filter = actual_filter["$or"]
+        statuses = ["TODO", "IN_PROGRESS", "BLOCKED", "DONE"]
+        self.assertEqual(active_filter, {"effectiveStatus": {"$in": statuses}})
+        self.assertEqual(expired_deferral_filter["status"], {"$in": statuses})
+
+    def test_list_with_count_reads_page_and_total_with_one_aggregation(self):
+        self.mock_collection.aggregate.return_value = iter(
+            [{"tasks": self.task_data, "total": [{"count": len(self.task_data) + 5}]}]
+        )
+
+        tasks, total = TaskRepository.list_with_count(2, 10, sort_by="createdAt", order="desc")
+
+        self.assertEqual(len(tasks), len(self.task_data))
+        self.assertTrue(all(isinstance(task, TaskModel) for task in tasks))
+        self.assertEqual(total, len(self.task_data) + 5)
+        self.mock_collection.aggregate.assert_called_once()
+        self.mock_collection.count_documents.assert_not_called()
+        self.mock_collection.find.assert_not_called()
+
+        match_stage, facet_stage = self.mock_collection.aggregate.call_args[0][0]
+        self.assertIn("$match", match_stage)
+        self.assertEqual(
+            facet_stage["$facet"],
+            {
+                "tasks": [{"$sort": {"createdAt": -1}}, {"$skip": 10}, {"$limit": 10}],
+                "total": [{"$count": "count"}],
+            },
+        )
+
+    def test_list_with_count_returns_zero_total_for_no_tasks(self):
+        self.mock_collection.aggregate.return_value = iter([{"tasks": [], "total": []}])
+
+        tasks, total = TaskRepository.list_with_count(1, 10, sort_by="createdAt", order="desc")
+
+        self.assertEqual((tasks, total), ([], 0))
+
+    def test_list_with_count_without_total_skips_facet(self):
+        self.mock_collection.aggregate.return_value = iter(self.task_data)
+
+        tasks, total = TaskRepository.list_with_count(1, 10, sort_by="priority", order="desc", include_total=False)
+
+        self.assertEqual(len(tasks), len(self.task_data))
+        self.assertIsNone(total)
+        pipeline = self.mock_collection.aggregate.call_args[0][0]
+        self.assertEqual(pipeline[1:], [{"$sort": {"priority": 1}}, {"$skip": 0}, {"$limit": 10}])
+
+    def test_backfill_last_activity_updates_tasks_in_batches(self):
+        first_batch, second_batch = [{"_id": ObjectId()}, {"_id": ObjectId()}], [{"_id": ObjectId()}]
+        self.mock_collection.find.return_value.limit.side_effect = [iter(first_batch), iter(second_batch), iter([])]
+        self.mock_collection.update_many.side_effect = [MagicMock(modified_count=2), MagicMock(modified_count=1)]
+
+        updated_count = TaskRepository.backfill_last_activity(batch_size=2)
+
+        self.assertEqual(updated_count, 3)
+        self.mock_collection.find.return_value.limit.assert_called_with(2)
+        update_filter, update_pipeline = self.mock_collection.update_many.call_args_list[0][0]
+        self.assertEqual(update_filter["_id"], {"$in": [task["_id"] for task in first_batch]})
+        self.assertEqual(update_filter["lastActivity"], {"$exists": False})
+        self.assertEqual(
+            update_pipeline,
+            [{"$set": {"lastActivity": {"$ifNull": [{"$toDate": "$updatedAt"}, {"$toDate": "$createdAt"}]}}}],
+        )
+
+    def test_backfill_effective_status_updates_tasks_in_batches(self):
+        batch = [{"_id": ObjectId()}]
+        self.mock_collection.find.return_value.limit.side_effect = [iter(batch), iter([])]
+        self.mock_collection.update_many.return_value = MagicMock(modified_count=1)
+
+        updated_count = TaskRepository.backfill_effective_status(batch_size=10)
+
+        self.assertEqual(updated_count, 1)
+        update_filter, update_pipeline = self.mock_collection.update_many.call_args[0]
+        self.assertEqual(update_filter, {"_id": {"$in": [batch[0]["_id"]]}, "effectiveStatus": {"$exists": False}})
+        self.assertEqual(
+            update_pipeline,
+            [
+                {
+                    "$set": {
+                        "effectiveStatus": {
+                            "$cond": [{"$gt": ["$deferredDetails.deferredTill", "$$NOW"]}, "DEFERRED", "$status"]
+                        }
+                    }
+                }
+            ],
+        )
+
+    def test_expire_deferrals_moves_ended_deferrals_back_to_status(self):
+        now = datetime.now(timezone.utc)
+        self.mock_collection.update_many.return_value = MagicMock(modified_count=2)
+
+        self.assertEqual(TaskRepository.expire_deferrals(now), 2)
+
+        self.mock_collection.update_many.assert_called_once_with(
+            {"effectiveStatus": "DEFERRED", "deferredDetails.deferredTill": {"$lte": now}},
+            [{"$set": {"effectiveStatus": "$status"}}],
+        )
+
+    def test_get_next_deferral_expiry_reads_earliest_deferred_till(self):
+        deferred_till = datetime.now(timezone.utc) + timedelta(hours=1)
+        self.mock_collection.find_one.return_value = {
+            "_id": ObjectId(),
+            "deferredDetails": {"deferredTill": deferred_till},
+        }
+
+        self.assertEqual(TaskRepository.get_next_deferral_expiry(), deferred_till)
+
+        _, kwargs = self.mock_collection.find_one.call_args
+        self.assertEqual(kwargs["sort"], [("deferredDetails.deferredTill", 1)])
 
     def test_get_all_returns_all_tasks(self):
         self.mock_collection.find.return_value = self.task_data
@@ -163,6 +292,47 @@ class TaskRepositoryCreateTests(TestCase):
             createdBy="system",
         )
 
+    def _create_with_dual_write(self, use_outbox: bool):
+        mock_collection = MagicMock()
+        mock_collection.insert_one.return_value.inserted_id = ObjectId()
+        mock_client = MagicMock()
+        mock_session = mock_client.start_session.return_value.__enter__.return_value
+        with (
+            patch("todo.repositories.task_repository.TaskRepository.get_collection", return_value=mock_collection),
+            patch("todo.repositories.task_repository.TaskRepository.get_database"),
+            patch("todo.repositories.task_repository.TaskRepository.get_client", return_value=mock_client),
+            patch("todo.repositories.task_repository._display_id_allocator") as mock_allocator,
+            patch("todo.repositories.task_repository.EnhancedDualWriteService") as mock_dual_write_service_class,
+        ):
+            mock_allocator.next_id.return_value = 7
+            mock_dual_write_service = mock_dual_write_service_class.return_value
+            mock_dual_write_service.enabled = True
+            mock_dual_write_service.use_outbox = use_outbox
+
+            result = TaskRepository.create(self.task)
+
+        return result, mock_collection, mock_client, mock_session, mock_dual_write_service
+
+    def test_create_task_takes_display_id_from_allocated_block_without_transaction(self):
+        result, mock_collection, mock_client, _, mock_dual_write_service = self._create_with_dual_write(
+            use_outbox=False
+        )
+
+        self.assertEqual(result.displayId, "#7")
+        self.assertEqual(result.effectiveStatus, TaskStatus.TODO)
+        mock_client.start_session.assert_not_called()
+        self.assertIsNone(mock_collection.insert_one.call_args.kwargs["session"])
+        self.assertIsNone(mock_dual_write_service.create_document.call_args.kwargs["session"])
+
+    def test_create_task_commits_outbox_event_with_task(self):
+        _, mock_collection, mock_client, mock_session, mock_dual_write_service = self._create_with_dual_write(
+            use_outbox=True
+        )
+
+        mock_session.start_transaction.assert_called_once()
+        self.assertIs(mock_collection.insert_one.call_args.kwargs["session"], mock_session)
+        self.assertIs(mock_dual_write_service.create_document.call_args.kwargs["session"], mock_session)
+
     @patch("todo.repositories.task_repository.TaskRepository.create")
     def test_create_task_successfully_inserts_and_returns_task(self, mock_create):
         task = TaskModel(
@@ -284,10 +454,37 @@ class TaskRepositoryUpdateTests(TestCase):
         set_payload = update_doc_arg["$set"]
         self.assertIn("updatedAt", set_payload)
         self.assertIsInstance(set_payload["updatedAt"], datetime)
+        self.assertEqual(set_payload["lastActivity"], set_payload["updatedAt"])
 
         for key, value in self.valid_update_data.items():
             self.assertEqual(set_payload[key], value)
 
+    def test_update_task_stores_effective_status_when_it_changes(self):
+        self.mock_collection.find_one_and_update.return_value = {
+            **self.updated_doc_from_db,
+            "status": TaskStatus.IN_PROGRESS.value,
+            "effectiveStatus": TaskStatus.DEFERRED.value,
+            "deferredDetails": None,
+        }
+
+        result_task = TaskRepository.update(self.task_id_str, {"status": TaskStatus.IN_PROGRESS.value})
+
+        self.assertEqual(result_task.effectiveStatus, TaskStatus.IN_PROGRESS)
+        [operation] = self.mock_collection.bulk_write.call_args[0][0]
+        self.assertEqual(operation._filter, {"_id": self.task_id_obj})
+        self.assertEqual(operation._doc, {"$set": {"effectiveStatus": "IN_PROGRESS"}})
+
+    def test_update_task_keeps_unchanged_effective_status(self):
+        self.mock_collection.find_one_and_update.return_value = {
+            **self.updated_doc_from_db,
+            "status": TaskStatus.TODO.value,
+            "effectiveStatus": TaskStatus.TODO.value,
+        }
+
+        TaskRepository.update(self.task_id_str, {"title": "New title"})
+
+        self.mock_collection.bulk_write.assert_not_called()
+
     def test_update_task_returns_none_if_task_not_found(self):
         self.mock_collection.find_one_and_update.return_value = None
 
@@ -325,8 +522,7 @@ class TaskRepositoryUpdateTests(TestCase):
         args, kwargs = self.mock_collection.find_one_and_update.call_args
         self.assertEqual(args[0], {"_id": self.task_id_obj})
         update_doc_arg = args[1]["$set"]
-        self.assertIn("updatedAt", update_doc_arg)
-        self.assertEqual(len(update_doc_arg), 1)
+        self.assertEqual(set(update_doc_arg), {"updatedAt", "lastActivity"})
 
     def test_update_task_does_not_pass_id_or_underscore_id_in_update_payload(self):
         self.mock_collection.find_one_and_update.return_value = self.updated_doc_from_db
@@ -348,16 +544,14 @@ class TaskRepositoryUpdateTests(TestCase):
     def test_update_task_permission_denied_if_not_creator_or_assignee(self):
         with (
             patch("todo.repositories.task_repository.TaskRepository.get_by_id") as mock_get_by_id,
-            patch(
-                "todo.repositories.task_repository.TaskRepository._get_assigned_task_ids_for_user"
-            ) as mock_get_assigned,
+            patch("todo.repositories.task_repository.TaskRepository.is_task_visible_to_user") as mock_is_visible,
         ):
             mock_task = self.updated_doc_from_db.copy()
             mock_task["createdBy"] = "some_other_user"
             mock_get_by_id.return_value = TaskModel(
                 _id=ObjectId(), **{k: v for k, v in mock_task.items() if k != "_id"}
             )
-            mock_get_assigned.return_value = []
+            mock_is_visible.return_value = False
             with self.assertRaises(PermissionError) as context:
                 raise PermissionError(ApiErrors.UNAUTHORIZED_TITLE)
             self.assertEqual(str(context.exception), ApiErrors.UNAUTHORIZED_TITLE)
@@ -416,21 +610,31 @@ class TaskRepositorySortingTests(TestCase):
         self.mock_collection.find.assert_called_once()
         self.mock_collection.find.return_value.sort.assert_called_once_with([(SORT_FIELD_DUE_AT, 1)])
 
-    def test_list_sort_by_assignee_falls_back_to_created_at(self):
-        """Test that assignee sorting falls back to createdAt sorting since assignee is in separate collection"""
+    def test_list_sort_by_updated_at_uses_stored_last_activity(self):
+        TaskRepository.list(1, 10, SORT_FIELD_UPDATED_AT, SORT_ORDER_DESC)
+
+        self.mock_collection.aggregate.assert_not_called()
+        self.mock_collection.find.return_value.sort.assert_called_once_with([("lastActivity", -1)])
+
+    def test_list_sort_by_assignee_uses_assignee_snapshot_name(self):
         TaskRepository.list(1, 10, SORT_FIELD_ASSIGNEE, SORT_ORDER_DESC)
 
         self.mock_collection.find.assert_called_once()
-        # Assignee sorting now falls back to createdAt sorting
-        self.mock_collection.find.return_value.sort.assert_called_once_with([("createdAt", -1)])
+        self.mock_collection.find.return_value.sort.assert_called_once_with([("assignee.name", -1)])
 
-    def test_list_sort_by_assignee_asc_falls_back_to_created_at(self):
-        """Test that assignee sorting falls back to createdAt sorting for ascending order"""
+    def test_list_sort_by_assignee_asc_uses_assignee_snapshot_name(self):
         TaskRepository.list(1, 10, SORT_FIELD_ASSIGNEE, SORT_ORDER_ASC)
 
         self.mock_collection.find.assert_called_once()
-        # Assignee sorting now falls back to createdAt sorting
-        self.mock_collection.find.return_value.sort.assert_called_once_with([("createdAt", 1)])
+        self.mock_collection.find.return_value.sort.assert_called_once_with([("assignee.name", 1)])
+
+    def test_list_for_team_filters_on_assignee_snapshot(self):
+        team_id = str(ObjectId())
+
+        TaskRepository.list(1, 10, SORT_FIELD_CREATED_AT, SORT_ORDER_DESC, team_id=team_id)
+
+        query_filter = self.mock_collection.find.call_args[0][0]
+        self.assertEqual(query_filter["$and"][1], {"assignee.team_id": team_id})
 
     def test_list_pagination_with_sorting(self):
         page = 3
@@ -451,6 +655,244 @@ class TaskRepositorySortingTests(TestCase):
         self.mock_collection.find.return_value.sort.assert_called_once_with([(SORT_FIELD_CREATED_AT, -1)])
 
 
+class TaskRepositoryCursorTests(TestCase):
+    def setUp(self):
+        self.patcher_get_collection = patch("todo.repositories.task_repository.TaskRepository.get_collection")
+        self.mock_get_collection = self.patcher_get_collection.start()
+        self.mock_collection = MagicMock()
+        self.mock_get_collection.return_value = self.mock_collection
+
+    def tearDown(self):
+        self.patcher_get_collection.stop()
+
+    def _task_docs(self, count):
+        docs = []
+        for index in range(count):
+            doc = {k: v for k, v in tasks_db_data[0].items() if k != "id"}
+            doc["_id"] = ObjectId()
+            doc["createdAt"] = datetime(2024, 1, index + 1, tzinfo=timezone.utc)
+            docs.append(doc)
+        return docs
+
+    def _cursor(self, docs):
+        self.mock_collection.find.return_value.sort.return_value.limit.return_value = iter(docs)
+
+    def _query(self):
+        return self.mock_collection.find.call_args[0][0]
+
+    def test_list_after_fetches_one_extra_document_and_never_skips(self):
+        self._cursor(self._task_docs(3))
+
+        tasks, next_after = TaskRepository.list_after(2, SORT_FIELD_CREATED_AT, SORT_ORDER_DESC)
+
+        self.mock_collection.find.return_value.sort.assert_called_once_with([("createdAt", -1), ("_id", -1)])
+        self.mock_collection.find.return_value.sort.return_value.limit.assert_called_once_with(3)
+        self.mock_collection.find.return_value.sort.return_value.skip.assert_not_called()
+        self.mock_collection.aggregate.assert_not_called()
+        self.assertEqual(len(tasks), 2)
+        self.assertEqual(next_after[1], tasks[1].id)
+        self.assertEqual(next_after[0], datetime(2024, 1, 2, tzinfo=timezone.utc))
+
+    def test_list_after_returns_no_position_on_last_page(self):
+        self._cursor(self._task_docs(2))
+
+        tasks, next_after = TaskRepository.list_after(2, SORT_FIELD_CREATED_AT, SORT_ORDER_DESC)
+
+        self.assertEqual(len(tasks), 2)
+        self.assertIsNone(next_after)
+
+    def test_list_after_position_reads_nested_sort_field(self):
+        docs = self._task_docs(2)
+        docs[0]["assignee"] = None
+        self._cursor(docs)
+
+        _, next_after = TaskRepository.list_after(1, SORT_FIELD_ASSIGNEE, SORT_ORDER_ASC)
+
+        self.assertEqual(next_after, (None, docs[0]["_id"]))
+
+    def test_list_after_seeks_past_position_descending(self):
+        self._cursor([])
+        last_id = ObjectId()
+        value = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+        TaskRepository.list_after(10, SORT_FIELD_DUE_AT, SORT_ORDER_DESC, after=(value, last_id))
+
+        seek = self._query()["$and"][1]
+        self.assertEqual(
+            seek,
+            {
+                "$or": [
+                    {"dueAt": {"$lt": value}},
+                    {"dueAt": value, "_id": {"$lt": last_id}},
+                    {
+                        "dueAt": {
+                            "$type": [
+                                "int",
+                                "long",
+                                "double",
+                                "decimal",
+                                "string",
+                                "object",
+                                "array",
+                                "objectId",
+                                "bool",
+                            ]
+                        }
+                    },
+                    {"dueAt": None},
+                ]
+            },
+        )
+
+    def test_list_after_seeks_past_string_position_ascending_into_dates(self):
+        self._cursor([])
+        last_id = ObjectId()
+
+        TaskRepository.list_after(10, SORT_FIELD_CREATED_AT, SORT_ORDER_ASC, after=("2024-01-01T00:00:00Z", last_id))
+
+        seek = self._query()["$and"][1]
+        self.assertEqual(
+            seek["$or"][:2],
+            [
+                {"createdAt": {"$gt": "2024-01-01T00:00:00Z"}},
+                {"createdAt": "2024-01-01T00:00:00Z", "_id": {"$gt": last_id}},
+            ],
+        )
+        self.assertEqual(seek["$or"][2], {"createdAt": {"$type": ["object", "array", "objectId", "bool", "date"]}})
+
+    def test_list_after_seeks_past_null_position_ascending(self):
+        self._cursor([])
+        last_id = ObjectId()
+
+        TaskRepository.list_after(10, SORT_FIELD_DUE_AT, SORT_ORDER_ASC, after=(None, last_id))
+
+        seek = self._query()["$and"][1]
+        self.assertEqual(seek["$or"][0], {"dueAt": None, "_id": {"$gt": last_id}})
+        self.assertEqual(len(seek["$or"]), 2)
+        self.assertIn("date", seek["$or"][1]["dueAt"]["$type"])
+
+    def test_list_after_uses_same_sort_fields_as_list(self):
+        cases = [
+            (SORT_FIELD_PRIORITY, SORT_ORDER_DESC, "priority", 1),
+            (SORT_FIELD_PRIORITY, SORT_ORDER_ASC, "priority", -1),
+            (SORT_FIELD_CREATED_AT, SORT_ORDER_ASC, "createdAt", 1),
+            (SORT_FIELD_DUE_AT, SORT_ORDER_ASC, "dueAt", 1),
+            (SORT_FIELD_ASSIGNEE, SORT_ORDER_DESC, "assignee.name", -1),
+            (SORT_FIELD_UPDATED_AT, SORT_ORDER_DESC, "lastActivity", -1),
+        ]
+        for sort_by, order, expected_field, expected_direction in cases:
+            with self.subTest(sort_by=sort_by, order=order):
+                self._cursor([])
+
+                TaskRepository.list_after(10, sort_by, order)
+
+                self.mock_collection.find.return_value.sort.assert_called_with(
+                    [(expected_field, expected_direction), ("_id", expected_direction)]
+                )
+
+    def test_sort_fields_have_compound_indexes_with_id(self):
+        index_keys = [list(index.document["key"].items()) for index in TaskRepository.indexes]
+        for sort_field in ("lastActivity", "createdAt", "dueAt", "priority", "assignee.name"):
+            with self.subTest(sort_field=sort_field):
+                self.assertTrue(
+                    any(len(keys) == 2 and keys[0][0] == sort_field and keys[1][0] == "_id" for keys in index_keys)
+                )
+
+
+class TaskRepositoryUserTasksTests(TestCase):
+    def setUp(self):
+        self.patcher_get_collection = patch("todo.repositories.task_repository.TaskRepository.get_collection")
+        self.mock_collection = self.patcher_get_collection.start().return_value
+        self.patcher_get_visibility_collection = patch(
+            "todo.repositories.task_repository.TaskVisibilityRepository.get_collection"
+        )
+        self.mock_visibility_collection = self.patcher_get_visibility_collection.start().return_value
+        self.user_id = str(ObjectId())
+
+    def tearDown(self):
+        self.patcher_get_visibility_collection.stop()
+        self.patcher_get_collection.stop()
+
+    def _pipeline(self):
+        self.mock_visibility_collection.aggregate.assert_called_once()
+        return self.mock_visibility_collection.aggregate.call_args[0][0]
+
+    def _assert_joins_visible_tasks(self, pipeline):
+        self.assertEqual(pipeline[0], {"$match": {"user_id": self.user_id}})
+        lookup = pipeline[1]["$lookup"]
+        self.assertEqual((lookup["from"], lookup["localField"], lookup["foreignField"]), ("tasks", "task_id", "_id"))
+        self.assertIn("$or", lookup["pipeline"][0]["$match"])
+        self.assertEqual(pipeline[2:4], [{"$unwind": "$task"}, {"$replaceRoot": {"newRoot": "$task"}}])
+
+    def test_list_with_count_joins_visible_tasks_in_one_aggregation(self):
+        self.mock_visibility_collection.aggregate.return_value = iter(
+            [{"tasks": [tasks_db_data[0]], "total": [{"count": 7}]}]
+        )
+
+        tasks, total = TaskRepository.list_with_count(
+            1, 10, SORT_FIELD_CREATED_AT, SORT_ORDER_DESC, user_id=self.user_id
+        )
+
+        self.assertEqual((len(tasks), total), (1, 7))
+        pipeline = self._pipeline()
+        self._assert_joins_visible_tasks(pipeline)
+        self.assertEqual(
+            pipeline[4:],
+            [
+                {
+                    "$facet": {
+                        "tasks": [{"$sort": {"createdAt": -1}}, {"$skip": 0}, {"$limit": 10}],
+                        "total": [{"$count": "count"}],
+                    }
+                }
+            ],
+        )
+        self.mock_collection.aggregate.assert_not_called()
+        self.mock_collection.find.assert_not_called()
+
+    def test_list_after_seeks_and_sorts_joined_tasks(self):
+        self.mock_visibility_collection.aggregate.return_value = iter([])
+        last_id = ObjectId()
+        value = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+        TaskRepository.list_after(10, SORT_FIELD_DUE_AT, SORT_ORDER_ASC, user_id=self.user_id, after=(value, last_id))
+
+        pipeline = self._pipeline()
+        self._assert_joins_visible_tasks(pipeline)
+        self.assertEqual(pipeline[4]["$match"]["$or"][0], {"dueAt": {"$gt": value}})
+        self.assertEqual(pipeline[5:], [{"$sort": {"dueAt": 1, "_id": 1}}, {"$limit": 11}])
+        self.mock_collection.find.assert_not_called()
+
+    def test_count_for_user_counts_visible_and_created_tasks_once(self):
+        self.mock_visibility_collection.aggregate.return_value = iter([{"count": 4}])
+
+        self.assertEqual(TaskRepository.count(user_id=self.user_id), 4)
+
+        pipeline = self._pipeline()
+        self._assert_joins_visible_tasks(pipeline)
+        union = pipeline[5]["$unionWith"]
+        self.assertEqual(union["coll"], "tasks")
+        self.assertEqual(union["pipeline"][0]["$match"]["$and"][1], {"createdBy": self.user_id})
+        self.assertEqual(pipeline[6:], [{"$group": {"_id": "$_id"}}, {"$count": "count"}])
+        self.mock_collection.count_documents.assert_not_called()
+
+    def test_count_for_user_without_tasks_is_zero(self):
+        self.mock_visibility_collection.aggregate.return_value = iter([])
+
+        self.assertEqual(TaskRepository.count(user_id=self.user_id), 0)
+
+    def test_get_tasks_for_user_pages_joined_tasks(self):
+        self.mock_visibility_collection.aggregate.return_value = iter([tasks_db_data[0]])
+
+        tasks = TaskRepository.get_tasks_for_user(self.user_id, page=2, limit=5)
+
+        self.assertEqual(len(tasks), 1)
+        pipeline = self._pipeline()
+        self._assert_joins_visible_tasks(pipeline)
+        self.assertEqual(pipeline[4:], [{"$skip": 5}, {"$limit": 5}])
+        self.mock_collection.find.assert_not_called()
+
+
 class TestRepositoryDeleteTaskById(TestCase):
     def setUp(self):
         self.task_id = tasks_db_data[0]["id"]
@@ -511,7 +953,41 @@ class TestRepositoryDeleteTaskById(TestCase):
             "isDeleted": False,
             "createdBy": "some_other_user",
         }
-        with patch("todo.repositories.task_repository.TaskRepository._get_assigned_task_ids_for_user", return_value=[]):
+        with patch("todo.repositories.task_repository.TaskRepository.is_task_visible_to_user", return_value=False):
             with self.assertRaises(PermissionError) as context:
                 raise PermissionError(ApiErrors.UNAUTHORIZED_TITLE)
             self.assertEqual(str(context.exception), ApiErrors.UNAUTHORIZED_TITLE)
+
+
+class TaskRepositoryTitlesCacheTests(TestCase):
+    def setUp(self):
+        self.patcher_get_collection = patch("todo.repositories.task_repository.TaskRepository.get_collection")
+        self.mock_collection = self.patcher_get_collection.start().return_value
+        self.patcher_cache = patch.object(
+            TaskRepository, "titles_cache", ModelCache("task_titles", enabled=True, copy=str)
+        )
+        self.patcher_cache.start()
+        self.task_id = ObjectId()
+        self.mock_collection.find.return_value = [{"_id": self.task_id, "title": "Title"}]
+
+    def tearDown(self):
+        self.patcher_cache.stop()
+        self.patcher_get_collection.stop()
+
+    def test_get_titles_by_ids_reads_only_titles_once(self):
+        TaskRepository.get_titles_by_ids([str(self.task_id), "not-an-id"])
+        titles = TaskRepository.get_titles_by_ids([str(self.task_id)])
+
+        self.assertEqual(titles, {str(self.task_id): "Title"})
+        self.mock_collection.find.assert_called_once_with({"_id": {"$in": [self.task_id]}}, {"title": 1})
+
+    @patch("todo.repositories.task_repository.EnhancedDualWriteService")
+    @patch("todo.repositories.task_repository.TaskRepository._store_effective_statuses")
+    def test_update_many_invalidates_titles(self, *mocks):
+        TaskRepository.get_titles_by_ids([str(self.task_id)])
+        self.mock_collection.find.return_value = []
+
+        TaskRepository.update_many({str(self.task_id): {"title": "Renamed"}})
+        self.mock_collection.find.return_value = [{"_id": self.task_id, "title": "Renamed"}]
+
+        self.assertEqual(TaskRepository.get_titles_by_ids([str(self.task_id)]), {str(self.task_id): "Renamed"})
@@ -0,0 +1,144 @@
+from unittest import TestCase
+from unittest.mock import MagicMock, patch
+from bson import ObjectId
+from pymongo import DeleteMany, UpdateOne
+
+from todo.repositories.task_visibility_repository import TaskVisibilityRepository
+
+
+class TaskVisibilityRepositoryTests(TestCase):
+    def setUp(self):
+        self.task_id = ObjectId()
+        self.user_id = str(ObjectId())
+        self.poc_id = ObjectId()
+        self.team_id = ObjectId()
+
+        self.task_details = MagicMock()
+        self.teams = MagicMock()
+        self.user_team_details = MagicMock()
+        self.visibility_collection = MagicMock()
+        collections = {
+            "task_details": self.task_details,
+            "teams": self.teams,
+            "user_team_details": self.user_team_details,
+        }
+        database = MagicMock()
+        database.__getitem__.side_effect = collections.__getitem__
+
+        self.patcher_database = patch(
+            "todo.repositories.task_visibility_repository.TaskVisibilityRepository.get_database",
+            return_value=database,
+        )
+        self.patcher_collection = patch(
+            "todo.repositories.task_visibility_repository.TaskVisibilityRepository.get_collection",
+            return_value=self.visibility_collection,
+        )
+        self.patcher_database.start()
+        self.patcher_collection.start()
+
+    def tearDown(self):
+        self.patcher_database.stop()
+        self.patcher_collection.stop()
+
+    def _written_operations(self):
+        return self.visibility_collection.bulk_write.call_args[0][0]
+
+    def test_refresh_for_task_adds_direct_assignee(self):
+        self.task_details.find.return_value = [
+            {"task_id": str(self.task_id), "assignee_id": self.user_id, "user_type": "user"}
+        ]
+
+        self.assertTrue(TaskVisibilityRepository.refresh_for_task(str(self.task_id)))
+
+        operations = self._written_operations()
+        self.assertIn(DeleteMany({"task_id": self.task_id, "user_id": {"$nin": [self.user_id]}}), operations)
+        upserts = [operation for operation in operations if isinstance(operation, UpdateOne)]
+        self.assertEqual(len(upserts), 1)
+        self.assertEqual(upserts[0]._filter, {"user_id": self.user_id, "task_id": self.task_id})
+        self.assertEqual(upserts[0]._doc["$set"]["via"], "assignee")
+        self.teams.find.assert_not_called()
+
+    def test_refresh_for_task_adds_team_poc_when_active_member(self):
+        self.task_details.find.return_value = [
+            {"task_id": self.task_id, "assignee_id": str(self.team_id), "user_type": "team"}
+        ]
+        self.teams.find.return_value = [{"_id": self.team_id, "poc_id": self.poc_id}]
+        self.user_team_details.find.return_value = [{"team_id": str(self.team_id), "user_id": str(self.poc_id)}]
+
+        TaskVisibilityRepository.refresh_for_task(str(self.task_id))
+
+        upserts = [operation for operation in self._written_operations() if isinstance(operation, UpdateOne)]
+        self.assertEqual(len(upserts), 1)
+        self.assertEqual(upserts[0]._filter, {"user_id": str(self.poc_id), "task_id": self.task_id})
+        self.assertEqual(upserts[0]._doc["$set"]["via"], "team_poc")
+
+    def test_refresh_for_task_skips_poc_who_left_the_team(self):
+        self.task_details.find.return_value = [
+            {"task_id": self.task_id, "assignee_id": str(self.team_id), "user_type": "team"}
+        ]
+        self.teams.find.return_value = [{"_id": self.team_id, "poc_id": self.poc_id}]
+        self.user_team_details.find.return_value = []
+
+        TaskVisibilityRepository.refresh_for_task(str(self.task_id))
+
+        self.assertEqual(self._written_operations(), [DeleteMany({"task_id": self.task_id, "user_id": {"$nin": []}})])
+
+    def test_refresh_for_task_removes_all_entries_when_unassigned(self):
+        self.task_details.find.return_value = []
+
+        TaskVisibilityRepository.refresh_for_task(str(self.task_id))
+
+        self.assertEqual(self._written_operations(), [DeleteMany({"task_id": self.task_id, "user_id": {"$nin": []}})])
+
+    def test_refresh_for_task_returns_false_on_failure(self):
+        self.task_details.find.side_effect = Exception("connection lost")
+
+        with self.assertLogs("todo.repositories.task_visibility_repository", level="ERROR"):
+            self.assertFalse(TaskVisibilityRepository.refresh_for_task(str(self.task_id)))
+
+    def test_refresh_for_team_refreshes_tasks_assigned_to_team(self):
+        self.task_details.distinct.return_value = [str(self.task_id)]
+
+        with patch.object(TaskVisibilityRepository, "refresh_for_tasks", return_value=True) as mock_refresh:
+            TaskVisibilityRepository.refresh_for_team(str(self.team_id))
+
+        query = self.task_details.distinct.call_args[0][1]
+        self.assertEqual(query["assignee_id"], {"$in": [str(self.team_id), self.team_id]})
+        self.assertEqual(query["user_type"], "team")
+        mock_refresh.assert_called_once_with([str(self.task_id)])
+
+    def test_is_visible_uses_single_lookup(self):
+        self.visibility_collection.find_one.return_value = {"_id": ObjectId()}
+
+        self.assertTrue(TaskVisibilityRepository.is_visible(self.user_id, str(self.task_id)))
+        self.visibility_collection.find_one.assert_called_once_with(
+            {"user_id": self.user_id, "task_id": self.task_id}, {"_id": 1}
+        )
+
+    def test_get_task_ids_for_user_projects_task_ids(self):
+        self.visibility_collection.find.return_value = [{"task_id": self.task_id}]
+
+        self.assertEqual(TaskVisibilityRepository.get_task_ids_for_user(self.user_id), [self.task_id])
+        self.visibility_collection.find.assert_called_once_with({"user_id": self.user_id}, {"task_id": 1, "_id": 0})
+
+    def test_get_task_ids_for_user_reads_only_given_tasks(self):
+        self.visibility_collection.find.return_value = [{"task_id": self.task_id}]
+
+        TaskVisibilityRepository.get_task_ids_for_user(self.user_id, [str(self.task_id), "not-an-id"])
+
+        self.visibility_collection.find.assert_called_once_with(
+            {"user_id": self.user_id, "task_id": {"$in": [self.task_id]}}, {"task_id": 1, "_id": 0}
+        )
+
+    def test_rebuild_processes_assigned_and_previously_visible_tasks_in_batches(self):
+        stale_task_id = ObjectId()
+        self.task_details.distinct.return_value = [str(self.task_id)]
+        self.visibility_collection.distinct.return_value = [stale_task_id]
+
+        with patch.object(TaskVisibilityRepository, "refresh_for_tasks", return_value=True) as mock_refresh:
+            processed = TaskVisibilityRepository.rebuild(batch_size=1)
+
+        self.assertEqual(processed, 2)
+        self.assertEqual(mock_refresh.call_count, 2)
+        refreshed = {call.args[0][0] for call in mock_refresh.call_args_list}
+        self.assertEqual(refreshed, {self.task_id, stale_task_id})
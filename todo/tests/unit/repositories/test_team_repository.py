@@ -0,0 +1,165 @@
+from datetime import datetime, timezone
+from unittest import TestCase
+from unittest.mock import MagicMock, patch
+from bson import ObjectId
+
+from todo.models.team import UserTeamDetailsModel
+from todo.repositories.common.model_cache import ModelCache
+from todo.repositories.team_repository import UserTeamDetailsRepository
+
+
+class UserTeamIdsCacheTests(TestCase):
+    def setUp(self) -> None:
+        self.mock_collection = MagicMock()
+        self.patcher_collection = patch.object(
+            UserTeamDetailsRepository, "get_collection", return_value=self.mock_collection
+        )
+        self.patcher_collection.start()
+        self.patcher_cache = patch.object(
+            UserTeamDetailsRepository, "team_ids_cache", ModelCache("user_team_ids", enabled=True, copy=list)
+        )
+        self.patcher_cache.start()
+        self.user_id = str(ObjectId())
+        self.team_ids = [str(ObjectId()), str(ObjectId())]
+        self.mock_collection.find.return_value = [{"team_id": team_id} for team_id in self.team_ids]
+
+    def tearDown(self) -> None:
+        self.patcher_cache.stop()
+        self.patcher_collection.stop()
+
+    def test_get_team_ids_reads_memberships_once(self):
+        first = UserTeamDetailsRepository.get_team_ids_by_user_id(self.user_id)
+        first.append("changed")
+        second = UserTeamDetailsRepository.get_team_ids_by_user_id(self.user_id)
+
+        self.assertEqual(second, self.team_ids)
+        self.mock_collection.find.assert_called_once_with({"user_id": self.user_id, "is_active": True}, {"team_id": 1})
+
+    @patch("todo.repositories.team_repository.MembershipVersionRepository.bump")
+    @patch("todo.repositories.team_repository.TaskVisibilityRepository.refresh_for_team")
+    @patch("todo.repositories.team_repository.EnhancedDualWriteService")
+    def test_membership_write_invalidates_team_ids_of_user(self, mock_dual_write_service, *mocks):
+        UserTeamDetailsRepository.get_team_ids_by_user_id(self.user_id)
+        self.mock_collection.insert_one.return_value.inserted_id = ObjectId()
+
+        UserTeamDetailsRepository.create(
+            UserTeamDetailsModel(
+                user_id=self.user_id,
+                team_id=self.team_ids[0],
+                role_id="1",
+                is_active=True,
+                created_by=self.user_id,
+                updated_by=self.user_id,
+            )
+        )
+        UserTeamDetailsRepository.get_team_ids_by_user_id(self.user_id)
+
+        self.assertEqual(self.mock_collection.find.call_count, 2)
+
+    def test_invalidation_keeps_team_ids_of_other_users(self):
+        other_user_id = str(ObjectId())
+        UserTeamDetailsRepository.get_team_ids_by_user_id(self.user_id)
+        UserTeamDetailsRepository.get_team_ids_by_user_id(other_user_id)
+
+        UserTeamDetailsRepository.invalidate_team_ids([ObjectId(self.user_id)])
+        UserTeamDetailsRepository.get_team_ids_by_user_id(self.user_id)
+        UserTeamDetailsRepository.get_team_ids_by_user_id(other_user_id)
+
+        self.assertEqual(self.mock_collection.find.call_count, 3)
+
+
+@patch("todo.repositories.team_repository.MembershipVersionRepository.bump")
+@patch("todo.repositories.team_repository.TaskVisibilityRepository.refresh_for_team")
+@patch("todo.repositories.team_repository.EnhancedDualWriteService")
+class UpdateTeamMembersTests(TestCase):
+    def setUp(self) -> None:
+        self.mock_collection = MagicMock()
+        self.patcher_collection = patch.object(
+            UserTeamDetailsRepository, "get_collection", return_value=self.mock_collection
+        )
+        self.patcher_collection.start()
+        self.team_id = str(ObjectId())
+        self.updated_by = str(ObjectId())
+        self.kept_id, self.removed_id, self.reactivated_id, self.new_id = (str(ObjectId()) for _ in range(4))
+
+        def relationship(user_id, is_active):
+            return {
+                "_id": ObjectId(),
+                "user_id": user_id,
+                "team_id": self.team_id,
+                "is_active": is_active,
+                "created_by": self.updated_by,
+                "updated_by": self.updated_by,
+                "created_at": datetime.now(timezone.utc),
+            }
+
+        self.removed_relationship = relationship(self.removed_id, True)
+        self.reactivated_relationship = relationship(self.reactivated_id, False)
+        self.mock_collection.find.side_effect = [
+            [{"user_id": self.kept_id}, {"user_id": self.removed_id}],
+            [self.removed_relationship, self.reactivated_relationship],
+        ]
+
+    def tearDown(self) -> None:
+        self.patcher_collection.stop()
+
+    def test_member_changes_are_written_in_one_bulk_write_and_one_sync(
+        self, mock_dual_write_service, mock_refresh, mock_bump
+    ):
+        result = UserTeamDetailsRepository.update_team_members(
+            self.team_id, [self.kept_id, self.reactivated_id, self.new_id, self.new_id], self.updated_by
+        )
+
+        self.assertTrue(result)
+        self.mock_collection.bulk_write.assert_called_once()
+        operations = self.mock_collection.bulk_write.call_args.args[0]
+        self.assertEqual(
+            [type(operation).__name__ for operation in operations], ["UpdateOne", "UpdateOne", "InsertOne"]
+        )
+        self.mock_collection.update_one.assert_not_called()
+        self.mock_collection.insert_one.assert_not_called()
+
+        sync_operations = mock_dual_write_service.return_value.batch_operations.call_args.args[0]
+        self.assertEqual(
+            [(operation["operation"], operation["data"]["is_active"]) for operation in sync_operations],
+            [("update", False), ("update", True), ("create", True)],
+        )
+        self.assertEqual(sync_operations[0]["mongo_id"], str(self.removed_relationship["_id"]))
+        mock_refresh.assert_called_once_with(self.team_id)
+        mock_bump.assert_called_once_with([self.removed_id, self.reactivated_id, self.new_id])
+
+    def test_removal_deactivates_active_membership_of_user_with_several(
+        self, mock_dual_write_service, mock_refresh, mock_bump
+    ):
+        earlier_relationship = {**self.removed_relationship, "_id": ObjectId(), "is_active": False}
+        self.mock_collection.find.side_effect = [
+            [{"user_id": self.kept_id}, {"user_id": self.removed_id}],
+            [earlier_relationship, self.removed_relationship],
+        ]
+
+        result = UserTeamDetailsRepository.update_team_members(self.team_id, [self.kept_id], self.updated_by)
+
+        self.assertTrue(result)
+        (operation,) = self.mock_collection.bulk_write.call_args.args[0]
+        self.assertEqual(operation._filter, {"_id": self.removed_relationship["_id"], "is_active": True})
+        self.assertEqual(operation._doc["$set"]["is_active"], False)
+
+    def test_failed_version_bump_fails_member_update(self, mock_dual_write_service, mock_refresh, mock_bump):
+        mock_bump.side_effect = Exception("Database error")
+
+        result = UserTeamDetailsRepository.update_team_members(
+            self.team_id, [self.kept_id, self.new_id], self.updated_by
+        )
+
+        self.assertFalse(result)
+        mock_dual_write_service.return_value.batch_operations.assert_called_once()
+
+    def test_unchanged_members_are_not_written(self, mock_dual_write_service, mock_refresh, mock_bump):
+        result = UserTeamDetailsRepository.update_team_members(
+            self.team_id, [self.removed_id, self.kept_id], self.updated_by
+        )
+
+        self.assertTrue(result)
+        self.mock_collection.bulk_write.assert_not_called()
+        mock_dual_write_service.return_value.batch_operations.assert_not_called()
+        mock_bump.assert_not_called()
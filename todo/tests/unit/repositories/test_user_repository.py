@@ -2,6 +2,7 @@ from unittest import TestCase
 from unittest.mock import patch, MagicMock
 from bson import ObjectId
 
+from todo.repositories.common.model_cache import ModelCache
 from todo.repositories.user_repository import UserRepository
 from todo.models.user import UserModel
 from todo.models.common.pyobjectid import PyObjectId
@@ -18,6 +19,15 @@ class UserRepositoryTests(TestCase):
         self.mock_collection = MagicMock()
         self.mock_db_manager = MagicMock()
         self.mock_db_manager.get_collection.return_value = self.mock_collection
+        # The Postgres sync and the copy of renames into assignee snapshots are not under test here
+        self.patcher_dual_write = patch("todo.repositories.user_repository.EnhancedDualWriteService")
+        self.patcher_dual_write.start()
+        self.addCleanup(self.patcher_dual_write.stop)
+        self.patcher_propagate = patch(
+            "todo.repositories.user_repository.TaskAssignmentRepository.propagate_assignee_name"
+        )
+        self.patcher_propagate.start()
+        self.addCleanup(self.patcher_propagate.stop)
 
     @patch("todo.repositories.user_repository.DatabaseManager")
     def test_get_by_id_success(self, mock_db_manager):
@@ -117,3 +127,86 @@ class UserTeamDetailsRepositoryTests(TestCase):
         self.assertEqual(result[0]["email"], "alice@example.com")
         self.assertEqual(result[1]["name"], "Bob")
         self.assertEqual(result[1]["email"], "bob@example.com")
+
+
+class UserRepositoryCacheTests(TestCase):
+    def setUp(self) -> None:
+        self.mock_collection = MagicMock()
+        self.patcher_collection = patch(
+            "todo.repositories.user_repository.UserRepository._get_collection", return_value=self.mock_collection
+        )
+        self.patcher_collection.start()
+        self.patcher_cache = patch.object(UserRepository, "cache", ModelCache("users", enabled=True))
+        self.patcher_cache.start()
+        self.patcher_names_cache = patch.object(
+            UserRepository, "names_cache", ModelCache("user_names", enabled=True, copy=str)
+        )
+        self.patcher_names_cache.start()
+        self.users = [{**user, "_id": ObjectId()} for user in users_db_data]
+        self.patcher_propagate = patch(
+            "todo.repositories.user_repository.TaskAssignmentRepository.propagate_assignee_name"
+        )
+        self.mock_propagate = self.patcher_propagate.start()
+        self.addCleanup(self.patcher_propagate.stop)
+
+    def tearDown(self) -> None:
+        self.patcher_names_cache.stop()
+        self.patcher_cache.stop()
+        self.patcher_collection.stop()
+
+    def test_get_by_id_reads_database_once(self):
+        self.mock_collection.find_one.return_value = self.users[0]
+        user_id = str(self.users[0]["_id"])
+
+        UserRepository.get_by_id(user_id)
+        result = UserRepository.get_by_id(user_id)
+
+        self.mock_collection.find_one.assert_called_once()
+        self.assertEqual(result.google_id, self.users[0]["google_id"])
+
+    def test_get_by_ids_only_queries_uncached_users(self):
+        self.mock_collection.find_one.return_value = self.users[0]
+        UserRepository.get_by_id(str(self.users[0]["_id"]))
+        self.mock_collection.find.return_value = [self.users[1]]
+
+        result = UserRepository.get_by_ids([str(self.users[0]["_id"]), str(self.users[1]["_id"])])
+
+        self.assertEqual([user.id for user in result], [self.users[0]["_id"], self.users[1]["_id"]])
+        self.assertEqual(self.mock_collection.find.call_args[0][0], {"_id": {"$in": [self.users[1]["_id"]]}})
+
+    @patch("todo.repositories.user_repository.EnhancedDualWriteService")
+    def test_create_or_update_writes_through(self, _):
+        user_id = str(self.users[0]["_id"])
+        self.mock_collection.find_one.return_value = None
+        self.assertIsNone(UserRepository.get_by_id(user_id))
+        self.mock_collection.find_one_and_update.return_value = {**self.users[0], "name": "Renamed"}
+
+        UserRepository.create_or_update({"google_id": "123", "email": "user@example.com", "name": "Renamed"})
+
+        self.assertEqual(UserRepository.get_by_id(user_id).name, "Renamed")
+        self.mock_collection.find_one.assert_called_once()
+
+    def test_get_names_by_ids_reads_only_names_once(self):
+        user_ids = [str(self.users[0]["_id"]), str(self.users[1]["_id"])]
+        self.mock_collection.find.return_value = [{"_id": self.users[0]["_id"], "name": "First"}]
+
+        UserRepository.get_names_by_ids(user_ids)
+        names = UserRepository.get_names_by_ids(user_ids)
+
+        self.assertEqual(names, {user_ids[0]: "First"})
+        self.mock_collection.find.assert_called_once_with(
+            {"_id": {"$in": [self.users[0]["_id"], self.users[1]["_id"]]}}, {"name": 1}
+        )
+
+    @patch("todo.repositories.user_repository.EnhancedDualWriteService")
+    def test_create_or_update_writes_name_through(self, _):
+        user_id = str(self.users[0]["_id"])
+        self.mock_collection.find.return_value = [{"_id": self.users[0]["_id"], "name": "Old"}]
+        UserRepository.get_names_by_ids([user_id])
+        self.mock_collection.find_one_and_update.return_value = {**self.users[0], "name": "Renamed"}
+
+        UserRepository.create_or_update({"google_id": "123", "email": "user@example.com", "name": "Renamed"})
+
+        self.assertEqual(UserRepository.get_names_by_ids([user_id]), {user_id: "Renamed"})
+        self.mock_collection.find.assert_called_once()
+        self.mock_propagate.assert_called_once_with(user_id, "user", "Renamed")
@@ -0,0 +1,108 @@
+from datetime import datetime, timezone
+from unittest import TestCase
+from unittest.mock import MagicMock, patch
+from bson import ObjectId
+
+from todo.constants.role import RoleName, RoleScope
+from todo.repositories.common.model_cache import ModelCache
+from todo.repositories.user_role_repository import UserRoleRepository, _copy_roles
+
+
+@patch("todo.repositories.user_role_repository.EnhancedDualWriteService")
+class UserRoleRepositoryCacheTests(TestCase):
+    def setUp(self) -> None:
+        self.mock_collection = MagicMock()
+        self.patcher_collection = patch.object(UserRoleRepository, "get_collection", return_value=self.mock_collection)
+        self.patcher_collection.start()
+        self.patcher_cache = patch.object(
+            UserRoleRepository, "roles_cache", ModelCache("user_roles", enabled=True, copy=_copy_roles)
+        )
+        self.patcher_cache.start()
+        self.patcher_bump = patch("todo.repositories.user_role_repository.MembershipVersionRepository.bump")
+        self.patcher_bump.start()
+        self.role_doc = {
+            "_id": ObjectId(),
+            "user_id": "user-1",
+            "role_name": RoleName.ADMIN.value,
+            "scope": RoleScope.TEAM.value,
+            "team_id": "team-1",
+            "is_active": True,
+            "created_at": datetime.now(timezone.utc),
+            "created_by": "system",
+        }
+
+    def tearDown(self) -> None:
+        self.patcher_bump.stop()
+        self.patcher_cache.stop()
+        self.patcher_collection.stop()
+
+    def test_roles_of_user_in_team_are_read_once(self, _):
+        self.mock_collection.find.return_value = [self.role_doc]
+
+        UserRoleRepository.get_user_roles("user-1", RoleScope.TEAM, "team-1")
+        roles = UserRoleRepository.get_user_roles("user-1", RoleScope.TEAM, "team-1")
+
+        self.mock_collection.find.assert_called_once()
+        self.assertEqual([role.role_name for role in roles], [RoleName.ADMIN.value])
+
+    def test_roles_of_user_in_every_team_are_not_cached(self, _):
+        self.mock_collection.find.return_value = [self.role_doc]
+
+        UserRoleRepository.get_user_roles("user-1", RoleScope.TEAM)
+        UserRoleRepository.get_user_roles("user-1", RoleScope.TEAM)
+
+        self.assertEqual(self.mock_collection.find.call_count, 2)
+
+    def test_assign_role_invalidates_cached_roles(self, _):
+        self.mock_collection.find.return_value = []
+        self.assertEqual(UserRoleRepository.get_user_roles("user-1", RoleScope.TEAM, "team-1"), [])
+
+        self.mock_collection.find_one.return_value = None
+        self.mock_collection.insert_one.return_value.inserted_id = self.role_doc["_id"]
+        UserRoleRepository.assign_role("user-1", RoleName.ADMIN, RoleScope.TEAM, "team-1")
+        self.mock_collection.find.return_value = [self.role_doc]
+
+        roles = UserRoleRepository.get_user_roles("user-1", RoleScope.TEAM, "team-1")
+
+        self.assertEqual(len(roles), 1)
+        self.assertEqual(self.mock_collection.find.call_count, 2)
+
+    def test_remove_role_invalidates_cached_roles(self, _):
+        self.mock_collection.find.return_value = [self.role_doc]
+        UserRoleRepository.get_user_roles("user-1", RoleScope.TEAM, "team-1")
+
+        self.mock_collection.find_one.return_value = self.role_doc
+        self.mock_collection.update_one.return_value.modified_count = 1
+        UserRoleRepository.remove_role_by_id("user-1", str(self.role_doc["_id"]), RoleScope.TEAM.value, "team-1")
+        self.mock_collection.find.return_value = []
+
+        self.assertEqual(UserRoleRepository.get_user_roles("user-1", RoleScope.TEAM, "team-1"), [])
+
+    @patch("todo.repositories.user_role_repository.MembershipVersionRepository.bump")
+    def test_assign_role_to_users_inserts_missing_roles_in_one_batch(self, mock_bump, mock_dual_write_service):
+        self.mock_collection.find.return_value = [self.role_doc]
+        inserted_ids = [ObjectId(), ObjectId()]
+        self.mock_collection.insert_many.return_value.inserted_ids = inserted_ids
+
+        roles = UserRoleRepository.assign_role_to_users(
+            ["user-1", "user-2", "user-3", "user-2"], RoleName.ADMIN, RoleScope.TEAM, "team-1"
+        )
+
+        self.mock_collection.insert_many.assert_called_once()
+        inserted_docs = self.mock_collection.insert_many.call_args.args[0]
+        self.assertEqual([doc["user_id"] for doc in inserted_docs], ["user-2", "user-3"])
+        self.assertEqual([role.user_id for role in roles], ["user-1", "user-2", "user-3"])
+        self.assertEqual(roles[0].id, self.role_doc["_id"])
+        self.assertEqual([role.id for role in roles[1:]], inserted_ids)
+        operations = mock_dual_write_service.return_value.batch_operations.call_args.args[0]
+        self.assertEqual([operation["mongo_id"] for operation in operations], [str(i) for i in inserted_ids])
+        self.assertEqual(list(mock_bump.call_args.args[0]), ["user-2", "user-3"])
+
+    def test_assign_role_to_users_with_existing_roles_does_not_write(self, mock_dual_write_service):
+        self.mock_collection.find.return_value = [self.role_doc]
+
+        roles = UserRoleRepository.assign_role_to_users(["user-1"], RoleName.ADMIN, RoleScope.TEAM, "team-1")
+
+        self.assertEqual([role.id for role in roles], [self.role_doc["_id"]])
+        self.mock_collection.insert_many.assert_not_called()
+        mock_dual_write_service.return_value.batch_operations.assert_not_called()
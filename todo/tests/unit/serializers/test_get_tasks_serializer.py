@@ -1,8 +1,10 @@
 from unittest import TestCase
+from bson import ObjectId
 from rest_framework.exceptions import ValidationError
 from django.conf import settings
 
 from todo.serializers.get_tasks_serializer import GetTaskQueryParamsSerializer
+from todo.utils.cursor_utils import TaskCursor, encode_cursor
 from todo.constants.task import (
     SORT_FIELD_PRIORITY,
     SORT_FIELD_DUE_AT,
@@ -201,3 +203,36 @@ class GetTaskQueryParamsSerializerSortingTests(TestCase):
                     )
                     self.assertEqual(serializer.validated_data["sort_by"], sort_field)
                     self.assertEqual(serializer.validated_data["order"], order)
+
+
+class GetTaskQueryParamsSerializerCursorTests(TestCase):
+    def test_empty_cursor_is_valid(self):
+        serializer = GetTaskQueryParamsSerializer(data={"cursor": ""})
+        self.assertTrue(serializer.is_valid(), serializer.errors)
+        self.assertEqual(serializer.validated_data["cursor"], "")
+
+    def test_cursor_is_optional(self):
+        serializer = GetTaskQueryParamsSerializer(data={})
+        self.assertTrue(serializer.is_valid())
+        self.assertNotIn("cursor", serializer.validated_data)
+
+    def test_valid_cursor_for_same_sort_is_decoded(self):
+        task_cursor = TaskCursor(SORT_FIELD_CREATED_AT, SORT_ORDER_DESC, None, ObjectId())
+        serializer = GetTaskQueryParamsSerializer(
+            data={"cursor": encode_cursor(task_cursor), "sort_by": SORT_FIELD_CREATED_AT, "order": SORT_ORDER_DESC}
+        )
+        self.assertTrue(serializer.is_valid(), serializer.errors)
+        self.assertEqual(serializer.validated_data["cursor"], task_cursor)
+
+    def test_malformed_cursor_is_rejected(self):
+        serializer = GetTaskQueryParamsSerializer(data={"cursor": "garbage"})
+        self.assertFalse(serializer.is_valid())
+        self.assertIn("cursor", serializer.errors)
+
+    def test_cursor_for_different_sort_is_rejected(self):
+        cursor = encode_cursor(TaskCursor(SORT_FIELD_PRIORITY, SORT_ORDER_DESC, 1, ObjectId()))
+        serializer = GetTaskQueryParamsSerializer(
+            data={"cursor": cursor, "sort_by": SORT_FIELD_CREATED_AT, "order": SORT_ORDER_DESC}
+        )
+        self.assertFalse(serializer.is_valid())
+        self.assertIn("cursor", serializer.errors)
@@ -0,0 +1,41 @@
+from datetime import datetime, timedelta, timezone
+from unittest import TestCase
+from unittest.mock import patch
+
+from todo.services.deferral_expiry_service import DeferralExpiryService
+
+
+@patch("todo.services.deferral_expiry_service.TaskRepository")
+class DeferralExpiryServiceTests(TestCase):
+    def setUp(self):
+        self.service = DeferralExpiryService()
+
+    def test_run_once_expires_ended_deferrals(self, mock_task_repository):
+        mock_task_repository.expire_deferrals.return_value = 2
+
+        self.assertEqual(self.service.run_once(), 2)
+
+        mock_task_repository.expire_deferrals.assert_called_once_with()
+
+    def test_sleeps_until_next_deferral_ends(self, mock_task_repository):
+        mock_task_repository.get_next_deferral_expiry.return_value = datetime.now(timezone.utc) + timedelta(seconds=10)
+
+        seconds = self.service._seconds_until_next_expiry(poll_interval=60)
+
+        self.assertGreater(seconds, 0)
+        self.assertLessEqual(seconds, 10)
+
+    def test_sleeps_at_most_poll_interval(self, mock_task_repository):
+        mock_task_repository.get_next_deferral_expiry.return_value = datetime.now(timezone.utc) + timedelta(days=1)
+
+        self.assertEqual(self.service._seconds_until_next_expiry(poll_interval=60), 60)
+
+    def test_sleeps_poll_interval_without_deferred_tasks(self, mock_task_repository):
+        mock_task_repository.get_next_deferral_expiry.return_value = None
+
+        self.assertEqual(self.service._seconds_until_next_expiry(poll_interval=60), 60)
+
+    def test_does_not_sleep_past_an_overdue_deferral(self, mock_task_repository):
+        mock_task_repository.get_next_deferral_expiry.return_value = datetime(2020, 1, 1)
+
+        self.assertEqual(self.service._seconds_until_next_expiry(poll_interval=60), 0)
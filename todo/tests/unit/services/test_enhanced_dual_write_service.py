@@ -0,0 +1,184 @@
+from datetime import datetime, timezone
+from unittest.mock import patch
+from bson import ObjectId
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+
+from todo.models.postgres import PostgresTask, PostgresTaskLabel, PostgresUserTeamDetails
+from todo.services.enhanced_dual_write_service import EnhancedDualWriteService
+
+
+def _task_operation(operation: str, mongo_id: str, title: str, labels=None) -> dict:
+    return {
+        "collection_name": "tasks",
+        "operation": operation,
+        "mongo_id": mongo_id,
+        "data": {
+            "title": title,
+            "priority": 2,
+            "status": "TODO",
+            "displayId": "#1",
+            "createdBy": str(ObjectId()),
+            "labels": labels or [],
+        },
+    }
+
+
+@override_settings(DUAL_WRITE_ENABLED=True, DUAL_WRITE_OUTBOX_ENABLED=False, DUAL_WRITE_FAILURE_STORE_ENABLED=True)
+class EnhancedDualWriteServiceBatchTests(TestCase):
+    def setUp(self):
+        self.service = EnhancedDualWriteService()
+        self.created_at = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        self.patcher_record = patch("todo.services.enhanced_dual_write_service.SyncFailureRepository.record")
+        self.mock_record = self.patcher_record.start()
+
+    def tearDown(self):
+        self.patcher_record.stop()
+
+    def _existing_task(self, title: str = "old") -> PostgresTask:
+        task = PostgresTask.objects.create(mongo_id=str(ObjectId()), title=title, created_by=str(ObjectId()))
+        PostgresTask.objects.filter(pk=task.pk).update(created_at=self.created_at)
+        return task
+
+    def test_batch_upserts_new_and_existing_documents(self):
+        existing = self._existing_task()
+        label_id = str(ObjectId())
+        new_id = str(ObjectId())
+
+        success = self.service.batch_operations(
+            [
+                _task_operation("update", existing.mongo_id, "updated"),
+                _task_operation("create", new_id, "created", labels=[label_id, label_id]),
+            ]
+        )
+
+        self.assertTrue(success)
+        existing.refresh_from_db()
+        self.assertEqual(existing.title, "updated")
+        self.assertEqual(existing.created_at, self.created_at)
+        self.assertIsNotNone(existing.updated_at)
+        created = PostgresTask.objects.get(mongo_id=new_id)
+        self.assertEqual(created.title, "created")
+        self.assertEqual(
+            list(PostgresTaskLabel.objects.filter(task=created).values_list("label_mongo_id", flat=True)), [label_id]
+        )
+
+    def test_batch_merges_operations_of_same_document_in_order(self):
+        mongo_id = str(ObjectId())
+
+        success = self.service.batch_operations(
+            [_task_operation("create", mongo_id, "first"), _task_operation("update", mongo_id, "second")]
+        )
+
+        self.assertTrue(success)
+        self.assertEqual(PostgresTask.objects.get(mongo_id=mongo_id).title, "second")
+
+    def test_batch_applies_write_after_delete_in_order(self):
+        existing = self._existing_task()
+
+        success = self.service.batch_operations(
+            [
+                {"collection_name": "tasks", "operation": "delete", "mongo_id": existing.mongo_id},
+                _task_operation("update", existing.mongo_id, "restored"),
+            ]
+        )
+
+        self.assertTrue(success)
+        existing.refresh_from_db()
+        self.assertEqual(existing.title, "restored")
+
+    def test_batch_soft_deletes_and_hard_deletes(self):
+        task = self._existing_task()
+        membership = PostgresUserTeamDetails.objects.create(
+            mongo_id=str(ObjectId()), user_id="u", team_id="t", created_by="u", updated_by="u"
+        )
+
+        success = self.service.batch_operations(
+            [
+                {"collection_name": "tasks", "operation": "delete", "mongo_id": task.mongo_id},
+                {"collection_name": "user_team_details", "operation": "delete", "mongo_id": membership.mongo_id},
+                {"collection_name": "tasks", "operation": "delete", "mongo_id": str(ObjectId())},
+            ]
+        )
+
+        self.assertTrue(success)
+        task.refresh_from_db()
+        self.assertTrue(task.is_deleted)
+        self.assertFalse(PostgresUserTeamDetails.objects.filter(pk=membership.pk).exists())
+
+    def test_failed_group_is_applied_one_by_one_and_reports_failed_documents(self):
+        valid_id = str(ObjectId())
+        invalid_id = str(ObjectId())
+
+        success = self.service.batch_operations(
+            [
+                _task_operation("create", valid_id, "valid"),
+                _task_operation("create", invalid_id, None),
+                {"collection_name": "tasks", "operation": "archive", "mongo_id": valid_id},
+            ]
+        )
+
+        self.assertFalse(success)
+        self.assertTrue(PostgresTask.objects.filter(mongo_id=valid_id).exists())
+        self.assertFalse(PostgresTask.objects.filter(mongo_id=invalid_id).exists())
+        self.assertEqual([failure["mongo_id"] for failure in self.service.get_sync_failures()], [invalid_id])
+        self.mock_record.assert_called_once()
+        collection_name, operation, mongo_id, data, error, retry_delay = self.mock_record.call_args[0]
+        self.assertEqual((collection_name, operation, mongo_id), ("tasks", "create", invalid_id))
+        self.assertIsNone(data["title"])
+        self.assertIn("NOT NULL", error)
+
+    def test_failed_single_write_is_stored_with_payload(self):
+        success = self.service.update_document("tasks", str(ObjectId()), {"title": None, "createdBy": "u"})
+
+        self.assertFalse(success)
+        self.assertEqual(self.mock_record.call_args[0][1], "update")
+        self.assertEqual(self.mock_record.call_args[0][3], {"title": None, "createdBy": "u"})
+
+    def test_successful_write_is_not_stored(self):
+        self.assertTrue(self.service.create_document("tasks", _task_operation("create", "x", "t")["data"], "x"))
+
+        self.mock_record.assert_not_called()
+
+    @patch("todo.services.enhanced_dual_write_service.SyncFailureRepository.get_metrics")
+    def test_get_sync_metrics_reads_failure_store(self, mock_get_metrics):
+        mock_get_metrics.return_value = {"total_failures": 2, "pending": 1, "dead": 1}
+
+        metrics = self.service.get_sync_metrics()
+
+        self.assertEqual(metrics, {"total_failures": 2, "pending": 1, "dead": 1, "enabled": True})
+
+    @patch("todo.services.enhanced_dual_write_service.SyncRetryService.retry", return_value=True)
+    def test_retry_failed_sync_retries_stored_failure(self, mock_retry):
+        self.assertTrue(self.service.retry_failed_sync("tasks", "abc"))
+
+        mock_retry.assert_called_once_with("tasks", "abc")
+
+    def test_benchmark_1000_operations_query_count(self):
+        """
+        1,000 task operations (half updates of existing rows, half creates, each with a label):
+        applied one at a time they take several queries per operation; batch mode needs one
+        statement per insert batch instead.
+        """
+        operations_count = 1000
+
+        def operations():
+            existing_ids = [self._existing_task().mongo_id for _ in range(operations_count // 2)]
+            new_ids = [str(ObjectId()) for _ in range(operations_count // 2)]
+            return [_task_operation("update", mongo_id, "t", [str(ObjectId())]) for mongo_id in existing_ids] + [
+                _task_operation("create", mongo_id, "t", [str(ObjectId())]) for mongo_id in new_ids
+            ]
+
+        one_by_one_operations = operations()
+        with CaptureQueriesContext(connection) as one_by_one:
+            self.assertEqual(self.service._apply_operations(one_by_one_operations), (operations_count, 0))
+
+        batch_operations = operations()
+        with CaptureQueriesContext(connection) as batched:
+            self.assertTrue(self.service.batch_operations(batch_operations))
+
+        self.assertGreaterEqual(len(one_by_one), operations_count * 4)
+        self.assertLessEqual(len(batched) * 100, len(one_by_one))
+        self.assertEqual(PostgresTask.objects.count(), operations_count * 2)
+        self.assertEqual(PostgresTaskLabel.objects.count(), operations_count * 2)
@@ -0,0 +1,116 @@
+from datetime import datetime, timezone
+from unittest.mock import MagicMock, patch
+from bson import ObjectId
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from todo.models.postgres import PostgresDeferredDetails, PostgresLabel, PostgresTask, PostgresTaskLabel
+from todo.models.sync_checkpoint import SyncCheckpointModel
+from todo.services.postgres_sync_service import BACKFILL_JOB, PostgresSyncService
+
+
+class _Cursor:
+    """Iterates once over documents, like a pymongo cursor."""
+
+    def __init__(self, documents: list):
+        self._documents = iter(documents)
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        return next(self._documents)
+
+    def close(self):
+        pass
+
+
+def _task(title: str, **fields) -> dict:
+    return {"_id": ObjectId(), "title": title, "createdBy": str(ObjectId()), **fields}
+
+
+@patch("todo.services.postgres_sync_service.SyncCheckpointRepository")
+class PostgresSyncServiceTests(TestCase):
+    def setUp(self):
+        self.service = PostgresSyncService(batch_size=2)
+        self.collection = MagicMock()
+        self.service.db_manager = MagicMock()
+        self.service.db_manager.get_collection.return_value = self.collection
+
+    def _set_documents(self, documents: list) -> None:
+        self.collection.find.return_value.sort.return_value.batch_size.return_value = _Cursor(documents)
+        self.collection.count_documents.return_value = len(documents)
+
+    def test_backfill_inserts_missing_tasks_with_labels_and_deferred_details(self, mock_checkpoints):
+        label_id = ObjectId()
+        deferred_till = datetime(2025, 2, 1, tzinfo=timezone.utc)
+        existing = _task("existing")
+        PostgresTask.objects.create(mongo_id=str(existing["_id"]), title="existing", created_by="u")
+        labelled = _task("labelled", labels=[label_id])
+        deferred = _task("deferred", deferredDetails={"deferredTill": deferred_till, "deferredBy": ObjectId()})
+        self._set_documents([existing, labelled, deferred])
+
+        [result] = self.service.backfill(["tasks"])
+
+        self.assertIsNone(result.error)
+        self.assertEqual((result.scanned, result.inserted, result.existing, result.failed), (3, 2, 1, 0))
+        self.assertEqual(PostgresTask.objects.count(), 3)
+        self.assertEqual(
+            list(PostgresTaskLabel.objects.values_list("task__mongo_id", "label_mongo_id")),
+            [(str(labelled["_id"]), str(label_id))],
+        )
+        details = PostgresDeferredDetails.objects.get(task__mongo_id=str(deferred["_id"]))
+        self.assertEqual(details.deferred_till, deferred_till)
+        self.assertEqual(mock_checkpoints.save_progress.call_count, 2)
+        self.assertEqual(mock_checkpoints.save_progress.call_args[0][2], str(deferred["_id"]))
+        mock_checkpoints.complete.assert_called_once()
+
+    def test_backfill_queries_per_batch_not_per_document(self, _):
+        self.service.batch_size = 100
+        self._set_documents([_task(f"task-{index}") for index in range(100)])
+
+        with CaptureQueriesContext(connection) as queries:
+            [result] = self.service.backfill(["tasks"], force=True)
+
+        self.assertEqual(result.inserted, 100)
+        self.assertLess(len(queries), 10)
+
+    def test_backfill_skips_up_to_date_table_unless_forced(self, _):
+        label = {"_id": ObjectId(), "name": "bug", "color": "#ff0000"}
+        PostgresLabel.objects.create(mongo_id=str(label["_id"]), name="bug")
+        self._set_documents([label])
+
+        [result] = self.service.backfill(["labels"])
+        self.assertTrue(result.up_to_date)
+        self.collection.find.assert_not_called()
+        self.collection.count_documents.assert_called_once_with({"isDeleted": {"$ne": True}})
+
+        [result] = self.service.backfill(["labels"], force=True)
+        self.assertFalse(result.up_to_date)
+        self.assertEqual((result.scanned, result.existing), (1, 1))
+
+    def test_backfill_resumes_after_checkpoint(self, mock_checkpoints):
+        last_id = ObjectId()
+        mock_checkpoints.get.return_value = SyncCheckpointModel(
+            job=BACKFILL_JOB,
+            target_collection="tasks",
+            key=f"{BACKFILL_JOB}:tasks",
+            last_id=str(last_id),
+            counters={"inserted": 5},
+        )
+        self._set_documents([_task("next")])
+
+        [result] = self.service.backfill(["tasks"], resume=True)
+
+        mock_checkpoints.start.assert_not_called()
+        self.collection.find.assert_called_once_with({"_id": {"$gt": last_id}})
+        self.assertEqual((result.resumed_from, result.inserted, result.scanned), (str(last_id), 6, 1))
+
+    def test_invalid_document_does_not_fail_batch(self, _):
+        self._set_documents([_task("valid"), _task(None)])
+
+        [result] = self.service.backfill(["tasks"], force=True)
+
+        self.assertEqual((result.inserted, result.failed), (1, 1))
+        self.assertTrue(PostgresTask.objects.filter(title="valid").exists())
@@ -0,0 +1,131 @@
+from datetime import datetime, timezone
+from unittest.mock import MagicMock, patch
+from bson import ObjectId
+from django.test import TestCase
+
+from todo.models.postgres import PostgresLabel, PostgresTask, PostgresTaskLabel
+from todo.models.sync_checkpoint import SyncCheckpointModel
+from todo.services.reconciliation_service import RECONCILE_JOB, ReconciliationService
+
+
+def _label(name: str, color: str = "#ffffff") -> dict:
+    now = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    return {"_id": ObjectId(), "name": name, "color": color, "description": None, "createdAt": now, "updatedAt": now}
+
+
+def _chunks(documents: list, chunk_size: int):
+    """Mimic find({"_id": {"$gt": ...}}).sort("_id").limit(chunk_size) over documents."""
+
+    def find(query):
+        after_id = query.get("_id", {}).get("$gt")
+        matching = sorted(
+            (document for document in documents if after_id is None or document["_id"] > after_id),
+            key=lambda document: document["_id"],
+        )
+        cursor = MagicMock()
+        cursor.sort.return_value.limit.return_value = matching[:chunk_size]
+        return cursor
+
+    return find
+
+
+@patch("todo.services.reconciliation_service.SyncCheckpointRepository")
+class ReconciliationServiceTests(TestCase):
+    def setUp(self):
+        self.service = ReconciliationService(chunk_size=2, workers=1)
+        self.collection = MagicMock()
+        self.service.db_manager = MagicMock()
+        self.service.db_manager.get_collection.return_value = self.collection
+
+    def _sync_labels(self, documents: list) -> None:
+        for document in documents:
+            PostgresLabel.objects.create(mongo_id=str(document["_id"]), name=document["name"], color=document["color"])
+
+    def test_in_sync_collection_has_no_mismatched_chunks(self, mock_checkpoints):
+        mock_checkpoints.get.return_value = None
+        documents = [_label(f"label-{index}") for index in range(5)]
+        self._sync_labels(documents)
+        self.collection.find.side_effect = _chunks(documents, 2)
+
+        [result] = self.service.reconcile(["labels"])
+
+        self.assertIsNone(result.error)
+        self.assertEqual((result.chunks, result.rows, result.mismatched_chunks), (3, 10, 0))
+        self.assertTrue(result.in_sync)
+        mock_checkpoints.start.assert_called_once_with(RECONCILE_JOB, "labels")
+        self.assertEqual(mock_checkpoints.save_progress.call_args[0][2], str(documents[-1]["_id"]))
+        mock_checkpoints.complete.assert_called_once()
+
+    def test_drift_is_reported_per_row(self, mock_checkpoints):
+        mock_checkpoints.get.return_value = None
+        documents = [_label(f"label-{index}") for index in range(4)]
+        self._sync_labels(documents[1:])
+        PostgresLabel.objects.filter(mongo_id=str(documents[2]["_id"])).update(color="#000000")
+        orphan = PostgresLabel.objects.create(mongo_id=str(ObjectId()), name="orphan")
+        self.collection.find.side_effect = _chunks(documents, 2)
+
+        [result] = self.service.reconcile(["labels"])
+
+        self.assertEqual((result.missing, result.different, result.extra), (1, 1, 1))
+        self.assertEqual(result.mismatched_chunks, 3)
+        self.assertCountEqual(result.sample_ids, [str(documents[0]["_id"]), str(documents[2]["_id"]), orphan.mongo_id])
+        self.assertFalse(result.in_sync)
+        self.assertEqual(PostgresLabel.objects.count(), 4)
+
+    def test_repair_writes_documents_and_deletes_orphans(self, mock_checkpoints):
+        mock_checkpoints.get.return_value = None
+        documents = [_label(f"label-{index}") for index in range(3)]
+        self._sync_labels(documents[1:])
+        PostgresLabel.objects.filter(mongo_id=str(documents[2]["_id"])).update(color="#000000")
+        PostgresLabel.objects.create(mongo_id=str(ObjectId()), name="orphan")
+        self.collection.find.side_effect = _chunks(documents, 2)
+        self.service.repair = True
+
+        [result] = self.service.reconcile(["labels"])
+
+        self.assertEqual((result.repaired, result.repair_failed), (3, 0))
+        self.assertTrue(result.in_sync)
+        self.assertCountEqual(
+            PostgresLabel.objects.values_list("mongo_id", "color"),
+            [(str(document["_id"]), document["color"]) for document in documents],
+        )
+
+    def test_task_labels_are_compared(self, mock_checkpoints):
+        mock_checkpoints.get.return_value = None
+        label_id = ObjectId()
+        document = {"_id": ObjectId(), "title": "task", "createdBy": "u", "labels": [label_id]}
+        task = PostgresTask.objects.create(mongo_id=str(document["_id"]), title="task", created_by="u")
+        self.collection.find.side_effect = _chunks([document], 2)
+
+        [result] = self.service.reconcile(["tasks"])
+        self.assertEqual(result.different, 1)
+
+        PostgresTaskLabel.objects.create(task=task, label_mongo_id=str(label_id))
+        [result] = self.service.reconcile(["tasks"])
+        self.assertEqual(result.different, 0)
+
+    def test_resumes_after_checkpoint(self, mock_checkpoints):
+        documents = [_label(f"label-{index}") for index in range(4)]
+        self._sync_labels(documents)
+        mock_checkpoints.get.return_value = SyncCheckpointModel(
+            job=RECONCILE_JOB,
+            target_collection="labels",
+            key=f"{RECONCILE_JOB}:labels",
+            last_id=str(documents[1]["_id"]),
+            counters={"rows": 4, "chunks": 1},
+        )
+        self.collection.find.side_effect = _chunks(documents, 2)
+
+        [result] = self.service.reconcile(["labels"])
+
+        mock_checkpoints.start.assert_not_called()
+        self.assertEqual(
+            self.collection.find.call_args_list[0][0][0],
+            {"isDeleted": {"$ne": True}, "_id": {"$gt": documents[1]["_id"]}},
+        )
+        self.assertEqual(result.resumed_from, str(documents[1]["_id"]))
+        self.assertEqual((result.chunks, result.rows, result.scanned), (2, 8, 4))
+
+    def test_rejects_unknown_collection(self, _):
+        with self.assertRaises(ValueError):
+            self.service.reconcile(["unknown"])
@@ -0,0 +1,114 @@
+from datetime import datetime, timezone
+from unittest import TestCase
+from unittest.mock import MagicMock, patch
+from bson import ObjectId
+from django.test import override_settings
+
+from todo.services.enhanced_dual_write_service import EnhancedDualWriteService
+from todo.services.sync_relay_service import SyncRelayService
+
+
+def _event(key: str, operation: str = "update") -> dict:
+    collection_name, mongo_id = key.split(":")
+    return {
+        "_id": ObjectId(),
+        "target_collection": collection_name,
+        "mongo_id": mongo_id,
+        "operation": operation,
+        "data": {"title": key},
+        "key": key,
+        "attempts": 0,
+        "created_at": datetime.now(timezone.utc),
+    }
+
+
+@patch("todo.services.sync_relay_service.close_old_connections")
+@patch("todo.services.sync_relay_service.OutboxRepository")
+class SyncRelayServiceTests(TestCase):
+    def setUp(self):
+        self.relay = SyncRelayService(batch_size=10, max_attempts=3, retry_delay=5)
+        self.relay.dual_write_service = MagicMock()
+        self.relay.dual_write_service.get_sync_failures.return_value = [{"error": "postgres down"}]
+
+    def test_run_once_applies_events_and_removes_them(self, mock_outbox, _):
+        events = [_event("tasks:1", "create"), _event("tasks:1", "update"), _event("teams:2", "delete")]
+        mock_outbox.get_ready_events.return_value = events
+        mock_outbox.mark_failed.return_value = 0
+        self.relay.dual_write_service.update_document.return_value = True
+        self.relay.dual_write_service.delete_document.return_value = True
+
+        result = self.relay.run_once()
+
+        self.assertEqual((result.fetched, result.synced, result.failed), (3, 3, 0))
+        self.assertIsNotNone(result.lag_seconds)
+        self.assertEqual(self.relay.dual_write_service.update_document.call_count, 2)
+        self.relay.dual_write_service.delete_document.assert_called_once_with("teams", "2")
+        mock_outbox.mark_synced.assert_called_once_with([event["_id"] for event in events])
+
+    def test_run_once_holds_back_later_events_of_a_failed_document(self, mock_outbox, _):
+        first, second, other = _event("tasks:1"), _event("tasks:1"), _event("tasks:2")
+        mock_outbox.get_ready_events.return_value = [first, second, other]
+        mock_outbox.mark_failed.return_value = 0
+        self.relay.dual_write_service.update_document.side_effect = lambda collection, mongo_id, data: mongo_id != "1"
+
+        result = self.relay.run_once()
+
+        self.assertEqual((result.synced, result.failed, result.deferred), (1, 1, 1))
+        self.assertEqual(self.relay.dual_write_service.update_document.call_count, 2)
+        mock_outbox.mark_synced.assert_called_once_with([other["_id"]])
+        failures, max_attempts, retry_delay, _now = mock_outbox.mark_failed.call_args[0]
+        self.assertEqual(failures, [(first, "postgres down")])
+        self.assertEqual((max_attempts, retry_delay), (3, 5))
+
+    def test_run_once_counts_exception_as_failure(self, mock_outbox, _):
+        event = _event("tasks:1")
+        mock_outbox.get_ready_events.return_value = [event]
+        mock_outbox.mark_failed.return_value = 1
+        self.relay.dual_write_service.update_document.side_effect = RuntimeError("boom")
+
+        result = self.relay.run_once()
+
+        self.assertEqual((result.failed, result.dead), (1, 1))
+        self.assertEqual(mock_outbox.mark_failed.call_args[0][0], [(event, "boom")])
+
+    def test_run_drain_stops_when_batch_is_not_full(self, mock_outbox, _):
+        mock_outbox.get_ready_events.return_value = []
+        mock_outbox.mark_failed.return_value = 0
+
+        self.relay.run(drain=True)
+
+        mock_outbox.get_ready_events.assert_called_once_with(10)
+
+
+class EnhancedDualWriteServiceOutboxTests(TestCase):
+    @override_settings(DUAL_WRITE_ENABLED=True, DUAL_WRITE_OUTBOX_ENABLED=True)
+    @patch("todo.services.enhanced_dual_write_service.OutboxRepository.enqueue_many")
+    @patch("todo.services.dual_write_service.DualWriteService.create_document")
+    def test_create_document_enqueues_in_session(self, mock_postgres_create, mock_enqueue):
+        session = MagicMock()
+
+        success = EnhancedDualWriteService().create_document("tasks", {"title": "t"}, "abc", session=session)
+
+        self.assertTrue(success)
+        mock_postgres_create.assert_not_called()
+        mock_enqueue.assert_called_once_with(
+            [{"collection_name": "tasks", "operation": "create", "mongo_id": "abc", "data": {"title": "t"}}],
+            session=session,
+        )
+
+    @override_settings(DUAL_WRITE_ENABLED=True, DUAL_WRITE_OUTBOX_ENABLED=True)
+    @patch("todo.services.enhanced_dual_write_service.OutboxRepository.enqueue_many", side_effect=RuntimeError)
+    def test_enqueue_failure_in_session_is_raised(self, _):
+        with self.assertRaises(RuntimeError):
+            EnhancedDualWriteService().delete_document("tasks", "abc", session=MagicMock())
+
+        self.assertFalse(EnhancedDualWriteService().delete_document("tasks", "abc"))
+
+    @override_settings(DUAL_WRITE_ENABLED=True, DUAL_WRITE_OUTBOX_ENABLED=False)
+    @patch("todo.services.enhanced_dual_write_service.OutboxRepository.enqueue_many")
+    @patch("todo.services.dual_write_service.DualWriteService.update_document", return_value=True)
+    def test_update_document_writes_postgres_without_outbox(self, mock_postgres_update, mock_enqueue):
+        self.assertTrue(EnhancedDualWriteService().update_document("tasks", "abc", {"title": "t"}))
+
+        mock_postgres_update.assert_called_once_with("tasks", "abc", {"title": "t"})
+        mock_enqueue.assert_not_called()
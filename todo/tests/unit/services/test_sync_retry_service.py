@@ -0,0 +1,91 @@
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+from bson import ObjectId
+from django.test import TestCase
+
+from todo.models.postgres import PostgresTask
+from todo.models.sync_failure import SyncFailureModel
+from todo.services.sync_retry_service import (
+    RETRY_STATUS_FAILED,
+    RETRY_STATUS_SUPERSEDED,
+    RETRY_STATUS_SYNCED,
+    SyncRetryService,
+)
+
+
+def _failure(mongo_id: str, operation: str = "update", failed_at: datetime | None = None) -> SyncFailureModel:
+    return SyncFailureModel(
+        _id=ObjectId(),
+        target_collection="tasks",
+        mongo_id=mongo_id,
+        operation=operation,
+        data={"title": "retried", "createdBy": "u"},
+        key=f"tasks:{mongo_id}",
+        failed_at=failed_at or datetime.now(timezone.utc),
+    )
+
+
+@patch("todo.services.sync_retry_service.SyncFailureRepository")
+class SyncRetryServiceTests(TestCase):
+    def setUp(self):
+        self.service = SyncRetryService(batch_size=10, workers=2, max_attempts=3, retry_delay=5)
+
+    def test_retry_failure_applies_stored_payload(self, _):
+        mongo_id = str(ObjectId())
+
+        status, error = self.service.retry_failure(_failure(mongo_id))
+
+        self.assertEqual((status, error), (RETRY_STATUS_SYNCED, ""))
+        self.assertEqual(PostgresTask.objects.get(mongo_id=mongo_id).title, "retried")
+
+    def test_retry_failure_skips_payload_superseded_by_later_write(self, _):
+        task = PostgresTask.objects.create(mongo_id=str(ObjectId()), title="newer", created_by="u")
+
+        status, _error = self.service.retry_failure(_failure(task.mongo_id, failed_at=task.last_sync_at - timedelta(1)))
+
+        self.assertEqual(status, RETRY_STATUS_SUPERSEDED)
+        task.refresh_from_db()
+        self.assertEqual(task.title, "newer")
+
+    def test_retry_failure_reports_error(self, _):
+        failure = _failure(str(ObjectId()))
+        failure.data = {"title": None}
+
+        status, error = self.service.retry_failure(failure)
+
+        self.assertEqual(status, RETRY_STATUS_FAILED)
+        self.assertIn("NOT NULL", error)
+
+    def test_run_once_resolves_synced_and_reschedules_failed(self, mock_repository):
+        synced, superseded, failed = _failure("1"), _failure("2"), _failure("3")
+        mock_repository.get_due.return_value = [synced, superseded, failed]
+        mock_repository.mark_failed.return_value = 0
+        outcomes = {
+            "1": (RETRY_STATUS_SYNCED, ""),
+            "2": (RETRY_STATUS_SUPERSEDED, ""),
+            "3": (RETRY_STATUS_FAILED, "timeout"),
+        }
+
+        with patch.object(self.service, "retry_failure", side_effect=lambda failure: outcomes[failure.mongo_id]):
+            result = self.service.run_once()
+
+        self.assertEqual((result.synced, result.superseded, result.failed), (1, 1, 1))
+        mock_repository.get_due.assert_called_once_with(10)
+        mock_repository.resolve.assert_called_once_with([synced, superseded])
+        mock_repository.mark_failed.assert_called_once_with([(failed, "timeout")], 3, 5)
+
+    def test_retry_requeues_and_resolves_failure(self, mock_repository):
+        failure = _failure(str(ObjectId()))
+        mock_repository.requeue.return_value = True
+        mock_repository.get_by_key.return_value = failure
+
+        self.assertTrue(self.service.retry("tasks", failure.mongo_id))
+
+        mock_repository.resolve.assert_called_once_with([failure])
+
+    def test_retry_without_stored_failure(self, mock_repository):
+        mock_repository.requeue.return_value = False
+
+        self.assertFalse(self.service.retry("tasks", "missing"))
+
+        mock_repository.get_by_key.assert_not_called()
@@ -1,9 +1,10 @@
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import Mock, call, patch, MagicMock
 from unittest import TestCase
 from django.core.exceptions import ValidationError
 from datetime import datetime, timedelta, timezone
 from bson import ObjectId
 
+from todo.dto.responses.bulk_task_response import BulkTaskResponse
 from todo.dto.responses.get_tasks_response import GetTasksResponse
 from todo.dto.responses.paginated_response import LinksData
 from todo.dto.user_dto import UserDTO
@@ -22,7 +23,7 @@ from todo.constants.task import (
     SORT_ORDER_ASC,
     SORT_ORDER_DESC,
 )
-from todo.models.task import TaskModel
+from todo.models.task import DeferredDetailsModel, TaskAssigneeModel, TaskModel
 from todo.exceptions.task_exceptions import (
     TaskNotFoundException,
     UnprocessableEntityException,
@@ -36,6 +37,8 @@ from todo.models.common.pyobjectid import PyObjectId
 from rest_framework.exceptions import ValidationError as DRFValidationError
 from todo.tests.integration.base_mongo_test import AuthenticatedMongoTestCase
 from todo.exceptions.user_exceptions import UserNotFoundException
+from todo.utils.cursor_utils import TaskCursor, decode_cursor
+from urllib.parse import parse_qs, urlparse
 
 
 class TaskServiceTests(AuthenticatedMongoTestCase):
@@ -44,17 +47,17 @@ class TaskServiceTests(AuthenticatedMongoTestCase):
         super().setUp()
         self.mock_reverse_lazy = mock_reverse_lazy
 
-    @patch("todo.services.task_service.UserRepository.get_by_id")
-    @patch("todo.services.task_service.TaskRepository.count")
-    @patch("todo.services.task_service.TaskRepository.list")
+    @patch("todo.services.task_service.UserRepository.get_by_ids")
+    @patch("todo.services.task_service.TaskRepository.list_with_count")
     @patch("todo.services.task_service.LabelRepository.list_by_ids")
     def test_get_tasks_returns_paginated_response(
-        self, mock_label_repo: Mock, mock_list: Mock, mock_count: Mock, mock_user_repo: Mock
+        self, mock_label_repo: Mock, mock_list_with_count: Mock, mock_user_repo: Mock
     ):
-        mock_list.return_value = [tasks_models[0]]
-        mock_count.return_value = 3
+        mock_list_with_count.return_value = ([tasks_models[0]], 3)
         mock_label_repo.return_value = label_models
-        mock_user_repo.return_value = self.get_user_model()
+        mock_user = self.get_user_model()
+        mock_user.id = tasks_models[0].createdBy
+        mock_user_repo.return_value = [mock_user]
 
         response: GetTasksResponse = TaskService.get_tasks(
             page=2, limit=1, sort_by="createdAt", order="desc", user_id=str(self.user_id)
@@ -71,22 +74,21 @@ class TaskServiceTests(AuthenticatedMongoTestCase):
             response.links.prev, f"{self.mock_reverse_lazy('tasks')}?page=1&limit=1&sort_by=createdAt&order=desc"
         )
 
-        mock_list.assert_called_once_with(
-            2, 1, "createdAt", "desc", str(self.user_id), team_id=None, status_filter=None
+        mock_list_with_count.assert_called_once_with(
+            2, 1, "createdAt", "desc", str(self.user_id), team_id=None, status_filter=None, include_total=True
         )
-        mock_count.assert_called_once()
 
-    @patch("todo.services.task_service.UserRepository.get_by_id")
-    @patch("todo.services.task_service.TaskRepository.count")
-    @patch("todo.services.task_service.TaskRepository.list")
+    @patch("todo.services.task_service.UserRepository.get_by_ids")
+    @patch("todo.services.task_service.TaskRepository.list_with_count")
     @patch("todo.services.task_service.LabelRepository.list_by_ids")
     def test_get_tasks_doesnt_returns_prev_link_for_first_page(
-        self, mock_label_repo: Mock, mock_list: Mock, mock_count: Mock, mock_user_repo: Mock
+        self, mock_label_repo: Mock, mock_list_with_count: Mock, mock_user_repo: Mock
     ):
-        mock_list.return_value = [tasks_models[0]]
-        mock_count.return_value = 2
+        mock_list_with_count.return_value = ([tasks_models[0]], 2)
         mock_label_repo.return_value = label_models
-        mock_user_repo.return_value = self.get_user_model()
+        mock_user = self.get_user_model()
+        mock_user.id = tasks_models[0].createdBy
+        mock_user_repo.return_value = [mock_user]
 
         response: GetTasksResponse = TaskService.get_tasks(
             page=1, limit=1, sort_by="createdAt", order="desc", user_id=str(self.user_id)
@@ -99,11 +101,32 @@ class TaskServiceTests(AuthenticatedMongoTestCase):
             response.links.next, f"{self.mock_reverse_lazy('tasks')}?page=2&limit=1&sort_by=createdAt&order=desc"
         )
 
-    @patch("todo.services.task_service.TaskRepository.count")
-    @patch("todo.services.task_service.TaskRepository.list")
-    def test_get_tasks_returns_empty_response_if_no_tasks_present(self, mock_list: Mock, mock_count: Mock):
-        mock_list.return_value = []
-        mock_count.return_value = 0
+    @patch("todo.services.task_service.UserRepository.get_by_ids")
+    @patch("todo.services.task_service.TaskRepository.list_with_count")
+    @patch("todo.services.task_service.LabelRepository.list_by_ids")
+    def test_get_tasks_without_total_links_next_page_when_page_is_full(
+        self, mock_label_repo: Mock, mock_list_with_count: Mock, mock_user_repo: Mock
+    ):
+        mock_list_with_count.return_value = ([tasks_models[0]], None)
+        mock_label_repo.return_value = label_models
+        mock_user = self.get_user_model()
+        mock_user.id = tasks_models[0].createdBy
+        mock_user_repo.return_value = [mock_user]
+
+        response: GetTasksResponse = TaskService.get_tasks(
+            page=1, limit=1, sort_by="createdAt", order="desc", user_id=str(self.user_id), include_total=False
+        )
+
+        self.assertEqual(
+            response.links.next, f"{self.mock_reverse_lazy('tasks')}?page=2&limit=1&sort_by=createdAt&order=desc"
+        )
+        mock_list_with_count.assert_called_once_with(
+            1, 1, "createdAt", "desc", str(self.user_id), team_id=None, status_filter=None, include_total=False
+        )
+
+    @patch("todo.services.task_service.TaskRepository.list_with_count")
+    def test_get_tasks_returns_empty_response_if_no_tasks_present(self, mock_list_with_count: Mock):
+        mock_list_with_count.return_value = ([], 0)
 
         response: GetTasksResponse = TaskService.get_tasks(
             page=1, limit=10, sort_by="createdAt", order="desc", user_id="test_user"
@@ -113,14 +136,13 @@ class TaskServiceTests(AuthenticatedMongoTestCase):
         self.assertEqual(len(response.tasks), 0)
         self.assertIsNone(response.links)
 
-        mock_list.assert_called_once_with(1, 10, "createdAt", "desc", "test_user", team_id=None, status_filter=None)
-        mock_count.assert_called_once()
+        mock_list_with_count.assert_called_once_with(
+            1, 10, "createdAt", "desc", "test_user", team_id=None, status_filter=None, include_total=True
+        )
 
-    @patch("todo.services.task_service.TaskRepository.count")
-    @patch("todo.services.task_service.TaskRepository.list")
-    def test_get_tasks_returns_empty_response_when_page_exceeds_range(self, mock_list: Mock, mock_count: Mock):
-        mock_list.return_value = []
-        mock_count.return_value = 50
+    @patch("todo.services.task_service.TaskRepository.list_with_count")
+    def test_get_tasks_returns_empty_response_when_page_exceeds_range(self, mock_list_with_count: Mock):
+        mock_list_with_count.return_value = ([], 50)
 
         response: GetTasksResponse = TaskService.get_tasks(
             page=999, limit=10, sort_by="createdAt", order="desc", user_id="test_user"
@@ -198,9 +220,9 @@ class TaskServiceTests(AuthenticatedMongoTestCase):
             self.assertEqual(len(response.tasks), 0)
             self.assertIsNone(response.links)
 
-    @patch("todo.services.task_service.TaskRepository.list")
-    def test_get_tasks_handles_general_exception(self, mock_list: Mock):
-        mock_list.side_effect = Exception("Test general error")
+    @patch("todo.services.task_service.TaskRepository.list_with_count")
+    def test_get_tasks_handles_general_exception(self, mock_list_with_count: Mock):
+        mock_list_with_count.side_effect = Exception("Test general error")
 
         response = TaskService.get_tasks(page=1, limit=10, sort_by="createdAt", order="desc", user_id="test_user")
 
@@ -208,13 +230,14 @@ class TaskServiceTests(AuthenticatedMongoTestCase):
         self.assertEqual(len(response.tasks), 0)
         self.assertIsNone(response.links)
 
+    @patch("todo.services.task_service.TaskRepository.get_by_id")
     @patch("todo.services.task_service.TaskRepository.create")
     @patch("todo.services.task_service.TaskService.prepare_task_dto")
     @patch("todo.services.task_service.TaskAssignmentService.create_task_assignment")
     @patch("todo.services.task_service.UserRepository.get_by_id")
     @patch("todo.services.task_service.TeamRepository.get_by_id")
     def test_create_task_with_user_assignment_and_team_id(
-        self, mock_team_repo, mock_user_repo, mock_create_assignment, mock_prepare_dto, mock_create
+        self, mock_team_repo, mock_user_repo, mock_create_assignment, mock_prepare_dto, mock_create, mock_get_by_id
     ):
         team_id = str(ObjectId())
         user_id = str(ObjectId())
@@ -237,6 +260,7 @@ class TaskServiceTests(AuthenticatedMongoTestCase):
         mock_task_model.id = ObjectId()
         mock_task_model.createdBy = str(self.user_id)
         mock_create.return_value = mock_task_model
+        mock_get_by_id.return_value = mock_task_model
         mock_task_dto = MagicMock(spec=TaskDTO)
         mock_prepare_dto.return_value = mock_task_dto
 
@@ -256,15 +280,18 @@ class TaskServiceTests(AuthenticatedMongoTestCase):
         self.assertEqual(assignment_call_args.user_type, "user")
         self.assertEqual(assignment_call_args.team_id, team_id)
 
+        # The DTO is built from the task read back with the assignee snapshot
+        mock_get_by_id.assert_called_once_with(str(mock_task_model.id))
         mock_prepare_dto.assert_called_once_with(mock_task_model, str(self.user_id))
         self.assertEqual(result.data, mock_task_dto)
 
+    @patch("todo.services.task_service.TaskRepository.get_by_id")
     @patch("todo.services.task_service.TaskRepository.create")
     @patch("todo.services.task_service.TaskService.prepare_task_dto")
     @patch("todo.services.task_service.TaskAssignmentService.create_task_assignment")
     @patch("todo.services.task_service.UserRepository.get_by_id")
     def test_create_task_with_user_assignment_without_team_id(
-        self, mock_user_repo, mock_create_assignment, mock_prepare_dto, mock_create
+        self, mock_user_repo, mock_create_assignment, mock_prepare_dto, mock_create, mock_get_by_id
     ):
         user_id = str(ObjectId())
 
@@ -285,6 +312,7 @@ class TaskServiceTests(AuthenticatedMongoTestCase):
         mock_task_model.id = ObjectId()
         mock_task_model.createdBy = str(self.user_id)
         mock_create.return_value = mock_task_model
+        mock_get_by_id.return_value = mock_task_model
         mock_task_dto = MagicMock(spec=TaskDTO)
         mock_prepare_dto.return_value = mock_task_dto
 
@@ -328,13 +356,14 @@ class TaskServiceTests(AuthenticatedMongoTestCase):
         self.assertIn(f"Team not found: {team_id}", str(context.exception))
         mock_team_repo.assert_called_once_with(team_id)
 
+    @patch("todo.services.task_service.TaskRepository.get_by_id")
     @patch("todo.services.task_service.TaskRepository.create")
     @patch("todo.services.task_service.TaskService.prepare_task_dto")
     @patch("todo.services.task_service.TaskAssignmentService.create_task_assignment")
     @patch("todo.services.task_service.UserRepository.get_by_id")
     @patch("todo.services.task_service.TeamRepository.get_by_id")
     def test_create_task_passes_team_id_to_assignment_service(
-        self, mock_team_repo, mock_user_repo, mock_create_assignment, mock_prepare_dto, mock_create
+        self, mock_team_repo, mock_user_repo, mock_create_assignment, mock_prepare_dto, mock_create, mock_get_by_id
     ):
         team_id = str(ObjectId())
         user_id = str(ObjectId())
@@ -357,6 +386,7 @@ class TaskServiceTests(AuthenticatedMongoTestCase):
         mock_task_model.id = ObjectId()
         mock_task_model.createdBy = str(self.user_id)
         mock_create.return_value = mock_task_model
+        mock_get_by_id.return_value = mock_task_model
         mock_task_dto = MagicMock(spec=TaskDTO)
         mock_prepare_dto.return_value = mock_task_dto
 
@@ -425,76 +455,99 @@ class TaskServiceTests(AuthenticatedMongoTestCase):
 
 
 class TaskServiceSortingTests(TestCase):
-    @patch("todo.services.task_service.TaskRepository.count")
-    @patch("todo.services.task_service.TaskRepository.list")
-    def test_get_tasks_default_sorting(self, mock_list, mock_count):
-        mock_list.return_value = []
-        mock_count.return_value = 0
+    @patch("todo.services.task_service.TaskRepository.list_with_count")
+    def test_get_tasks_default_sorting(self, mock_list_with_count):
+        mock_list_with_count.return_value = ([], 0)
 
         TaskService.get_tasks(page=1, limit=20, sort_by="createdAt", order="desc", user_id="test_user")
 
-        mock_list.assert_called_once_with(
-            1, 20, SORT_FIELD_CREATED_AT, SORT_ORDER_DESC, "test_user", team_id=None, status_filter=None
+        mock_list_with_count.assert_called_once_with(
+            1,
+            20,
+            SORT_FIELD_CREATED_AT,
+            SORT_ORDER_DESC,
+            "test_user",
+            team_id=None,
+            status_filter=None,
+            include_total=True,
         )
 
-    @patch("todo.services.task_service.TaskRepository.count")
-    @patch("todo.services.task_service.TaskRepository.list")
-    def test_get_tasks_explicit_sort_by_priority(self, mock_list, mock_count):
-        mock_list.return_value = []
-        mock_count.return_value = 0
+    @patch("todo.services.task_service.TaskRepository.list_with_count")
+    def test_get_tasks_explicit_sort_by_priority(self, mock_list_with_count):
+        mock_list_with_count.return_value = ([], 0)
 
         TaskService.get_tasks(page=1, limit=20, sort_by=SORT_FIELD_PRIORITY, order=SORT_ORDER_DESC, user_id="test_user")
 
-        mock_list.assert_called_once_with(
-            1, 20, SORT_FIELD_PRIORITY, SORT_ORDER_DESC, "test_user", team_id=None, status_filter=None
+        mock_list_with_count.assert_called_once_with(
+            1,
+            20,
+            SORT_FIELD_PRIORITY,
+            SORT_ORDER_DESC,
+            "test_user",
+            team_id=None,
+            status_filter=None,
+            include_total=True,
         )
 
-    @patch("todo.services.task_service.TaskRepository.count")
-    @patch("todo.services.task_service.TaskRepository.list")
-    def test_get_tasks_sort_by_due_at_default_order(self, mock_list, mock_count):
-        mock_list.return_value = []
-        mock_count.return_value = 0
+    @patch("todo.services.task_service.TaskRepository.list_with_count")
+    def test_get_tasks_sort_by_due_at_default_order(self, mock_list_with_count):
+        mock_list_with_count.return_value = ([], 0)
 
         TaskService.get_tasks(page=1, limit=20, sort_by=SORT_FIELD_DUE_AT, order="asc", user_id="test_user")
 
-        mock_list.assert_called_once_with(
-            1, 20, SORT_FIELD_DUE_AT, SORT_ORDER_ASC, "test_user", team_id=None, status_filter=None
+        mock_list_with_count.assert_called_once_with(
+            1, 20, SORT_FIELD_DUE_AT, SORT_ORDER_ASC, "test_user", team_id=None, status_filter=None, include_total=True
         )
 
-    @patch("todo.services.task_service.TaskRepository.count")
-    @patch("todo.services.task_service.TaskRepository.list")
-    def test_get_tasks_sort_by_priority_default_order(self, mock_list, mock_count):
-        mock_list.return_value = []
-        mock_count.return_value = 0
+    @patch("todo.services.task_service.TaskRepository.list_with_count")
+    def test_get_tasks_sort_by_priority_default_order(self, mock_list_with_count):
+        mock_list_with_count.return_value = ([], 0)
 
         TaskService.get_tasks(page=1, limit=20, sort_by=SORT_FIELD_PRIORITY, order="desc", user_id="test_user")
 
-        mock_list.assert_called_once_with(
-            1, 20, SORT_FIELD_PRIORITY, SORT_ORDER_DESC, "test_user", team_id=None, status_filter=None
+        mock_list_with_count.assert_called_once_with(
+            1,
+            20,
+            SORT_FIELD_PRIORITY,
+            SORT_ORDER_DESC,
+            "test_user",
+            team_id=None,
+            status_filter=None,
+            include_total=True,
         )
 
-    @patch("todo.services.task_service.TaskRepository.count")
-    @patch("todo.services.task_service.TaskRepository.list")
-    def test_get_tasks_sort_by_assignee_default_order(self, mock_list, mock_count):
-        mock_list.return_value = []
-        mock_count.return_value = 0
+    @patch("todo.services.task_service.TaskRepository.list_with_count")
+    def test_get_tasks_sort_by_assignee_default_order(self, mock_list_with_count):
+        mock_list_with_count.return_value = ([], 0)
 
         TaskService.get_tasks(page=1, limit=20, sort_by=SORT_FIELD_ASSIGNEE, order="asc", user_id="test_user")
 
-        mock_list.assert_called_once_with(
-            1, 20, SORT_FIELD_ASSIGNEE, SORT_ORDER_ASC, "test_user", team_id=None, status_filter=None
+        mock_list_with_count.assert_called_once_with(
+            1,
+            20,
+            SORT_FIELD_ASSIGNEE,
+            SORT_ORDER_ASC,
+            "test_user",
+            team_id=None,
+            status_filter=None,
+            include_total=True,
         )
 
-    @patch("todo.services.task_service.TaskRepository.count")
-    @patch("todo.services.task_service.TaskRepository.list")
-    def test_get_tasks_sort_by_created_at_default_order(self, mock_list, mock_count):
-        mock_list.return_value = []
-        mock_count.return_value = 0
+    @patch("todo.services.task_service.TaskRepository.list_with_count")
+    def test_get_tasks_sort_by_created_at_default_order(self, mock_list_with_count):
+        mock_list_with_count.return_value = ([], 0)
 
         TaskService.get_tasks(page=1, limit=20, sort_by=SORT_FIELD_CREATED_AT, order="desc", user_id="test_user")
 
-        mock_list.assert_called_once_with(
-            1, 20, SORT_FIELD_CREATED_AT, SORT_ORDER_DESC, "test_user", team_id=None, status_filter=None
+        mock_list_with_count.assert_called_once_with(
+            1,
+            20,
+            SORT_FIELD_CREATED_AT,
+            SORT_ORDER_DESC,
+            "test_user",
+            team_id=None,
+            status_filter=None,
+            include_total=True,
         )
 
     @patch("todo.services.task_service.reverse_lazy", return_value="/v1/tasks")
@@ -511,21 +564,20 @@ class TaskServiceSortingTests(TestCase):
         expected_url = "/v1/tasks?page=1&limit=20&sort_by=dueAt&order=asc"
         self.assertEqual(url, expected_url)
 
-    @patch("todo.services.task_service.TaskRepository.count")
-    @patch("todo.services.task_service.TaskRepository.list")
-    def test_get_tasks_pagination_links_preserve_sort_params(self, mock_list, mock_count):
+    @patch("todo.services.task_service.TaskRepository.list_with_count")
+    def test_get_tasks_pagination_links_preserve_sort_params(self, mock_list_with_count):
         """Test that pagination links preserve sort parameters"""
         from todo.tests.fixtures.task import tasks_models
 
         mock_user = MagicMock()
+        mock_user.id = tasks_models[0].createdBy
         mock_user.name = "Test User"
 
-        mock_list.return_value = [tasks_models[0]]
-        mock_count.return_value = 3
+        mock_list_with_count.return_value = ([tasks_models[0]], 3)
 
         with (
             patch("todo.services.task_service.LabelRepository.list_by_ids", return_value=[]),
-            patch("todo.services.task_service.UserRepository.get_by_id", return_value=mock_user),
+            patch("todo.services.task_service.UserRepository.get_by_ids", return_value=[mock_user]),
             patch("todo.services.task_service.reverse_lazy", return_value="/v1/tasks"),
         ):
             response = TaskService.get_tasks(
@@ -539,6 +591,205 @@ class TaskServiceSortingTests(TestCase):
             self.assertIn("order=desc", response.links.prev)
 
 
+class TaskServiceCursorTests(TestCase):
+    def setUp(self):
+        self.task_dto = MagicMock(spec=TaskDTO)
+        self.patcher_prepare = patch(
+            "todo.services.task_service.TaskService.prepare_task_dtos", return_value=[self.task_dto]
+        )
+        self.patcher_prepare.start()
+        self.patcher_reverse = patch("todo.services.task_service.reverse_lazy", return_value="/v1/tasks")
+        self.patcher_reverse.start()
+
+    def tearDown(self):
+        self.patcher_prepare.stop()
+        self.patcher_reverse.stop()
+
+    @patch("todo.services.task_service.TaskRepository.list_with_count")
+    @patch("todo.services.task_service.TaskRepository.list_after")
+    def test_empty_cursor_returns_first_page_without_counting(self, mock_list_after, mock_list_with_count):
+        last_id = ObjectId()
+        mock_list_after.return_value = ([tasks_models[0]], (None, last_id))
+
+        response = TaskService.get_tasks(
+            page=1, limit=1, sort_by=SORT_FIELD_DUE_AT, order=SORT_ORDER_ASC, user_id="test_user", cursor=""
+        )
+
+        mock_list_with_count.assert_not_called()
+        mock_list_after.assert_called_once_with(
+            1, SORT_FIELD_DUE_AT, SORT_ORDER_ASC, "test_user", team_id=None, status_filter=None, after=None
+        )
+        self.assertEqual(response.tasks, [self.task_dto])
+        self.assertIsNone(response.links.prev)
+        self.assertIn("cursor=", response.links.next)
+        self.assertIn("sort_by=dueAt", response.links.next)
+
+        next_cursor = parse_qs(urlparse(response.links.next).query)["cursor"][0]
+        decoded = decode_cursor(next_cursor)
+        self.assertEqual(decoded.last_id, last_id)
+        self.assertIsNone(decoded.value)
+
+    @patch("todo.services.task_service.TaskRepository.list_after")
+    def test_cursor_is_passed_to_repository_as_seek_position(self, mock_list_after):
+        last_id = ObjectId()
+        cursor = TaskCursor(SORT_FIELD_PRIORITY, SORT_ORDER_DESC, 2, last_id)
+        mock_list_after.return_value = ([tasks_models[0]], None)
+
+        response = TaskService.get_tasks(
+            page=1,
+            limit=10,
+            sort_by=SORT_FIELD_PRIORITY,
+            order=SORT_ORDER_DESC,
+            user_id="test_user",
+            status_filter="DONE",
+            cursor=cursor,
+        )
+
+        self.assertEqual(mock_list_after.call_args.kwargs["after"], (2, last_id))
+        self.assertEqual(mock_list_after.call_args.kwargs["status_filter"], "DONE")
+        self.assertIsNone(response.links.next)
+
+    @patch("todo.services.task_service.TaskRepository.list_after")
+    def test_next_link_keeps_filters(self, mock_list_after):
+        mock_list_after.return_value = ([tasks_models[0]], (1, ObjectId()))
+
+        with patch("todo.services.task_service.TeamRepository.is_user_team_member", return_value=True):
+            response = TaskService.get_tasks(
+                page=1,
+                limit=10,
+                sort_by=SORT_FIELD_PRIORITY,
+                order=SORT_ORDER_DESC,
+                user_id="test_user",
+                team_id="team-1",
+                status_filter="DONE",
+                cursor="",
+            )
+
+        self.assertIn("teamId=team-1", response.links.next)
+        self.assertIn("status=DONE", response.links.next)
+
+
+class TaskServiceBatchHydrationTests(TestCase):
+    def setUp(self):
+        self.user_id = str(ObjectId())
+        self.team_id = ObjectId()
+        self.label_id = ObjectId()
+
+        self.mock_user = MagicMock()
+        self.mock_user.id = self.user_id
+        self.mock_user.name = "Test User"
+        self.mock_team = MagicMock()
+        self.mock_team.id = self.team_id
+        self.mock_team.name = "Test Team"
+        self.mock_label = LabelModel(
+            _id=self.label_id,
+            name="Label",
+            color="#fff",
+            createdAt=datetime.now(timezone.utc),
+            createdBy=self.user_id,
+        )
+
+    def _build_tasks(self, count: int) -> list[TaskModel]:
+        return [
+            TaskModel(
+                _id=ObjectId(),
+                displayId=f"#{index}",
+                title=f"Task {index}",
+                labels=[self.label_id],
+                assignee=TaskAssigneeModel(
+                    assignment_id=str(ObjectId()),
+                    id=str(self.team_id) if index % 2 else self.user_id,
+                    type="team" if index % 2 else "user",
+                    name="Test Team" if index % 2 else "Test User",
+                    created_by=self.user_id,
+                    created_at=datetime.now(timezone.utc),
+                ),
+                createdAt=datetime.now(timezone.utc),
+                createdBy=self.user_id,
+                updatedBy=self.user_id,
+            )
+            for index in range(count)
+        ]
+
+    def _hydrate(self, tasks: list[TaskModel]) -> tuple[list[TaskDTO], dict[str, Mock]]:
+        mocks = {}
+        with (
+            patch("todo.services.task_service.UserRepository.get_by_ids", return_value=[self.mock_user]) as mocks[
+                "users"
+            ],
+            patch("todo.services.task_service.LabelRepository.list_by_ids", return_value=[self.mock_label]) as mocks[
+                "labels"
+            ],
+            patch("todo.services.task_service.WatchlistRepository.get_by_user_and_task_ids", return_value=[]) as mocks[
+                "watchlist"
+            ],
+            patch("todo.services.task_service.TaskAssignmentRepository.get_by_task_ids") as mocks["assignments"],
+            patch("todo.services.task_service.TaskAssignmentRepository.get_by_task_id") as mocks["assignment"],
+            patch("todo.services.task_service.TeamRepository.get_by_ids") as mocks["teams"],
+            patch("todo.services.task_service.UserRepository.get_by_id") as mocks["user"],
+            patch("todo.services.task_service.TeamRepository.get_by_id") as mocks["team"],
+            patch("todo.services.task_service.WatchlistRepository.get_by_user_and_task") as mocks["watchlist_entry"],
+        ):
+            task_dtos = TaskService.prepare_task_dtos(tasks, self.user_id)
+        return task_dtos, mocks
+
+    def test_prepare_task_dtos_query_count_is_independent_of_page_size(self):
+        for page_size in (1, 50, 200):
+            task_dtos, mocks = self._hydrate(self._build_tasks(page_size))
+
+            self.assertEqual(len(task_dtos), page_size)
+            for batch_query in ("users", "labels", "watchlist"):
+                self.assertEqual(mocks[batch_query].call_count, 1)
+            for single_query in ("assignments", "assignment", "teams", "user", "team", "watchlist_entry"):
+                mocks[single_query].assert_not_called()
+
+    def test_prepare_task_dtos_maps_related_entities(self):
+        tasks = self._build_tasks(2)
+
+        task_dtos, _ = self._hydrate(tasks)
+
+        self.assertEqual(task_dtos[0].id, str(tasks[0].id))
+        self.assertEqual(task_dtos[0].createdBy.name, "Test User")
+        self.assertEqual(task_dtos[0].labels[0].name, "Label")
+        self.assertEqual(task_dtos[0].assignee.assignee_name, "Test User")
+        self.assertEqual(task_dtos[0].assignee.id, tasks[0].assignee.assignment_id)
+        self.assertEqual(task_dtos[1].assignee.assignee_name, "Test Team")
+        self.assertEqual(task_dtos[1].assignee.user_type, "team")
+
+    def test_prepare_task_dtos_omits_assignee_that_no_longer_exists(self):
+        tasks = self._build_tasks(1)
+        tasks[0].assignee.name = None
+
+        task_dtos, _ = self._hydrate(tasks)
+
+        self.assertIsNone(task_dtos[0].assignee)
+
+    def test_prepare_task_dtos_shows_status_of_task_whose_deferral_ended(self):
+        tasks = self._build_tasks(2)
+        for task, deferred_till in zip(tasks, (timedelta(hours=-1), timedelta(hours=1))):
+            task.status = TaskStatus.IN_PROGRESS
+            task.effectiveStatus = TaskStatus.DEFERRED
+            task.deferredDetails = DeferredDetailsModel(
+                deferredAt=datetime.now(timezone.utc) - timedelta(days=1),
+                deferredTill=datetime.now(timezone.utc) + deferred_till,
+                deferredBy=self.user_id,
+            )
+
+        task_dtos, _ = self._hydrate(tasks)
+
+        self.assertEqual(task_dtos[0].status, TaskStatus.IN_PROGRESS)
+        self.assertEqual(task_dtos[1].status, TaskStatus.DEFERRED)
+
+    def test_prepare_task_dtos_raises_when_creator_missing(self):
+        with (
+            patch("todo.services.task_service.UserRepository.get_by_ids", return_value=[]),
+            patch("todo.services.task_service.LabelRepository.list_by_ids", return_value=[]),
+            patch("todo.services.task_service.WatchlistRepository.get_by_user_and_task_ids", return_value=[]),
+        ):
+            with self.assertRaises(UserNotFoundException):
+                TaskService.prepare_task_dtos(self._build_tasks(1), self.user_id)
+
+
 class TaskServiceUpdateTests(TestCase):
     def setUp(self):
         self.task_id_str = str(ObjectId())
@@ -787,39 +1038,39 @@ def test_update_task_success_full_payload(
 
     @patch("todo.services.task_service.TaskRepository.get_by_id")
     @patch("todo.services.task_service.TaskRepository.update")
-    @patch("todo.services.task_service.TaskRepository._get_assigned_task_ids_for_user")
+    @patch("todo.services.task_service.TaskRepository.is_task_visible_to_user")
     def test_update_task_permission_denied_if_not_creator_or_assignee(
-        self, mock_get_assigned, mock_update, mock_get_by_id
+        self, mock_is_visible, mock_update, mock_get_by_id
     ):
         task_id = self.task_id_str
         user_id = "not_creator_or_assignee"
         task_model = self.default_task_model.model_copy(deep=True)
         task_model.createdBy = "some_other_user"
         mock_get_by_id.return_value = task_model
-        mock_get_assigned.return_value = []
+        mock_is_visible.return_value = False
         validated_data = {"title": "new title"}
         with self.assertRaises(PermissionError) as context:
             TaskService.update_task(task_id, validated_data, user_id)
         self.assertEqual(str(context.exception), ApiErrors.UNAUTHORIZED_TITLE)
         mock_get_by_id.assert_called_once_with(task_id)
-        mock_get_assigned.assert_called_once_with(user_id)
+        mock_is_visible.assert_called_once_with(task_model.id, user_id)
         mock_update.assert_not_called()
 
     @patch("todo.services.task_service.TaskRepository.get_by_id")
     @patch("todo.services.task_service.TaskRepository.update")
-    @patch("todo.services.task_service.TaskRepository._get_assigned_task_ids_for_user")
-    def test_update_task_permission_allowed_if_assignee(self, mock_get_assigned, mock_update, mock_get_by_id):
+    @patch("todo.services.task_service.TaskRepository.is_task_visible_to_user")
+    def test_update_task_permission_allowed_if_assignee(self, mock_is_visible, mock_update, mock_get_by_id):
         task_id = self.task_id_str
         user_id = "assignee_user"
         task_model = self.default_task_model.model_copy(deep=True)
         task_model.createdBy = "some_other_user"
         mock_get_by_id.return_value = task_model
-        mock_get_assigned.return_value = [task_model.id]
+        mock_is_visible.return_value = True
         mock_update.return_value = task_model
         validated_data = {"title": "new title"}
         TaskService.update_task(task_id, validated_data, user_id)
         mock_get_by_id.assert_called_once_with(task_id)
-        mock_get_assigned.assert_called_once_with(user_id)
+        mock_is_visible.assert_called_once_with(task_model.id, user_id)
         mock_update.assert_called_once()
 
 
@@ -848,7 +1099,16 @@ class TaskServiceUpdateWithAssigneeTests(TestCase):
         self, mock_prepare_dto, mock_user_get_by_id, mock_update_assignment, mock_repo_update, mock_repo_get_by_id
     ):
         mock_user_get_by_id.return_value = MagicMock()
-        mock_repo_get_by_id.return_value = self.default_task_model
+        reassigned_task_model = self.default_task_model.model_copy(deep=True)
+        reassigned_task_model.assignee = TaskAssigneeModel(
+            assignment_id=str(ObjectId()),
+            id=self.assignee_id_str,
+            type="user",
+            name="Assignee",
+            created_by=self.user_id_str,
+            created_at=datetime.now(timezone.utc),
+        )
+        mock_repo_get_by_id.side_effect = [self.default_task_model, reassigned_task_model]
 
         updated_task_model = self.default_task_model.model_copy(deep=True)
         updated_task_model.title = "Updated Title"
@@ -870,11 +1130,12 @@ class TaskServiceUpdateWithAssigneeTests(TestCase):
 
         result_dto = TaskService.update_task_with_assignee(self.task_id_str, dto, self.user_id_str)
 
-        mock_repo_get_by_id.assert_called_once_with(self.task_id_str)
+        self.assertEqual(mock_repo_get_by_id.call_args_list, [call(self.task_id_str), call(self.task_id_str)])
         mock_user_get_by_id.assert_called_once_with(self.assignee_id_str)
         mock_repo_update.assert_called_once()
         mock_update_assignment.assert_called_once_with(self.task_id_str, self.assignee_id_str, "user", self.user_id_str)
-        mock_prepare_dto.assert_called_once_with(updated_task_model, self.user_id_str)
+        # The DTO is built from the task read back with the assignee snapshot
+        mock_prepare_dto.assert_called_once_with(reassigned_task_model, self.user_id_str)
 
         self.assertEqual(result_dto, mock_dto_response)
 
@@ -924,12 +1185,12 @@ class TaskServiceUpdateWithAssigneeTests(TestCase):
         self.assertEqual(str(context.exception), ApiErrors.TASK_NOT_FOUND.format(self.task_id_str))
 
     @patch("todo.services.task_service.TaskRepository.get_by_id")
-    @patch("todo.services.task_service.TaskRepository._get_assigned_task_ids_for_user")
-    def test_update_task_with_assignee_permission_denied(self, mock_get_assigned, mock_repo_get_by_id):
+    @patch("todo.services.task_service.TaskRepository.is_task_visible_to_user")
+    def test_update_task_with_assignee_permission_denied(self, mock_is_visible, mock_repo_get_by_id):
         task_model = self.default_task_model.model_copy(deep=True)
         task_model.createdBy = "different_user"
         mock_repo_get_by_id.return_value = task_model
-        mock_get_assigned.return_value = []
+        mock_is_visible.return_value = False
 
         dto = CreateTaskDTO(title="Updated Title", createdBy=self.user_id_str)
 
@@ -1027,7 +1288,16 @@ class TaskServiceUpdateWithAssigneeFromDictTests(TestCase):
         self, mock_prepare_dto, mock_user_get_by_id, mock_update_assignment, mock_repo_update, mock_repo_get_by_id
     ):
         mock_user_get_by_id.return_value = MagicMock()
-        mock_repo_get_by_id.return_value = self.default_task_model
+        reassigned_task_model = self.default_task_model.model_copy(deep=True)
+        reassigned_task_model.assignee = TaskAssigneeModel(
+            assignment_id=str(ObjectId()),
+            id=self.assignee_id_str,
+            type="user",
+            name="Assignee",
+            created_by=self.user_id_str,
+            created_at=datetime.now(timezone.utc),
+        )
+        mock_repo_get_by_id.side_effect = [self.default_task_model, reassigned_task_model]
 
         updated_task_model = self.default_task_model.model_copy(deep=True)
         updated_task_model.title = "Updated Title"
@@ -1048,11 +1318,12 @@ class TaskServiceUpdateWithAssigneeFromDictTests(TestCase):
 
         result_dto = TaskService.update_task_with_assignee_from_dict(self.task_id_str, validated_data, self.user_id_str)
 
-        mock_repo_get_by_id.assert_called_once_with(self.task_id_str)
+        self.assertEqual(mock_repo_get_by_id.call_args_list, [call(self.task_id_str), call(self.task_id_str)])
         mock_user_get_by_id.assert_called_once_with(self.assignee_id_str)
         mock_repo_update.assert_called_once()
         mock_update_assignment.assert_called_once_with(self.task_id_str, self.assignee_id_str, "user", self.user_id_str)
-        mock_prepare_dto.assert_called_once_with(updated_task_model, self.user_id_str)
+        # The DTO is built from the task read back with the assignee snapshot
+        mock_prepare_dto.assert_called_once_with(reassigned_task_model, self.user_id_str)
 
         self.assertEqual(result_dto, mock_dto_response)
 
@@ -1155,6 +1426,7 @@ class TaskServiceDeferTests(TestCase):
         self.assertEqual(update_call_args[0], self.task_id)
         update_payload = update_call_args[1]
         self.assertEqual(update_payload["updatedBy"], self.user_id)
+        self.assertEqual(update_payload["effectiveStatus"], TaskStatus.DEFERRED.value)
         self.assertIn("deferredDetails", update_payload)
         self.assertEqual(update_payload["deferredDetails"]["deferredTill"], deferred_till)
 
@@ -1230,29 +1502,29 @@ class TaskServiceDeferTests(TestCase):
 
     @patch("todo.services.task_service.TaskRepository.get_by_id")
     @patch("todo.services.task_service.TaskRepository.update")
-    @patch("todo.services.task_service.TaskRepository._get_assigned_task_ids_for_user")
+    @patch("todo.services.task_service.TaskRepository.is_task_visible_to_user")
     def test_defer_task_permission_denied_if_not_creator_or_assignee(
-        self, mock_get_assigned, mock_update, mock_get_by_id
+        self, mock_is_visible, mock_update, mock_get_by_id
     ):
         task_id = self.task_id
         user_id = "not_creator_or_assignee"
         task_model = self.task_model
         task_model.createdBy = "some_other_user"
         mock_get_by_id.return_value = task_model
-        mock_get_assigned.return_value = []
+        mock_is_visible.return_value = False
         deferred_till = self.current_time + timedelta(days=5)
         with self.assertRaises(PermissionError) as context:
             TaskService.defer_task(task_id, deferred_till, user_id)
         self.assertEqual(str(context.exception), ApiErrors.UNAUTHORIZED_TITLE)
         mock_get_by_id.assert_called_once_with(task_id)
-        mock_get_assigned.assert_called_once_with(user_id)
+        mock_is_visible.assert_called_once_with(task_model.id, user_id)
         mock_update.assert_not_called()
 
     @patch("todo.services.task_service.TaskRepository.get_by_id")
-    @patch("todo.services.task_service.TaskRepository._get_assigned_task_ids_for_user")
+    @patch("todo.services.task_service.TaskRepository.is_task_visible_to_user")
     @patch("todo.services.task_service.TaskRepository.delete_by_id")
     def test_delete_task_permission_denied_if_not_creator_or_assignee(
-        self, mock_delete_by_id, mock_get_assigned, mock_get_by_id
+        self, mock_delete_by_id, mock_is_visible, mock_get_by_id
     ):
         task_id = str(ObjectId())
         user_id = "not_creator_or_assignee"
@@ -1260,11 +1532,243 @@ class TaskServiceDeferTests(TestCase):
         task_model.createdBy = "some_other_user"
         task_model.id = ObjectId(task_id)
         mock_get_by_id.return_value = task_model
-        mock_get_assigned.return_value = []
+        mock_is_visible.return_value = False
         mock_delete_by_id.side_effect = PermissionError(ApiErrors.UNAUTHORIZED_TITLE)
         with self.assertRaises(PermissionError) as context:
             TaskService.delete_task(task_id, user_id)
         self.assertEqual(str(context.exception), ApiErrors.UNAUTHORIZED_TITLE)
         mock_get_by_id.assert_not_called()
-        mock_get_assigned.assert_not_called()
+        mock_is_visible.assert_not_called()
         mock_delete_by_id.assert_called_once_with(task_id, user_id)
+
+
+class TaskServiceBulkTests(TestCase):
+    def setUp(self):
+        self.user_id = str(ObjectId())
+        self.team_id = str(ObjectId())
+
+    def _task(self, **overrides) -> TaskModel:
+        data = {
+            "id": ObjectId(),
+            "displayId": "#1",
+            "title": "Bulk task",
+            "priority": TaskPriority.LOW,
+            "status": TaskStatus.TODO,
+            "createdAt": datetime.now(timezone.utc),
+            "createdBy": self.user_id,
+        }
+        data.update(overrides)
+        return TaskModel(**data)
+
+    @patch("todo.services.task_service.TaskService.prepare_task_dtos")
+    @patch("todo.services.task_service.AuditLogRepository.create_many")
+    @patch("todo.services.task_service.TaskAssignmentRepository.create_many")
+    @patch("todo.services.task_service.TaskRepository.get_by_ids")
+    @patch("todo.services.task_service.TaskRepository.create_many")
+    @patch("todo.services.task_service.LabelRepository.list_by_ids", return_value=[])
+    @patch("todo.services.task_service.TeamRepository.get_by_ids")
+    @patch("todo.services.task_service.UserRepository.get_by_ids", return_value=[])
+    def test_bulk_create_tasks_reports_missing_references_and_creates_the_rest(
+        self,
+        mock_get_users,
+        mock_get_teams,
+        mock_list_labels,
+        mock_create_many,
+        mock_get_tasks,
+        mock_create_assignments,
+        mock_create_audit_logs,
+        mock_prepare_task_dtos,
+    ):
+        mock_get_teams.return_value = [Mock(id=ObjectId(self.team_id))]
+        created_task = self._task()
+        mock_create_many.return_value = [created_task]
+        mock_get_tasks.return_value = [created_task]
+        task_dto = Mock(spec=TaskDTO, id=str(created_task.id))
+        mock_prepare_task_dtos.return_value = [task_dto]
+        missing_user_id = str(ObjectId())
+        dtos = {
+            0: CreateTaskDTO(
+                title="Assigned to a missing user",
+                assignee={"assignee_id": missing_user_id, "user_type": "user"},
+                createdBy=self.user_id,
+            ),
+            1: CreateTaskDTO(
+                title="Assigned to a team",
+                assignee={"assignee_id": self.team_id, "user_type": "team"},
+                createdBy=self.user_id,
+            ),
+        }
+
+        with patch("todo.services.task_service.BulkTaskResult.model_validate", side_effect=lambda value: value):
+            results = {result.index: result for result in TaskService.bulk_create_tasks(dtos, self.user_id)}
+
+        mock_get_users.assert_called_once_with([missing_user_id])
+        mock_get_teams.assert_called_once_with([self.team_id])
+        self.assertEqual(results[0].statusCode, 404)
+        self.assertEqual(results[0].errors[0].detail, ApiErrors.USER_NOT_FOUND.format(missing_user_id))
+        self.assertEqual(results[1].statusCode, 201)
+        self.assertEqual(len(mock_create_many.call_args[0][0]), 1)
+        assignment = mock_create_assignments.call_args[0][0][0]
+        self.assertEqual(str(assignment.assignee_id), self.team_id)
+        self.assertEqual(mock_create_audit_logs.call_args[0][0][0].action, "assigned_to_team")
+
+    @patch("todo.services.task_service.LabelRepository.list_by_ids", return_value=[])
+    @patch("todo.services.task_service.TeamRepository.get_by_ids", return_value=[])
+    @patch("todo.services.task_service.UserRepository.get_by_ids", return_value=[])
+    @patch("todo.services.task_service.TaskRepository.create_many", side_effect=ValueError("insert failed"))
+    def test_bulk_create_tasks_reports_server_error_for_every_task_when_insert_fails(self, *mocks):
+        dtos = {
+            0: CreateTaskDTO(title="First", createdBy=self.user_id),
+            1: CreateTaskDTO(title="Second", createdBy=self.user_id),
+        }
+
+        results = TaskService.bulk_create_tasks(dtos, self.user_id)
+
+        self.assertEqual(sorted(result.index for result in results), [0, 1])
+        self.assertTrue(all(result.statusCode == 500 for result in results))
+
+    @patch("todo.services.task_service.TaskAssignmentRepository.create_many", side_effect=ValueError("write failed"))
+    @patch("todo.services.task_service.TaskRepository.create_many")
+    @patch("todo.services.task_service.LabelRepository.list_by_ids", return_value=[])
+    @patch("todo.services.task_service.TeamRepository.get_by_ids")
+    @patch("todo.services.task_service.UserRepository.get_by_ids", return_value=[])
+    def test_bulk_create_tasks_reports_created_tasks_when_assignment_write_fails(
+        self, mock_get_users, mock_get_teams, mock_list_labels, mock_create_many, mock_create_assignments
+    ):
+        mock_get_teams.return_value = [Mock(id=ObjectId(self.team_id))]
+        task_id = ObjectId()
+
+        def create_many(tasks):
+            for task in tasks:
+                task.id = task_id
+            return tasks
+
+        mock_create_many.side_effect = create_many
+        dtos = {
+            0: CreateTaskDTO(
+                title="Assigned to a team",
+                assignee={"assignee_id": self.team_id, "user_type": "team"},
+                createdBy=self.user_id,
+            )
+        }
+
+        results = TaskService.bulk_create_tasks(dtos, self.user_id)
+
+        self.assertEqual(len(results), 1)
+        self.assertEqual((results[0].statusCode, results[0].id), (201, str(task_id)))
+        self.assertIsNone(results[0].data)
+        self.assertIn(str(task_id), results[0].errors[0].detail)
+        response = BulkTaskResponse.from_results(results, 201)
+        self.assertEqual((response.statusCode, response.succeeded, response.failed), (207, 1, 0))
+
+    @patch("todo.services.task_service.TaskService.prepare_task_dtos", return_value=[])
+    @patch("todo.services.task_service.AuditLogRepository.create_many")
+    @patch("todo.services.task_service.TaskRepository.update_many", return_value={})
+    @patch("todo.services.task_service.TaskVisibilityRepository.get_task_ids_for_user", return_value=[])
+    @patch("todo.services.task_service.TaskRepository.get_by_ids")
+    def test_bulk_update_tasks_reports_duplicate_missing_and_forbidden_tasks(
+        self, mock_get_tasks, mock_get_visible_ids, mock_update_many, mock_create_audit_logs, mock_prepare_task_dtos
+    ):
+        own_task = self._task()
+        other_task = self._task(createdBy=str(ObjectId()))
+        mock_get_tasks.return_value = [own_task, other_task]
+        missing_task_id = str(ObjectId())
+        updates = {
+            0: {"id": str(own_task.id)},
+            1: {"id": str(own_task.id)},
+            2: {"id": missing_task_id},
+            3: {"id": str(other_task.id)},
+        }
+
+        results = {result.index: result for result in TaskService.bulk_update_tasks(updates, self.user_id)}
+
+        self.assertEqual(
+            {index: result.statusCode for index, result in results.items() if index}, {1: 400, 2: 404, 3: 403}
+        )
+        self.assertEqual(results[2].errors[0].detail, ApiErrors.TASK_NOT_FOUND.format(missing_task_id))
+        mock_get_visible_ids.assert_called_once_with(self.user_id, [str(other_task.id)])
+        mock_update_many.assert_called_once_with({})
+        mock_create_audit_logs.assert_called_once_with([])
+
+    @patch("todo.services.task_service.TaskService.prepare_task_dtos")
+    @patch("todo.services.task_service.AuditLogRepository.create_many")
+    @patch("todo.services.task_service.TaskRepository.update_many")
+    @patch("todo.services.task_service.TaskRepository.get_by_ids")
+    def test_bulk_update_tasks_audits_status_changes_in_one_insert(
+        self, mock_get_tasks, mock_update_many, mock_create_audit_logs, mock_prepare_task_dtos
+    ):
+        task = self._task()
+        updated_task = self._task(id=task.id, status=TaskStatus.DONE)
+        mock_get_tasks.return_value = [task]
+        mock_update_many.return_value = {str(task.id): updated_task}
+        mock_prepare_task_dtos.return_value = [Mock(spec=TaskDTO)]
+
+        with patch("todo.services.task_service.BulkTaskResult.model_validate", side_effect=lambda value: value):
+            results = TaskService.bulk_update_tasks(
+                {0: {"id": str(task.id), "status": TaskStatus.DONE.value}}, self.user_id
+            )
+
+        payload = mock_update_many.call_args[0][0][str(task.id)]
+        self.assertEqual(payload["status"], TaskStatus.DONE.value)
+        self.assertEqual(payload["updatedBy"], self.user_id)
+        audit_log = mock_create_audit_logs.call_args[0][0][0]
+        self.assertEqual(
+            (audit_log.action, audit_log.status_from, audit_log.status_to), ("status_changed", "TODO", "DONE")
+        )
+        mock_prepare_task_dtos.assert_called_once_with([updated_task], self.user_id)
+        self.assertEqual(results[0].statusCode, 200)
+
+    @patch("todo.services.task_service.TaskService.prepare_task_dtos", return_value=[])
+    @patch("todo.services.task_service.AuditLogRepository.create_many")
+    @patch("todo.services.task_service.TaskRepository.update_many", return_value={})
+    @patch("todo.services.task_service.TaskRepository.get_by_ids")
+    def test_bulk_update_to_in_progress_stamps_started_at_and_ends_deferral(
+        self, mock_get_tasks, mock_update_many, mock_create_audit_logs, mock_prepare_task_dtos
+    ):
+        deferred_task = self._task(
+            deferredDetails=DeferredDetailsModel(
+                deferredAt=datetime.now(timezone.utc),
+                deferredTill=datetime.now(timezone.utc) + timedelta(days=1),
+                deferredBy=self.user_id,
+            )
+        )
+        started_at = datetime(2025, 1, 1, tzinfo=timezone.utc)
+        started_task = self._task(status=TaskStatus.IN_PROGRESS, startedAt=started_at)
+        mock_get_tasks.return_value = [deferred_task, started_task]
+
+        TaskService.bulk_update_tasks(
+            {
+                0: {"id": str(deferred_task.id), "status": TaskStatus.IN_PROGRESS.value},
+                1: {"id": str(started_task.id), "status": TaskStatus.IN_PROGRESS.value},
+            },
+            self.user_id,
+        )
+
+        payloads = mock_update_many.call_args[0][0]
+        deferred_payload = payloads[str(deferred_task.id)]
+        self.assertEqual(deferred_payload["status"], TaskStatus.IN_PROGRESS.value)
+        self.assertIsInstance(deferred_payload["startedAt"], datetime)
+        self.assertIsNone(deferred_payload["deferredDetails"])
+        self.assertNotIn("startedAt", payloads[str(started_task.id)])
+
+    @patch("todo.services.task_service.TaskService.prepare_task_dtos", return_value=[])
+    @patch("todo.services.task_service.AuditLogRepository.create_many")
+    @patch("todo.services.task_service.TaskRepository.update_many", return_value={})
+    @patch("todo.services.task_service.TaskRepository.get_by_ids")
+    def test_bulk_update_to_deferred_keeps_status_like_single_update(
+        self, mock_get_tasks, mock_update_many, mock_create_audit_logs, mock_prepare_task_dtos
+    ):
+        task = self._task(status=TaskStatus.IN_PROGRESS)
+        mock_get_tasks.return_value = [task]
+        update = {"status": TaskStatus.DEFERRED.value, "title": "Renamed"}
+
+        TaskService.bulk_update_tasks({0: {"id": str(task.id), **update}}, self.user_id)
+
+        payload = mock_update_many.call_args[0][0][str(task.id)]
+        self.assertEqual(
+            {key: value for key, value in payload.items() if key != "updatedBy"},
+            TaskService._build_task_update_payload(task, update),
+        )
+        self.assertEqual(payload["status"], TaskStatus.IN_PROGRESS.value)
+        self.assertNotIn("deferredDetails", payload)
+        mock_create_audit_logs.assert_called_once_with([])
@@ -1,6 +1,7 @@
 from unittest import TestCase
 from unittest.mock import patch
 from datetime import datetime, timezone
+from django.test import override_settings
 
 from todo.constants.messages import ApiErrors
 from todo.exceptions.team_exceptions import (
@@ -15,6 +16,10 @@ from todo.models.common.pyobjectid import PyObjectId
 from todo.dto.user_dto import UserDTO
 from todo.dto.team_dto import TeamDTO
 from todo.constants.role import RoleName, RoleScope
+from todo.models.user_role import UserRoleModel
+from todo.repositories.team_repository import TeamRepository
+from todo.services.user_role_service import UserRoleService
+from todo.utils.team_claims import reset_request_team_roles, set_request_team_roles
 
 
 class TeamServiceTests(TestCase):
@@ -74,13 +79,13 @@ class TeamServiceTests(TestCase):
             updated_at=datetime.now(timezone.utc),
         )
 
-    @patch("todo.services.team_service.TeamRepository.get_by_id")
-    @patch("todo.services.team_service.UserTeamDetailsRepository.get_by_user_id")
-    def test_get_user_teams_success(self, mock_get_by_user_id, mock_get_team_by_id):
+    @patch("todo.services.team_service.TeamRepository.get_by_ids")
+    @patch("todo.services.team_service.UserTeamDetailsRepository.get_team_ids_by_user_id")
+    def test_get_user_teams_success(self, mock_get_team_ids, mock_get_teams_by_ids):
         """Test successful retrieval of user teams"""
         # Mock repository responses
-        mock_get_by_user_id.return_value = [self.user_team_details]
-        mock_get_team_by_id.return_value = self.team_model
+        mock_get_team_ids.return_value = [self.team_id]
+        mock_get_teams_by_ids.return_value = [self.team_model]
 
         # Call service method
         response = TeamService.get_user_teams(self.user_id)
@@ -93,26 +98,28 @@ class TeamServiceTests(TestCase):
         self.assertEqual(response.teams[0].id, self.team_id)
 
         # Verify repository calls
-        mock_get_by_user_id.assert_called_once_with(self.user_id)
-        mock_get_team_by_id.assert_called_once_with(self.team_id)
+        mock_get_team_ids.assert_called_once_with(self.user_id)
+        mock_get_teams_by_ids.assert_called_once_with([self.team_id])
 
-    @patch("todo.services.team_service.UserTeamDetailsRepository.get_by_user_id")
-    def test_get_user_teams_no_teams(self, mock_get_by_user_id):
+    @patch("todo.services.team_service.TeamRepository.get_by_ids")
+    @patch("todo.services.team_service.UserTeamDetailsRepository.get_team_ids_by_user_id")
+    def test_get_user_teams_no_teams(self, mock_get_team_ids, mock_get_teams_by_ids):
         """Test when user has no teams"""
-        mock_get_by_user_id.return_value = []
+        mock_get_team_ids.return_value = []
 
         response = TeamService.get_user_teams(self.user_id)
 
         self.assertIsInstance(response, GetUserTeamsResponse)
         self.assertEqual(response.total, 0)
         self.assertEqual(len(response.teams), 0)
+        mock_get_teams_by_ids.assert_not_called()
 
-    @patch("todo.services.team_service.TeamRepository.get_by_id")
-    @patch("todo.services.team_service.UserTeamDetailsRepository.get_by_user_id")
-    def test_get_user_teams_team_not_found(self, mock_get_by_user_id, mock_get_team_by_id):
+    @patch("todo.services.team_service.TeamRepository.get_by_ids")
+    @patch("todo.services.team_service.UserTeamDetailsRepository.get_team_ids_by_user_id")
+    def test_get_user_teams_team_not_found(self, mock_get_team_ids, mock_get_teams_by_ids):
         """Test when team is not found for user team relationship"""
-        mock_get_by_user_id.return_value = [self.user_team_details]
-        mock_get_team_by_id.return_value = None  # Team not found
+        mock_get_team_ids.return_value = [self.team_id]
+        mock_get_teams_by_ids.return_value = []  # Team not found or deleted
 
         response = TeamService.get_user_teams(self.user_id)
 
@@ -120,10 +127,10 @@ class TeamServiceTests(TestCase):
         self.assertEqual(response.total, 0)
         self.assertEqual(len(response.teams), 0)
 
-    @patch("todo.services.team_service.UserTeamDetailsRepository.get_by_user_id")
-    def test_get_user_teams_repository_error(self, mock_get_by_user_id):
+    @patch("todo.services.team_service.UserTeamDetailsRepository.get_team_ids_by_user_id")
+    def test_get_user_teams_repository_error(self, mock_get_team_ids):
         """Test when repository throws an exception"""
-        mock_get_by_user_id.side_effect = Exception("Database error")
+        mock_get_team_ids.side_effect = Exception("Database error")
 
         with self.assertRaises(ValueError) as context:
             TeamService.get_user_teams(self.user_id)
@@ -442,3 +449,120 @@ class TeamServiceTests(TestCase):
         self.assertEqual(audit_log_model.action, "poc_changed")
         self.assertEqual(audit_log_model.team_id, PyObjectId(self.team_id))
         self.assertEqual(audit_log_model.performed_by, PyObjectId(self.owner_id))
+
+    @patch("todo.services.team_service.AuditLogRepository.create_many")
+    @patch("todo.services.team_service.UserRoleService.assign_role_to_users")
+    @patch("todo.services.team_service.UserTeamDetailsRepository.create_many")
+    @patch("todo.services.team_service.UserTeamDetailsRepository.get_users_by_team_id")
+    @patch("todo.repositories.user_repository.UserRepository.get_by_ids")
+    @patch("todo.services.team_service.TeamRepository.is_user_team_member")
+    @patch("todo.services.team_service.TeamRepository.get_by_id")
+    def test_add_team_members_batches_checks_and_writes(
+        self,
+        mock_team_get,
+        mock_is_member,
+        mock_users_get,
+        mock_get_members,
+        mock_create_many,
+        mock_assign_roles,
+        mock_audit_create_many,
+    ):
+        mock_team_get.return_value = self.team_model
+        mock_is_member.return_value = True
+        mock_users_get.return_value = [
+            UserDTO(id=member_id, name="Member") for member_id in (self.admin_id, self.member_id)
+        ]
+        mock_get_members.return_value = [self.user_id]
+        mock_assign_roles.return_value = True
+
+        TeamService.add_team_members(self.team_id, [self.admin_id, self.member_id, self.admin_id], self.user_id)
+
+        mock_users_get.assert_called_once_with([self.admin_id, self.member_id])
+        mock_create_many.assert_called_once()
+        self.assertEqual(
+            [str(user_team.user_id) for user_team in mock_create_many.call_args.args[0]],
+            [self.admin_id, self.member_id],
+        )
+        mock_assign_roles.assert_called_once_with(
+            [self.admin_id, self.member_id], RoleName.MEMBER.value, "TEAM", self.team_id
+        )
+        mock_audit_create_many.assert_called_once()
+        audit_logs = mock_audit_create_many.call_args.args[0]
+        self.assertEqual([audit_log.action for audit_log in audit_logs], ["member_added_to_team"] * 2)
+
+    @patch("todo.services.team_service.UserTeamDetailsRepository.create_many")
+    @patch("todo.repositories.user_repository.UserRepository.get_by_ids")
+    @patch("todo.services.team_service.TeamRepository.is_user_team_member")
+    @patch("todo.services.team_service.TeamRepository.get_by_id")
+    def test_add_team_members_rejects_unknown_users(
+        self, mock_team_get, mock_is_member, mock_users_get, mock_create_many
+    ):
+        mock_team_get.return_value = self.team_model
+        mock_is_member.return_value = True
+        mock_users_get.return_value = [UserDTO(id=self.admin_id, name="Member")]
+
+        with self.assertRaises(ValueError) as context:
+            TeamService.add_team_members(self.team_id, [self.admin_id, self.member_id], self.user_id)
+
+        self.assertIn(f"User with id {self.member_id} not found", str(context.exception))
+        mock_create_many.assert_not_called()
+
+
+class TeamClaimsAuthorizationTests(TestCase):
+    def setUp(self):
+        self.user_id = str(PyObjectId())
+        self.team_id = str(PyObjectId())
+        self.claims_token = set_request_team_roles(self.user_id, {self.team_id: [RoleName.MEMBER.value]})
+
+    def tearDown(self):
+        reset_request_team_roles(self.claims_token)
+
+    @patch("todo.services.user_role_service.UserRoleRepository.get_user_roles")
+    def test_has_role_is_answered_from_team_claims(self, mock_get_user_roles):
+        self.assertTrue(
+            UserRoleService.has_role(self.user_id, RoleName.MEMBER.value, RoleScope.TEAM.value, self.team_id)
+        )
+        self.assertFalse(
+            UserRoleService.has_role(self.user_id, RoleName.ADMIN.value, RoleScope.TEAM.value, self.team_id)
+        )
+        mock_get_user_roles.assert_not_called()
+
+    @patch("todo.services.user_role_service.UserRoleRepository.get_user_roles", return_value=[])
+    def test_has_role_of_other_user_is_read_from_database(self, mock_get_user_roles):
+        other_user_id = str(PyObjectId())
+
+        self.assertFalse(
+            UserRoleService.has_role(other_user_id, RoleName.MEMBER.value, RoleScope.TEAM.value, self.team_id)
+        )
+        mock_get_user_roles.assert_called_once()
+
+    @patch("todo.repositories.team_repository.UserTeamDetailsRepository.get_users_by_team_id")
+    def test_is_user_team_member_is_answered_from_team_claims(self, mock_get_users_by_team_id):
+        self.assertTrue(TeamRepository.is_user_team_member(self.team_id, self.user_id))
+        self.assertFalse(TeamRepository.is_user_team_member(str(PyObjectId()), self.user_id))
+        mock_get_users_by_team_id.assert_not_called()
+
+    @override_settings(JWT_TEAM_CLAIMS_ENABLED=True)
+    @patch("todo.services.user_role_service.UserRoleRepository.get_user_roles")
+    @patch("todo.repositories.team_repository.UserTeamDetailsRepository.get_by_user_id")
+    @patch("todo.services.user_role_service.MembershipVersionRepository.get_version", return_value=3)
+    def test_get_team_claims_maps_member_teams_to_roles(self, _, mock_get_by_user_id, mock_get_user_roles):
+        other_team_id = str(PyObjectId())
+        mock_get_by_user_id.return_value = [
+            UserTeamDetailsModel(
+                user_id=PyObjectId(self.user_id),
+                team_id=PyObjectId(team_id),
+                role_id="1",
+                created_by=PyObjectId(self.user_id),
+                updated_by=PyObjectId(self.user_id),
+            )
+            for team_id in (self.team_id, other_team_id)
+        ]
+        mock_get_user_roles.return_value = [
+            UserRoleModel(user_id=self.user_id, role_name=role_name, scope=RoleScope.TEAM, team_id=self.team_id)
+            for role_name in (RoleName.MEMBER, RoleName.ADMIN)
+        ]
+
+        claims = UserRoleService.get_team_claims(self.user_id)
+
+        self.assertEqual(claims, {"teams": {self.team_id: ["member", "admin"], other_team_id: []}, "mv": 3})
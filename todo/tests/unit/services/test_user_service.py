@@ -1,3 +1,4 @@
+from datetime import datetime, timezone
 from unittest import TestCase
 from unittest.mock import patch
 from rest_framework.exceptions import ValidationError as DRFValidationError
@@ -90,3 +91,28 @@ class UserServiceTests(TestCase):
                     self.assertIn(ValidationErrors.MISSING_EMAIL, str(error_dict))
                 if "name" not in invalid_data:
                     self.assertIn(ValidationErrors.MISSING_NAME, str(error_dict))
+
+    @patch("todo.services.user_service.UserRepository")
+    def test_get_users_by_ids_reads_users_in_one_call(self, mock_repository):
+        mock_repository.get_by_ids.return_value = [self.user_model]
+
+        result = UserService.get_users_by_ids([str(self.user_model.id), "missing"])
+
+        mock_repository.get_by_ids.assert_called_once_with([str(self.user_model.id), "missing"])
+        mock_repository.get_by_id.assert_not_called()
+        self.assertEqual([user.id for user in result], [str(self.user_model.id)])
+
+    @patch("todo.repositories.team_repository.UserTeamDetailsRepository.get_members_with_task_counts")
+    def test_get_users_by_team_id_maps_members_with_task_counts(self, mock_get_members):
+        added_on = datetime.now(timezone.utc)
+        mock_get_members.return_value = [
+            {"user_id": "user-1", "name": "First", "added_on": added_on, "tasks_assigned_count": 3},
+            {"user_id": "user-2", "name": "Second", "added_on": None, "tasks_assigned_count": 0},
+        ]
+
+        result = UserService.get_users_by_team_id("team-1")
+
+        mock_get_members.assert_called_once_with("team-1")
+        self.assertEqual([user.id for user in result], ["user-1", "user-2"])
+        self.assertEqual(result[0].addedOn, added_on)
+        self.assertEqual([user.tasksAssignedCount for user in result], [3, 0])
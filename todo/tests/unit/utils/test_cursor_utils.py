@@ -0,0 +1,35 @@
+from unittest import TestCase
+from datetime import datetime, timezone
+from bson import ObjectId
+
+from todo.utils.cursor_utils import TaskCursor, decode_cursor, encode_cursor
+
+
+class CursorUtilsTests(TestCase):
+    def test_round_trips_datetime_value(self):
+        last_id = ObjectId()
+        value = datetime(2024, 11, 8, 10, 14, 35, 123000, tzinfo=timezone.utc)
+
+        cursor = decode_cursor(encode_cursor(TaskCursor("updatedAt", "desc", value, last_id)))
+
+        self.assertEqual(cursor.sort_by, "updatedAt")
+        self.assertEqual(cursor.order, "desc")
+        self.assertEqual(cursor.value, value)
+        self.assertEqual(cursor.last_id, last_id)
+
+    def test_round_trips_int_and_null_values(self):
+        for value in (1, None):
+            with self.subTest(value=value):
+                cursor = decode_cursor(encode_cursor(TaskCursor("priority", "asc", value, ObjectId())))
+                self.assertEqual(cursor.value, value)
+
+    def test_encoded_cursor_is_url_safe(self):
+        token = encode_cursor(TaskCursor("dueAt", "asc", None, ObjectId()))
+
+        self.assertRegex(token, r"^[A-Za-z0-9_-]+$")
+
+    def test_decode_rejects_malformed_tokens(self):
+        for token in ("not-a-cursor", "e30", "W10", "!!!"):
+            with self.subTest(token=token):
+                with self.assertRaises(ValueError):
+                    decode_cursor(token)
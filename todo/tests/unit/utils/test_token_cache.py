@@ -0,0 +1,64 @@
+import time
+from unittest import TestCase
+from unittest.mock import patch
+
+from todo.utils.token_cache import VerifiedTokenCache
+
+
+def _payload(user_id: str = "user-1", expires_in: float = 60) -> dict:
+    return {"user_id": user_id, "token_type": "access", "exp": int(time.time() + expires_in)}
+
+
+class VerifiedTokenCacheTests(TestCase):
+    def setUp(self):
+        self.cache = VerifiedTokenCache(max_size=2, enabled=True)
+
+    def test_get_returns_cached_payload_and_email(self):
+        self.cache.put("token", _payload(), "user@example.com")
+
+        payload, user_email = self.cache.get("token")
+
+        self.assertEqual(payload["user_id"], "user-1")
+        self.assertEqual(user_email, "user@example.com")
+        self.assertIsNone(self.cache.get("other-token"))
+        self.assertEqual(self.cache.stats()["hits"], 1)
+
+    def test_entry_expires_with_token(self):
+        payload = _payload(expires_in=10)
+        self.cache.put("token", payload, "user@example.com")
+
+        with patch("todo.utils.token_cache.time.time", return_value=payload["exp"]):
+            self.assertIsNone(self.cache.get("token"))
+        self.assertEqual(self.cache.stats()["size"], 0)
+
+    def test_least_recently_used_entry_is_evicted(self):
+        self.cache.put("first", _payload(), "user@example.com")
+        self.cache.put("second", _payload(), "user@example.com")
+        self.cache.get("first")
+
+        self.cache.put("third", _payload(), "user@example.com")
+
+        self.assertIsNotNone(self.cache.get("first"))
+        self.assertIsNone(self.cache.get("second"))
+
+    def test_invalidate_user_drops_every_token_of_user(self):
+        self.cache.put("first", _payload("user-1"), "user@example.com")
+        self.cache.put("second", _payload("user-2"), "other@example.com")
+
+        self.cache.invalidate_user("user-1")
+
+        self.assertIsNone(self.cache.get("first"))
+        self.assertIsNotNone(self.cache.get("second"))
+
+    def test_invalidate_drops_token(self):
+        self.cache.put("token", _payload(), "user@example.com")
+
+        self.cache.invalidate("token")
+
+        self.assertIsNone(self.cache.get("token"))
+
+    def test_disabled_cache_stores_nothing(self):
+        cache = VerifiedTokenCache(enabled=False)
+        cache.put("token", _payload(), "user@example.com")
+
+        self.assertIsNone(cache.get("token"))
@@ -1,5 +1,6 @@
 from rest_framework.test import APITestCase, APIClient, APIRequestFactory
 from rest_framework.reverse import reverse
+from django.test import override_settings
 from rest_framework import status
 from unittest.mock import patch, Mock, PropertyMock
 from bson.objectid import ObjectId
@@ -141,6 +142,8 @@ class GoogleCallbackViewTests(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_302_FOUND)
         self.assertIn("error=invalid_state", response.url)
 
+    # Team claims would be read from the database, which this view test does not mock
+    @override_settings(JWT_TEAM_CLAIMS_ENABLED=False)
     @patch("todo.services.google_oauth_service.GoogleOAuthService.handle_callback")
     @patch("todo.services.user_service.UserService.create_or_update_user")
     def test_get_redirects_for_valid_code_and_state(self, mock_create_user, mock_handle_callback):
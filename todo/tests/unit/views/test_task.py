@@ -11,6 +11,7 @@ from todo.dto.user_dto import UserDTO
 from todo.dto.task_dto import TaskDTO
 from todo.dto.responses.get_tasks_response import GetTasksResponse
 from todo.dto.responses.create_task_response import CreateTaskResponse
+from todo.dto.responses.bulk_task_response import BulkTaskResult
 from todo.tests.fixtures.task import task_dtos
 from todo.constants.task import (
     TaskPriority,
@@ -22,6 +23,7 @@ from todo.constants.task import (
     SORT_FIELD_ASSIGNEE,
     SORT_ORDER_ASC,
     SORT_ORDER_DESC,
+    BULK_TASKS_MAX_ITEMS,
 )
 from todo.dto.responses.get_task_by_id_response import GetTaskByIdResponse
 from todo.exceptions.task_exceptions import TaskNotFoundException, UnprocessableEntityException
@@ -53,6 +55,8 @@ class TaskViewTests(AuthenticatedMongoTestCase):
             user_id=str(self.user_id),
             team_id=None,
             status_filter=None,
+            cursor=None,
+            include_total=True,
         )
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         expected_response = mock_get_tasks.return_value.model_dump(mode="json")
@@ -72,6 +76,8 @@ class TaskViewTests(AuthenticatedMongoTestCase):
             user_id=str(self.user_id),
             team_id=None,
             status_filter=None,
+            cursor=None,
+            include_total=True,
         )
         self.assertEqual(response.status_code, status.HTTP_200_OK)
 
@@ -183,6 +189,8 @@ class TaskViewTest(AuthenticatedMongoTestCase):
             user_id=str(self.user_id),
             team_id=None,
             status_filter=None,
+            cursor=None,
+            include_total=True,
         )
 
     @patch("todo.services.task_service.TaskService.get_tasks")
@@ -201,6 +209,8 @@ class TaskViewTest(AuthenticatedMongoTestCase):
             user_id=str(self.user_id),
             team_id=None,
             status_filter=None,
+            cursor=None,
+            include_total=True,
         )
 
     def test_get_tasks_with_invalid_page(self):
@@ -249,6 +259,8 @@ class TaskViewSortingTests(AuthenticatedMongoTestCase):
             user_id=str(self.user_id),
             team_id=None,
             status_filter=None,
+            cursor=None,
+            include_total=True,
         )
 
     @patch("todo.services.task_service.TaskService.get_tasks")
@@ -266,6 +278,8 @@ class TaskViewSortingTests(AuthenticatedMongoTestCase):
             user_id=str(self.user_id),
             team_id=None,
             status_filter=None,
+            cursor=None,
+            include_total=True,
         )
 
     @patch("todo.services.task_service.TaskService.get_tasks")
@@ -295,6 +309,8 @@ class TaskViewSortingTests(AuthenticatedMongoTestCase):
                     user_id=str(self.user_id),
                     team_id=None,
                     status_filter=None,
+                    cursor=None,
+                    include_total=True,
                 )
 
     @patch("todo.services.task_service.TaskService.get_tasks")
@@ -318,6 +334,8 @@ class TaskViewSortingTests(AuthenticatedMongoTestCase):
                     user_id=str(self.user_id),
                     team_id=None,
                     status_filter=None,
+                    cursor=None,
+                    include_total=True,
                 )
 
     def test_get_tasks_with_invalid_sort_by(self):
@@ -353,6 +371,8 @@ class TaskViewSortingTests(AuthenticatedMongoTestCase):
             user_id=str(self.user_id),
             team_id=None,
             status_filter=None,
+            cursor=None,
+            include_total=True,
         )
 
     @patch("todo.services.task_service.TaskService.get_tasks")
@@ -370,6 +390,8 @@ class TaskViewSortingTests(AuthenticatedMongoTestCase):
             user_id=str(self.user_id),
             team_id=None,
             status_filter=None,
+            cursor=None,
+            include_total=True,
         )
 
     def test_get_tasks_edge_case_combinations(self):
@@ -387,6 +409,8 @@ class TaskViewSortingTests(AuthenticatedMongoTestCase):
                 user_id=str(self.user_id),
                 team_id=None,
                 status_filter=None,
+                cursor=None,
+                include_total=True,
             )
 
 
@@ -1023,3 +1047,74 @@ class TaskViewProfileTrueTests(AuthenticatedMongoTestCase):
         client = APIClient()
         response = client.get(self.url + "?profile=true")
         self.assertEqual(response.status_code, 401)
+
+
+class TaskBulkViewTests(AuthenticatedMongoTestCase):
+    def setUp(self):
+        super().setUp()
+        self.url = reverse("tasks_bulk")
+
+    @patch("todo.views.task.TaskService.bulk_create_tasks")
+    def test_bulk_create_returns_207_with_per_task_results(self, mock_bulk_create_tasks: Mock):
+        mock_bulk_create_tasks.return_value = [BulkTaskResult(index=1, statusCode=201, data=task_dtos[0])]
+
+        response = self.client.post(
+            self.url,
+            data={
+                "tasks": [
+                    {"priority": "HIGH", "timezone": "Asia/Kolkata"},
+                    {"title": "Valid task", "timezone": "Asia/Kolkata"},
+                ]
+            },
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_207_MULTI_STATUS)
+        self.assertEqual((response.data["succeeded"], response.data["failed"]), (1, 1))
+        self.assertEqual([result["index"] for result in response.data["results"]], [0, 1])
+        self.assertEqual(response.data["results"][0]["statusCode"], 400)
+        self.assertEqual(response.data["results"][0]["errors"][0]["source"]["parameter"], "title")
+        dtos = mock_bulk_create_tasks.call_args[0][0]
+        self.assertEqual(list(dtos), [1])
+        self.assertEqual(dtos[1].createdBy, str(self.user_id))
+
+    @patch("todo.views.task.TaskService.bulk_create_tasks")
+    def test_bulk_create_returns_201_when_all_tasks_are_created(self, mock_bulk_create_tasks: Mock):
+        mock_bulk_create_tasks.return_value = [BulkTaskResult(index=0, statusCode=201, data=task_dtos[0])]
+
+        response = self.client.post(
+            self.url, data={"tasks": [{"title": "Valid task", "timezone": "Asia/Kolkata"}]}, format="json"
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data["succeeded"], 1)
+
+    def test_bulk_create_rejects_more_tasks_than_the_limit(self):
+        tasks = [{"title": f"Task {i}", "timezone": "Asia/Kolkata"} for i in range(BULK_TASKS_MAX_ITEMS + 1)]
+
+        response = self.client.post(self.url, data={"tasks": tasks}, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    @patch("todo.views.task.TaskService.bulk_update_tasks")
+    def test_bulk_update_rejects_missing_id_and_assignee_changes(self, mock_bulk_update_tasks: Mock):
+        task_id = str(ObjectId())
+        mock_bulk_update_tasks.return_value = [BulkTaskResult(index=2, statusCode=200, data=task_dtos[0])]
+
+        response = self.client.patch(
+            self.url,
+            data={
+                "tasks": [
+                    {"title": "No id"},
+                    {"id": task_id, "assignee": {"assignee_id": str(ObjectId()), "user_type": "user"}},
+                    {"id": task_id, "status": TaskStatus.DONE.value},
+                ]
+            },
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_207_MULTI_STATUS)
+        self.assertEqual([result["statusCode"] for result in response.data["results"]], [400, 400, 200])
+        updates = mock_bulk_update_tasks.call_args[0][0]
+        self.assertEqual(list(updates), [2])
+        self.assertEqual(updates[2]["id"], task_id)
@@ -3,7 +3,10 @@ from unittest.mock import patch, MagicMock
 from rest_framework.test import APIClient
 from rest_framework import status
 
-from todo.views.team import TeamListView, JoinTeamByInviteCodeView, RemoveTeamMemberView
+from bson import ObjectId
+
+from todo.models.audit_log import AuditLogModel
+from todo.views.team import TeamListView, JoinTeamByInviteCodeView, RemoveTeamMemberView, TeamActivityTimelineView
 from todo.dto.responses.get_user_teams_response import GetUserTeamsResponse
 from todo.dto.team_dto import TeamDTO
 from datetime import datetime, timezone
@@ -182,3 +185,91 @@ class RemoveTeamMemberViewTests(TestCase):
 
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
         self.assertIn("Something went wrong", response.data["detail"])
+
+
+class TeamActivityTimelineViewTests(TestCase):
+    def setUp(self):
+        self.view = TeamActivityTimelineView()
+        self.team_id = "507f1f77bcf86cd799439012"
+        self.user_id = "507f1f77bcf86cd799439011"
+        self.task_id = "507f1f77bcf86cd799439013"
+        self.team = MagicMock()
+        self.team.name = "Test Team"
+        self.logs = [
+            AuditLogModel(
+                id=ObjectId(),
+                team_id=self.team_id,
+                task_id=self.task_id,
+                action="status_changed",
+                performed_by=self.user_id,
+                status_from="TODO",
+                status_to="DONE",
+                timestamp=datetime(2025, 1, 2, 10, 0, 0, 500000, tzinfo=timezone.utc),
+            ),
+            AuditLogModel(
+                id=ObjectId(),
+                team_id=self.team_id,
+                action="member_added_to_team",
+                performed_by=self.user_id,
+                timestamp=datetime(2025, 1, 1, 9, 0, tzinfo=timezone.utc),
+            ),
+        ]
+
+    def _request(self, **query_params):
+        mock_request = MagicMock()
+        mock_request.query_params = query_params
+        return mock_request
+
+    @patch("todo.views.team.TaskRepository.get_titles_by_ids")
+    @patch("todo.views.team.UserRepository.get_names_by_ids")
+    @patch("todo.views.team.AuditLogRepository.get_team_timeline")
+    @patch("todo.views.team.TeamRepository.get_by_id")
+    def test_get_returns_page_with_names_and_links(self, mock_get_team, mock_timeline, mock_names, mock_titles):
+        mock_get_team.return_value = self.team
+        mock_timeline.return_value = self.logs
+        mock_names.return_value = {self.user_id: "Test User"}
+        mock_titles.return_value = {self.task_id: "Test Task"}
+
+        response = self.view.get(self._request(limit="2"), self.team_id)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        mock_timeline.assert_called_once_with(self.team_id, 2, before=None, since=None)
+        mock_names.assert_called_once_with([self.user_id])
+        timeline = response.data["timeline"]
+        self.assertEqual(timeline[0]["task_title"], "Test Task")
+        self.assertEqual(timeline[0]["performed_by_name"], "Test User")
+        self.assertEqual(timeline[1]["id"], str(self.logs[1].id))
+        self.assertIn(f"before=2025-01-01T09%3A00%3A00Z%2C{self.logs[1].id}", response.data["links"]["next"])
+        self.assertIn(f"since=2025-01-02T10%3A00%3A00.500000Z%2C{self.logs[0].id}", response.data["links"]["prev"])
+
+    @patch("todo.views.team.TaskRepository.get_titles_by_ids", return_value={})
+    @patch("todo.views.team.UserRepository.get_names_by_ids", return_value={})
+    @patch("todo.views.team.AuditLogRepository.get_team_timeline")
+    @patch("todo.views.team.TeamRepository.get_by_id")
+    def test_get_since_without_new_activities_keeps_polling_position(self, mock_get_team, mock_timeline, *mocks):
+        mock_get_team.return_value = self.team
+        mock_timeline.return_value = []
+        since = f"2025-01-02T10:00:00.500000Z,{self.logs[0].id}"
+
+        response = self.view.get(self._request(since=since), self.team_id)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            mock_timeline.call_args.kwargs["since"],
+            (datetime(2025, 1, 2, 10, 0, 0, 500000, tzinfo=timezone.utc), self.logs[0].id),
+        )
+        self.assertIsNone(response.data["links"]["next"])
+        self.assertIn("since=2025-01-02T10%3A00%3A00.500000Z", response.data["links"]["prev"])
+
+    @patch("todo.views.team.TeamRepository.get_by_id")
+    def test_get_rejects_invalid_positions(self, mock_get_team):
+        for query_params in (
+            {"before": "not-a-timestamp"},
+            {"before": "2025-01-01T09:00:00Z,not-an-id"},
+            {"before": "2025-01-01T09:00:00Z", "since": "2025-01-01T09:00:00Z"},
+        ):
+            with self.subTest(query_params=query_params):
+                response = self.view.get(self._request(**query_params), self.team_id)
+
+                self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        mock_get_team.assert_not_called()
@@ -1,5 +1,5 @@
 from django.urls import path
-from todo.views.task import TaskListView, TaskDetailView, TaskUpdateView
+from todo.views.task import TaskListView, TaskBulkView, TaskDetailView, TaskUpdateView
 from todo.views.health import HealthView
 from todo.views.user import UsersView
 from todo.views.auth import GoogleLoginView, GoogleCallbackView, LogoutView
@@ -41,6 +41,7 @@ urlpatterns = [
     path("teams/<str:team_id>/invite-code", TeamInviteCodeView.as_view(), name="team_invite_code"),
     path("teams/<str:team_id>/activity-timeline", TeamActivityTimelineView.as_view(), name="team_activity_timeline"),
     path("tasks", TaskListView.as_view(), name="tasks"),
+    path("tasks/bulk", TaskBulkView.as_view(), name="tasks_bulk"),
     path("tasks/<str:task_id>", TaskDetailView.as_view(), name="task_detail"),
     path("tasks/<str:task_id>/update", TaskUpdateView.as_view(), name="update_task_and_assignee"),
     path("tasks/<str:task_id>/assign", AssignTaskToUserView.as_view(), name="assign_task_to_user"),
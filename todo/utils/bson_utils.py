@@ -0,0 +1,15 @@
+from enum import Enum
+from typing import Any
+
+
+def to_bson_value(value: Any) -> Any:
+    """
+    Make a payload BSON encodable. Enums are stored as their value, like in the Mongo documents.
+    """
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, dict):
+        return {key: to_bson_value(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [to_bson_value(item) for item in value]
+    return value
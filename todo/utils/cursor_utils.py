@@ -0,0 +1,50 @@
+import base64
+import binascii
+from dataclasses import dataclass
+from datetime import timezone
+from typing import Any
+
+from bson import ObjectId, json_util
+from bson.json_util import JSONOptions, JSONMode
+
+CURSOR_JSON_OPTIONS = JSONOptions(json_mode=JSONMode.CANONICAL, tz_aware=True, tzinfo=timezone.utc)
+
+
+@dataclass
+class TaskCursor:
+    """
+    Position of the last task of a page: the value of the sort key and the task _id.
+    """
+
+    sort_by: str
+    order: str
+    value: Any
+    last_id: ObjectId
+
+
+def encode_cursor(cursor: TaskCursor) -> str:
+    """
+    Encode a cursor as an opaque url-safe token.
+    """
+    payload = {"s": cursor.sort_by, "o": cursor.order, "v": cursor.value, "id": cursor.last_id}
+    raw = json_util.dumps(payload, json_options=CURSOR_JSON_OPTIONS)
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(token: str) -> TaskCursor:
+    """
+    Decode a token produced by encode_cursor.
+
+    Raises:
+        ValueError: If the token is malformed
+    """
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        payload = json_util.loads(base64.urlsafe_b64decode(padded.encode()).decode(), json_options=CURSOR_JSON_OPTIONS)
+        cursor = TaskCursor(sort_by=payload["s"], order=payload["o"], value=payload["v"], last_id=payload["id"])
+    except (binascii.Error, UnicodeDecodeError, ValueError, KeyError, TypeError) as e:
+        raise ValueError("Invalid cursor") from e
+
+    if not isinstance(cursor.last_id, ObjectId):
+        raise ValueError("Invalid cursor")
+    return cursor
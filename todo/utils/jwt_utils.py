@@ -1,5 +1,6 @@
 import jwt
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from django.conf import settings
 
 from todo.exceptions.auth_exceptions import (
@@ -10,6 +11,26 @@ from todo.exceptions.auth_exceptions import (
 
 from todo.constants.messages import AuthErrorMessages
 
+# Claims of access tokens given by UserRoleService.get_team_claims: role names by team id, and the
+# membership version they were read at
+TEAM_CLAIMS = ("teams", "mv")
+
+
+@lru_cache(maxsize=8)
+def _prepare_key(algorithm: str, key: str):
+    """
+    Parse a key once per process. Given the PEM string, PyJWT parses it again on every call.
+    """
+    return jwt.get_algorithm_by_name(algorithm).prepare_key(key)
+
+
+def _get_signing_key():
+    return _prepare_key(settings.JWT_CONFIG.get("ALGORITHM"), settings.JWT_CONFIG.get("PRIVATE_KEY"))
+
+
+def _get_verification_key():
+    return _prepare_key(settings.JWT_CONFIG.get("ALGORITHM"), settings.JWT_CONFIG.get("PUBLIC_KEY"))
+
 
 def generate_access_token(user_data: dict) -> str:
     try:
@@ -24,10 +45,11 @@ def generate_access_token(user_data: dict) -> str:
             "user_id": user_data["user_id"],
             "token_type": "access",
         }
+        payload.update({claim: user_data[claim] for claim in TEAM_CLAIMS if claim in user_data})
 
         token = jwt.encode(
             payload=payload,
-            key=settings.JWT_CONFIG.get("PRIVATE_KEY"),
+            key=_get_signing_key(),
             algorithm=settings.JWT_CONFIG.get("ALGORITHM"),
         )
         return token
@@ -51,7 +73,7 @@ def generate_refresh_token(user_data: dict) -> str:
         }
         token = jwt.encode(
             payload=payload,
-            key=settings.JWT_CONFIG.get("PRIVATE_KEY"),
+            key=_get_signing_key(),
             algorithm=settings.JWT_CONFIG.get("ALGORITHM"),
         )
 
@@ -65,7 +87,7 @@ def validate_access_token(token: str) -> dict:
     try:
         payload = jwt.decode(
             jwt=token,
-            key=settings.JWT_CONFIG.get("PUBLIC_KEY"),
+            key=_get_verification_key(),
             algorithms=[settings.JWT_CONFIG.get("ALGORITHM")],
         )
 
@@ -86,7 +108,7 @@ def validate_refresh_token(token: str) -> dict:
     try:
         payload = jwt.decode(
             jwt=token,
-            key=settings.JWT_CONFIG.get("PUBLIC_KEY"),
+            key=_get_verification_key(),
             algorithms=[settings.JWT_CONFIG.get("ALGORITHM")],
         )
         if payload.get("token_type") != "refresh":
@@ -0,0 +1,12 @@
+from datetime import timedelta
+
+# Upper bound for the exponential backoff between two attempts of the same sync
+MAX_RETRY_BACKOFF_SECONDS = 300
+
+
+def get_retry_backoff(attempts: int, retry_delay: int) -> timedelta:
+    """
+    Delay before the next attempt: retry_delay seconds after the first failed attempt,
+    doubled after every further one, capped at MAX_RETRY_BACKOFF_SECONDS.
+    """
+    return timedelta(seconds=min(retry_delay * 2 ** (max(attempts, 1) - 1), MAX_RETRY_BACKOFF_SECONDS))
@@ -0,0 +1,30 @@
+from contextvars import ContextVar, Token
+from typing import Dict, List, Tuple
+
+# User id and team roles (team id -> role names) of the access token of the current request,
+# set only when the claims are current
+_request_team_roles: ContextVar[Tuple[str, Dict[str, List[str]]] | None] = ContextVar(
+    "request_team_roles", default=None
+)
+
+
+def set_request_team_roles(user_id: str, team_roles: Dict[str, List[str]] | None) -> Token:
+    return _request_team_roles.set((str(user_id), team_roles) if team_roles is not None else None)
+
+
+def reset_request_team_roles(token: Token) -> None:
+    _request_team_roles.reset(token)
+
+
+def get_request_team_roles(user_id: str) -> Dict[str, List[str]] | None:
+    """
+    Team roles of a user from the access token of the current request.
+
+    Returns:
+        Dict[str, List[str]] | None: Role names by team id, None when the request has no current
+        team claims for this user (another user, a token without claims, or a stale token)
+    """
+    request_team_roles = _request_team_roles.get()
+    if request_team_roles is None or request_team_roles[0] != str(user_id):
+        return None
+    return request_team_roles[1]
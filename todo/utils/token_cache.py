@@ -0,0 +1,104 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Set, Tuple
+
+from django.conf import settings
+
+
+class VerifiedTokenCache:
+    """
+    Bounded LRU cache of verified access tokens, shared by the threads of a process.
+
+    Entries are keyed by the SHA-256 digest of the token, so that tokens are not kept in memory,
+    and hold the verified payload and the email of the user until the token expires.
+    """
+
+    def __init__(self, max_size: int | None = None, enabled: bool | None = None):
+        self.max_size = max_size or getattr(settings, "JWT_CACHE_MAX_SIZE", 10000)
+        self.enabled = enabled if enabled is not None else getattr(settings, "JWT_CACHE_ENABLED", True)
+        self._entries: OrderedDict[str, Tuple[float, Dict[str, Any], str]] = OrderedDict()
+        self._digests_by_user: Dict[str, Set[str]] = {}
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    @staticmethod
+    def _digest(token: str) -> str:
+        return hashlib.sha256(token.encode()).hexdigest()
+
+    def _remove(self, digest: str) -> None:
+        """Must hold the lock."""
+        _expires_at, payload, _user_email = self._entries.pop(digest)
+        digests = self._digests_by_user.get(payload["user_id"])
+        if digests is not None:
+            digests.discard(digest)
+            if not digests:
+                del self._digests_by_user[payload["user_id"]]
+
+    def get(self, token: str) -> Tuple[Dict[str, Any], str] | None:
+        """
+        Returns:
+            Tuple[Dict[str, Any], str] | None: Payload and user email of a verified, unexpired token
+        """
+        if not self.enabled:
+            return None
+
+        digest = self._digest(token)
+        with self._lock:
+            entry = self._entries.get(digest)
+            if entry is None:
+                self._misses += 1
+                return None
+            expires_at, payload, user_email = entry
+            if expires_at <= time.time():
+                self._remove(digest)
+                self._misses += 1
+                return None
+            self._entries.move_to_end(digest)
+            self._hits += 1
+            return dict(payload), user_email
+
+    def put(self, token: str, payload: Dict[str, Any], user_email: str) -> None:
+        if not self.enabled or "exp" not in payload:
+            return
+
+        digest = self._digest(token)
+        with self._lock:
+            if digest in self._entries:
+                self._remove(digest)
+            self._entries[digest] = (float(payload["exp"]), dict(payload), user_email)
+            self._digests_by_user.setdefault(payload["user_id"], set()).add(digest)
+            while len(self._entries) > self.max_size:
+                self._remove(next(iter(self._entries)))
+
+    def invalidate(self, token: str) -> None:
+        digest = self._digest(token)
+        with self._lock:
+            if digest in self._entries:
+                self._remove(digest)
+
+    def invalidate_user(self, user_id: str) -> None:
+        """Drop every cached token of a user."""
+        with self._lock:
+            for digest in list(self._digests_by_user.get(str(user_id), ())):
+                self._remove(digest)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._digests_by_user.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "size": len(self._entries),
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": self._hits / lookups if lookups else 0.0,
+            }
+
+
+verified_token_cache = VerifiedTokenCache()
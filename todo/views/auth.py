@@ -8,7 +8,9 @@ from drf_spectacular.utils import extend_schema, OpenApiParameter, OpenApiRespon
 from drf_spectacular.types import OpenApiTypes
 from todo.services.google_oauth_service import GoogleOAuthService
 from todo.services.user_service import UserService
+from todo.services.user_role_service import UserRoleService
 from todo.utils.jwt_utils import generate_token_pair
+from todo.utils.token_cache import verified_token_cache
 from todo.constants.messages import AppMessages
 
 
@@ -119,6 +121,7 @@ class GoogleCallbackView(APIView):
                 {
                     "user_id": str(user.id),
                     "name": user.name,
+                    **UserRoleService.get_team_claims(str(user.id)),
                 }
             )
 
@@ -172,6 +175,9 @@ class LogoutView(APIView):
 
     def _handle_logout(self, request: Request):
         request.session.flush()
+        access_token = request.COOKIES.get(settings.COOKIE_SETTINGS.get("ACCESS_COOKIE_NAME"))
+        if access_token:
+            verified_token_cache.invalidate(access_token)
 
         response = Response(
             {
@@ -1,3 +1,4 @@
+from typing import List
 from bson import ObjectId
 from rest_framework.views import APIView
 from rest_framework.response import Response
@@ -11,9 +12,11 @@ from todo.serializers.get_tasks_serializer import GetTaskQueryParamsSerializer
 from todo.serializers.create_task_serializer import CreateTaskSerializer
 from todo.serializers.update_task_serializer import UpdateTaskSerializer
 from todo.serializers.defer_task_serializer import DeferTaskSerializer
+from todo.serializers.bulk_task_serializer import BulkTaskSerializer, BulkUpdateTaskSerializer
 from todo.services.task_service import TaskService
 from todo.dto.task_dto import CreateTaskDTO
 from todo.dto.responses.create_task_response import CreateTaskResponse
+from todo.dto.responses.bulk_task_response import BulkTaskResponse, BulkTaskResult
 from todo.dto.responses.get_task_by_id_response import GetTaskByIdResponse
 from todo.dto.responses.error_response import (
     ApiErrorResponse,
@@ -30,6 +33,29 @@ from todo.dto.task_assignment_dto import CreateTaskAssignmentDTO
 from todo.exceptions.task_exceptions import TaskNotFoundException
 
 
+def _format_validation_errors(errors) -> List[ApiErrorDetail]:
+    formatted_errors = []
+    for field, messages in errors.items():
+        if isinstance(messages, list):
+            for message in messages:
+                formatted_errors.append(
+                    ApiErrorDetail(
+                        source={ApiErrorSource.PARAMETER: field},
+                        title=ApiErrors.VALIDATION_ERROR,
+                        detail=str(message),
+                    )
+                )
+        else:
+            formatted_errors.append(
+                ApiErrorDetail(
+                    source={ApiErrorSource.PARAMETER: field},
+                    title=ApiErrors.VALIDATION_ERROR,
+                    detail=str(messages),
+                )
+            )
+    return formatted_errors
+
+
 class TaskListView(APIView):
     @extend_schema(
         operation_id="get_tasks",
@@ -49,6 +75,13 @@ class TaskListView(APIView):
                 location=OpenApiParameter.QUERY,
                 description="Number of tasks per page",
             ),
+            OpenApiParameter(
+                name="cursor",
+                type=OpenApiTypes.STR,
+                location=OpenApiParameter.QUERY,
+                description="Opaque cursor from a previous response's next link. Pass an empty value to start cursor pagination. In cursor mode page is ignored, the total count is not computed and only a next link is returned.",
+                required=False,
+            ),
             OpenApiParameter(
                 name="teamId",
                 type=OpenApiTypes.STR,
@@ -56,6 +89,13 @@ class TaskListView(APIView):
                 description="If provided, filters tasks assigned to this team.",
                 required=False,
             ),
+            OpenApiParameter(
+                name="includeTotal",
+                type=OpenApiTypes.BOOL,
+                location=OpenApiParameter.QUERY,
+                description="Count the matching tasks to build the next link (default true). When false, a next link is returned whenever the page is full.",
+                required=False,
+            ),
             OpenApiParameter(
                 name="status",
                 type=OpenApiTypes.STR,
@@ -108,6 +148,8 @@ class TaskListView(APIView):
             user_id=request.user_id,
             team_id=team_id,
             status_filter=status_filter,
+            cursor=query.validated_data.get("cursor"),
+            include_total=query.validated_data["includeTotal"],
         )
 
         if response.error and response.error.get("code") == "FORBIDDEN":
@@ -167,25 +209,7 @@ class TaskListView(APIView):
             )
 
     def _handle_validation_errors(self, errors):
-        formatted_errors = []
-        for field, messages in errors.items():
-            if isinstance(messages, list):
-                for message in messages:
-                    formatted_errors.append(
-                        ApiErrorDetail(
-                            source={ApiErrorSource.PARAMETER: field},
-                            title=ApiErrors.VALIDATION_ERROR,
-                            detail=str(message),
-                        )
-                    )
-            else:
-                formatted_errors.append(
-                    ApiErrorDetail(
-                        source={ApiErrorSource.PARAMETER: field},
-                        title=ApiErrors.VALIDATION_ERROR,
-                        detail=str(messages),
-                    )
-                )
+        formatted_errors = _format_validation_errors(errors)
 
         error_response = ApiErrorResponse(statusCode=400, message=ApiErrors.VALIDATION_ERROR, errors=formatted_errors)
 
@@ -195,6 +219,80 @@ class TaskListView(APIView):
         )
 
 
+class TaskBulkView(APIView):
+    @extend_schema(
+        operation_id="bulk_create_tasks",
+        summary="Create tasks in bulk",
+        description=(
+            "Create up to 1000 tasks, each with the fields of task creation. Every task gets its own result, "
+            "in the order of the request; the response is 207 when some of the tasks could not be created."
+        ),
+        tags=["tasks"],
+        request=BulkTaskSerializer,
+        responses={
+            201: OpenApiResponse(description="All tasks created successfully"),
+            207: OpenApiResponse(description="Some tasks could not be created"),
+            400: OpenApiResponse(description="Bad request"),
+        },
+    )
+    def post(self, request: Request):
+        serializer = BulkTaskSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        results = []
+        dtos = {}
+        for index, task_data in enumerate(serializer.validated_data["tasks"]):
+            task_serializer = CreateTaskSerializer(data=task_data)
+            if not task_serializer.is_valid():
+                results.append(self._validation_error_result(index, task_serializer.errors))
+                continue
+            dtos[index] = CreateTaskDTO(**task_serializer.validated_data, createdBy=request.user_id)
+
+        if dtos:
+            results.extend(TaskService.bulk_create_tasks(dtos, request.user_id))
+
+        response = BulkTaskResponse.from_results(results, status.HTTP_201_CREATED)
+        return Response(data=response.model_dump(mode="json"), status=response.statusCode)
+
+    @extend_schema(
+        operation_id="bulk_update_tasks",
+        summary="Update tasks in bulk",
+        description=(
+            "Partially update up to 1000 tasks, each with the fields of a task update and the id of the task. "
+            "Assignees cannot be changed. Every task gets its own result, in the order of the request; "
+            "the response is 207 when some of the tasks could not be updated."
+        ),
+        tags=["tasks"],
+        request=BulkTaskSerializer,
+        responses={
+            200: OpenApiResponse(description="All tasks updated successfully"),
+            207: OpenApiResponse(description="Some tasks could not be updated"),
+            400: OpenApiResponse(description="Bad request"),
+        },
+    )
+    def patch(self, request: Request):
+        serializer = BulkTaskSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        results = []
+        updates = {}
+        for index, task_data in enumerate(serializer.validated_data["tasks"]):
+            task_serializer = BulkUpdateTaskSerializer(data=task_data, partial=True)
+            if not task_serializer.is_valid():
+                results.append(self._validation_error_result(index, task_serializer.errors))
+                continue
+            updates[index] = task_serializer.validated_data
+
+        if updates:
+            results.extend(TaskService.bulk_update_tasks(updates, request.user_id))
+
+        response = BulkTaskResponse.from_results(results, status.HTTP_200_OK)
+        return Response(data=response.model_dump(mode="json"), status=response.statusCode)
+
+    def _validation_error_result(self, index: int, errors) -> BulkTaskResult:
+        return BulkTaskResult(index=index, statusCode=400, errors=_format_validation_errors(errors))
+
+
 class TaskDetailView(APIView):
     @extend_schema(
         operation_id="get_task_by_id",
@@ -365,25 +463,7 @@ class TaskUpdateView(APIView):
             )
 
     def _handle_validation_errors(self, errors):
-        formatted_errors = []
-        for field, messages in errors.items():
-            if isinstance(messages, list):
-                for message in messages:
-                    formatted_errors.append(
-                        ApiErrorDetail(
-                            source={ApiErrorSource.PARAMETER: field},
-                            title=ApiErrors.VALIDATION_ERROR,
-                            detail=str(message),
-                        )
-                    )
-            else:
-                formatted_errors.append(
-                    ApiErrorDetail(
-                        source={ApiErrorSource.PARAMETER: field},
-                        title=ApiErrors.VALIDATION_ERROR,
-                        detail=str(messages),
-                    )
-                )
+        formatted_errors = _format_validation_errors(errors)
 
         error_response = ApiErrorResponse(statusCode=400, message=ApiErrors.VALIDATION_ERROR, errors=formatted_errors)
 
@@ -3,6 +3,8 @@ from rest_framework.response import Response
 from rest_framework import status
 from rest_framework.request import Request
 from django.conf import settings
+from django.urls import reverse
+from urllib.parse import urlencode
 
 from todo.serializers.create_team_serializer import CreateTeamSerializer, JoinTeamByInviteCodeSerializer
 from todo.serializers.update_team_serializer import UpdateTeamSerializer
@@ -27,6 +29,10 @@ from todo.exceptions.team_exceptions import (
     CannotRemoveTeamPOCException,
 )
 from todo.serializers.remove_from_team_serializer import RemoveFromTeamSerializer
+from todo.serializers.get_team_activity_timeline_serializer import (
+    GetTeamActivityTimelineQueryParamsSerializer,
+    format_timeline_position,
+)
 
 
 class TeamListView(APIView):
@@ -369,7 +375,7 @@ class TeamActivityTimelineView(APIView):
     @extend_schema(
         operation_id="get_team_activity_timeline",
         summary="Get team activity timeline",
-        description="Return a timeline of all activities related to tasks assigned to the team, including assignment, unassignment, executor changes, and status changes. All IDs are replaced with names.",
+        description="Return a page of the timeline of all activities related to tasks assigned to the team, newest first, including assignment, unassignment, executor changes, and status changes. All IDs are replaced with names. Follow links.next for older activities, and poll links.prev for newer ones.",
         tags=["teams"],
         parameters=[
             OpenApiParameter(
@@ -379,6 +385,27 @@ class TeamActivityTimelineView(APIView):
                 description="Unique identifier of the team",
                 required=True,
             ),
+            OpenApiParameter(
+                name="limit",
+                type=OpenApiTypes.INT,
+                location=OpenApiParameter.QUERY,
+                description="Number of activities to return",
+                required=False,
+            ),
+            OpenApiParameter(
+                name="before",
+                type=OpenApiTypes.STR,
+                location=OpenApiParameter.QUERY,
+                description="Only activities older than this position, timestamp[,id] of the last activity of the previous page",
+                required=False,
+            ),
+            OpenApiParameter(
+                name="since",
+                type=OpenApiTypes.STR,
+                location=OpenApiParameter.QUERY,
+                description="Only activities newer than this position, timestamp[,id] of the newest activity already read. Cannot be used with before.",
+                required=False,
+            ),
         ],
         responses={
             200: OpenApiResponse(
@@ -388,20 +415,36 @@ class TeamActivityTimelineView(APIView):
                         "timeline": {
                             "type": "array",
                             "items": {"type": "object"},
-                        }
+                        },
+                        "links": {
+                            "type": "object",
+                            "properties": {
+                                "next": {"type": "string", "nullable": True},
+                                "prev": {"type": "string", "nullable": True},
+                            },
+                        },
                     },
                 },
                 description="Team activity timeline returned successfully",
             ),
+            400: OpenApiResponse(description="Bad request - validation error"),
             403: OpenApiResponse(description="Forbidden"),
             404: OpenApiResponse(description="Team not found"),
         },
     )
     def get(self, request: Request, team_id: str):
+        query = GetTeamActivityTimelineQueryParamsSerializer(data=request.query_params)
+        if not query.is_valid():
+            return self._handle_validation_errors(query.errors)
+
         team = TeamRepository.get_by_id(team_id)
         if not team:
             return Response({"detail": "Team not found."}, status=status.HTTP_404_NOT_FOUND)
-        logs = AuditLogRepository.get_by_team_id(team_id)
+        limit = query.validated_data["limit"]
+        since = query.validated_data.get("since")
+        logs = AuditLogRepository.get_team_timeline(
+            team_id, limit, before=query.validated_data.get("before"), since=since
+        )
         # Pre-fetch team name
         team_name = team.name
         # Pre-fetch all user and task names needed
@@ -418,11 +461,12 @@ class TeamActivityTimelineView(APIView):
                 user_ids.add(str(log.new_executor_id))
             if log.task_id:
                 task_ids.add(str(log.task_id))
-        user_map = {str(u.id): u.name for u in UserRepository.get_by_ids(list(user_ids))}
-        task_map = {str(t.id): t.title for t in TaskRepository.get_by_ids(list(task_ids))}
+        user_map = UserRepository.get_names_by_ids(list(user_ids))
+        task_map = TaskRepository.get_titles_by_ids(list(task_ids))
         timeline = []
         for log in logs:
             entry = {
+                "id": str(log.id),
                 "action": log.action,
                 "timestamp": log.timestamp,
             }
@@ -445,7 +489,40 @@ class TeamActivityTimelineView(APIView):
             if log.status_to:
                 entry["status_to"] = log.status_to
             timeline.append(entry)
-        return Response({"timeline": timeline}, status=status.HTTP_200_OK)
+
+        # Older activities are already known to a client that polls with since
+        next_link = None
+        if len(logs) == limit and not since:
+            next_link = self._build_link(team_id, limit, before=self._position(logs[-1]))
+        prev_link = None
+        if logs:
+            prev_link = self._build_link(team_id, limit, since=self._position(logs[0]))
+        elif since:
+            prev_link = self._build_link(team_id, limit, since=request.query_params["since"])
+
+        return Response(
+            {"timeline": timeline, "links": {"next": next_link, "prev": prev_link}}, status=status.HTTP_200_OK
+        )
+
+    def _position(self, log) -> str:
+        return format_timeline_position(log.timestamp, log.id)
+
+    def _build_link(self, team_id: str, limit: int, **position) -> str:
+        base_url = reverse("team_activity_timeline", kwargs={"team_id": team_id})
+        return f"{base_url}?{urlencode({**position, 'limit': limit})}"
+
+    def _handle_validation_errors(self, errors):
+        formatted_errors = []
+        for field, messages in errors.items():
+            for message in messages if isinstance(messages, list) else [messages]:
+                formatted_errors.append(
+                    ApiErrorDetail(
+                        source={ApiErrorSource.PARAMETER: field}, title=ApiErrors.VALIDATION_ERROR, detail=str(message)
+                    )
+                )
+
+        error_response = ApiErrorResponse(statusCode=400, message=ApiErrors.VALIDATION_ERROR, errors=formatted_errors)
+        return Response(data=error_response.model_dump(mode="json"), status=status.HTTP_400_BAD_REQUEST)
 
 
 class RemoveTeamMemberView(APIView):
@@ -0,0 +1,172 @@
+import importlib
+import logging
+import pkgutil
+from dataclasses import dataclass
+from typing import Any, Dict, List
+
+from pymongo import IndexModel
+from pymongo.errors import PyMongoError
+
+logger = logging.getLogger(__name__)
+
+INDEX_STATUS_MISSING = "missing"
+INDEX_STATUS_CHANGED = "changed"
+INDEX_STATUS_UNMANAGED = "unmanaged"
+INDEX_STATUS_CREATED = "created"
+INDEX_STATUS_REBUILT = "rebuilt"
+INDEX_STATUS_FAILED = "failed"
+
+# Index options that are part of an index definition and are compared to detect drift
+COMPARED_INDEX_OPTIONS = ("unique", "sparse", "partialFilterExpression", "expireAfterSeconds")
+
+
+@dataclass
+class IndexReport:
+    collection: str
+    name: str
+    status: str
+    detail: str = ""
+
+
+def _load_repositories() -> None:
+    """
+    Import every repository module so that their index declarations are registered.
+    """
+    import todo.repositories
+
+    for module_info in pkgutil.walk_packages(todo.repositories.__path__, prefix="todo.repositories."):
+        importlib.import_module(module_info.name)
+
+
+def get_declared_indexes() -> Dict[str, List[IndexModel]]:
+    """
+    Get the indexes declared by repositories grouped by collection name.
+    """
+    from todo.repositories.common.mongo_repository import MongoRepository
+
+    _load_repositories()
+
+    declared: Dict[str, List[IndexModel]] = {}
+    for repository in MongoRepository.get_indexed_repositories():
+        collection_indexes = declared.setdefault(repository.collection_name, [])
+        declared_names = {index.document["name"] for index in collection_indexes}
+        for index in repository.indexes:
+            if index.document["name"] not in declared_names:
+                collection_indexes.append(index)
+    return declared
+
+
+def _normalize_spec(spec: Dict[str, Any]) -> Dict[str, Any]:
+    normalized = {"key": [(field, direction) for field, direction in dict(spec["key"]).items()]}
+    for option in COMPARED_INDEX_OPTIONS:
+        value = spec.get(option)
+        if option in ("unique", "sparse"):
+            value = bool(value)
+        normalized[option] = value
+    return normalized
+
+
+def _describe_difference(declared: Dict[str, Any], existing: Dict[str, Any]) -> str:
+    differences = [
+        f"{option}: expected {declared[option]!r}, found {existing[option]!r}"
+        for option in declared
+        if declared[option] != existing[option]
+    ]
+    return "; ".join(differences)
+
+
+def check_indexes(database) -> List[IndexReport]:
+    """
+    Compare the declared indexes with the ones present in the database.
+    Reports indexes that are missing, that exist with a different definition, and
+    indexes that exist in the database but are not declared by any repository.
+    """
+    reports: List[IndexReport] = []
+
+    for collection_name, indexes in get_declared_indexes().items():
+        existing_indexes = database[collection_name].index_information()
+        declared_names = set()
+
+        for index in indexes:
+            name = index.document["name"]
+            declared_names.add(name)
+
+            if name not in existing_indexes:
+                reports.append(IndexReport(collection_name, name, INDEX_STATUS_MISSING))
+                continue
+
+            declared_spec = _normalize_spec(index.document)
+            existing_spec = _normalize_spec(existing_indexes[name])
+            if declared_spec != existing_spec:
+                reports.append(
+                    IndexReport(
+                        collection_name,
+                        name,
+                        INDEX_STATUS_CHANGED,
+                        _describe_difference(declared_spec, existing_spec),
+                    )
+                )
+
+        for name in existing_indexes:
+            if name != "_id_" and name not in declared_names:
+                reports.append(IndexReport(collection_name, name, INDEX_STATUS_UNMANAGED))
+
+    return reports
+
+
+def ensure_indexes(database, rebuild_changed: bool = False) -> List[IndexReport]:
+    """
+    Create missing declared indexes. This is idempotent and can be run multiple times safely.
+
+    Indexes that exist with a different definition are only reported unless
+    `rebuild_changed` is set, in which case they are dropped and created again.
+    Unmanaged indexes are never dropped.
+    """
+    declared = get_declared_indexes()
+    reports: List[IndexReport] = []
+
+    for report in check_indexes(database):
+        if report.status == INDEX_STATUS_UNMANAGED or (report.status == INDEX_STATUS_CHANGED and not rebuild_changed):
+            reports.append(report)
+            continue
+
+        index = next(index for index in declared[report.collection] if index.document["name"] == report.name)
+        collection = database[report.collection]
+        try:
+            if report.status == INDEX_STATUS_CHANGED:
+                collection.drop_index(report.name)
+                collection.create_indexes([index])
+                reports.append(IndexReport(report.collection, report.name, INDEX_STATUS_REBUILT, report.detail))
+            else:
+                collection.create_indexes([index])
+                reports.append(IndexReport(report.collection, report.name, INDEX_STATUS_CREATED))
+        except PyMongoError as e:
+            logger.error(f"Failed to build index {report.name} on {report.collection}: {str(e)}")
+            reports.append(IndexReport(report.collection, report.name, INDEX_STATUS_FAILED, str(e)))
+
+    return reports
+
+
+def log_index_drift(database) -> bool:
+    """
+    Log declared indexes that are missing or differ from the database.
+
+    Returns:
+        bool: True if all declared indexes are present and up to date, False otherwise
+    """
+    try:
+        reports = check_indexes(database)
+    except PyMongoError as e:
+        logger.warning(f"Index check failed: {str(e)}")
+        return False
+
+    in_sync = True
+    for report in reports:
+        if report.status in (INDEX_STATUS_MISSING, INDEX_STATUS_CHANGED):
+            in_sync = False
+            logger.warning(
+                f"Index {report.name} on {report.collection} is {report.status}"
+                + (f" ({report.detail})" if report.detail else "")
+                + ". Run `python manage.py ensure_indexes` to fix it."
+            )
+    return in_sync
@@ -1,6 +1,8 @@
 import logging
 import time
+from django.conf import settings
 from todo_project.db.config import DatabaseManager
+from todo_project.db.indexes import log_index_drift
 from todo_project.db.migrations import run_all_migrations
 from todo.services.postgres_sync_service import PostgresSyncService
 
@@ -51,15 +53,22 @@ def initialize_database(max_retries=5, retry_delay=2):
         if not migrations_success:
             logger.warning("Some database migrations failed, but continuing with initialization")
 
-        try:
-            postgres_sync_service = PostgresSyncService()
-            postgres_sync_success = postgres_sync_service.sync_all_tables()
-            if not postgres_sync_success:
-                logger.warning("Some PostgreSQL table synchronizations failed, but continuing with initialization")
+        if settings.MONGO_INDEX_CHECK_ON_BOOT:
+            if log_index_drift(db_manager.get_database()):
+                logger.info("All declared MongoDB indexes are present")
             else:
-                logger.info("PostgreSQL table synchronization completed successfully")
-        except Exception as e:
-            logger.warning(f"PostgreSQL table synchronization failed: {str(e)}, but continuing with initialization")
+                logger.warning("Some declared MongoDB indexes are missing or out of date")
+
+        if getattr(settings, "POSTGRES_SYNC_ON_BOOT", False):
+            try:
+                postgres_sync_service = PostgresSyncService()
+                postgres_sync_success = postgres_sync_service.sync_all_tables(resume=True)
+                if not postgres_sync_success:
+                    logger.warning("Some PostgreSQL table synchronizations failed, but continuing with initialization")
+                else:
+                    logger.info("PostgreSQL table synchronization completed successfully")
+            except Exception as e:
+                logger.warning(f"PostgreSQL table synchronization failed: {str(e)}, but continuing with initialization")
 
         logger.info("Database initialization completed successfully")
         return True
@@ -1,6 +1,8 @@
 import logging
 from datetime import datetime, timezone
 from typing import List, Dict, Any
+from django.utils.dateparse import parse_datetime
+from pymongo import UpdateOne
 from todo_project.db.config import DatabaseManager
 from todo.models.label import LabelModel
 from todo.models.role import RoleModel
@@ -206,6 +208,130 @@ def migrate_predefined_roles() -> bool:
         return False
 
 
+def migrate_task_visibility() -> bool:
+    """
+    Migration to backfill the task_visibility collection.
+    Only runs when the collection is empty, so it is a no-op once visibility is maintained
+    by the write paths. Use `python manage.py rebuild_task_visibility` to repair it afterwards.
+    """
+    logger.info("Starting task visibility migration")
+
+    try:
+        from todo.repositories.task_visibility_repository import TaskVisibilityRepository
+
+        db_manager = DatabaseManager()
+        if db_manager.get_collection("task_visibility").find_one({}, {"_id": 1}):
+            logger.info("Task visibility already populated, skipping")
+            return True
+
+        processed_count = TaskVisibilityRepository.rebuild()
+        logger.info(f"Task visibility migration completed - {processed_count} tasks processed")
+        return True
+
+    except Exception as e:
+        logger.error(f"Task visibility migration failed: {str(e)}")
+        return False
+
+
+def migrate_task_assignee_snapshots() -> bool:
+    """
+    Migration to store the assignee snapshot, which team task lists and task assignees are read from, on tasks.
+    Only runs when no task has a snapshot yet, so it is a no-op once snapshots are maintained
+    by the write paths. Use `python manage.py rebuild_task_assignee_snapshots` to repair them afterwards.
+    """
+    logger.info("Starting task assignee snapshots migration")
+
+    try:
+        from todo.repositories.task_assignment_repository import TaskAssignmentRepository
+
+        db_manager = DatabaseManager()
+        if db_manager.get_collection("tasks").find_one({"assignee.assignment_id": {"$exists": True}}, {"_id": 1}):
+            logger.info("Task assignee snapshots already populated, skipping")
+            return True
+
+        processed_count = TaskAssignmentRepository.rebuild_assignee_snapshots()
+        logger.info(f"Task assignee snapshots migration completed - {processed_count} tasks processed")
+        return True
+
+    except Exception as e:
+        logger.error(f"Task assignee snapshots migration failed: {str(e)}")
+        return False
+
+
+def migrate_task_last_activity() -> bool:
+    """
+    Migration to store lastActivity, which tasks are sorted and paged by for updatedAt, on the tasks written
+    before it was stored. Only tasks without lastActivity are updated, so it is a no-op once they all have it.
+    """
+    logger.info("Starting task lastActivity migration")
+
+    try:
+        from todo.repositories.task_repository import TaskRepository
+
+        updated_count = TaskRepository.backfill_last_activity()
+        logger.info(f"Task lastActivity migration completed - {updated_count} tasks updated")
+        return True
+
+    except Exception as e:
+        logger.error(f"Task lastActivity migration failed: {str(e)}")
+        return False
+
+
+def migrate_task_effective_status() -> bool:
+    """
+    Migration to store effectiveStatus, which status filters match on, on the tasks written before it was stored.
+    Only tasks without effectiveStatus are updated, so it is a no-op once they all have it.
+    """
+    logger.info("Starting task effectiveStatus migration")
+
+    try:
+        from todo.repositories.task_repository import TaskRepository
+
+        updated_count = TaskRepository.backfill_effective_status()
+        logger.info(f"Task effectiveStatus migration completed - {updated_count} tasks updated")
+        return True
+
+    except Exception as e:
+        logger.error(f"Task effectiveStatus migration failed: {str(e)}")
+        return False
+
+
+def migrate_audit_log_timestamps(batch_size: int = 1000) -> bool:
+    """
+    Migration to store the timestamps of audit logs as dates. Audit logs used to be written with the
+    timestamp as a JSON string, which team timelines cannot order and page by.
+    Only audit logs that still have a string timestamp are read, so it is a no-op once they are converted.
+    """
+    logger.info("Starting audit log timestamps migration")
+
+    try:
+        collection = DatabaseManager().get_collection("audit_logs")
+        converted_count = 0
+        operations = []
+        for audit_log in collection.find({"timestamp": {"$type": "string"}}, {"timestamp": 1}):
+            timestamp = parse_datetime(audit_log["timestamp"])
+            if timestamp is None:
+                logger.warning(f"Audit log {audit_log['_id']} has an invalid timestamp, skipping")
+                continue
+            if timestamp.tzinfo is None:
+                timestamp = timestamp.replace(tzinfo=timezone.utc)
+            operations.append(UpdateOne({"_id": audit_log["_id"]}, {"$set": {"timestamp": timestamp}}))
+            if len(operations) >= batch_size:
+                collection.bulk_write(operations, ordered=False)
+                converted_count += len(operations)
+                operations = []
+        if operations:
+            collection.bulk_write(operations, ordered=False)
+            converted_count += len(operations)
+
+        logger.info(f"Audit log timestamps migration completed - {converted_count} audit logs converted")
+        return True
+
+    except Exception as e:
+        logger.error(f"Audit log timestamps migration failed: {str(e)}")
+        return False
+
+
 def run_all_migrations() -> bool:
     """
     Run all database migrations.
@@ -218,6 +344,11 @@ def run_all_migrations() -> bool:
     migrations = [
         ("Fixed Labels Migration", migrate_fixed_labels),
         ("Predefined Roles Migration", migrate_predefined_roles),
+        ("Task Visibility Migration", migrate_task_visibility),
+        ("Task Assignee Snapshots Migration", migrate_task_assignee_snapshots),
+        ("Task lastActivity Migration", migrate_task_last_activity),
+        ("Task effectiveStatus Migration", migrate_task_effective_status),
+        ("Audit Log Timestamps Migration", migrate_audit_log_timestamps),
     ]
 
     success_count = 0
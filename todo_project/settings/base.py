@@ -47,6 +47,7 @@ MIDDLEWARE = [
     "django.contrib.auth.middleware.AuthenticationMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.common.CommonMiddleware",
+    "todo.middlewares.request_loader_middleware.RequestLoaderMiddleware",
     "todo.middlewares.jwt_auth.JWTAuthenticationMiddleware",
     "todo.middlewares.team_access_middleware.TeamAccessMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
@@ -186,10 +187,60 @@ else:
         }
     }
 
+# Task displayIds reserved per write of the counters document; ids left in a block when a process exits are skipped
+TASK_DISPLAY_ID_BLOCK_SIZE = int(os.getenv("TASK_DISPLAY_ID_BLOCK_SIZE", "20"))
+
 # Dual-Write Configuration
 DUAL_WRITE_ENABLED = os.getenv("DUAL_WRITE_ENABLED", "True").lower() == "true"
 DUAL_WRITE_RETRY_ATTEMPTS = int(os.getenv("DUAL_WRITE_RETRY_ATTEMPTS", "3"))
 DUAL_WRITE_RETRY_DELAY = int(os.getenv("DUAL_WRITE_RETRY_DELAY", "5"))  # seconds
+# Queue Postgres syncs in the Mongo outbox collection, applied by `manage.py run_sync_relay`
+DUAL_WRITE_OUTBOX_ENABLED = os.getenv("DUAL_WRITE_OUTBOX_ENABLED", "False").lower() == "true"
+# Store failed syncs in the Mongo sync_failures collection, retried by `manage.py run_sync_retry`
+DUAL_WRITE_FAILURE_STORE_ENABLED = os.getenv("DUAL_WRITE_FAILURE_STORE_ENABLED", "True").lower() == "true"
+
+# Per-process LRU cache of user, team and user role models (see todo/repositories/common/model_cache.py).
+# Entries of other processes are only refreshed after MODEL_CACHE_TTL, so turn it off to read every lookup
+MODEL_CACHE_ENABLED = os.getenv("MODEL_CACHE_ENABLED", "True").lower() == "true"
+MODEL_CACHE_MAX_SIZE = int(os.getenv("MODEL_CACHE_MAX_SIZE", "10000"))
+MODEL_CACHE_TTL = int(os.getenv("MODEL_CACHE_TTL", "60"))  # seconds
+MODEL_CACHE_NEGATIVE_TTL = int(os.getenv("MODEL_CACHE_NEGATIVE_TTL", "10"))  # seconds
+ROLE_CACHE_TTL = int(os.getenv("ROLE_CACHE_TTL", "10"))  # seconds, for the roles of permission checks
+
+# Request-scoped identity map of users, teams, tasks, labels and assignments loaded by id
+# (see todo/repositories/common/request_loader.py)
+REQUEST_LOADER_ENABLED = os.getenv("REQUEST_LOADER_ENABLED", "True").lower() == "true"
+# Report the lookups answered by the request loaders in an X-DB-Lookups-Saved header outside DEBUG
+REQUEST_LOADER_DEBUG_HEADER = os.getenv("REQUEST_LOADER_DEBUG_HEADER", "False").lower() == "true"
+
+# Per-process cache of verified access tokens, kept until the token expires (see todo/utils/token_cache.py)
+JWT_CACHE_ENABLED = os.getenv("JWT_CACHE_ENABLED", "True").lower() == "true"
+JWT_CACHE_MAX_SIZE = int(os.getenv("JWT_CACHE_MAX_SIZE", "10000"))
+
+# Team roles embedded in access tokens, revoked by the per-user membership version (membership_versions).
+# Turned off, every permission check reads the roles from the database and tokens carry no team claims
+JWT_TEAM_CLAIMS_ENABLED = os.getenv("JWT_TEAM_CLAIMS_ENABLED", "True").lower() == "true"
+# Users in more teams get tokens without team claims and are authorized from the database
+JWT_TEAM_CLAIMS_MAX_TEAMS = int(os.getenv("JWT_TEAM_CLAIMS_MAX_TEAMS", "50"))
+
+# Copy renamed users and teams into the assignee snapshots of their tasks, in a background thread
+ASSIGNEE_NAME_PROPAGATION_ENABLED = os.getenv("ASSIGNEE_NAME_PROPAGATION_ENABLED", "True").lower() == "true"
+
+# Buffer audit logs in memory and write them in batches from a background thread, every
+# AUDIT_LOG_FLUSH_INTERVAL seconds or once AUDIT_LOG_BUFFER_SIZE are waiting (see todo/repositories/common/write_buffer.py).
+# Turned off, audit logs are written by the request that creates them
+AUDIT_LOG_BUFFER_ENABLED = os.getenv("AUDIT_LOG_BUFFER_ENABLED", "True").lower() == "true"
+AUDIT_LOG_BUFFER_SIZE = int(os.getenv("AUDIT_LOG_BUFFER_SIZE", "100"))
+AUDIT_LOG_FLUSH_INTERVAL = float(os.getenv("AUDIT_LOG_FLUSH_INTERVAL", "1"))  # seconds
+# Number of times a failed batch of audit logs is written again before it is dropped
+AUDIT_LOG_WRITE_RETRIES = int(os.getenv("AUDIT_LOG_WRITE_RETRIES", "3"))
+
+# MongoDB index check on startup (logs missing or drifted indexes, does not build them)
+MONGO_INDEX_CHECK_ON_BOOT = os.getenv("MONGO_INDEX_CHECK_ON_BOOT", "False").lower() == "true"
+
+# Backfill of Postgres from MongoDB on startup. Off by default so that worker starts only check schema and
+# indexes; run `python manage.py sync_postgres_tables --resume` to backfill instead
+POSTGRES_SYNC_ON_BOOT = os.getenv("POSTGRES_SYNC_ON_BOOT", "False").lower() == "true"
 
 PUBLIC_PATHS = [
     "/favicon.ico",
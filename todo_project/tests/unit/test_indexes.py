@@ -0,0 +1,149 @@
+from unittest import TestCase
+from unittest.mock import MagicMock, patch
+
+from pymongo import ASCENDING, IndexModel
+from pymongo.errors import OperationFailure
+
+from todo_project.db.indexes import (
+    INDEX_STATUS_CHANGED,
+    INDEX_STATUS_CREATED,
+    INDEX_STATUS_FAILED,
+    INDEX_STATUS_MISSING,
+    INDEX_STATUS_REBUILT,
+    INDEX_STATUS_UNMANAGED,
+    check_indexes,
+    ensure_indexes,
+    get_declared_indexes,
+    log_index_drift,
+)
+
+
+class IndexRegistryTests(TestCase):
+    def setUp(self):
+        self.active_index = IndexModel(
+            [("task_id", ASCENDING)], name="task_id_active", partialFilterExpression={"is_active": True}
+        )
+        self.declared = {"task_details": [self.active_index]}
+        self.patcher = patch("todo_project.db.indexes.get_declared_indexes", return_value=self.declared)
+        self.patcher.start()
+
+        self.collection = MagicMock()
+        self.database = MagicMock()
+        self.database.__getitem__.return_value = self.collection
+
+    def tearDown(self):
+        self.patcher.stop()
+
+    def _set_existing(self, indexes: dict):
+        self.collection.index_information.return_value = {"_id_": {"key": [("_id", 1)], "v": 2}, **indexes}
+
+    def test_check_indexes_reports_missing_index(self):
+        self._set_existing({})
+
+        reports = check_indexes(self.database)
+
+        self.assertEqual(len(reports), 1)
+        self.assertEqual(reports[0].status, INDEX_STATUS_MISSING)
+        self.assertEqual(reports[0].name, "task_id_active")
+
+    def test_check_indexes_reports_nothing_when_in_sync(self):
+        self._set_existing(
+            {"task_id_active": {"key": [("task_id", 1)], "v": 2, "partialFilterExpression": {"is_active": True}}}
+        )
+
+        self.assertEqual(check_indexes(self.database), [])
+
+    def test_check_indexes_reports_changed_definition(self):
+        self._set_existing({"task_id_active": {"key": [("task_id", 1)], "v": 2}})
+
+        reports = check_indexes(self.database)
+
+        self.assertEqual(len(reports), 1)
+        self.assertEqual(reports[0].status, INDEX_STATUS_CHANGED)
+        self.assertIn("partialFilterExpression", reports[0].detail)
+
+    def test_check_indexes_reports_unmanaged_index(self):
+        self._set_existing(
+            {
+                "task_id_active": {"key": [("task_id", 1)], "v": 2, "partialFilterExpression": {"is_active": True}},
+                "legacy_index": {"key": [("legacy", 1)], "v": 2},
+            }
+        )
+
+        reports = check_indexes(self.database)
+
+        self.assertEqual(
+            [(report.name, report.status) for report in reports], [("legacy_index", INDEX_STATUS_UNMANAGED)]
+        )
+
+    def test_ensure_indexes_creates_only_missing_indexes(self):
+        self._set_existing({})
+
+        reports = ensure_indexes(self.database)
+
+        self.collection.create_indexes.assert_called_once_with([self.active_index])
+        self.assertEqual(reports[0].status, INDEX_STATUS_CREATED)
+
+    def test_ensure_indexes_is_idempotent(self):
+        self._set_existing(
+            {"task_id_active": {"key": [("task_id", 1)], "v": 2, "partialFilterExpression": {"is_active": True}}}
+        )
+
+        reports = ensure_indexes(self.database)
+
+        self.collection.create_indexes.assert_not_called()
+        self.assertEqual(reports, [])
+
+    def test_ensure_indexes_does_not_touch_changed_index_by_default(self):
+        self._set_existing({"task_id_active": {"key": [("task_id", 1)], "v": 2}})
+
+        reports = ensure_indexes(self.database)
+
+        self.collection.drop_index.assert_not_called()
+        self.collection.create_indexes.assert_not_called()
+        self.assertEqual(reports[0].status, INDEX_STATUS_CHANGED)
+
+    def test_ensure_indexes_rebuilds_changed_index_when_requested(self):
+        self._set_existing({"task_id_active": {"key": [("task_id", 1)], "v": 2}})
+
+        reports = ensure_indexes(self.database, rebuild_changed=True)
+
+        self.collection.drop_index.assert_called_once_with("task_id_active")
+        self.collection.create_indexes.assert_called_once_with([self.active_index])
+        self.assertEqual(reports[0].status, INDEX_STATUS_REBUILT)
+
+    def test_ensure_indexes_reports_build_failure(self):
+        self._set_existing({})
+        self.collection.create_indexes.side_effect = OperationFailure("duplicate key")
+
+        reports = ensure_indexes(self.database)
+
+        self.assertEqual(reports[0].status, INDEX_STATUS_FAILED)
+        self.assertIn("duplicate key", reports[0].detail)
+
+    def test_log_index_drift_returns_false_for_missing_index(self):
+        self._set_existing({})
+
+        with self.assertLogs("todo_project.db.indexes", level="WARNING"):
+            self.assertFalse(log_index_drift(self.database))
+
+
+class DeclaredIndexesTests(TestCase):
+    def test_repositories_declare_indexes_for_hot_collections(self):
+        declared = get_declared_indexes()
+
+        for collection_name in (
+            "tasks",
+            "task_details",
+            "watchlist",
+            "user_team_details",
+            "user_roles",
+            "audit_logs",
+            "users",
+        ):
+            self.assertIn(collection_name, declared)
+
+        index_names = {index.document["name"] for index in declared["task_details"]}
+        self.assertIn("task_id_active", index_names)
+        audit_index = declared["audit_logs"][0].document
+        self.assertEqual(list(audit_index["key"].items()), [("team_id", 1), ("timestamp", -1), ("_id", -1)])
@@ -0,0 +1,34 @@
+from unittest import TestCase
+from unittest.mock import MagicMock, patch
+
+from django.test import override_settings
+
+from todo_project.db.init import initialize_database
+
+
+@patch("todo_project.db.init.run_all_migrations", return_value=True)
+@patch("todo_project.db.init.DatabaseManager")
+@patch("todo_project.db.init.PostgresSyncService")
+class InitializeDatabaseTests(TestCase):
+    def _set_up_database(self, mock_database_manager):
+        db_manager = MagicMock()
+        db_manager.check_database_health.return_value = True
+        db_manager.get_collection.return_value.find_one.return_value = {"_id": "taskDisplayId", "seq": 0}
+        mock_database_manager.return_value = db_manager
+
+    @override_settings(POSTGRES_SYNC_ON_BOOT=False, MONGO_INDEX_CHECK_ON_BOOT=False)
+    def test_does_not_backfill_postgres_by_default(self, mock_sync_service, mock_database_manager, mock_migrations):
+        self._set_up_database(mock_database_manager)
+
+        self.assertTrue(initialize_database())
+
+        mock_migrations.assert_called_once()
+        mock_sync_service.assert_not_called()
+
+    @override_settings(POSTGRES_SYNC_ON_BOOT=True, MONGO_INDEX_CHECK_ON_BOOT=False)
+    def test_backfills_postgres_when_enabled(self, mock_sync_service, mock_database_manager, mock_migrations):
+        self._set_up_database(mock_database_manager)
+
+        self.assertTrue(initialize_database())
+
+        mock_sync_service.return_value.sync_all_tables.assert_called_once_with(resume=True)